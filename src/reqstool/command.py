@@ -28,25 +28,20 @@ from reqstool.commands.exit_codes import (
     EXIT_CODE_MISSING_REQUIREMENTS_FILE,
 )
 from reqstool.common.exceptions import ArtifactDownloadError, ArtifactExtractionError, MissingRequirementsFileError
-from reqstool.commands.generate_json.generate_json import GenerateJsonCommand
-from reqstool.commands.report import report
-from reqstool.commands.validate.validate import ValidateCommand
-from reqstool.commands.report.criterias.group_by import GroupbyOptions
+from reqstool.commands.report.criterias.group_by_options import GroupbyOptions
 from reqstool.commands.report.criterias.sort_by import SortByOptions
-from reqstool.commands.enrich.enrich import EnrichCommand
-from reqstool.commands.status.status import StatusCommand, VerbosityLevel
-from reqstool.common.enrichment.enricher import BUILT_IN_PRESETS
-from reqstool.common.utils import Utils
-from reqstool.common.validators.syntax_validator import JsonSchemaItem
-from reqstool.locations.git_location import GitLocation
+from reqstool.commands.status.verbosity import VerbosityLevel
+from reqstool.common.enrichment.presets import BUILT_IN_PRESETS
+from reqstool.daemon.client import DAEMON_SOCKET_ENV, default_socket_path
+from reqstool.daemon.defaults import DEFAULT_MAX_SESSIONS
+from reqstool.locations.artifact_cache import DEFAULT_MAX_SIZE_MB, ArtifactCache
 from reqstool.locations.local_location import LocalLocation
-from reqstool.locations.local_maven_location import LocalMavenLocation
-from reqstool.locations.local_npm_location import LocalNpmLocation
-from reqstool.locations.local_pypi_location import LocalPypiLocation
 from reqstool.locations.location import LocationInterface
-from reqstool.locations.maven_location import MavenLocation
-from reqstool.locations.npm_location import NpmLocation
-from reqstool.locations.pypi_location import PypiLocation
+from reqstool.model_generators.parsing_config import ParsingConfig, ValidationStrategy
+
+# Only what building the argument parser needs is imported above. Commands and location
+# types are imported when selected: between them they pull in pygit2, requests, bs4, rich,
+# jinja2, lark and jsonschema, which took most of the run time of short invocations.
 
 
 _LOCATION_DEFS = [
@@ -74,6 +69,13 @@ _LOCATION_DEFS = [
             {"flags": ["-u", "--url"], "kwargs": {"help": "git repository URL", "required": True}},
             {"flags": ["-p", "--path"], "kwargs": {"help": "path within the repository", "required": True}},
             {"flags": ["-r", "--ref"], "kwargs": {"help": "git branch, tag, or commit SHA", "required": True}},
+            {
+                "flags": ["--sparse"],
+                "kwargs": {
+                    "action": "store_true",
+                    "help": "only check out the path within the repository",
+                },
+            },
             {
                 "flags": ["-t", "--token"],
                 "kwargs": {"help": "authentication token value (use ${VAR} in YAML or shell expansion for CLI)"},
@@ -130,6 +132,31 @@ _LOCATION_DEFS = [
 ]
 
 
+class _VersionAction(argparse.Action):
+    """Like argparse's "version" action, but the text is only put together when it is asked for."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help or "show program's version number and exit",
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from reqstool.common.utils import Utils
+        from reqstool.common.validators.syntax_validator import JsonSchemaItem
+
+        print(
+            f"""
+{Utils.get_version()}
+        # JSON Schema version: {JsonSchemaItem.schema_version}
+        # JSON Schema location: {JsonSchemaItem.schema_module.__path__._path[0]}"""
+        )
+        parser.exit()
+
+
 class Command:
     __parser: argparse.Namespace
 
@@ -223,17 +250,7 @@ class Command:
                 self._add_filter_options(sub)
 
     def _add_argument_version(self, argument_parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
-        ver = Utils.get_version()
-
-        argument_parser.add_argument(
-            "-V",
-            "--version",
-            action="version",
-            version=f"""
-{ver}
-        # JSON Schema version: {JsonSchemaItem.schema_version}
-        # JSON Schema location: {JsonSchemaItem.schema_module.__path__._path[0]}""",
-        )
+        argument_parser.add_argument("-V", "--version", action=_VersionAction)
 
         return argument_parser
 
@@ -242,7 +259,41 @@ class Command:
             "--log", default="WARNING", help="Set the logging level (FATAL, ERROR, WARNING, INFO, DEBUG)."
         )
 
-    def get_arguments(self) -> argparse.Namespace:
+    def _add_argument_cache_dir(self, argument_parser: argparse.ArgumentParser) -> None:
+        argument_parser.add_argument(
+            "--cache-dir",
+            default=os.environ.get("REQSTOOL_CACHE_DIR"),
+            help="Directory for caching parsed snapshots, downloaded sources and the projects the LSP server "
+            "discovered between runs (default: $REQSTOOL_CACHE_DIR; caching is disabled when unset). Only remote "
+            "sources pinned to an exact version or commit are cached, as are only snapshots whose remote sources "
+            "are all pinned.",
+        )
+        argument_parser.add_argument(
+            "--artifact-cache-max-size",
+            type=int,
+            metavar="MB",
+            # Read from the environment after parsing, and only checked when there is a cache dir to use it
+            default=argparse.SUPPRESS,
+            help="Size limit in megabytes for downloaded sources and git mirrors kept in the cache directory; the least "
+            "recently used are removed beyond it (default: $REQSTOOL_ARTIFACT_CACHE_MAX_SIZE or "
+            f"{DEFAULT_MAX_SIZE_MB}).",
+        )
+
+    def _add_argument_validation(self, argument_parser: argparse.ArgumentParser) -> None:
+        argument_parser.add_argument(
+            "--validation",
+            type=_validation_strategy,
+            choices=list(ValidationStrategy),
+            # A string default goes through type=, so a bad $REQSTOOL_VALIDATION is a usage error too
+            default=os.environ.get("REQSTOOL_VALIDATION", ValidationStrategy.JSON_SCHEMA.value),
+            help="How input files are validated (default: $REQSTOOL_VALIDATION or json-schema). 'json-schema' "
+            "checks every file against its JSON Schema; 'pydantic' validates once with the generated models, "
+            "which is faster, and only consults the JSON Schema to report the errors of files the models "
+            "reject. The models are more lenient, so files the schema rejects can pass unnoticed: they skip "
+            "conditionally required fields and formats and coerce some values. A warning is logged when used.",
+        )
+
+    def get_arguments(self, argv: Optional[list[str]] = None) -> argparse.Namespace:
         class ComboRawTextandArgsDefaultUltimateHelpFormatter(
             argparse.RawTextHelpFormatter, argparse.ArgumentDefaultsHelpFormatter
         ):
@@ -255,6 +306,8 @@ class Command:
 
         self._add_argument_version(self.__parser)
         self._add_argument_log_level(self.__parser)
+        self._add_argument_cache_dir(self.__parser)
+        self._add_argument_validation(self.__parser)
 
         subparsers = self.__parser.add_subparsers(dest="command", help="Sub-commands")
 
@@ -435,14 +488,52 @@ class Command:
         mcp_source_subparsers = mcp_parser.add_subparsers(dest="source", required=False)
         self._add_subparsers_source(mcp_source_subparsers, include_report_options=False, include_filter_options=False)
 
-        args = self.__parser.parse_args()
+        # command: daemon
+        daemon_parser = subparsers.add_parser(
+            "daemon",
+            help=(
+                f"Keep parsed projects in memory and run report, export, status and validate for reqstool "
+                f"invocations with {DAEMON_SOCKET_ENV} set"
+            ),
+        )
+        daemon_parser.add_argument(
+            "--socket",
+            metavar="PATH",
+            default=default_socket_path(),
+            help=f"Unix domain socket to listen on (default: ${DAEMON_SOCKET_ENV} or %(default)s)",
+        )
+        daemon_parser.add_argument(
+            "--max-sessions",
+            type=int,
+            default=DEFAULT_MAX_SESSIONS,
+            help="Number of parsed projects kept in memory; the least recently used is dropped beyond it "
+            "(default: %(default)s)",
+        )
+
+        args = self.__parser.parse_args(argv)
+        if not hasattr(args, "artifact_cache_max_size"):
+            args.artifact_cache_max_size = self.__artifact_cache_max_size_from_env(args)
 
         return args
 
+    def __artifact_cache_max_size_from_env(self, args: argparse.Namespace) -> int:
+        value = os.environ.get("REQSTOOL_ARTIFACT_CACHE_MAX_SIZE")
+        if value is None:
+            return DEFAULT_MAX_SIZE_MB
+        try:
+            return int(value)
+        except ValueError:
+            if args.cache_dir:
+                self.__parser.error(f"REQSTOOL_ARTIFACT_CACHE_MAX_SIZE: invalid int value: {value!r}")
+            # Without a cache dir the limit is never used; a bad value shared with other jobs is harmless
+            return DEFAULT_MAX_SIZE_MB
+
     def _get_initial_source(self, args_source: argparse.Namespace) -> LocationInterface:
         location: Optional[LocationInterface] = None
 
         if args_source.source == "maven":
+            from reqstool.locations.maven_location import MavenLocation
+
             location = MavenLocation(
                 url=args_source.url if args_source.url else None,
                 group_id=args_source.group_id,
@@ -452,6 +543,8 @@ class Command:
                 token=args_source.token or None,
             )
         elif args_source.source == "npm":
+            from reqstool.locations.npm_location import NpmLocation
+
             location = NpmLocation(
                 url=args_source.url if args_source.url else "https://registry.npmjs.org",
                 package=args_source.package,
@@ -459,6 +552,8 @@ class Command:
                 token=args_source.token or None,
             )
         elif args_source.source == "pypi":
+            from reqstool.locations.pypi_location import PypiLocation
+
             location = PypiLocation(
                 url=args_source.url if args_source.url else None,
                 package=args_source.package,
@@ -466,35 +561,82 @@ class Command:
                 token=args_source.token or None,
             )
         elif args_source.source == "git":
+            from reqstool.locations.git_location import GitLocation
+
             location = GitLocation(
                 url=args_source.url,
                 path=args_source.path,
                 ref=args_source.ref,
                 token=args_source.token or None,
+                sparse=getattr(args_source, "sparse", False),
             )
         elif args_source.source == "local":
             if args_source.maven:
+                from reqstool.locations.local_maven_location import LocalMavenLocation
+
                 location = LocalMavenLocation(path=args_source.maven)
             elif args_source.npm:
+                from reqstool.locations.local_npm_location import LocalNpmLocation
+
                 location = LocalNpmLocation(path=args_source.npm)
             elif args_source.pypi:
+                from reqstool.locations.local_pypi_location import LocalPypiLocation
+
                 location = LocalPypiLocation(path=args_source.pypi)
             else:
                 location = LocalLocation(path=args_source.path)
 
         return location
 
+    def _get_snapshot_cache(self, args: argparse.Namespace):
+        cache_dir = getattr(args, "cache_dir", None)
+        if not cache_dir:
+            return None
+        from reqstool.storage.snapshot_cache import SnapshotCache
+
+        return SnapshotCache(os.path.join(cache_dir, "snapshots"))
+
+    def _get_artifact_cache(self, args: argparse.Namespace) -> Optional[ArtifactCache]:
+        cache_dir = getattr(args, "cache_dir", None)
+        if not cache_dir:
+            return None
+        max_size_mb = getattr(args, "artifact_cache_max_size", DEFAULT_MAX_SIZE_MB)
+        return ArtifactCache(
+            os.path.join(cache_dir, "artifacts"),
+            max_size_bytes=max_size_mb * 1024 * 1024,
+            git_mirror_dir=os.path.join(cache_dir, "git"),
+        )
+
+    def _get_database_provider(self, args: argparse.Namespace):
+        # Only set when the command is run by `reqstool daemon`
+        return getattr(args, "database_provider", None)
+
+    def _get_parsing_config(self, args: argparse.Namespace) -> ParsingConfig:
+        validation_strategy = getattr(args, "validation", ValidationStrategy.JSON_SCHEMA)
+        if validation_strategy is ValidationStrategy.PYDANTIC:
+            logging.warning(
+                "--validation pydantic: input files are not checked against their JSON Schema, and some the "
+                "schema rejects are accepted (conditionally required fields, formats, coerced values)"
+            )
+        return ParsingConfig(validation_strategy=validation_strategy)
+
     @Requirements("REPORT_0005", "REPORT_0006")
     def command_report(self, report_args: argparse.Namespace):
+        from reqstool.commands.report.report import ReportCommand
+
         initial_source = self._get_initial_source(report_args)
 
         output = report_args.output  # where to put the generated report
         format = getattr(report_args, "format", "asciidoc")
-        result = report.ReportCommand(
+        result = ReportCommand(
             location=initial_source,
             group_by=GroupbyOptions(report_args.group_by),
             sort_by=[SortByOptions(s) for s in report_args.sort_by],
             format=format,
+            snapshot_cache=self._get_snapshot_cache(report_args),
+            artifact_cache=self._get_artifact_cache(report_args),
+            database_provider=self._get_database_provider(report_args),
+            parsing_config=self._get_parsing_config(report_args),
         )
 
         output.write(result.result)
@@ -520,28 +662,52 @@ class Command:
                 location=initial_source,
                 semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
                 filter_data=filter_data,
+                snapshot_cache=self._get_snapshot_cache(export_args),
+                artifact_cache=self._get_artifact_cache(export_args),
+                database_provider=self._get_database_provider(export_args),
+                parsing_config=self._get_parsing_config(export_args),
             ) as (db, _):
                 db.backup_to(output_path)
         else:
+            from reqstool.commands.generate_json.generate_json import GenerateJsonCommand
+
             filter_data = not getattr(export_args, "no_filters", False)
             req_ids = getattr(export_args, "req_ids", None)
             svc_ids = getattr(export_args, "svc_ids", None)
             result = GenerateJsonCommand(
-                location=initial_source, filter_data=filter_data, req_ids=req_ids, svc_ids=svc_ids
+                location=initial_source,
+                filter_data=filter_data,
+                req_ids=req_ids,
+                svc_ids=svc_ids,
+                snapshot_cache=self._get_snapshot_cache(export_args),
+                artifact_cache=self._get_artifact_cache(export_args),
+                database_provider=self._get_database_provider(export_args),
+                parsing_config=self._get_parsing_config(export_args),
             )
             export_args.output.write(result.result)
 
     def command_validate(self, validate_args: argparse.Namespace) -> int:
+        from reqstool.commands.validate.validate import ValidateCommand
+
         initial_source = self._get_initial_source(validate_args)
         output = validate_args.output
         strict = getattr(validate_args, "strict", False)
 
-        result = ValidateCommand(location=initial_source, strict=strict)
+        result = ValidateCommand(
+            location=initial_source,
+            strict=strict,
+            snapshot_cache=self._get_snapshot_cache(validate_args),
+            artifact_cache=self._get_artifact_cache(validate_args),
+            database_provider=self._get_database_provider(validate_args),
+            parsing_config=self._get_parsing_config(validate_args),
+        )
         output.write(result.result)
         return result.exit_code
 
     @Requirements("STATUS_0007", "STATUS_0009")
     def command_status(self, status_args: argparse.Namespace) -> int:
+        from reqstool.commands.status.status import StatusCommand
+
         initial_source = self._get_initial_source(status_args)
         output = status_args.output
 
@@ -559,6 +725,10 @@ class Command:
             req_ids=req_ids,
             svc_ids=svc_ids,
             with_post_tests=getattr(status_args, "with_post_tests", None),
+            snapshot_cache=self._get_snapshot_cache(status_args),
+            artifact_cache=self._get_artifact_cache(status_args),
+            database_provider=self._get_database_provider(status_args),
+            parsing_config=self._get_parsing_config(status_args),
         )
         status, nr_of_incomplete_requirements = result.result
 
@@ -581,7 +751,13 @@ class Command:
             )
             sys.exit(1)
         try:
-            start_server(tcp=lsp_args.tcp, host=lsp_args.host, port=lsp_args.port, log_file=lsp_args.log_file)
+            start_server(
+                tcp=lsp_args.tcp,
+                host=lsp_args.host,
+                port=lsp_args.port,
+                log_file=lsp_args.log_file,
+                cache_dir=getattr(lsp_args, "cache_dir", None),
+            )
         except Exception as exc:
             logging.fatal("reqstool LSP server crashed: %s", exc)
             sys.exit(1)
@@ -663,21 +839,52 @@ class Command:
             with open(input_file, encoding="utf-8") as f:
                 input_content = f.read()
 
+        from reqstool.commands.enrich.enrich import EnrichCommand
+
         config = BUILT_IN_PRESETS[enrich_args.preset]
-        result = EnrichCommand(location=location, input_content=input_content, config=config)
+        result = EnrichCommand(
+            location=location,
+            input_content=input_content,
+            config=config,
+            snapshot_cache=self._get_snapshot_cache(enrich_args),
+            artifact_cache=self._get_artifact_cache(enrich_args),
+            parsing_config=self._get_parsing_config(enrich_args),
+        )
         enrich_args.output.write(result.result)
 
+    def command_daemon(self, daemon_args: argparse.Namespace):
+        from reqstool.daemon.server import start_daemon
+
+        try:
+            start_daemon(socket_path=daemon_args.socket, max_sessions=daemon_args.max_sessions)
+        except RuntimeError as exc:
+            print(f"reqstool daemon: {exc}", file=sys.stderr)
+            sys.exit(1)
+
     def print_help(self):
         self.__parser.print_help(sys.stderr)
 
 
-def main():  # noqa: C901
+def main():
     command = Command()
     args = command.get_arguments()
 
     # Set the logging level based on the argument
     logging.basicConfig(level=getattr(logging, args.log.upper(), logging.WARNING))
 
+    sys.exit(run(command, args))
+
+
+def _validation_strategy(value: str) -> ValidationStrategy:
+    try:
+        return ValidationStrategy(value)
+    except ValueError:
+        choices = ", ".join(repr(strategy.value) for strategy in ValidationStrategy)
+        raise argparse.ArgumentTypeError(f"invalid choice: {value!r} (choose from {choices})")
+
+
+def run(command: Command, args: argparse.Namespace) -> int:  # noqa: C901
+    """Run the command selected by ``args`` and return the process exit code."""
     exit_code: int = 0
 
     try:
@@ -701,16 +908,18 @@ def main():  # noqa: C901
             command.command_mcp(mcp_args=args)
         elif args.command == "enrich":
             command.command_enrich(enrich_args=args)
+        elif args.command == "daemon":
+            command.command_daemon(daemon_args=args)
         else:
             command.print_help()
     except MissingRequirementsFileError as exc:
         logging.fatal(str(exc))
-        sys.exit(EXIT_CODE_MISSING_REQUIREMENTS_FILE)
+        return EXIT_CODE_MISSING_REQUIREMENTS_FILE
     except (ArtifactDownloadError, ArtifactExtractionError) as exc:
         logging.fatal(str(exc))
-        sys.exit(EXIT_CODE_ARTIFACT_ERROR)
+        return EXIT_CODE_ARTIFACT_ERROR
 
-    sys.exit(exit_code)
+    return exit_code
 
 
 if __name__ == "__main__":
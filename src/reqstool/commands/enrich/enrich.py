@@ -2,18 +2,33 @@
 
 from reqstool_python_decorators.decorators.decorators import Requirements
 
-from reqstool.common.enrichment.enricher import EnrichmentConfig, enrich_text
+from reqstool.common.enrichment.enricher import enrich_text
+from reqstool.common.enrichment.presets import EnrichmentConfig
 from reqstool.common.validator_error_holder import ValidationErrorHolder
 from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.locations.artifact_cache import ArtifactCache
 from reqstool.locations.location import LocationInterface
+from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.storage.pipeline import build_database
 from reqstool.storage.requirements_repository import RequirementsRepository
+from reqstool.storage.snapshot_cache import SnapshotCache
 
 
 @Requirements("ENRICH_0001", "ENRICH_0002")
 class EnrichCommand:
-    def __init__(self, location: LocationInterface, input_content: str, config: EnrichmentConfig):
+    def __init__(
+        self,
+        location: LocationInterface,
+        input_content: str,
+        config: EnrichmentConfig,
+        snapshot_cache: SnapshotCache | None = None,
+        artifact_cache: ArtifactCache | None = None,
+        parsing_config: ParsingConfig = ParsingConfig(),
+    ):
         self.__initial_location: LocationInterface = location
+        self.__snapshot_cache: SnapshotCache | None = snapshot_cache
+        self.__artifact_cache: ArtifactCache | None = artifact_cache
+        self.__parsing_config: ParsingConfig = parsing_config
         self.__input_content: str = input_content
         self.__config: EnrichmentConfig = config
         self.result: str = self.__run()
@@ -22,6 +37,9 @@ class EnrichCommand:
         with build_database(
             location=self.__initial_location,
             semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+            snapshot_cache=self.__snapshot_cache,
+            artifact_cache=self.__artifact_cache,
+            parsing_config=self.__parsing_config,
         ) as (db, _):
             repo = RequirementsRepository(db)
             requirements = repo.get_all_requirements()
@@ -8,10 +8,13 @@ from reqstool_python_decorators.decorators.decorators import Requirements
 
 from reqstool.common.validator_error_holder import ValidationErrorHolder
 from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.locations.artifact_cache import ArtifactCache
 from reqstool.locations.location import LocationInterface
+from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.services.export_service import ExportService
-from reqstool.storage.pipeline import build_database
+from reqstool.storage.pipeline import DatabaseProvider, build_database
 from reqstool.storage.requirements_repository import RequirementsRepository
+from reqstool.storage.snapshot_cache import SnapshotCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,11 +27,19 @@ class GenerateJsonCommand:
         filter_data: bool,
         req_ids: list[str] | None = None,
         svc_ids: list[str] | None = None,
+        snapshot_cache: SnapshotCache | None = None,
+        artifact_cache: ArtifactCache | None = None,
+        database_provider: DatabaseProvider | None = None,
+        parsing_config: ParsingConfig = ParsingConfig(),
     ):
         self.__initial_location: LocationInterface = location
         self.__filter_data: bool = filter_data
         self.__req_ids: list[str] | None = req_ids
         self.__svc_ids: list[str] | None = svc_ids
+        self.__snapshot_cache: SnapshotCache | None = snapshot_cache
+        self.__artifact_cache: ArtifactCache | None = artifact_cache
+        self.__database_provider: DatabaseProvider | None = database_provider
+        self.__parsing_config: ParsingConfig = parsing_config
         self.result = self.__run()
 
     def __run(self) -> str:
@@ -37,6 +48,10 @@ class GenerateJsonCommand:
             location=self.__initial_location,
             semantic_validator=SemanticValidator(validation_error_holder=holder),
             filter_data=self.__filter_data,
+            snapshot_cache=self.__snapshot_cache,
+            artifact_cache=self.__artifact_cache,
+            database_provider=self.__database_provider,
+            parsing_config=self.__parsing_config,
         ) as (db, _):
             repo = RequirementsRepository(db)
             export_service = ExportService(repo)
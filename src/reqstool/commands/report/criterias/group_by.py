@@ -2,7 +2,6 @@
 
 from abc import ABC
 from collections import defaultdict
-from enum import Enum
 from operator import attrgetter
 from types import MappingProxyType
 from typing import Callable, Dict, Iterator, List, Tuple
@@ -11,17 +10,13 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from reqstool_python_decorators.decorators.decorators import Requirements
 
+from reqstool.commands.report.criterias.group_by_options import GroupbyOptions
 from reqstool.commands.report.criterias.sort_by import SortByOptions
 from reqstool.common.models.urn_id import UrnId
-from reqstool.models.requirements import RequirementData
+from reqstool.storage.records import RequirementRecord
 from reqstool.storage.requirements_repository import RequirementsRepository
 
 
-class GroupbyOptions(Enum):
-    INITIAL_IMPORTS = "initial/imports"
-    CATEGORY = "category"
-
-
 @Requirements("REPORT_0003")
 class GroupByOrganizor(BaseModel, ABC):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -69,7 +64,7 @@ class GroupByOrganizor(BaseModel, ABC):
 
 
 # Define the Callable interface with type annotations
-GroupByFunction = Callable[[RequirementData, str], str]
+GroupByFunction = Callable[[RequirementRecord, str], str]
 
 # Define lambda functions for grouping
 group_by_category: GroupByFunction = lambda req_data, initial_urn: (
@@ -0,0 +1,8 @@
+# Copyright © LFV
+
+from enum import Enum
+
+
+class GroupbyOptions(Enum):
+    INITIAL_IMPORTS = "initial/imports"
+    CATEGORY = "category"
@@ -12,13 +12,15 @@ from reqstool.common.models.urn_id import UrnId
 from reqstool.common.jinja2 import Jinja2Utils
 from reqstool.common.validator_error_holder import ValidationErrorHolder
 from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.locations.artifact_cache import ArtifactCache
 from reqstool.locations.location import LocationInterface
-from reqstool.models.annotations import AnnotationData
-from reqstool.models.svcs import SVCData
+from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.models.test_data import TEST_RUN_STATUS
 from reqstool.services.statistics_service import StatisticsService
-from reqstool.storage.pipeline import build_database
+from reqstool.storage.pipeline import DatabaseProvider, build_database
+from reqstool.storage.records import AnnotationRecord, SVCRecord
 from reqstool.storage.requirements_repository import RequirementsRepository
+from reqstool.storage.snapshot_cache import SnapshotCache
 
 FORMAT_CONFIG = {
     "asciidoc": {"template_subdir": "asciidoc", "h1": "= ", "h2": "== "},
@@ -51,8 +53,16 @@ class ReportCommand:
         group_by: GroupbyOptions,
         sort_by: list[SortByOptions],
         format: str = "asciidoc",
+        snapshot_cache: SnapshotCache | None = None,
+        artifact_cache: ArtifactCache | None = None,
+        database_provider: DatabaseProvider | None = None,
+        parsing_config: ParsingConfig = ParsingConfig(),
     ):
         self.__initial_location: LocationInterface = location
+        self.__snapshot_cache: SnapshotCache | None = snapshot_cache
+        self.__artifact_cache: ArtifactCache | None = artifact_cache
+        self.__database_provider: DatabaseProvider | None = database_provider
+        self.__parsing_config: ParsingConfig = parsing_config
         self.group_by: GroupbyOptions = group_by
         self.sort_by: list[SortByOptions] = sort_by
         self.__format_config = FORMAT_CONFIG[format]
@@ -68,6 +78,10 @@ class ReportCommand:
         with build_database(
             location=self.__initial_location,
             semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+            snapshot_cache=self.__snapshot_cache,
+            artifact_cache=self.__artifact_cache,
+            database_provider=self.__database_provider,
+            parsing_config=self.__parsing_config,
         ) as (db, _):
             repo = RequirementsRepository(db)
 
@@ -152,7 +166,7 @@ class ReportCommand:
             svcs_urn_ids: list[UrnId] = repo.get_svcs_for_req(urn_id)
 
             # Get svcs for current requirement
-            svcs: list[SVCData] = [all_svcs[sid] for sid in svcs_urn_ids if sid in all_svcs]
+            svcs: list[SVCRecord] = [all_svcs[sid] for sid in svcs_urn_ids if sid in all_svcs]
 
             # Get all verification types for current req
             verifications_as_string = ", ".join(str(svc.verification.value) for svc in svcs)
@@ -240,7 +254,7 @@ class ReportCommand:
 
     def _get_annotation_impls(self, repo: RequirementsRepository, urn_id: UrnId):
         impls_list = []
-        impls_for_urn: list[AnnotationData] = repo.get_annotations_impls_for_req(urn_id)
+        impls_for_urn: list[AnnotationRecord] = repo.get_annotations_impls_for_req(urn_id)
         if impls_for_urn:
             for impl in impls_for_urn:
                 impl_template = {"element_kind": impl.element_kind, "fqn": impl.fully_qualified_name}
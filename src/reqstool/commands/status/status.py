@@ -4,7 +4,6 @@
 import json
 import logging
 import shutil
-from enum import Enum
 from pathlib import Path
 
 from rich.console import Console
@@ -12,14 +11,15 @@ from rich.table import Table, box
 from rich.text import Text
 from reqstool_python_decorators.decorators.decorators import Requirements
 
+from reqstool.commands.status.verbosity import VerbosityLevel
 from reqstool.common.models.urn_id import UrnId
 from reqstool.common.validator_error_holder import ValidationErrorHolder
 from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.locations.artifact_cache import ArtifactCache
 from reqstool.locations.location import LocationInterface
+from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.model_generators.testdata_model_generator import TestDataModelGenerator
-from reqstool.models.mvrs import MVRData
 from reqstool.models.requirements import IMPLEMENTATION, NON_CODE_IMPLEMENTATIONS
-from reqstool.models.svcs import SVCData
 from reqstool.services.export_service import ExportService
 from reqstool.services.statistics_service import (
     EXPECTS_MVRS,
@@ -28,8 +28,10 @@ from reqstool.services.statistics_service import (
     TestStats,
 )
 from reqstool.storage.database import RequirementsDatabase
-from reqstool.storage.pipeline import build_database
+from reqstool.storage.pipeline import DatabaseProvider, build_database
+from reqstool.storage.records import MVRRecord, SVCRecord
 from reqstool.storage.requirements_repository import RequirementsRepository
+from reqstool.storage.snapshot_cache import SnapshotCache
 
 
 _ORANGE = "dark_orange"
@@ -48,13 +50,6 @@ assert (
 ), f"_NON_CODE_LABELS keys {set(_NON_CODE_LABELS)} must match NON_CODE_IMPLEMENTATIONS {NON_CODE_IMPLEMENTATIONS}"
 
 
-class VerbosityLevel(Enum):
-    COMPACT = "compact"
-    NORMAL = "normal"
-    VERBOSE = "verbose"
-    EXTRA_VERBOSE = "extra-verbose"
-
-
 def _make_console() -> Console:
     width = max(_MIN_CONSOLE_WIDTH, shutil.get_terminal_size((120, 24)).columns)
     return Console(highlight=False, force_terminal=True, color_system="standard", width=width)
@@ -79,6 +74,10 @@ class StatusCommand:
         req_ids: list[str] | None = None,
         svc_ids: list[str] | None = None,
         with_post_tests: list[str] | None = None,
+        snapshot_cache: SnapshotCache | None = None,
+        artifact_cache: ArtifactCache | None = None,
+        database_provider: DatabaseProvider | None = None,
+        parsing_config: ParsingConfig = ParsingConfig(),
     ):
         self.__initial_location: LocationInterface = location
         self.__format: str = format
@@ -87,6 +86,10 @@ class StatusCommand:
         self.__req_ids: list[str] | None = req_ids
         self.__svc_ids: list[str] | None = svc_ids
         self.__with_post_tests: list[str] | None = with_post_tests
+        self.__snapshot_cache: SnapshotCache | None = snapshot_cache
+        self.__artifact_cache: ArtifactCache | None = artifact_cache
+        self.__database_provider: DatabaseProvider | None = database_provider
+        self.__parsing_config: ParsingConfig = parsing_config
 
         if self.__format == "json" and self.__verbosity != VerbosityLevel.NORMAL.value:
             logging.warning("--verbosity has no effect when --format json is used; ignoring")
@@ -97,6 +100,10 @@ class StatusCommand:
         with build_database(
             location=self.__initial_location,
             semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+            snapshot_cache=self.__snapshot_cache,
+            artifact_cache=self.__artifact_cache,
+            database_provider=self.__database_provider,
+            parsing_config=self.__parsing_config,
         ) as (db, _):
             repo = RequirementsRepository(db)
             if self.__with_post_tests:
@@ -304,8 +311,8 @@ def _build_drill_down_block(
     req_uid: UrnId,
     req_status: RequirementStatus,
     repo: RequirementsRepository,
-    all_svcs: dict[UrnId, SVCData],
-    all_mvrs: dict[UrnId, MVRData],
+    all_svcs: dict[UrnId, SVCRecord],
+    all_mvrs: dict[UrnId, MVRRecord],
 ) -> str:
     lines = [f"✗ {req_uid.id} · {req_uid.urn} · {_incomplete_reasons(req_status)}"]
 
@@ -330,7 +337,7 @@ def _build_drill_down_block(
     return "\n".join(lines)
 
 
-def _render_mvrs(svc_uid: UrnId, all_mvrs: dict[UrnId, MVRData], repo: RequirementsRepository) -> list[str]:
+def _render_mvrs(svc_uid: UrnId, all_mvrs: dict[UrnId, MVRRecord], repo: RequirementsRepository) -> list[str]:
     mvr_ids = repo.get_mvrs_for_svc(svc_uid)
     if not mvr_ids:
         return ["                     ⌀ no manual result"]
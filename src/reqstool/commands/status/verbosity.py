@@ -0,0 +1,10 @@
+# Copyright © LFV
+
+from enum import Enum
+
+
+class VerbosityLevel(Enum):
+    COMPACT = "compact"
+    NORMAL = "normal"
+    VERBOSE = "verbose"
+    EXTRA_VERBOSE = "extra-verbose"
@@ -4,10 +4,13 @@
 from reqstool_python_decorators.decorators.decorators import Requirements
 from reqstool.common.validator_error_holder import ValidationErrorHolder
 from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.locations.artifact_cache import ArtifactCache
 from reqstool.locations.location import LocationInterface
+from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.services.statistics_service import EXPECTS_MVRS
-from reqstool.storage.pipeline import build_database
+from reqstool.storage.pipeline import DatabaseProvider, build_database
 from reqstool.storage.requirements_repository import RequirementsRepository
+from reqstool.storage.snapshot_cache import SnapshotCache
 
 
 @Requirements("VALIDATE_0003", "VALIDATE_0004", "VALIDATE_0005")
@@ -19,9 +22,21 @@ class ValidateCommand:
     become errors with --strict.
     """
 
-    def __init__(self, location: LocationInterface, strict: bool = False):
+    def __init__(
+        self,
+        location: LocationInterface,
+        strict: bool = False,
+        snapshot_cache: SnapshotCache | None = None,
+        artifact_cache: ArtifactCache | None = None,
+        database_provider: DatabaseProvider | None = None,
+        parsing_config: ParsingConfig = ParsingConfig(),
+    ):
         self.__initial_location = location
         self.__strict = strict
+        self.__snapshot_cache = snapshot_cache
+        self.__artifact_cache = artifact_cache
+        self.__database_provider = database_provider
+        self.__parsing_config = parsing_config
         self.result, self.exit_code = self.__run()
 
     def __run(self) -> tuple[str, int]:
@@ -29,6 +44,10 @@ class ValidateCommand:
         with build_database(
             location=self.__initial_location,
             semantic_validator=SemanticValidator(validation_error_holder=holder),
+            snapshot_cache=self.__snapshot_cache,
+            artifact_cache=self.__artifact_cache,
+            database_provider=self.__database_provider,
+            parsing_config=self.__parsing_config,
         ) as (db, _):
             repo = RequirementsRepository(db)
             initial_urn = repo.get_initial_urn()
@@ -4,30 +4,12 @@ import re
 from dataclasses import dataclass
 from typing import Optional
 
-from reqstool.models.mvrs import MVRData
-from reqstool.models.requirements import RequirementData
-from reqstool.models.svcs import SVCData
+from reqstool.common.enrichment.presets import EnrichmentConfig
+from reqstool.storage.records import MVRRecord, RequirementRecord, SVCRecord
 
 _UPPERCASE_VALUES = frozenset({"shall", "should", "may"})
 
 
-@dataclass(frozen=True)
-class EnrichmentConfig:
-    trigger: str  # 'colon-header' | 'inline'
-    title_only: bool  # True → skip block injection
-    drop_stubs: bool
-    skip_code_spans: bool
-
-
-BUILT_IN_PRESETS: dict[str, EnrichmentConfig] = {
-    "openspec:spec": EnrichmentConfig("colon-header", False, True, True),
-    "openspec:delta-spec": EnrichmentConfig("colon-header", False, True, True),
-    "openspec:design": EnrichmentConfig("inline", True, False, True),
-    "openspec:proposal": EnrichmentConfig("inline", True, False, True),
-    "openspec:tasks": EnrichmentConfig("inline", True, False, True),
-}
-
-
 @dataclass
 class _EntityInfo:
     inline_text: str
@@ -58,7 +40,7 @@ def _block_field(label: str, value: str) -> list:
     return result
 
 
-def _req_block_lines(req: RequirementData) -> list:
+def _req_block_lines(req: RequirementRecord) -> list:
     lines = []
     lines.append(f"**Significance**: {_format_value(req.significance.value)}")
     if req.description:
@@ -81,7 +63,7 @@ def _req_block_lines(req: RequirementData) -> list:
     return lines
 
 
-def _svc_block_lines(svc: SVCData) -> list:
+def _svc_block_lines(svc: SVCRecord) -> list:
     lines = []
     if svc.description:
         lines.extend(_block_field("Description", svc.description))
@@ -96,7 +78,7 @@ def _svc_block_lines(svc: SVCData) -> list:
     return lines
 
 
-def _mvr_block_lines(mvr: MVRData) -> list:
+def _mvr_block_lines(mvr: MVRRecord) -> list:
     lines = []
     if mvr.comment:
         lines.extend(_block_field("Comment", mvr.comment))
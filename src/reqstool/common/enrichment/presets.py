@@ -0,0 +1,20 @@
+# Copyright © LFV
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EnrichmentConfig:
+    trigger: str  # 'colon-header' | 'inline'
+    title_only: bool  # True → skip block injection
+    drop_stubs: bool
+    skip_code_spans: bool
+
+
+BUILT_IN_PRESETS: dict[str, EnrichmentConfig] = {
+    "openspec:spec": EnrichmentConfig("colon-header", False, True, True),
+    "openspec:delta-spec": EnrichmentConfig("colon-header", False, True, True),
+    "openspec:design": EnrichmentConfig("inline", True, False, True),
+    "openspec:proposal": EnrichmentConfig("inline", True, False, True),
+    "openspec:tasks": EnrichmentConfig("inline", True, False, True),
+}
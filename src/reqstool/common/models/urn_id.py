@@ -1,19 +1,40 @@
 # Copyright © LFV
 
-from pydantic import BaseModel, ConfigDict, model_serializer
+import sys
+from typing import Any
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
 
 URN_ID_SEPARATOR: str = ":"
 
+_set_slot = object.__setattr__
+
+
+class UrnId:
+    """Immutable ``urn:id`` pair identifying a requirement, SVC, MVR or test.
+
+    A plain slotted class rather than a pydantic model: UrnIds are created, hashed and
+    compared in every hot loop (row hydration, filtering, statistics), where model
+    validation and pydantic's ``__eq__`` dominated. URNs are interned since a handful of
+    them are shared by every id, and the hash is computed once. Models can still declare
+    UrnId fields: they accept a UrnId, a ``{"urn": ..., "id": ...}`` mapping or an
+    ``"urn:id"`` string, and serialize to the ``"urn:id"`` string.
+    """
 
-class UrnId(BaseModel):
-    model_config = ConfigDict(frozen=True)
+    __slots__ = ("urn", "id", "_hash")
 
     urn: str
     id: str
 
-    @model_serializer
-    def ser_model(self):
-        return str(self)
+    def __init__(self, urn: str, id: str):
+        if not isinstance(urn, str) or not isinstance(id, str):
+            raise TypeError(f"UrnId urn and id must be str, got {type(urn).__name__} and {type(id).__name__}")
+        # sys.intern() refuses str subclasses
+        urn = sys.intern(urn if type(urn) is str else str(urn))
+        _set_slot(self, "urn", urn)
+        _set_slot(self, "id", id)
+        _set_slot(self, "_hash", hash((urn, id)))
 
     @staticmethod
     def instance(urn_id_str: str) -> "UrnId":
@@ -28,6 +49,25 @@ class UrnId(BaseModel):
         else:
             return UrnId(urn=urn, id=id)
 
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"UrnId is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"UrnId is immutable, cannot delete {name!r}")
+
+    def __reduce__(self):
+        return UrnId, (self.urn, self.id)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, UrnId):
+            return NotImplemented
+        return self._hash == other._hash and self.urn == other.urn and self.id == other.id
+
+    def __hash__(self) -> int:
+        return self._hash
+
     def __lt__(self, other: "UrnId"):
         if not isinstance(other, UrnId):
             return NotImplemented
@@ -37,3 +77,30 @@ class UrnId(BaseModel):
 
     def __str__(self) -> str:
         return f"{self.urn}:{self.id}"
+
+    def __repr__(self) -> str:
+        return f"UrnId(urn={self.urn!r}, id={self.id!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        from_mapping = core_schema.no_info_after_validator_function(
+            lambda data: cls(urn=data["urn"], id=data["id"]),
+            core_schema.typed_dict_schema(
+                {
+                    "urn": core_schema.typed_dict_field(core_schema.str_schema()),
+                    "id": core_schema.typed_dict_field(core_schema.str_schema()),
+                }
+            ),
+        )
+        from_string = core_schema.no_info_after_validator_function(cls.__from_string, core_schema.str_schema())
+
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), from_mapping, from_string],
+            serialization=core_schema.to_string_ser_schema(when_used="always"),
+        )
+
+    @classmethod
+    def __from_string(cls, urn_id_str: str) -> "UrnId":
+        if URN_ID_SEPARATOR not in urn_id_str:
+            raise ValueError(f"expected 'urn{URN_ID_SEPARATOR}id', got {urn_id_str!r}")
+        return cls.instance(urn_id_str)
@@ -7,12 +7,14 @@ from datetime import datetime, timezone
 
 from reqstool.common.exceptions import SnapshotReloadError
 from reqstool.common.snapshot_fingerprint import SnapshotFingerprint
+from reqstool.common.utils import Utils
 from reqstool.common.validators.lifecycle_validator import LifecycleValidator
 from reqstool.common.validators.semantic_validator import SemanticValidator
-from reqstool.common.validator_error_holder import ValidationErrorHolder
+from reqstool.common.validator_error_holder import ValidationError, ValidationErrorHolder
 from reqstool.locations.location import LocationInterface
 from reqstool.model_generators.combined_raw_datasets_generator import CombinedRawDatasetsGenerator
 from reqstool.model_generators.parsing_config import ParsingConfig
+from reqstool.models.raw_datasets import RawDataset
 from reqstool.storage.database import RequirementsDatabase
 from reqstool.storage.database_filter_processor import DatabaseFilterProcessor
 from reqstool.storage.requirements_repository import RequirementsRepository
@@ -30,30 +32,61 @@ class ProjectSession:
     A session records a fingerprint of the local files it parsed. Servers without an
     external change signal call `ensure_fresh()` before serving a request; servers driven
     by client file-change notifications (LSP) call `rebuild()` directly.
+
+    Both refresh incrementally: only sources with a changed input file are parsed again.
+    The parsed datasets of every other source — including remote imports, which have no
+    local files and are expensive to fetch — are kept from the previous build and the
+    database is repopulated from them. `build()` always starts from scratch.
+
+    A build parses into a new database and swaps it in only once it is complete, so
+    readers keep being served the previous snapshot meanwhile, from any thread. A build
+    that fails leaves that snapshot in place too: ``ready`` stays True and ``error`` tells
+    that it no longer matches the sources. When builds overlap, the one started last wins:
+    an older build still running when it finishes, or one running when the session is
+    closed, is discarded.
     """
 
-    def __init__(self, location: LocationInterface, parsing_config: ParsingConfig = ParsingConfig()):
+    def __init__(
+        self,
+        location: LocationInterface,
+        parsing_config: ParsingConfig = ParsingConfig(),
+        filter_data: bool = True,
+    ):
         self._location = location
         self._parsing_config = parsing_config
+        self._filter_data = filter_data
         self._db: RequirementsDatabase | None = None
         self._repo: RequirementsRepository | None = None
         self._urn_source_paths: dict[str, dict[str, str]] = {}
         self._ready: bool = False
         self._error: str | None = None
+        self._failure: BaseException | None = None
         self._fingerprint: SnapshotFingerprint | None = None
         self._built_at: str | None = None
         self._initial_urn: str | None = None
+        self._raw_datasets: dict[str, RawDataset] = {}
+        self._validation_errors: list[ValidationError] = []
+        self._env_var_names: frozenset[str] = frozenset()
+        # Bumped by every build started and by close(); a build commits only if it is still current
+        self._generation = 0
         # ensure_fresh() may rebuild the database underneath concurrent request handlers.
         self._lock = threading.RLock()
 
     @property
     def ready(self) -> bool:
+        """Whether a snapshot is loaded; it may be an older one if the last build failed (see ``error``)."""
         return self._ready
 
     @property
     def error(self) -> str | None:
+        """Why the last build failed, or None if it succeeded."""
         return self._error
 
+    @property
+    def failure(self) -> BaseException | None:
+        """The exception (a SystemExit, possibly) the last build failed with, or None if it succeeded."""
+        return self._failure
+
     @property
     def repo(self) -> RequirementsRepository | None:
         return self._repo
@@ -76,45 +109,136 @@ class ProjectSession:
         """URN of the source this session was opened on (imports and implementations excluded)."""
         return self._initial_urn
 
+    @property
+    def validation_errors(self) -> list[ValidationError]:
+        """Semantic validation errors reported while the current snapshot was parsed."""
+        return self._validation_errors
+
+    @property
+    def env_var_names(self) -> frozenset[str]:
+        """Environment variables interpolated into the input files of the current snapshot."""
+        return self._env_var_names
+
+    def copy_database(self) -> RequirementsDatabase | None:
+        """Return an independent copy of the current database, or None if the session is not ready.
+
+        The copy may be modified and must be closed by the caller; the session's own database
+        stays untouched.
+        """
+        with self._lock:
+            return self._db.copy() if self._db is not None else None
+
     def build(self) -> None:
+        self.__build(reusable_datasets={})
+
+    def refresh(self) -> None:
+        """Rebuild, re-parsing only the sources whose tracked input files changed."""
+        with self._lock:
+            reusable_datasets = self.__reusable_datasets()
+        self.__build(reusable_datasets=reusable_datasets)
+
+    def __reusable_datasets(self) -> dict[str, RawDataset]:
+        # After a failed build the fingerprint was restamped without parsing: it no longer
+        # tells which of the kept datasets are out of date
+        if self._fingerprint is None or not self._raw_datasets or self._error is not None:
+            return {}
+
+        stale_urns = self._fingerprint.stale_urns()
+        return {
+            rd.location_key: rd
+            for urn, rd in self._raw_datasets.items()
+            if urn not in stale_urns and rd.location_key is not None
+        }
+
+    def __build(self, reusable_datasets: dict[str, RawDataset]) -> None:
         with self._lock:
+            self._generation += 1
+            generation = self._generation
             previous_fingerprint = self._fingerprint
-            self.close()
-            self._error = None
-            db = RequirementsDatabase()
-            try:
-                holder = ValidationErrorHolder()
-                semantic_validator = SemanticValidator(validation_error_holder=holder)
+            # Reused datasets are not interpolated again, so their variables are carried over
+            reused_env_var_names = self._env_var_names if reusable_datasets else frozenset()
+
+        # Built on whichever thread calls build(), read and closed on the ones serving requests
+        db = RequirementsDatabase(defer_indexes=True, check_same_thread=False)
+        try:
+            holder = ValidationErrorHolder()
+            semantic_validator = SemanticValidator(validation_error_holder=holder)
 
+            with Utils.recording_env_var_reads() as env_var_names:
                 crdg = CombinedRawDatasetsGenerator(
                     initial_location=self._location,
                     semantic_validator=semantic_validator,
                     database=db,
                     parsing_config=self._parsing_config,
+                    reusable_datasets=reusable_datasets,
                 )
-                crd = crdg.combined_raw_datasets
+            crd = crdg.combined_raw_datasets
 
+            if self._filter_data:
                 DatabaseFilterProcessor(db, crd.raw_datasets).apply_filters()
-                LifecycleValidator(RequirementsRepository(db))
-
-                self._db = db
-                self._repo = RequirementsRepository(db)
-                self._urn_source_paths = dict(crd.urn_source_paths)
-                self._fingerprint = crd.fingerprint
-                self._initial_urn = crd.initial_model_urn
-                self._built_at = datetime.now(timezone.utc).isoformat()
-                self._ready = True
-                logger.info("Built project session for %s", self._location)
-            except SystemExit as e:
-                logger.warning("build() called sys.exit(%s) for %s", e.code, self._location)
-                self._error = f"Pipeline error (exit code {e.code})"
-                db.close()
-                self._fingerprint = self.__fingerprint_after_failure(previous_fingerprint)
-            except Exception as e:
-                logger.error("Failed to build project session for %s: %s", self._location, e)
-                self._error = str(e)
+            LifecycleValidator(RequirementsRepository(db))
+        except SystemExit as e:
+            logger.warning("build() called sys.exit(%s) for %s", e.code, self._location)
+            db.close()
+            self.__fail(generation, f"Pipeline error (exit code {e.code})", e, previous_fingerprint)
+            return
+        except Exception as e:
+            logger.error("Failed to build project session for %s: %s", self._location, e)
+            db.close()
+            self.__fail(generation, str(e), e, previous_fingerprint)
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                logger.info("Discarding superseded build of project session for %s", self._location)
                 db.close()
-                self._fingerprint = self.__fingerprint_after_failure(previous_fingerprint)
+                return
+
+            replaced_db = self._db
+            self._db = db
+            self._repo = RequirementsRepository(db)
+            self._urn_source_paths = dict(crd.urn_source_paths)
+            self._fingerprint = crd.fingerprint
+            self._initial_urn = crd.initial_model_urn
+            self._raw_datasets = dict(crd.raw_datasets)
+            self._validation_errors = list(holder.get_errors())
+            self._env_var_names = reused_env_var_names | env_var_names
+            self._built_at = datetime.now(timezone.utc).isoformat()
+            self._error = None
+            self._failure = None
+            self._ready = True
+            self._snapshot_swapped_in()
+            if replaced_db is not None:
+                replaced_db.close()
+
+        reused = sum(1 for rd in crd.raw_datasets.values() if rd.location_key in reusable_datasets)
+        logger.info(
+            "Built project session for %s (%d of %d sources reused)",
+            self._location,
+            reused,
+            len(crd.raw_datasets),
+        )
+
+    def __fail(
+        self,
+        generation: int,
+        error: str,
+        failure: BaseException,
+        previous_fingerprint: SnapshotFingerprint | None,
+    ) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            # The previous snapshot, if any, keeps being served
+            self._error = error
+            self._failure = failure
+            self._fingerprint = self.__fingerprint_after_failure(previous_fingerprint)
+
+    def _snapshot_swapped_in(self) -> None:
+        """Called with the lock held right after a new snapshot replaced the previous one.
+
+        Subclasses derive their own per-snapshot state here.
+        """
 
     @staticmethod
     def __fingerprint_after_failure(previous: SnapshotFingerprint | None) -> SnapshotFingerprint | None:
@@ -126,7 +250,7 @@ class ProjectSession:
         return previous.restamped() if previous is not None else None
 
     def rebuild(self) -> None:
-        self.build()
+        self.refresh()
 
     def ensure_fresh(self) -> bool:
         """Rebuild if the local input files no longer match the loaded snapshot.
@@ -139,20 +263,21 @@ class ProjectSession:
             if self._fingerprint is not None:
                 stale_reasons = self._fingerprint.stale_reasons(limit=5)
                 if not stale_reasons:
-                    if self._ready:
+                    if self._ready and self._error is None:
                         return False
                     raise SnapshotReloadError(f"reqstool project is not loaded: {self._error}")
                 logger.info("Reloading snapshot for %s: %s", self._location, "; ".join(stale_reasons))
 
-            self.build()
+            self.refresh()
 
-            if not self._ready:
+            if self._error is not None:
                 raise SnapshotReloadError(f"reqstool project sources changed but reloading them failed: {self._error}")
 
             return True
 
     def close(self) -> None:
         with self._lock:
+            self._generation += 1
             if self._db is not None:
                 self._db.close()
                 self._db = None
@@ -161,4 +286,7 @@ class ProjectSession:
             self._fingerprint = None
             self._built_at = None
             self._initial_urn = None
+            self._raw_datasets = {}
+            self._validation_errors = []
+            self._env_var_names = frozenset()
             self._ready = False
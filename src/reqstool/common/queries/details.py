@@ -4,7 +4,11 @@
 from reqstool_python_decorators.decorators.decorators import Requirements
 
 from reqstool.common.models.urn_id import UrnId
-from reqstool.services.statistics_service import compute_requirement_status, requirement_to_dict
+from reqstool.services.statistics_service import (
+    compute_requirement_status,
+    compute_requirement_statuses,
+    requirement_to_dict,
+)
 from reqstool.storage.requirements_repository import RequirementsRepository
 
 
@@ -25,14 +29,13 @@ def get_requirement_details(
 ) -> dict | None:
     initial_urn = repo.get_initial_urn()
     urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-    all_reqs = repo.get_all_requirements()
-    req = all_reqs.get(urn_id)
+    req = repo.get_requirement(urn_id)
     if req is None:
         return None
 
     svc_urn_ids = repo.get_svcs_for_req(req.id)
-    all_svcs = repo.get_all_svcs()
-    svcs = [all_svcs[uid] for uid in svc_urn_ids if uid in all_svcs]
+    svcs_by_id = repo.get_svcs(svc_urn_ids)
+    svcs = [svcs_by_id[uid] for uid in svc_urn_ids if uid in svcs_by_id]
 
     impls = repo.get_annotations_impls_for_req(req.id)
     references = [str(ref_id) for rd in (req.references or []) for ref_id in rd.requirement_ids]
@@ -78,20 +81,19 @@ def get_svc_details(
 ) -> dict | None:
     initial_urn = repo.get_initial_urn()
     urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-    all_svcs = repo.get_all_svcs()
-    svc = all_svcs.get(urn_id)
+    svc = repo.get_svc(urn_id)
     if svc is None:
         return None
 
-    all_mvrs = repo.get_all_mvrs()
     mvr_urn_ids = repo.get_mvrs_for_svc(svc.id)
-    mvrs = [all_mvrs[uid] for uid in mvr_urn_ids if uid in all_mvrs]
+    mvrs_by_id = repo.get_mvrs(mvr_urn_ids)
+    mvrs = [mvrs_by_id[uid] for uid in mvr_urn_ids if uid in mvrs_by_id]
     superseded_ids = {m.id for m in repo.get_superseded_mvrs_for_svc(svc.id)}
 
     test_annotations = repo.get_annotations_tests_for_svc(svc.id)
     test_results = repo.get_test_results_for_annotations(svc.id.urn, test_annotations)
 
-    all_reqs = repo.get_all_requirements()
+    linked_reqs = repo.get_requirements(svc.requirement_ids)
 
     paths = urn_source_paths or {}
     return {
@@ -111,8 +113,8 @@ def get_svc_details(
             {
                 "id": r.id,
                 "urn": r.urn,
-                "title": all_reqs[r].title if r in all_reqs else "",
-                "lifecycle_state": all_reqs[r].lifecycle.state.value if r in all_reqs else "",
+                "title": linked_reqs[r].title if r in linked_reqs else "",
+                "lifecycle_state": linked_reqs[r].lifecycle.state.value if r in linked_reqs else "",
             }
             for r in svc.requirement_ids
         ],
@@ -147,8 +149,7 @@ def get_mvr_details(
 ) -> dict | None:
     initial_urn = repo.get_initial_urn()
     urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-    all_mvrs = repo.get_all_mvrs()
-    mvr = all_mvrs.get(urn_id)
+    mvr = repo.get_mvr(urn_id)
     if mvr is None:
         return None
 
@@ -201,7 +202,7 @@ def get_requirement_status(
     so this surface can never drift from `status`/`report`/`export`."""
     initial_urn = repo.get_initial_urn()
     urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-    req = repo.get_all_requirements().get(urn_id)
+    req = repo.get_requirement(urn_id)
     if req is None:
         return None
 
@@ -220,15 +221,15 @@ def get_requirements_status_all(
     """Batch status for all requirements. Optionally scoped to a URN. Delegates to the
     shared verdict computation so this surface can never drift from `status`/`report`/`export`."""
     reqs = repo.get_all_requirements(urn=urn)
+    statuses = compute_requirement_statuses(repo, reqs.values(), include_post_build=include_post_build)
     result = []
     for req in reqs.values():
-        status = compute_requirement_status(req, repo, include_post_build=include_post_build)
         result.append(
             {
                 "id": req.id.id,
                 "urn": req.id.urn,
                 "lifecycle_state": req.lifecycle.state.value,
-                **requirement_to_dict(status),
+                **requirement_to_dict(statuses[req.id]),
             }
         )
     return result
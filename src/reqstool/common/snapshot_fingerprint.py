@@ -6,16 +6,19 @@ A long-lived server (MCP) parses once and then serves that snapshot. The fingerp
 records what was read — and what was looked for but absent — so the server can tell,
 cheaply and per request, whether the snapshot still matches the working tree.
 
-Only local sources are fingerprinted. Remote sources (git/maven/npm/pypi) are
-version-pinned downloads materialized into a temp directory that is removed once
-parsing finishes, so there is nothing stable to stat.
+Only local sources are fingerprinted; local archives (zip/tgz) are stamped as a whole.
+Remote sources (git/maven/npm/pypi) are downloads materialized into a temp directory
+that is removed once parsing finishes, so there is nothing stable to stat.
+
+Fingerprints round-trip through plain dicts so the on-disk snapshot cache can store them
+alongside the database they describe.
 """
 
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +119,24 @@ class SnapshotFingerprint:
             globs.extend(part.globs)
         return SnapshotFingerprint(stamps=tuple(stamps), globs=tuple(globs))
 
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "SnapshotFingerprint":
+        return SnapshotFingerprint(
+            stamps=tuple(FileStamp(**stamp) for stamp in data.get("stamps", ())),
+            globs=tuple(
+                GlobSpec(
+                    root=g["root"],
+                    pattern=g["pattern"],
+                    urn=g["urn"],
+                    matched=tuple(FileStamp(**stamp) for stamp in g.get("matched", ())),
+                )
+                for g in data.get("globs", ())
+            ),
+        )
+
     @property
     def tracked_file_count(self) -> int:
         return len(self.stamps) + sum(len(g.matched) for g in self.globs)
@@ -133,6 +154,10 @@ class SnapshotFingerprint:
 
         return reasons
 
+    def stale_urns(self) -> Set[str]:
+        """URNs with at least one tracked input that no longer matches disk."""
+        return {checkable.urn for checkable in (*self.stamps, *self.globs) if checkable.changed_on_disk() is not None}
+
     def is_stale(self) -> bool:
         return bool(self.stale_reasons(limit=1))
 
@@ -5,12 +5,20 @@ import os
 import re
 import tarfile
 import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from importlib.metadata import version
 from itertools import chain
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, Generator, Iterable, List, Optional, Sequence, Set
 from zipfile import ZipFile
 
+try:
+    import fcntl
+except ImportError:  # Windows: file_lock() degrades to no locking between processes
+    fcntl = None
+
 import expandvars
 import requests
 from packaging.version import InvalidVersion, Version as PkgVersion
@@ -32,6 +40,51 @@ class Utils:
     # ``# yaml-language-server: $schema=...`` directive (and regexes, prices,
     # etc.) where a stray ``$`` must not be treated as a variable reference.
     _ENV_VAR_PATTERN = re.compile(r"\$\{[^{}]*\}")
+    _ENV_VAR_NAME_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)")
+
+    # Names read by interpolate_env_vars() while a recording_env_var_reads() block is active. A
+    # context variable, so that builds on different threads record separately; work a build hands
+    # to a pool has to run in a copy of its context (contextvars.copy_context()) to be recorded.
+    _env_var_reads: ContextVar[Optional[Set[str]]] = ContextVar("reqstool_env_var_reads", default=None)
+
+    @staticmethod
+    @contextmanager
+    def recording_env_var_reads() -> Generator[Set[str], None, None]:
+        """Collect the names of environment variables interpolated into YAML input within the block.
+
+        The parsed result depends on these variables as much as on the files themselves,
+        so anything caching that result (the snapshot cache) has to track them too.
+        """
+        outer = Utils._env_var_reads.get()
+        reads: Set[str] = set()
+        token = Utils._env_var_reads.set(reads)
+        try:
+            yield reads
+        finally:
+            Utils._env_var_reads.reset(token)
+            if outer is not None:
+                outer.update(reads)
+
+    @staticmethod
+    @contextmanager
+    def file_lock(path: str, shared: bool = False, blocking: bool = True) -> Generator[None, None, None]:
+        """Hold a lock on ``path`` (created if missing) for the duration of the block.
+
+        Used to serialise processes and threads sharing an on-disk cache. The lock is exclusive
+        unless ``shared``, which lets several readers hold it at once. Unless ``blocking``, raises
+        ``BlockingIOError`` instead of waiting when the lock is taken. Where flock is not
+        available the block runs unlocked.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a") as lock_file:
+            if fcntl is not None:
+                operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                fcntl.flock(lock_file, operation if blocking else operation | fcntl.LOCK_NB)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
 
     @staticmethod
     def interpolate_env_vars(text: str, source: str | None = None) -> str:
@@ -59,6 +112,11 @@ class Utils:
         """
 
         def _expand(match: "re.Match[str]") -> str:
+            reads = Utils._env_var_reads.get()
+            if reads is not None:
+                name = Utils._ENV_VAR_NAME_PATTERN.match(match.group(0))
+                if name is not None:
+                    reads.add(name.group(1))
             try:
                 return expandvars.expand(match.group(0), nounset=True)
             except expandvars.ExpandvarsException as e:
@@ -249,17 +307,21 @@ class TempDirectoryManager:
     def __init__(self):
         self._tmpdir = tempfile.TemporaryDirectory()
         self._count = 0
+        self._count_lock = threading.Lock()
 
     def get_path(self) -> Path:
         return Path(self._tmpdir.name)
 
     def get_suffix_path(self, suffix: str) -> Path:
-        new_path = Path(self._tmpdir.name) / str(self._count) / suffix
+        # Sources are fetched from several threads at once; each must get its own directory
+        with self._count_lock:
+            count = self._count
+            self._count += 1
+        new_path = Path(self._tmpdir.name) / str(count) / suffix
         root = Path(self._tmpdir.name).resolve()
         if not new_path.resolve().is_relative_to(root):
             raise ValueError(f"suffix {suffix!r} would escape the managed temp directory")
         new_path.mkdir(parents=True, exist_ok=True)
-        self._count += 1
         return new_path
 
     def cleanup(self):
@@ -6,9 +6,7 @@ import logging
 
 from reqstool.common.models.lifecycle import LIFECYCLESTATE, lifecycle_state_sort_order
 from reqstool.common.models.urn_id import UrnId
-from reqstool.models.annotations import AnnotationData
-from reqstool.models.requirements import RequirementData
-from reqstool.models.svcs import SVCData
+from reqstool.storage.records import AnnotationRecord, RequirementRecord, SVCRecord
 from reqstool.storage.requirements_repository import RequirementsRepository
 from reqstool_python_decorators.decorators.decorators import Requirements
 
@@ -46,8 +44,8 @@ class LifecycleValidator:
 
     def _check_defunct_annotations(
         self,
-        annotations: dict[UrnId, list[AnnotationData]],
-        collection_to_check: dict[UrnId, RequirementData | SVCData],
+        annotations: dict[UrnId, list[AnnotationRecord]],
+        collection_to_check: dict[UrnId, RequirementRecord | SVCRecord],
     ):
         """
         Creates warnings for defunct requirements or SVCs that are annotated in the code.
@@ -61,7 +59,7 @@ class LifecycleValidator:
                     Warning(state, f"Urn {urn_id} is used in an annotation despite being {state.value}.")
                 )
 
-    def _check_mvr_references(self, svcs: dict[UrnId, SVCData]):
+    def _check_mvr_references(self, svcs: dict[UrnId, SVCRecord]):
         """
         Creates warnings if any MVR contains a reference to defunct SVCs
         """
@@ -87,7 +85,7 @@ class LifecycleValidator:
                     )
                 )
 
-    def _check_svc_references(self, requirements: dict[UrnId, RequirementData], svcs: dict[UrnId, SVCData]):
+    def _check_svc_references(self, requirements: dict[UrnId, RequirementRecord], svcs: dict[UrnId, SVCRecord]):
         """
         Creates warnings if any defunct requirement is referenced by active SVCs
         """
@@ -58,6 +58,27 @@ class SemanticValidator:
 
         return errors
 
+    def get_errors(self) -> List[ValidationError]:
+        return self._validation_error_holder.get_errors()
+
+    def add_errors(self, errors: List[ValidationError]) -> None:
+        """Take over errors reported to another validator, e.g. one used while parsing on a worker thread
+
+        Args:
+            errors: the validation errors to add, in the order they should be reported
+        """
+        self._validation_error_holder.add_errors(errors)
+
+    def replay_errors(self, errors: List[ValidationError]) -> None:
+        """Re-report errors recorded when a cached snapshot was built, as validate_post_parsing() would have
+
+        Args:
+            errors: the validation errors stored with the snapshot
+        """
+        self._validation_error_holder.add_errors(errors)
+
+        self._log_all_errors()
+
     def _log_all_errors(self):
         errors = self._validation_error_holder.get_errors()
 
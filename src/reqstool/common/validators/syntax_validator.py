@@ -1,16 +1,27 @@
 # Copyright © LFV
 
+import functools
 import json
 import logging
 from dataclasses import dataclass, field
 from enum import Enum, unique
 from importlib.resources import files
+from typing import Any, Callable, Optional, TypeVar
 
-from jsonschema import Draft202012Validator
-from referencing import Registry, Resource
+import pydantic
 from reqstool_python_decorators.decorators.decorators import Requirements
 
 import reqstool.resources.schemas.v1
+from reqstool.model_generators.parsing_config import ValidationStrategy
+
+try:
+    import fastjsonschema
+except ImportError:  # optional: without it every document is validated by jsonschema alone
+    fastjsonschema = None
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=pydantic.BaseModel)
 
 
 @dataclass
@@ -36,21 +47,23 @@ class JsonSchemaTypes(Enum):
 
 
 class SyntaxValidator:
-    registry = Registry()
-    resource = Resource.from_contents(JsonSchemaTypes.COMMON.value.schema)
-    registry = resource @ registry
-    registry = registry.with_resource(uri="common.schema.json", resource=resource)
+    # jsonschema is imported by the methods that use it: importing it takes far longer than
+    # a short command run, and documents that the compiled validator or the generated
+    # models accept never need it.
 
     @Requirements("PARSE_0001")
     @staticmethod
     def is_valid_data(json_schema_type: JsonSchemaTypes, data: dict, urn: str) -> bool:
-        jsonvalidator_draft202012 = Draft202012Validator(
-            schema=json_schema_type.value.schema,
-            registry=SyntaxValidator.registry,
-            format_checker=Draft202012Validator.FORMAT_CHECKER,
-        )
-
-        validation_errors = jsonvalidator_draft202012.iter_errors(data)
+        compiled_validator = SyntaxValidator.compiled_validator_for(json_schema_type)
+        if compiled_validator is not None:
+            try:
+                compiled_validator(data)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                # jsonschema has the final say and renders the messages
+                pass
+
+        validation_errors = SyntaxValidator.validator_for(json_schema_type).iter_errors(data)
         has_validation_errors: bool = False
 
         for index, error in enumerate(validation_errors):
@@ -62,3 +75,109 @@ class SyntaxValidator:
             logging.error(message)
 
         return not has_validation_errors
+
+    @staticmethod
+    def validated_model(
+        model_type: type[M],
+        json_schema_type: JsonSchemaTypes,
+        data: dict,
+        urn: str,
+        validation_strategy: ValidationStrategy = ValidationStrategy.JSON_SCHEMA,
+    ) -> Optional[M]:
+        """Validate ``data`` as ``validation_strategy`` says and return it as ``model_type``.
+
+        Returns None, with the errors logged as by is_valid_data(), if ``data`` is rejected. With
+        ValidationStrategy.PYDANTIC only what the model rejects is: ``data`` that passes the model
+        is returned without ever being checked against its schema, even where the schema would
+        reject it.
+        """
+        if validation_strategy is ValidationStrategy.PYDANTIC:
+            try:
+                return model_type.model_validate(data)
+            except pydantic.ValidationError:
+                if SyntaxValidator.is_valid_data(json_schema_type=json_schema_type, data=data, urn=urn):
+                    # Stricter than the schema: fail as the JSON_SCHEMA strategy would
+                    raise
+                return None
+
+        if not SyntaxValidator.is_valid_data(json_schema_type=json_schema_type, data=data, urn=urn):
+            return None
+        return model_type.model_validate(data)
+
+    @staticmethod
+    @functools.cache
+    def registry():
+        """The ``referencing`` registry resolving $refs to common.schema.json, built once per process."""
+        from referencing import Registry, Resource
+
+        resource = Resource.from_contents(JsonSchemaTypes.COMMON.value.schema)
+        registry = resource @ Registry()
+        return registry.with_resource(uri="common.schema.json", resource=resource)
+
+    @staticmethod
+    @functools.cache
+    def validator_for(json_schema_type: JsonSchemaTypes):
+        """The prepared jsonschema ``Draft202012Validator`` for ``json_schema_type``, built once per process."""
+        from jsonschema import Draft202012Validator
+
+        return Draft202012Validator(
+            schema=json_schema_type.value.schema,
+            registry=SyntaxValidator.registry(),
+            format_checker=Draft202012Validator.FORMAT_CHECKER,
+        )
+
+    @staticmethod
+    @functools.cache
+    def compiled_validator_for(json_schema_type: JsonSchemaTypes) -> Optional[Callable[[Any], Any]]:
+        """A code-generated validator for ``json_schema_type``, or None if fastjsonschema is unavailable.
+
+        fastjsonschema implements draft 2019-09 at most, so the schema is first rewritten to
+        keep its 2020-12 meaning (see _without_ref_siblings()) and formats are checked by
+        jsonschema's own format checker. A schema that still cannot be compiled is left to
+        jsonschema.
+        """
+        if fastjsonschema is None:
+            return None
+
+        from jsonschema import Draft202012Validator
+
+        format_checker = Draft202012Validator.FORMAT_CHECKER
+        try:
+            return fastjsonschema.compile(
+                _without_ref_siblings(json_schema_type.value.schema),
+                handlers={"": _bundled_schema, "https": _bundled_schema},
+                formats={
+                    name: functools.partial(format_checker.conforms, format=name) for name in format_checker.checkers
+                },
+                use_default=False,
+            )
+        except (fastjsonschema.JsonSchemaDefinitionException, LookupError) as e:
+            logger.debug("Not compiling %s, using jsonschema only: %s", json_schema_type.value.short_uri, e)
+            return None
+
+
+def _bundled_schema(uri: str) -> dict:
+    """Resolve a $ref to another schema file to the copy shipped with reqstool, never the network."""
+    short_uri = uri.rsplit("/", 1)[-1]
+    for json_schema_type in JsonSchemaTypes:
+        if json_schema_type.value.short_uri == short_uri:
+            return _without_ref_siblings(json_schema_type.value.schema)
+    raise LookupError(f"no bundled schema for {uri}")
+
+
+def _without_ref_siblings(schema: Any) -> Any:
+    """Move keywords next to a $ref into an allOf with it.
+
+    Since 2019-09 they apply together with the $ref, but fastjsonschema follows the older
+    drafts and ignores them.
+    """
+    if isinstance(schema, list):
+        return [_without_ref_siblings(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    result = {key: _without_ref_siblings(value) for key, value in schema.items()}
+    if "$ref" in result and len(result) > 1:
+        ref = result.pop("$ref")
+        result["allOf"] = [{"$ref": ref}] + result.get("allOf", [])
+    return result
@@ -0,0 +1,77 @@
+# Copyright © LFV
+
+"""Safe YAML loading that also records where each item's ``id`` is in the source.
+
+The LSP needs the line and columns of every requirement, SVC and MVR id. A round-trip
+(``typ="rt"``) parse provides them, but it is several times slower than the safe loader
+and would be a second parse of the same file. Instead, the safe constructor here notes
+the position of the ``id`` value of every mapping it builds, keyed by the identity of the
+constructed dict, so one safe parse yields both the plain data and the positions.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ruamel.yaml import YAML
+from ruamel.yaml.constructor import SafeConstructor
+from ruamel.yaml.nodes import ScalarNode
+
+# line, start column, end column (0-based) of an item's id value
+SourcePosition = Tuple[int, int, int]
+
+
+class _IdPositionConstructor(SafeConstructor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.id_positions: Dict[int, Tuple[int, int]] = {}
+
+    def construct_yaml_map(self, node):
+        constructing = SafeConstructor.construct_yaml_map(self, node)
+        data = next(constructing)
+
+        for key_node, value_node in node.value:
+            if isinstance(key_node, ScalarNode) and key_node.value == "id" and isinstance(value_node, ScalarNode):
+                self.id_positions[id(data)] = (value_node.start_mark.line, value_node.start_mark.column)
+
+        yield data
+        for _ in constructing:
+            pass
+
+
+_IdPositionConstructor.add_constructor("tag:yaml.org,2002:map", _IdPositionConstructor.construct_yaml_map)
+
+
+class IdPositions:
+    """Positions of ``id`` values recorded while loading a document; see load_yaml()."""
+
+    def __init__(self, positions: Optional[Dict[int, Tuple[int, int]]] = None):
+        self._positions = positions or {}
+
+    def of_items(self, items: Optional[Iterable[Any]]) -> Dict[str, SourcePosition]:
+        """Map the id of each item in ``items`` (a list from the loaded data) to its source position."""
+        result: Dict[str, SourcePosition] = {}
+        for item in items or []:
+            if not isinstance(item, dict) or "id" not in item:
+                continue
+            position = self._positions.get(id(item))
+            if position is None:
+                continue
+            id_text = str(item["id"])
+            line, col = position
+            result[id_text] = (line, col, col + len(id_text))
+        return result
+
+
+def load_yaml(text: str, track_positions: bool = False) -> Tuple[Any, IdPositions]:
+    """Safe-load ``text``; with ``track_positions``, also record where every item's id is.
+
+    Positions refer to ``text`` as given, so when it has been through environment variable
+    interpolation they are those of the interpolated text (which only differ from the file
+    on lines where a variable was expanded).
+    """
+    yaml = YAML(typ="safe")
+    if not track_positions:
+        return yaml.load(text), IdPositions()
+
+    yaml.Constructor = _IdPositionConstructor
+    data = yaml.load(text)
+    return data, IdPositions(yaml.constructor.id_positions)
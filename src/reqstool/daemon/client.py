@@ -0,0 +1,131 @@
+# Copyright © LFV
+
+"""Thin client forwarding a reqstool invocation to a running ``reqstool daemon``.
+
+``main()`` is the ``reqstool`` entry point. With ``$REQSTOOL_DAEMON_SOCKET`` set, commands
+the daemon runs are forwarded to it; everything else, and everything when no daemon is
+listening, goes to ``reqstool.command.main()``. Only the standard library is imported
+here: the point of the daemon is that a forwarded invocation does not pay for importing
+(or parsing) anything.
+
+The protocol is newline-delimited JSON over a Unix domain socket. The client sends one
+request, ``{"argv": [...], "cwd": ..., "env": {...}}``, and the daemon answers with any
+number of ``{"stdout": ...}`` and ``{"stderr": ...}`` messages, sent while the command runs
+and in the order it wrote them, followed by a final ``{"exit_code": ...}``.
+"""
+
+import getpass
+import json
+import logging
+import os
+import shutil
+import socket
+import sys
+import tempfile
+from typing import IO, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DAEMON_SOCKET_ENV = "REQSTOOL_DAEMON_SOCKET"
+
+# Commands the daemon runs; the others are long-running servers or read stdin
+DAEMON_COMMANDS = frozenset({"report", "report-asciidoc", "export", "validate", "status"})
+_LOCAL_COMMANDS = frozenset({"lsp", "mcp", "enrich", "daemon"})
+
+_RECV_SIZE = 64 * 1024
+
+
+def default_socket_path() -> str:
+    """``$REQSTOOL_DAEMON_SOCKET``, or a per-user socket in the runtime (or temp) directory."""
+    configured = os.environ.get(DAEMON_SOCKET_ENV)
+    if configured:
+        return configured
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"reqstool-daemon-{getpass.getuser()}.sock")
+
+
+def is_forwardable(argv: List[str]) -> bool:
+    """Whether ``argv`` (without the program name) selects a command the daemon runs."""
+    for arg in argv:
+        if arg in DAEMON_COMMANDS:
+            return True
+        if arg in _LOCAL_COMMANDS:
+            return False
+    return False
+
+
+def send_message(stream: IO[bytes], message: dict) -> None:
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def read_messages(stream: IO[bytes]) -> Iterator[dict]:
+    for line in stream:
+        yield json.loads(line)
+
+
+def forward(argv: List[str], socket_path: str) -> Optional[int]:
+    """Run ``argv`` on the daemon listening on ``socket_path``, relaying its output.
+
+    Returns the exit code, or None if no daemon could be reached; the caller then runs the
+    command itself. A daemon that goes away midway is reported as a failed run (exit 1),
+    since part of the output may already have been written.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    env = dict(os.environ)
+    if sys.stdout.isatty():
+        # The daemon has no terminal of its own to size console output by
+        size = shutil.get_terminal_size()
+        env.setdefault("COLUMNS", str(size.columns))
+        env.setdefault("LINES", str(size.lines))
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(socket_path)
+        except OSError as e:
+            logger.debug("No reqstool daemon at %s (%s); running locally", socket_path, e)
+            return None
+
+        with sock.makefile("rwb", buffering=_RECV_SIZE) as stream:
+            send_message(stream, {"argv": argv, "cwd": os.getcwd(), "env": env})
+            exit_code = _relay(stream)
+    except (OSError, ValueError) as e:
+        print(f"reqstool: lost connection to the daemon at {socket_path}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        sock.close()
+
+    if exit_code is None:
+        print(f"reqstool: the daemon at {socket_path} closed the connection without a result", file=sys.stderr)
+        return 1
+    return exit_code
+
+
+def _relay(stream: IO[bytes]) -> Optional[int]:
+    """Write the daemon's output to stdout and stderr as it arrives; return its exit code."""
+    for message in read_messages(stream):
+        # Flushed one by one, so that stdout and stderr interleave as the command wrote them
+        if "stdout" in message:
+            sys.stdout.write(message["stdout"])
+            sys.stdout.flush()
+        elif "stderr" in message:
+            sys.stderr.write(message["stderr"])
+            sys.stderr.flush()
+        elif "exit_code" in message:
+            return int(message["exit_code"])
+    return None
+
+
+def main():
+    socket_path = os.environ.get(DAEMON_SOCKET_ENV)
+    if socket_path and is_forwardable(sys.argv[1:]):
+        exit_code = forward(sys.argv[1:], socket_path)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from reqstool.command import main as command_main
+
+    command_main()
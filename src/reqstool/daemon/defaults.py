@@ -0,0 +1,6 @@
+# Copyright © LFV
+
+"""Defaults shared by the daemon and its command line, kept free of imports so both can use them."""
+
+# Parsed projects a daemon keeps in memory by default
+DEFAULT_MAX_SESSIONS = 8
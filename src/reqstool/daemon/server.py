@@ -0,0 +1,268 @@
+# Copyright © LFV
+
+"""``reqstool daemon``: runs CLI invocations forwarded by the thin client against warm sessions.
+
+Requests are handled one at a time. Each runs with the client's working directory and
+environment, with standard output, standard error and logging streamed back as they are
+written, exactly as the command would have run in the client's own process — except that
+the location is served from a warm ProjectSession in the SessionPool instead of being parsed
+from scratch.
+"""
+
+import io
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from typing import Callable, Dict, Generator, List, Optional, TextIO
+
+from reqstool.command import Command, run
+from reqstool.daemon.client import (
+    DAEMON_COMMANDS,
+    DAEMON_SOCKET_ENV,
+    read_messages,
+    send_message,
+)
+from reqstool.daemon.defaults import DEFAULT_MAX_SESSIONS
+from reqstool.daemon.session_pool import SessionPool
+
+logger = logging.getLogger(__name__)
+
+# Largest piece of output sent in one message
+_OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# Requests are handled one at a time, so a client that connects and then sends nothing (or
+# stops reading its result) must not hold up every other client for longer than this
+_REQUEST_TIMEOUT_SECONDS = 10.0
+_RESULT_TIMEOUT_SECONDS = 120.0
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+    # Applied to the accepted socket by setup()
+    timeout = _REQUEST_TIMEOUT_SECONDS
+    _client_gone = False
+
+    def handle(self):
+        try:
+            request = next(read_messages(self.rfile))
+            argv, cwd, env = list(request["argv"]), str(request["cwd"]), dict(request["env"])
+        except OSError as e:
+            logger.warning("Dropping daemon connection without a request: %s", e)
+            return
+        except (StopIteration, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring malformed daemon request: %s", e)
+            return
+
+        # The client may be relaying the output to a pager the user has not scrolled yet
+        self.connection.settimeout(_RESULT_TIMEOUT_SECONDS)
+        exit_code = self.server.run_request(argv=argv, cwd=cwd, env=env, send=self.__send)
+        self.__send({"exit_code": exit_code})
+
+    def __send(self, message: dict) -> None:
+        # A client that went away no longer gets output, but the command still runs to the end
+        if self._client_gone:
+            return
+        try:
+            send_message(self.wfile, message)
+        except OSError as e:
+            self._client_gone = True
+            logger.info("Client went away before its result was sent: %s", e)
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: str, session_pool: SessionPool):
+        self.session_pool = session_pool
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_bind(self):
+        # The client hands over its environment, tokens included: only its owner may connect
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+
+    def run_request(self, argv: List[str], cwd: str, env: Dict[str, str], send: Callable[[dict], None]) -> int:
+        """Run ``argv`` as the client would have and return its exit code.
+
+        Its output is passed to ``send`` as ``{"stdout": ...}`` and ``{"stderr": ...}`` messages
+        while it runs, in the order it was written.
+        """
+        logger.info("Running %s in %s", argv, cwd)
+        relay = _OutputRelay(send)
+        try:
+            with (
+                _client_environment(cwd, env),
+                redirect_stdout(relay.stdout),
+                redirect_stderr(relay.stderr),
+                _logging_to(relay.stderr),
+            ):
+                exit_code = self.__run(argv)
+        except OSError as e:
+            # The client's working directory may be gone
+            relay.stderr.write(f"reqstool daemon: {e}\n")
+            exit_code = 1
+        finally:
+            relay.flush()
+        return exit_code
+
+    def __run(self, argv: List[str]) -> int:
+        command = Command()
+        args = None
+        try:
+            args = command.get_arguments(argv)
+            if args.command not in DAEMON_COMMANDS:
+                print(f"reqstool daemon: '{args.command}' cannot be run by the daemon", file=sys.stderr)
+                return 2
+            logging.getLogger().setLevel(getattr(logging, args.log.upper(), logging.WARNING))
+            args.database_provider = self.session_pool.database
+            return run(command, args)
+        except SystemExit as e:
+            return _exit_code(e)
+        except Exception:
+            traceback.print_exc()
+            return 1
+        finally:
+            # Without the process exiting, an output file is only complete once closed
+            output = getattr(args, "output", None)
+            if output is not None and output is not sys.stdout and not output.closed:
+                output.close()
+
+
+class _OutputRelay:
+    """Sends what a request writes to its stdout and stderr to the client as messages.
+
+    Output is line buffered, as on a terminal. Both streams share one buffer, so the client
+    receives warnings and output in the order they were written.
+    """
+
+    def __init__(self, send: Callable[[dict], None]):
+        self._send = send
+        self._lock = threading.RLock()  # logging may write from worker threads
+        self._stream_name: Optional[str] = None
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self.stdout = _RelayedStream(self, "stdout")
+        self.stderr = _RelayedStream(self, "stderr")
+
+    def write(self, stream_name: str, text: str) -> None:
+        with self._lock:
+            if stream_name != self._stream_name:
+                self.flush()
+                self._stream_name = stream_name
+            self._pending.append(text)
+            self._pending_size += len(text)
+            if "\n" in text or self._pending_size >= _OUTPUT_CHUNK_SIZE:
+                self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            text = "".join(self._pending)
+            self._pending, self._pending_size = [], 0
+            for start in range(0, len(text), _OUTPUT_CHUNK_SIZE):
+                self._send({self._stream_name: text[start : start + _OUTPUT_CHUNK_SIZE]})  # noqa: E203
+
+
+class _RelayedStream(io.TextIOBase):
+    def __init__(self, relay: _OutputRelay, name: str):
+        self._relay = relay
+        self._name = name
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._relay.write(self._name, text)
+        return len(text)
+
+    def flush(self) -> None:
+        self._relay.flush()
+
+
+def _exit_code(e: SystemExit) -> int:
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    print(e.code, file=sys.stderr)
+    return 1
+
+
+@contextmanager
+def _client_environment(cwd: str, env: Dict[str, str]) -> Generator[None, None, None]:
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    os.chdir(cwd)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+@contextmanager
+def _logging_to(stream: TextIO) -> Generator[None, None, None]:
+    """Send log records to ``stream`` only, at the level the request asks for (WARNING until it is parsed)."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    root.handlers = [handler]
+    root.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.remove(socket_path)
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"a reqstool daemon is already listening on {socket_path}")
+
+
+def start_daemon(socket_path: str, max_sessions: int = DEFAULT_MAX_SESSIONS) -> None:
+    """Serve forwarded invocations on ``socket_path`` until interrupted or terminated."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("the reqstool daemon requires Unix domain sockets, which this platform lacks")
+
+    _remove_stale_socket(socket_path)
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(socket_dir, exist_ok=True)
+
+    session_pool = SessionPool(max_sessions=max_sessions)
+    server = DaemonServer(socket_path, session_pool)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    print(
+        f"reqstool daemon listening on {socket_path}\n"
+        f"Set {DAEMON_SOCKET_ENV}={socket_path} for reqstool to use it.",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        session_pool.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
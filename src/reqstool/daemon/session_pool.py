@@ -0,0 +1,146 @@
+# Copyright © LFV
+
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Generator, Optional
+
+from reqstool.common.exceptions import SnapshotReloadError
+from reqstool.common.project_session import ProjectSession
+from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.daemon.defaults import DEFAULT_MAX_SESSIONS
+from reqstool.locations.location import LocationInterface
+from reqstool.model_generators.parsing_config import ParsingConfig
+from reqstool.storage.database import RequirementsDatabase
+from reqstool.storage.snapshot_cache import SnapshotCache, env_digest
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PooledSession:
+    session: ProjectSession
+    # Values of the interpolated environment variables the snapshot was parsed with
+    env_digest: str
+
+
+class SessionPool:
+    """Warm ProjectSessions kept by the daemon, one per location, filter flag and parsing config.
+
+    Sessions are keyed like SnapshotCache entries (see ``SnapshotCache.key_for()``), so the
+    working directory that relative paths resolve against is part of the key. Before a
+    session is used its local input files are checked as in ``ProjectSession.ensure_fresh()``
+    and the environment variables interpolated into them are compared with the values it was
+    parsed with; either change reloads it. Remote sources are fetched once per session.
+
+    The least recently used session is closed once more than ``max_sessions`` are open.
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        self._max_sessions = max(1, max_sessions)
+        self._sessions: OrderedDict[str, _PooledSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def database(
+        self,
+        location: LocationInterface,
+        filter_data: bool,
+        parsing_config: ParsingConfig,
+        semantic_validator: SemanticValidator,
+    ) -> Optional[RequirementsDatabase]:
+        """Return a private copy of the up-to-date database for ``location``.
+
+        The validation errors of the snapshot are replayed into ``semantic_validator``, as a
+        SnapshotCache hit does. If the project cannot be built, the exception (or SystemExit)
+        the build failed with is raised, as parsing it without the daemon would have; its
+        output was already written while the session was being built.
+        """
+        key = SnapshotCache.key_for(location, filter_data, parsing_config)
+
+        with self._lock, _session_logging_muted():
+            session = self.__fresh_session(key, location, filter_data, parsing_config)
+            db = session.copy_database()
+            validation_errors = list(session.validation_errors)
+
+        if db is None:
+            return None
+
+        semantic_validator.replay_errors(validation_errors)
+        return db
+
+    def close(self) -> None:
+        with self._lock:
+            for pooled in self._sessions.values():
+                pooled.session.close()
+            self._sessions.clear()
+
+    def __fresh_session(
+        self, key: str, location: LocationInterface, filter_data: bool, parsing_config: ParsingConfig
+    ) -> ProjectSession:
+        pooled = self._sessions.get(key)
+
+        if pooled is None:
+            session = ProjectSession(location, parsing_config=parsing_config, filter_data=filter_data)
+            session.build()
+        else:
+            self._sessions.move_to_end(key)
+            session = pooled.session
+            self.__reload_if_stale(session, pooled.env_digest)
+
+        if not session.ready or session.error is not None:
+            logger.info("Dropping project session for %s: %s", location, session.error)
+            failure = session.failure
+            session.close()
+            self._sessions.pop(key, None)
+            if failure is None:
+                raise SnapshotReloadError(f"reqstool project could not be loaded: {session.error}")
+            raise failure
+
+        self._sessions[key] = _PooledSession(session=session, env_digest=env_digest(session.env_var_names))
+        self.__evict()
+        return session
+
+    @staticmethod
+    def __reload_if_stale(session: ProjectSession, parsed_env_digest: str) -> None:
+        if parsed_env_digest != env_digest(session.env_var_names):
+            logger.info("Reloading project session: interpolated environment variables changed")
+            session.build()
+            return
+
+        # An incremental refresh does not re-report the parse errors of the sources it reuses,
+        # so a snapshot that had any is parsed again in full to keep them.
+        if session.validation_errors and session.fingerprint is not None and session.fingerprint.stale_urns():
+            session.build()
+            return
+
+        try:
+            session.ensure_fresh()
+        except SnapshotReloadError as e:
+            logger.info("%s", e)
+
+    def __evict(self) -> None:
+        while len(self._sessions) > self._max_sessions:
+            key, pooled = self._sessions.popitem(last=False)
+            logger.debug("Closing least recently used project session %s", key)
+            pooled.session.close()
+
+
+@contextmanager
+def _session_logging_muted() -> Generator[None, None, None]:
+    """Silence ProjectSession's own log records while a pooled session is used.
+
+    A command run without the daemon parses through build_database(), which logs nothing of
+    the kind; a failed build in particular is reported by the command itself.
+    """
+    session_logger = logging.getLogger(ProjectSession.__module__)
+    saved_disabled = session_logger.disabled
+    session_logger.disabled = True
+    try:
+        yield
+    finally:
+        session_logger.disabled = saved_disabled
@@ -0,0 +1,250 @@
+# Copyright © LFV
+
+"""Persistent cache of fetched remote sources, shared between runs and processes.
+
+Every run fetches remote sources into a temporary directory that is removed when the run
+ends, so each invocation downloads the same artifacts again. A source pinned to immutable
+content (see ``LocationInterface.pinned_key()``) — a released Maven/npm/PyPI version, a git
+commit SHA — can never change, so its fetched tree is kept here and later fetches of the
+same source are served by copying that tree instead of going to the network. Unpinned
+sources are always fetched.
+
+Entries are published atomically (built under a temporary name, then renamed into place)
+and every operation on the cache directory holds a lock on ``.lock`` — shared while copying
+an entry out, exclusive while publishing or evicting — so several processes (concurrent CI
+jobs, say) can share one cache. Once the cache grows past its
+size limit, the least recently used entries are evicted.
+
+Given a ``git_mirror_dir``, git sources are fetched through a bare mirror of each repository
+kept there (see ``GitLocation.make_available()``), so fetching another ref of a repository
+already seen only transfers the objects that are new. Mirrors count against the same size
+limit as the entries and are evicted with them in least recently used order; a mirror that
+is being fetched into is skipped.
+
+Layout::
+
+    <cache_dir>/.lock
+    <cache_dir>/<tmpdir_key>-<sha256 of pinned_key>/entry.json
+    <cache_dir>/<tmpdir_key>-<sha256 of pinned_key>/content/...
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import List, Optional, Tuple
+
+from reqstool.location_resolver.location_resolver import LocationResolver
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE_MB = 1024
+
+_ENTRY = "entry.json"
+_CONTENT = "content"
+_LOCK = ".lock"
+_TMP_PREFIX = ".tmp-"
+
+
+class ArtifactCache:
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+        git_mirror_dir: Optional[str] = None,
+    ):
+        self._cache_dir = cache_dir
+        self._max_size_bytes = max_size_bytes
+        self._git_mirror_dir = git_mirror_dir
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def make_available_on_localdisk(self, location_handler: LocationResolver, dst_path: str) -> str:
+        """Make the source available under ``dst_path`` as ``location_handler`` would, using the cache if possible.
+
+        Returns the directory the source is available in, like
+        ``LocationResolver.make_available_on_localdisk()``.
+        """
+        location = location_handler.current
+        pinned_key = location.pinned_key()
+        if pinned_key is None:
+            return self._fetch(location_handler, dst_path)
+
+        entry_name = self.entry_name(location.tmpdir_key(), pinned_key)
+
+        cached_path = self._copy_from_cache(entry_name, str(dst_path))
+        if cached_path is not None:
+            logger.debug("Using cached artifact %s for %s", entry_name, pinned_key)
+            return cached_path
+
+        actual_path = self._fetch(location_handler, dst_path)
+        self._publish(entry_name, pinned_key, str(dst_path), str(actual_path))
+        return actual_path
+
+    def _fetch(self, location_handler: LocationResolver, dst_path: str) -> str:
+        # Imported here so the CLI can read this module's defaults without loading pygit2
+        from reqstool.locations.git_location import GitLocation
+
+        location = location_handler.current
+        if self._git_mirror_dir is not None and isinstance(location, GitLocation):
+            actual_path = location.make_available(dst_path=str(dst_path), mirror_dir=self._git_mirror_dir)
+            self._mirror_used(os.path.join(self._git_mirror_dir, location.mirror_key()))
+            return actual_path
+        return location_handler.make_available_on_localdisk(dst_path=dst_path)
+
+    def _mirror_used(self, mirror_path: str) -> None:
+        """Record the use of a git mirror, which may have grown, and evict to make room for it."""
+        try:
+            # Last use is tracked by the mirror directory's mtime
+            os.utime(mirror_path)
+            with self._locked():
+                self._evict(keep=mirror_path)
+        except OSError as e:
+            logger.warning("Could not update the artifact cache for git mirror %s: %s", mirror_path, e)
+
+    @staticmethod
+    def entry_name(tmpdir_key: str, pinned_key: str) -> str:
+        return f"{tmpdir_key}-{hashlib.sha256(pinned_key.encode('utf-8')).hexdigest()[:16]}"
+
+    def _copy_from_cache(self, entry_name: str, dst_path: str) -> Optional[str]:
+        entry_dir = os.path.join(self._cache_dir, entry_name)
+        try:
+            # Readers only exclude publishing and eviction, not each other
+            with self._locked(shared=True):
+                with open(os.path.join(entry_dir, _ENTRY), encoding="utf-8") as f:
+                    relpath = json.load(f)["relpath"]
+
+                actual_path = os.path.normpath(os.path.join(dst_path, relpath))
+                if os.path.commonpath([actual_path, os.path.abspath(dst_path)]) != os.path.abspath(dst_path):
+                    logger.debug("Ignoring cached artifact %s: it points outside its directory", entry_name)
+                    return None
+
+                shutil.copytree(os.path.join(entry_dir, _CONTENT), actual_path, symlinks=True, dirs_exist_ok=True)
+                # Last use is tracked by the entry file's mtime
+                os.utime(os.path.join(entry_dir, _ENTRY))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug("Could not use cached artifact %s: %s", entry_name, e)
+            return None
+
+        return actual_path
+
+    def _publish(self, entry_name: str, pinned_key: str, dst_path: str, actual_path: str) -> None:
+        """Copy a freshly fetched source into the cache. Failing to do so is logged and otherwise ignored."""
+        tmp_dir = None
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(prefix=_TMP_PREFIX, dir=self._cache_dir)
+
+            # .git holds the whole history of a clone; only the checked out tree is ever read
+            shutil.copytree(
+                actual_path, os.path.join(tmp_dir, _CONTENT), symlinks=True, ignore=shutil.ignore_patterns(".git")
+            )
+            entry = {
+                "pinned_key": pinned_key,
+                "relpath": os.path.relpath(actual_path, dst_path),
+                "size": self._tree_size(os.path.join(tmp_dir, _CONTENT)),
+            }
+            with open(os.path.join(tmp_dir, _ENTRY), "w", encoding="utf-8") as f:
+                json.dump(entry, f, indent=2)
+
+            with self._locked():
+                entry_dir = os.path.join(self._cache_dir, entry_name)
+                if os.path.exists(entry_dir):
+                    # Someone else fetched the same immutable content first
+                    return
+                os.rename(tmp_dir, entry_dir)
+                tmp_dir = None
+                logger.debug("Cached artifact %s for %s", entry_name, pinned_key)
+                self._evict()
+        except OSError as e:
+            logger.warning("Could not write artifact cache entry %s: %s", entry_name, e)
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Remove least recently used entries and git mirrors until the cache is within its size limit.
+
+        ``keep`` (the mirror just fetched through) is never removed. Caller holds the lock.
+        """
+        mirrors = self._mirrors()
+        mirror_paths = {path for _, path, _ in mirrors}
+        entries = self._entries() + mirrors
+        total = sum(size for _, _, size in entries)
+
+        for last_used, path, size in sorted(entries):
+            if total <= self._max_size_bytes:
+                break
+            if path == keep:
+                continue
+            if path in mirror_paths:
+                if not self._remove_mirror(path):
+                    continue
+            else:
+                logger.debug("Evicting cached artifact %s", os.path.basename(path))
+                shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    @staticmethod
+    def _remove_mirror(mirror_path: str) -> bool:
+        from reqstool.common.utils import Utils
+
+        try:
+            # The same lock GitLocation holds while fetching into the mirror
+            with Utils.file_lock(f"{mirror_path}.lock", blocking=False):
+                logger.debug("Evicting git mirror %s", os.path.basename(mirror_path))
+                shutil.rmtree(mirror_path, ignore_errors=True)
+        except BlockingIOError:
+            logger.debug("Not evicting git mirror %s: it is in use", os.path.basename(mirror_path))
+            return False
+        return True
+
+    def _entries(self) -> List[Tuple[float, str, int]]:
+        entries = []
+        for name in os.listdir(self._cache_dir):
+            if name.startswith("."):
+                continue
+            entry_dir = os.path.join(self._cache_dir, name)
+            entry_file = os.path.join(entry_dir, _ENTRY)
+            try:
+                with open(entry_file, encoding="utf-8") as f:
+                    size = int(json.load(f)["size"])
+                entries.append((os.stat(entry_file).st_mtime, entry_dir, size))
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        return entries
+
+    def _mirrors(self) -> List[Tuple[float, str, int]]:
+        if self._git_mirror_dir is None or not os.path.isdir(self._git_mirror_dir):
+            return []
+        mirrors = []
+        for name in os.listdir(self._git_mirror_dir):
+            mirror_path = os.path.join(self._git_mirror_dir, name)
+            if name.endswith(".lock") or not os.path.isdir(mirror_path):
+                continue
+            try:
+                mirrors.append((os.stat(mirror_path).st_mtime, mirror_path, self._tree_size(mirror_path)))
+            except OSError:
+                continue
+        return mirrors
+
+    @staticmethod
+    def _tree_size(path: str) -> int:
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                file_path = os.path.join(root, name)
+                if not os.path.islink(file_path):
+                    total += os.path.getsize(file_path)
+        return total
+
+    def _locked(self, shared: bool = False):
+        from reqstool.common.utils import Utils
+
+        return Utils.file_lock(os.path.join(self._cache_dir, _LOCK), shared=shared)
@@ -1,19 +1,24 @@
 # Copyright © LFV
 
+import hashlib
 import logging
+import os
 import re
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import SecretStr, field_validator
-from pygit2 import Commit, GitError, RemoteCallbacks, UserPass, clone_repository
+from pygit2 import Commit, GitError, Remote, RemoteCallbacks, Repository, UserPass, init_repository
+from pygit2.enums import CheckoutStrategy, FetchPrune
 from reqstool_python_decorators.decorators.decorators import Requirements
 
 from reqstool.common.exceptions import GitRefNotFoundError
+from reqstool.common.utils import Utils
 from reqstool.locations.location import LocationInterface, make_safe_tmpdir_suffix
 
 # Accepted ref characters: alphanumerics, '.', '/', '-', '_'.
 # Rejects control chars, '..', shell-special chars, and git revision syntax (@{, ~, ^, :).
 _VALID_REF_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._/\-]*$")
+_COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
 
 
 @Requirements("SOURCE_0004", "SOURCE_0008")
@@ -22,6 +27,8 @@ class GitLocation(LocationInterface):
     ref: str
     token: Optional[SecretStr] = None
     path: str = ""
+    # Check out only `path` (which holds reqstool_config.yml too) instead of the whole tree
+    sparse: bool = False
 
     @field_validator("ref")
     @classmethod
@@ -33,40 +40,141 @@ class GitLocation(LocationInterface):
             )
         return v
 
-    def tmpdir_key(self) -> str:
+    def _url_without_credentials(self) -> str:
         from urllib.parse import urlparse, urlunparse
 
         parsed = urlparse(self.url)
         if parsed.username or parsed.password:
             host = parsed.hostname or ""
             parsed = parsed._replace(netloc=host + (f":{parsed.port}" if parsed.port else ""))
-        return make_safe_tmpdir_suffix("git", f"{urlunparse(parsed)}@{self.ref}")
+        return urlunparse(parsed)
+
+    def tmpdir_key(self) -> str:
+        return make_safe_tmpdir_suffix("git", f"{self._url_without_credentials()}@{self.ref}")
+
+    def pinned_key(self) -> Optional[str]:
+        # Branches and tags can move; only a full commit SHA names fixed content.
+        if not _COMMIT_SHA_RE.match(self.ref):
+            return None
+        return f"git:{self._url_without_credentials()}@{self.ref}:{self.path}{':sparse' if self.sparse else ''}"
 
     def _make_available_on_localdisk(self, dst_path: str) -> str:
+        return self.make_available(dst_path=dst_path)
+
+    def make_available(self, dst_path: str, mirror_dir: Optional[str] = None) -> str:
+        """Check out ``ref`` into ``dst_path`` and return the checked out directory.
+
+        Without a mirror, only the requested ref is fetched, with a history depth of 1.
+        With a ``mirror_dir``, the checkout is made from a bare mirror of the repository kept
+        there, so repeated fetches of the same repository only transfer new objects.
+
+        With ``sparse``, only ``path`` is checked out.
+        """
+        if mirror_dir is not None:
+            return self.__make_available_from_mirror(dst_path=dst_path, mirror_dir=mirror_dir)
+
+        repo = init_repository(dst_path)
+        remote = repo.remotes.create_anonymous(self.url)
+
+        commit = self.__fetch_ref(repo, remote)
+        repo.checkout_tree(commit, **self.__checkout_options())
+        repo.set_head(commit.id)  # passing an Oid always results in a detached HEAD
+
+        logging.debug(f"Fetched repo {self.url} (ref: {self.ref}) to {repo.workdir}\n")
+
+        return repo.workdir
+
+    def mirror_key(self) -> str:
+        """Return a filesystem-safe directory name for a mirror of this location's repository."""
+        url = self._url_without_credentials()
+        return f"{make_safe_tmpdir_suffix('git', url)}-{hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]}"
+
+    def __fetch_ref(self, repo: Repository, remote: Remote) -> Commit:
+        # Fetch just the ref first. A ref that is neither a branch, a tag nor a full commit SHA
+        # (an abbreviated SHA, say), or a server refusing to serve a commit by SHA, falls back
+        # to fetching every branch and tag with full history.
+        if _COMMIT_SHA_RE.match(self.ref):
+            refspecs = [f"+{self.ref}:refs/reqstool/{self.ref}"]
+        else:
+            refspecs = [
+                f"+refs/heads/{self.ref}:refs/remotes/origin/{self.ref}",
+                f"+refs/tags/{self.ref}:refs/tags/{self.ref}",
+            ]
+
+        try:
+            self.__fetch(remote, refspecs, depth=1)
+            commit = self.__resolve(repo)
+        except GitError as e:
+            logging.debug(f"Fetching only {self.ref} from {self.url} failed, fetching all refs: {e}")
+            commit = None
+
+        if commit is None:
+            self.__fetch(remote, ["+refs/heads/*:refs/remotes/origin/*", "+refs/tags/*:refs/tags/*"], depth=0)
+            commit = self.__resolve(repo)
+
+        if commit is None:
+            raise GitRefNotFoundError(self.ref, self.url)
+
+        return commit
+
+    def __make_available_from_mirror(self, dst_path: str, mirror_dir: str) -> str:
+        mirror_path = os.path.join(mirror_dir, self.mirror_key())
+
+        with Utils.file_lock(f"{mirror_path}.lock"):
+            if os.path.exists(mirror_path):
+                mirror = Repository(mirror_path)
+            else:
+                mirror = init_repository(mirror_path, bare=True)
+
+            # A commit already in the mirror cannot have changed; branches and tags can move
+            commit = self.__resolve(mirror) if _COMMIT_SHA_RE.match(self.ref) else None
+            if commit is None:
+                logging.debug(f"Updating mirror {mirror_path} of {self._url_without_credentials()}")
+                self.__fetch(
+                    mirror.remotes.create_anonymous(self.url),
+                    ["+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"],
+                    depth=0,
+                    prune=FetchPrune.PRUNE,
+                )
+                commit = self.__resolve(mirror)
+
+            if commit is None:
+                raise GitRefNotFoundError(self.ref, self.url)
+
+            mirror.checkout_tree(
+                commit, directory=dst_path, strategy=CheckoutStrategy.FORCE, **self.__checkout_options()
+            )
+
+        logging.debug(f"Checked out {self.url} (ref: {self.ref}) from mirror to {dst_path}\n")
+
+        return dst_path
+
+    def __fetch(self, remote: Remote, refspecs: List[str], depth: int, prune: FetchPrune = FetchPrune.UNSPECIFIED):
         api_token = self.token.get_secret_value() if self.token else None
         callbacks = self.MyRemoteCallbacks(api_token) if api_token else None
 
-        repo = clone_repository(url=self.url, path=dst_path, callbacks=callbacks)
-
-        # Try direct lookup first (tag, default branch, or commit SHA), then fall back to the
-        # remote-tracking ref — non-default branches only exist as origin/<ref> after a plain clone.
-        obj = None
+        try:
+            remote.fetch(refspecs=refspecs, callbacks=callbacks, depth=depth, prune=prune)
+        except GitError as e:
+            # Local paths and file:// URLs are served without shallow support
+            if depth == 0 or "shallow" not in str(e):
+                raise
+            remote.fetch(refspecs=refspecs, callbacks=callbacks, prune=prune)
+
+    def __resolve(self, repo: Repository) -> Optional[Commit]:
+        # Try direct lookup first (tag, mirrored branch, or commit SHA), then the remote-tracking
+        # ref a branch is fetched into.
         for name in (self.ref, f"origin/{self.ref}"):
             try:
-                obj = repo.revparse_single(name)
-                break
+                return repo.revparse_single(name).peel(Commit)
             except (KeyError, GitError):
                 continue
-        if obj is None:
-            raise GitRefNotFoundError(self.ref, self.url)
-
-        commit = obj.peel(Commit)
-        repo.checkout_tree(commit)
-        repo.set_head(commit.id)  # passing an Oid always results in a detached HEAD
-
-        logging.debug(f"Cloned repo {self.url} (ref: {self.ref}) to {repo.workdir}\n")
+        return None
 
-        return repo.workdir
+    def __checkout_options(self) -> dict:
+        if not self.sparse or not self.path:
+            return {}
+        return {"paths": [self.path.strip("/")]}
 
     class MyRemoteCallbacks(RemoteCallbacks):
         def __init__(self, api_token):
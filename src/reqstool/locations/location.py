@@ -3,6 +3,7 @@
 import re
 from abc import ABC, abstractmethod
 from enum import Enum, unique
+from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
 
@@ -35,3 +36,11 @@ class LocationInterface(BaseModel, ABC):
     @abstractmethod
     def tmpdir_key(self) -> str:
         """Return a short, filesystem-safe string identifying this location for use as a temp-dir suffix."""
+
+    def pinned_key(self) -> Optional[str]:
+        """Return a key identifying immutable content at this location, or None if it can change.
+
+        Only version-pinned remote artifacts (an exact release, a full commit SHA) are pinned;
+        local paths and moving references (branches, tags, snapshots, dist-tags) are not.
+        """
+        return None
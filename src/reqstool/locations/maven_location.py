@@ -24,6 +24,11 @@ class MavenLocation(LocationInterface):
     def tmpdir_key(self) -> str:
         return make_safe_tmpdir_suffix("maven", f"{self.group_id}:{self.artifact_id}:{self.version}")
 
+    def pinned_key(self) -> Optional[str]:
+        if self.version.endswith("-SNAPSHOT") or self.version in ("LATEST", "RELEASE"):
+            return None
+        return f"maven:{self.url}:{self.group_id}:{self.artifact_id}:{self.version}:{self.classifier}"
+
     def _make_available_on_localdisk(self, dst_path: str):
         token = self.token.get_secret_value() if self.token else None
 
@@ -1,6 +1,7 @@
 # Copyright © LFV
 
 import logging
+import re
 import tarfile
 from typing import Optional
 from urllib.parse import quote, urlparse
@@ -15,6 +16,7 @@ from reqstool.locations.location import LocationInterface, make_safe_tmpdir_suff
 
 _METADATA_MAX_BYTES = 10 * 1024 * 1024  # 10 MB
 _REQUEST_TIMEOUT = 30  # seconds
+_EXACT_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(-[0-9A-Za-z.-]+)?(\+[0-9A-Za-z.-]+)?$")
 
 
 @Requirements("SOURCE_0006")
@@ -34,6 +36,12 @@ class NpmLocation(LocationInterface):
     def tmpdir_key(self) -> str:
         return make_safe_tmpdir_suffix("npm", f"{self.package}@{self.version}")
 
+    def pinned_key(self) -> Optional[str]:
+        # The registry also resolves dist-tags ("latest", "next"); only an exact version is immutable.
+        if not _EXACT_SEMVER_RE.match(self.version):
+            return None
+        return f"npm:{self.url}:{self.package}@{self.version}"
+
     def _make_available_on_localdisk(self, dst_path: str):
         """Fetch tarball URL → SSRF check → download → extract."""
         token = self.token.get_secret_value() if self.token else None
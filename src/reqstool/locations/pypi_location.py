@@ -8,6 +8,7 @@ from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
+from packaging.version import InvalidVersion, Version
 from pydantic import SecretStr
 from reqstool.common.exceptions import ArtifactDownloadError, ArtifactExtractionError
 from reqstool.common.utils import Utils
@@ -29,6 +30,13 @@ class PypiLocation(LocationInterface):
     def tmpdir_key(self) -> str:
         return make_safe_tmpdir_suffix("pypi", f"{self.package}=={self.version}")
 
+    def pinned_key(self) -> Optional[str]:
+        try:
+            Version(self.version)
+        except InvalidVersion:
+            return None
+        return f"pypi:{self.url}:{self.normalize_pypi_package_name(self.package)}=={self.version}"
+
     def _make_available_on_localdisk(self, dst_path: str):
         token = self.token.get_secret_value() if self.token else None
 
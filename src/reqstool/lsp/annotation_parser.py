@@ -2,7 +2,9 @@
 
 
 import re
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, replace
+from typing import Iterable, Sequence
 
 
 @dataclass(frozen=True)
@@ -25,6 +27,9 @@ BARE_ID_RE = re.compile(r"[\w:./-]+")
 SOURCE_LANGUAGES = {"python", "java"}
 JSDOC_LANGUAGES = {"javascript", "typescript", "javascriptreact", "typescriptreact"}
 
+# Line breaks str.splitlines() honours but LSP positions do not count
+_NON_LSP_LINE_BREAK_RE = re.compile("[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]|\r(?!\n)")
+
 
 def find_all_annotations(text: str, language_id: str) -> list[AnnotationMatch]:
     lines = text.splitlines()
@@ -36,10 +41,7 @@ def find_all_annotations(text: str, language_id: str) -> list[AnnotationMatch]:
 
 
 def annotation_at_position(text: str, line: int, character: int, language_id: str) -> AnnotationMatch | None:
-    for match in find_all_annotations(text, language_id):
-        if match.line == line and match.start_col <= character < match.end_col:
-            return match
-    return None
+    return DocumentAnnotations(text, language_id).at_position(line, character)
 
 
 def is_inside_annotation(line_text: str, character: int, language_id: str) -> str | None:
@@ -50,27 +52,233 @@ def is_inside_annotation(line_text: str, character: int, language_id: str) -> st
     return None
 
 
+class DocumentAnnotations:
+    """The annotations of one document, grouped by the line their annotation starts on.
+
+    What an annotation starting on a line matches depends only on that line and, for
+    multi-line parens, the lines up to its closing paren (its span). ``apply_changes()``
+    therefore re-scans only the lines an edit touched, plus the annotations whose span
+    reaches into it, and shifts the rest. Instances are not modified once built, so a
+    handler holding one keeps a consistent view while the document is edited.
+    """
+
+    def __init__(self, text: str, language_id: str, version: int | None = None):
+        lines = _document_lines(text)
+        self.text = text
+        self.language_id = language_id
+        self.version = version
+        # Per line: the matches of the annotations starting on it, and the last line they span
+        self._units: list[tuple[AnnotationMatch, ...]] = []
+        self._span_ends: list[int] = []
+        for i in range(len(lines)):
+            unit, span_end = _scan_line(lines, i, language_id)
+            self._units.append(unit)
+            self._span_ends.append(span_end)
+        self._matches: list[AnnotationMatch] | None = None
+        self._by_line: dict[int, list[AnnotationMatch]] | None = None
+
+    @property
+    def matches(self) -> list[AnnotationMatch]:
+        """All matches in document order, as ``find_all_annotations()`` returns them."""
+        if self._matches is None:
+            self._matches = [match for unit in self._units for match in unit]
+        return self._matches
+
+    def on_line(self, line: int) -> list[AnnotationMatch]:
+        if self._by_line is None:
+            by_line: dict[int, list[AnnotationMatch]] = {}
+            for match in self.matches:
+                by_line.setdefault(match.line, []).append(match)
+            self._by_line = by_line
+        return self._by_line.get(line, [])
+
+    def at_position(self, line: int, character: int) -> AnnotationMatch | None:
+        for match in self.on_line(line):
+            if match.start_col <= character < match.end_col:
+                return match
+        return None
+
+    def apply_changes(self, text: str, version: int | None, changes: Iterable[object]) -> "DocumentAnnotations":
+        """Return the annotations of ``text``, this document after the LSP content ``changes``.
+
+        ``changes`` are ``TextDocumentContentChangeEvent``s in the order the client sent
+        them, each ranged against the document as the previous one left it. Whenever the
+        edit cannot be mapped line by line (a full-text change, or line breaks the LSP
+        does not count as such), the document is parsed again in full.
+        """
+        if _has_non_lsp_line_breaks(self.text) or _has_non_lsp_line_breaks(text):
+            return DocumentAnnotations(text, self.language_id, version)
+
+        units: list[tuple[AnnotationMatch, ...] | None] = list(self._units)
+        span_ends: list[int | None] = list(self._span_ends)
+        for change in changes:
+            change_range = getattr(change, "range", None)
+            if change_range is None or not _mark_changed_lines(units, span_ends, change_range, change.text):
+                return DocumentAnnotations(text, self.language_id, version)
+
+        lines = _document_lines(text)
+        if len(units) != len(lines):
+            return DocumentAnnotations(text, self.language_id, version)
+
+        for i, unit in enumerate(units):
+            if unit is None:
+                units[i], span_ends[i] = _scan_line(lines, i, self.language_id)
+
+        updated = DocumentAnnotations.__new__(DocumentAnnotations)
+        updated.text = text
+        updated.language_id = self.language_id
+        updated.version = version
+        updated._units = units
+        updated._span_ends = span_ends
+        updated._matches = None
+        updated._by_line = None
+        return updated
+
+
+class AnnotationCache:
+    """Parsed annotations of the open documents, keyed by URI and document version.
+
+    The language server keeps it in step with ``textDocument/didChange`` through
+    ``update()``; request handlers take the parse of the document version they serve
+    from ``get()`` instead of scanning the text again.
+    """
+
+    def __init__(self):
+        self._documents: dict[str, DocumentAnnotations] = {}
+        self._lock = threading.Lock()
+
+    def get(self, uri: str, text: str, language_id: str, version: int | None) -> DocumentAnnotations:
+        with self._lock:
+            cached = self._documents.get(uri)
+        if cached is not None and _is_parse_of(cached, text, language_id, version):
+            return cached
+        parsed = DocumentAnnotations(text, language_id, version)
+        with self._lock:
+            self._documents[uri] = parsed
+        return parsed
+
+    def update(
+        self, uri: str, text: str, language_id: str, version: int | None, changes: Sequence[object]
+    ) -> DocumentAnnotations:
+        with self._lock:
+            cached = self._documents.get(uri)
+        if cached is not None and _is_parse_of(cached, text, language_id, version):
+            return cached
+        if cached is None or cached.language_id != language_id:
+            parsed = DocumentAnnotations(text, language_id, version)
+        else:
+            parsed = cached.apply_changes(text, version, changes)
+        with self._lock:
+            self._documents[uri] = parsed
+        return parsed
+
+    def discard(self, uri: str) -> None:
+        with self._lock:
+            self._documents.pop(uri, None)
+
+
+def annotations_of(uri: str, document, annotation_cache: AnnotationCache | None = None) -> DocumentAnnotations:
+    """The annotations of an open text document, from ``annotation_cache`` when one is given."""
+    language_id = getattr(document, "language_id", None) or ""
+    if annotation_cache is None:
+        return DocumentAnnotations(document.source, language_id)
+    return annotation_cache.get(uri, document.source, language_id, getattr(document, "version", None))
+
+
+def _is_parse_of(parsed: DocumentAnnotations, text: str, language_id: str, version: int | None) -> bool:
+    if parsed.language_id != language_id or parsed.version != version:
+        return False
+    # Without a version only the text itself tells whether it changed
+    return version is not None or parsed.text is text or parsed.text == text
+
+
+def _document_lines(text: str) -> list[str]:
+    """The lines of ``text`` as LSP positions count them (a trailing line break starts an empty line)."""
+    lines = text.splitlines()
+    if not text or text.endswith(("\n", "\r")):
+        lines.append("")
+    return lines
+
+
+def _has_non_lsp_line_breaks(text: str) -> bool:
+    return _NON_LSP_LINE_BREAK_RE.search(text) is not None
+
+
+def _mark_changed_lines(
+    units: list[tuple[AnnotationMatch, ...] | None],
+    span_ends: list[int | None],
+    change_range,
+    new_text: str,
+) -> bool:
+    """Apply one ranged change to the per-line units, marking every line to re-scan as None.
+
+    Returns False if the range does not fit the document.
+    """
+    start_line, end_line = change_range.start.line, change_range.end.line
+    if not 0 <= start_line <= end_line < len(units) or _has_non_lsp_line_breaks(new_text):
+        return False
+
+    # Annotations starting above the edit whose parens reach into it
+    first_dirty = start_line
+    for i in range(start_line - 1, -1, -1):
+        span_end = span_ends[i]
+        if span_end is not None and span_end >= start_line:
+            first_dirty = i
+    for i in range(first_dirty, start_line):
+        units[i] = span_ends[i] = None
+
+    inserted_lines = new_text.count("\n") + 1
+    delta = inserted_lines - (end_line - start_line + 1)
+    if delta:
+        for i in range(end_line + 1, len(units)):
+            unit, span_end = units[i], span_ends[i]
+            if unit is None or span_end is None:
+                continue
+            units[i] = tuple(replace(match, line=match.line + delta) for match in unit)
+            span_ends[i] = span_end + delta
+
+    changed = slice(start_line, end_line + 1)
+    units[changed] = [None] * inserted_lines
+    span_ends[changed] = [None] * inserted_lines
+    return True
+
+
+def _scan_line(lines: list[str], i: int, language_id: str) -> tuple[tuple[AnnotationMatch, ...], int]:
+    """Scan the annotations starting on line ``i``: their matches and the last line they span."""
+    if language_id in SOURCE_LANGUAGES:
+        return _scan_source_line(lines, i)
+    elif language_id in JSDOC_LANGUAGES:
+        return tuple(_scan_jsdoc_line(lines[i], i)), i
+    return (), i
+
+
 def _find_source_annotations(lines: list[str]) -> list[AnnotationMatch]:
     results: list[AnnotationMatch] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        for m in SOURCE_ANNOTATION_RE.finditer(line):
-            kind = m.group(1)
-            # Collect the full argument text, handling multi-line parens
-            paren_start = m.end() - 1  # position of '('
-            arg_text, arg_lines = _collect_paren_content(lines, i, paren_start)
-            # Find all quoted IDs within the argument text
-            offset_in_first_line = m.end()
-            _extract_quoted_ids(results, kind, arg_text, arg_lines, lines, i, offset_in_first_line)
-        i += 1
+    for i in range(len(lines)):
+        results.extend(_scan_source_line(lines, i)[0])
     return results
 
 
-def _collect_paren_content(lines: list[str], start_line: int, paren_col: int) -> tuple[str, list[tuple[int, int]]]:
+def _scan_source_line(lines: list[str], i: int) -> tuple[tuple[AnnotationMatch, ...], int]:
+    results: list[AnnotationMatch] = []
+    span_end = i
+    for m in SOURCE_ANNOTATION_RE.finditer(lines[i]):
+        kind = m.group(1)
+        # Collect the full argument text, handling multi-line parens
+        paren_start = m.end() - 1  # position of '('
+        arg_text, arg_lines, end_line = _collect_paren_content(lines, i, paren_start)
+        span_end = max(span_end, end_line)
+        # Find all quoted IDs within the argument text
+        offset_in_first_line = m.end()
+        _extract_quoted_ids(results, kind, arg_text, arg_lines, lines, i, offset_in_first_line)
+    return tuple(results), span_end
+
+
+def _collect_paren_content(lines: list[str], start_line: int, paren_col: int) -> tuple[str, list[tuple[int, int]], int]:
     """Collect text between parens, possibly spanning multiple lines.
 
-    Returns (full_text_between_parens, list_of_(line_idx, line_start_offset)).
+    Returns (full_text_between_parens, list_of_(line_idx, line_start_offset), line_of_closing_paren);
+    an unclosed paren runs to the last line.
     """
     depth = 0
     parts: list[str] = []
@@ -91,7 +299,7 @@ def _collect_paren_content(lines: list[str], start_line: int, paren_col: int) ->
             elif ch == ")":
                 depth -= 1
                 if depth == 0:
-                    return "".join(parts), line_offsets
+                    return "".join(parts), line_offsets, line_idx
             if depth >= 1:
                 if not parts or line_offsets[-1][0] != line_idx:
                     line_offsets.append((line_idx, combined_len))
@@ -100,7 +308,7 @@ def _collect_paren_content(lines: list[str], start_line: int, paren_col: int) ->
         if depth >= 1:
             parts.append("\n")
             combined_len += 1
-    return "".join(parts), line_offsets
+    return "".join(parts), line_offsets, max(start_line, len(lines) - 1)
 
 
 def _extract_quoted_ids(
@@ -171,25 +379,31 @@ def _map_offset_to_source(
 def _find_jsdoc_annotations(lines: list[str]) -> list[AnnotationMatch]:
     results: list[AnnotationMatch] = []
     for line_idx, line in enumerate(lines):
-        for m in JSDOC_TAG_RE.finditer(line):
-            kind = m.group(1)
-            ids_text = m.group(2)
-            ids_start = m.start(2)
-            # Strip trailing */ or whitespace
-            ids_text = re.sub(r"\s*\*/\s*$", "", ids_text)
-            for id_match in BARE_ID_RE.finditer(ids_text):
-                raw_id = id_match.group(0)
-                start_col = ids_start + id_match.start()
-                end_col = ids_start + id_match.end()
-                results.append(
-                    AnnotationMatch(
-                        kind=kind,
-                        raw_id=raw_id,
-                        line=line_idx,
-                        start_col=start_col,
-                        end_col=end_col,
-                    )
+        results.extend(_scan_jsdoc_line(line, line_idx))
+    return results
+
+
+def _scan_jsdoc_line(line: str, line_idx: int) -> list[AnnotationMatch]:
+    results: list[AnnotationMatch] = []
+    for m in JSDOC_TAG_RE.finditer(line):
+        kind = m.group(1)
+        ids_text = m.group(2)
+        ids_start = m.start(2)
+        # Strip trailing */ or whitespace
+        ids_text = re.sub(r"\s*\*/\s*$", "", ids_text)
+        for id_match in BARE_ID_RE.finditer(ids_text):
+            raw_id = id_match.group(0)
+            start_col = ids_start + id_match.start()
+            end_col = ids_start + id_match.end()
+            results.append(
+                AnnotationMatch(
+                    kind=kind,
+                    raw_id=raw_id,
+                    line=line_idx,
+                    start_col=start_col,
+                    end_col=end_col,
                 )
+            )
     return results
 
 
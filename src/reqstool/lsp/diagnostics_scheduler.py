@@ -0,0 +1,135 @@
+# Copyright © LFV
+
+"""Debounced diagnostics, computed off the language server's event loop.
+
+Each schedule() of a URI supersedes the previous one: a pending computation is pushed
+back by the debounce delay, and a computation already running is discarded when it
+finishes. Results equal to what was last published for the URI are not sent again.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from lsprotocol import types
+
+logger = logging.getLogger(__name__)
+
+# Quiet time after the last edit of a document before its diagnostics are recomputed
+DEFAULT_DEBOUNCE_SECONDS = 0.3
+
+
+class DiagnosticsScheduler:
+    """Runs ``compute(uri)`` in a worker pool and hands the result to ``publish(uri, diagnostics)``.
+
+    ``compute`` returns None when the document is gone. When schedule() is called from a
+    running event loop (the language server's), ``publish`` is called on that loop, so it
+    is ordered with the handlers running there; otherwise it is called from the worker.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[str], list[types.Diagnostic] | None],
+        publish: Callable[[str, list[types.Diagnostic]], None],
+        debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_workers: int = 1,
+    ):
+        self._compute = compute
+        self._publish = publish
+        self._debounce = debounce
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reqstool-diagnostics")
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # Bumped by every schedule() and cancel(); a computation is current while its generation is
+        self._generations: dict[str, int] = {}
+        self._due: dict[str, float] = {}
+        self._published: dict[str, list[types.Diagnostic]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._dispatcher: threading.Thread | None = None
+        self._closed = False
+
+    def schedule(self, uri: str, delay: float | None = None) -> None:
+        """(Re)compute the diagnostics of ``uri`` after ``delay`` seconds (default: the debounce delay)."""
+        loop = _running_loop()
+        with self._lock:
+            if self._closed:
+                return
+            if loop is not None:
+                self._loop = loop
+            self._generations[uri] = self._generations.get(uri, 0) + 1
+            self._due[uri] = time.monotonic() + (self._debounce if delay is None else delay)
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self.__dispatch, name="reqstool-diagnostics-dispatcher", daemon=True
+                )
+                self._dispatcher.start()
+            self._wakeup.notify()
+
+    def cancel(self, uri: str) -> None:
+        """Drop pending and running computations for ``uri`` and forget what was published for it."""
+        with self._lock:
+            self._generations[uri] = self._generations.get(uri, 0) + 1
+            self._due.pop(uri, None)
+            self._published.pop(uri, None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._due.clear()
+            self._wakeup.notify()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __dispatch(self) -> None:
+        with self._lock:
+            while not self._closed:
+                now = time.monotonic()
+                for uri in [uri for uri, due_at in self._due.items() if due_at <= now]:
+                    del self._due[uri]
+                    self._executor.submit(self.__run, uri, self._generations[uri])
+                timeout = min(self._due.values()) - now if self._due else None
+                self._wakeup.wait(timeout)
+
+    def __run(self, uri: str, generation: int) -> None:
+        if not self.__is_current(uri, generation):
+            return
+        try:
+            diagnostics = self._compute(uri)
+        except Exception:
+            logger.exception("Computing diagnostics for %s failed", uri)
+            return
+        if diagnostics is None:
+            return
+
+        loop = self._loop
+        if loop is None:
+            self.__publish(uri, generation, diagnostics)
+            return
+        try:
+            loop.call_soon_threadsafe(self.__publish, uri, generation, diagnostics)
+        except RuntimeError:
+            # The event loop has been closed: the server is gone
+            pass
+
+    def __publish(self, uri: str, generation: int, diagnostics: list[types.Diagnostic]) -> None:
+        with self._lock:
+            if not self.__is_current_locked(uri, generation) or self._published.get(uri) == diagnostics:
+                return
+            self._published[uri] = diagnostics
+        self._publish(uri, diagnostics)
+
+    def __is_current(self, uri: str, generation: int) -> bool:
+        with self._lock:
+            return self.__is_current_locked(uri, generation)
+
+    def __is_current_locked(self, uri: str, generation: int) -> bool:
+        return not self._closed and self._generations.get(uri) == generation
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
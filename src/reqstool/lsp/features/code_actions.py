@@ -5,7 +5,7 @@ import re
 
 from lsprotocol import types
 
-from reqstool.lsp.annotation_parser import annotation_at_position
+from reqstool.lsp.annotation_parser import DocumentAnnotations
 from reqstool.lsp.project_state import ProjectState
 from reqstool.lsp.workspace_manager import WorkspaceManager
 
@@ -23,10 +23,11 @@ def handle_code_actions(
     language_id: str,
     project: ProjectState | None,
     workspace_manager: WorkspaceManager | None = None,
+    annotations: DocumentAnnotations | None = None,
 ) -> list[types.CodeAction]:
     only = set(context.only) if context.only else None
     actions = _actions_from_diagnostics(uri, context.diagnostics, only)
-    actions += _source_action(uri, range_, text, language_id, project, only, workspace_manager)
+    actions += _source_action(uri, range_, text, language_id, project, only, workspace_manager, annotations)
     return actions
 
 
@@ -72,12 +73,15 @@ def _source_action(
     project: ProjectState | None,
     only: set | None,
     workspace_manager: WorkspaceManager | None = None,
+    annotations: DocumentAnnotations | None = None,
 ) -> list[types.CodeAction]:
     if project is None or not project.ready:
         return []
     if only is not None and types.CodeActionKind.Source not in only:
         return []
-    match = annotation_at_position(text, range_.start.line, range_.start.character, language_id)
+    if annotations is None:
+        annotations = DocumentAnnotations(text, language_id)
+    match = annotations.at_position(range_.start.line, range_.start.character)
     if match is None:
         return []
     p = workspace_manager.resolve_project(match.raw_id, project) if workspace_manager else project
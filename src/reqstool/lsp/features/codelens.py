@@ -4,7 +4,7 @@
 from lsprotocol import types
 
 from reqstool.common.models.lifecycle import LIFECYCLESTATE
-from reqstool.lsp.annotation_parser import find_all_annotations
+from reqstool.lsp.annotation_parser import DocumentAnnotations
 from reqstool.lsp.project_state import ProjectState
 from reqstool.lsp.workspace_manager import WorkspaceManager
 
@@ -15,17 +15,19 @@ def handle_code_lens(
     language_id: str,
     project: ProjectState | None,
     workspace_manager: WorkspaceManager | None = None,
+    annotations: DocumentAnnotations | None = None,
 ) -> list[types.CodeLens]:
     if project is None or not project.ready:
         return []
 
-    annotations = find_all_annotations(text, language_id)
-    if not annotations:
+    if annotations is None:
+        annotations = DocumentAnnotations(text, language_id)
+    if not annotations.matches:
         return []
 
     # Group annotation matches by (line, kind)
     by_line: dict[tuple[int, str], list[str]] = {}
-    for match in annotations:
+    for match in annotations.matches:
         key = (match.line, match.kind)
         by_line.setdefault(key, []).append(match.raw_id)
 
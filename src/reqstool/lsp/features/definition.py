@@ -7,7 +7,7 @@ import re
 
 from lsprotocol import types
 
-from reqstool.lsp.annotation_parser import annotation_at_position
+from reqstool.lsp.annotation_parser import DocumentAnnotations
 from reqstool.lsp.project_state import ProjectState
 
 logger = logging.getLogger(__name__)
@@ -26,12 +26,13 @@ def handle_definition(
     text: str,
     language_id: str,
     project: ProjectState | None,
+    annotations: DocumentAnnotations | None = None,
 ) -> list[types.Location]:
     basename = os.path.basename(uri)
     if basename in YAML_ID_FILES:
         return _definition_from_yaml(text, position, basename, project)
     else:
-        return _definition_from_source(text, position, language_id, project)
+        return _definition_from_source(text, position, language_id, project, annotations)
 
 
 def _definition_from_source(
@@ -39,12 +40,15 @@ def _definition_from_source(
     position: types.Position,
     language_id: str,
     project: ProjectState | None,
+    annotations: DocumentAnnotations | None = None,
 ) -> list[types.Location]:
     """Go-to-definition from @Requirements/@SVCs annotation → YAML file."""
     if project is None or not project.ready:
         return []
 
-    match = annotation_at_position(text, position.line, position.character, language_id)
+    if annotations is None:
+        annotations = DocumentAnnotations(text, language_id)
+    match = annotations.at_position(position.line, position.character)
     if match is None:
         return []
 
@@ -13,7 +13,7 @@ from referencing.exceptions import Unresolvable
 
 from reqstool.common.models.lifecycle import LIFECYCLESTATE
 from reqstool.common.validators.syntax_validator import SyntaxValidator
-from reqstool.lsp.annotation_parser import find_all_annotations
+from reqstool.lsp.annotation_parser import DocumentAnnotations
 from reqstool.lsp.project_state import ProjectState
 from reqstool.lsp.workspace_manager import WorkspaceManager
 from reqstool.lsp.yaml_schema import schema_for_yaml_file
@@ -35,12 +35,13 @@ def compute_diagnostics(
     language_id: str,
     project: ProjectState | None,
     workspace_manager: WorkspaceManager | None = None,
+    annotations: DocumentAnnotations | None = None,
 ) -> list[types.Diagnostic]:
     basename = os.path.basename(uri)
     if basename in REQSTOOL_YAML_FILES:
         return _yaml_diagnostics(text, basename)
     else:
-        return _source_diagnostics(text, language_id, project, workspace_manager)
+        return _source_diagnostics(text, language_id, project, workspace_manager, annotations)
 
 
 def _source_diagnostics(
@@ -48,14 +49,16 @@ def _source_diagnostics(
     language_id: str,
     project: ProjectState | None,
     workspace_manager: WorkspaceManager | None = None,
+    annotations: DocumentAnnotations | None = None,
 ) -> list[types.Diagnostic]:
     if project is None or not project.ready:
         return []
 
-    annotations = find_all_annotations(text, language_id)
+    if annotations is None:
+        annotations = DocumentAnnotations(text, language_id)
     diagnostics: list[types.Diagnostic] = []
 
-    for match in annotations:
+    for match in annotations.matches:
         p = workspace_manager.resolve_project(match.raw_id, project) if workspace_manager else project
         if match.kind == "Requirements":
             req = p.get_requirement(match.raw_id)
@@ -160,7 +163,7 @@ def _yaml_diagnostics(text: str, filename: str) -> list[types.Diagnostic]:
     # common.schema.json#/$defs/* resolve at runtime.
     validator = Draft202012Validator(
         schema=schema,
-        registry=SyntaxValidator.registry,
+        registry=SyntaxValidator.registry(),
         format_checker=Draft202012Validator.FORMAT_CHECKER,
     )
     diagnostics: list[types.Diagnostic] = []
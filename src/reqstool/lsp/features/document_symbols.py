@@ -7,9 +7,7 @@ from urllib.parse import unquote, urlparse
 from lsprotocol import types
 
 from reqstool.lsp.project_state import ProjectState
-from reqstool.models.mvrs import MVRData
-from reqstool.models.requirements import RequirementData
-from reqstool.models.svcs import SVCData
+from reqstool.storage.records import MVRRecord, RequirementRecord, SVCRecord
 
 REQSTOOL_YAML_FILES = {
     "requirements.yml",
@@ -42,7 +40,7 @@ def handle_document_symbols(
 
 
 def _symbols_for_requirements(
-    reqs: list[RequirementData],
+    reqs: list[RequirementRecord],
     project: ProjectState,
     line_count: int,
 ) -> list[types.DocumentSymbol]:
@@ -78,7 +76,7 @@ def _symbols_for_requirements(
 
 
 def _symbols_for_svcs(
-    svcs: list[SVCData],
+    svcs: list[SVCRecord],
     project: ProjectState,
     line_count: int,
 ) -> list[types.DocumentSymbol]:
@@ -123,7 +121,7 @@ def _symbols_for_svcs(
 
 
 def _symbols_for_mvrs(
-    mvrs: list[MVRData],
+    mvrs: list[MVRRecord],
     line_count: int,
 ) -> list[types.DocumentSymbol]:
     sorted_mvrs = sorted(mvrs, key=_source_line_or_inf)
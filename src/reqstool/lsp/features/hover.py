@@ -8,7 +8,7 @@ import urllib.parse
 
 from lsprotocol import types
 
-from reqstool.lsp.annotation_parser import annotation_at_position
+from reqstool.lsp.annotation_parser import DocumentAnnotations
 from reqstool.lsp.project_state import ProjectState
 from reqstool.lsp.workspace_manager import WorkspaceManager
 from reqstool.lsp.yaml_schema import get_field_description, schema_for_yaml_file
@@ -29,12 +29,13 @@ def handle_hover(
     language_id: str,
     project: ProjectState | None,
     workspace_manager: WorkspaceManager | None = None,
+    annotations: DocumentAnnotations | None = None,
 ) -> types.Hover | None:
     basename = os.path.basename(uri)
     if basename in REQSTOOL_YAML_FILES:
         return _hover_yaml(text, position, basename)
     else:
-        return _hover_source(uri, text, position, language_id, project, workspace_manager)
+        return _hover_source(uri, text, position, language_id, project, workspace_manager, annotations)
 
 
 def _hover_source(
@@ -44,8 +45,11 @@ def _hover_source(
     language_id: str,
     project: ProjectState | None,
     workspace_manager: WorkspaceManager | None = None,
+    annotations: DocumentAnnotations | None = None,
 ) -> types.Hover | None:
-    match = annotation_at_position(text, position.line, position.character, language_id)
+    if annotations is None:
+        annotations = DocumentAnnotations(text, language_id)
+    match = annotations.at_position(position.line, position.character)
     if match is None:
         return None
 
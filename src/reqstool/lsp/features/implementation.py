@@ -7,7 +7,7 @@ import re
 
 from lsprotocol import types
 
-from reqstool.lsp.annotation_parser import annotation_at_position, find_all_annotations
+from reqstool.lsp.annotation_parser import AnnotationCache, DocumentAnnotations, annotations_of
 from reqstool.lsp.project_state import ProjectState
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,8 @@ def handle_implementation(
     language_id: str,
     project: ProjectState | None,
     workspace_text_documents: dict,
+    annotations: DocumentAnnotations | None = None,
+    annotation_cache: AnnotationCache | None = None,
 ) -> list[types.Location]:
     """Go to Test: navigate to the SVCs (in YAML) or @SVCs test annotations (in source)
     that verify a given requirement or implement a given SVC."""
@@ -37,16 +39,18 @@ def handle_implementation(
     basename = os.path.basename(uri)
 
     if basename == "requirements.yml":
-        return _from_yaml_req(text, position, workspace_text_documents)
+        return _from_yaml_req(text, position, workspace_text_documents, annotation_cache)
 
     if basename == "software_verification_cases.yml":
-        return _from_yaml_svc(text, position, workspace_text_documents)
+        return _from_yaml_svc(text, position, workspace_text_documents, annotation_cache)
 
     if basename not in REQSTOOL_YAML_FILES:
         # Source file: @Requirements annotation → source @SVCs test annotations
-        match = annotation_at_position(text, position.line, position.character, language_id)
+        if annotations is None:
+            annotations = DocumentAnnotations(text, language_id)
+        match = annotations.at_position(position.line, position.character)
         if match and match.kind == "Requirements":
-            return _svcs_in_source_for_req(match.raw_id, project, workspace_text_documents)
+            return _svcs_in_source_for_req(match.raw_id, project, workspace_text_documents, annotation_cache)
 
     return []
 
@@ -55,6 +59,7 @@ def _from_yaml_req(
     text: str,
     position: types.Position,
     workspace_text_documents: dict,
+    annotation_cache: AnnotationCache | None = None,
 ) -> list[types.Location]:
     """YAML requirements.yml id: REQ → source @Requirements annotations."""
     lines = text.splitlines()
@@ -64,17 +69,18 @@ def _from_yaml_req(
     if not m:
         return []
     bare_id = m.group(1).split(":")[-1]
-    return _req_annotations_in_source(bare_id, workspace_text_documents)
+    return _req_annotations_in_source(bare_id, workspace_text_documents, annotation_cache)
 
 
-def _req_annotations_in_source(bare_req_id: str, workspace_text_documents: dict) -> list[types.Location]:
+def _req_annotations_in_source(
+    bare_req_id: str, workspace_text_documents: dict, annotation_cache: AnnotationCache | None = None
+) -> list[types.Location]:
     """Find @Requirements("REQ-001") annotations in open source documents."""
     locations: list[types.Location] = []
     for doc_uri, doc in workspace_text_documents.items():
         if os.path.basename(doc_uri) in REQSTOOL_YAML_FILES:
             continue
-        lang = getattr(doc, "language_id", None) or ""
-        for ann in find_all_annotations(doc.source, lang):
+        for ann in annotations_of(doc_uri, doc, annotation_cache).matches:
             if ann.kind == "Requirements" and ann.raw_id.split(":")[-1] == bare_req_id:
                 locations.append(
                     types.Location(
@@ -92,6 +98,7 @@ def _from_yaml_svc(
     text: str,
     position: types.Position,
     workspace_text_documents: dict,
+    annotation_cache: AnnotationCache | None = None,
 ) -> list[types.Location]:
     """YAML svcs.yml id: SVC → source @SVCs test annotations in open documents."""
     lines = text.splitlines()
@@ -101,30 +108,32 @@ def _from_yaml_svc(
     if not m:
         return []
     bare_id = m.group(1).split(":")[-1]
-    return _svc_annotations_in_source(bare_id, workspace_text_documents)
+    return _svc_annotations_in_source(bare_id, workspace_text_documents, annotation_cache)
 
 
 def _svcs_in_source_for_req(
     raw_req_id: str,
     project: ProjectState,
     workspace_text_documents: dict,
+    annotation_cache: AnnotationCache | None = None,
 ) -> list[types.Location]:
     """Source @Requirements(REQ) → source @SVCs for all SVCs that verify this requirement."""
     svcs = project.get_svcs_for_req(raw_req_id)
     locations: list[types.Location] = []
     for svc in svcs:
-        locations.extend(_svc_annotations_in_source(svc.id.id, workspace_text_documents))
+        locations.extend(_svc_annotations_in_source(svc.id.id, workspace_text_documents, annotation_cache))
     return locations
 
 
-def _svc_annotations_in_source(bare_svc_id: str, workspace_text_documents: dict) -> list[types.Location]:
+def _svc_annotations_in_source(
+    bare_svc_id: str, workspace_text_documents: dict, annotation_cache: AnnotationCache | None = None
+) -> list[types.Location]:
     """Find @SVCs("SVC-001") annotations in open source documents."""
     locations: list[types.Location] = []
     for doc_uri, doc in workspace_text_documents.items():
         if os.path.basename(doc_uri) in REQSTOOL_YAML_FILES:
             continue
-        lang = getattr(doc, "language_id", None) or ""
-        for ann in find_all_annotations(doc.source, lang):
+        for ann in annotations_of(doc_uri, doc, annotation_cache).matches:
             if ann.kind == "SVCs" and ann.raw_id.split(":")[-1] == bare_svc_id:
                 locations.append(
                     types.Location(
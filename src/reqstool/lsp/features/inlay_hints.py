@@ -3,7 +3,7 @@
 
 from lsprotocol import types
 
-from reqstool.lsp.annotation_parser import find_all_annotations
+from reqstool.lsp.annotation_parser import DocumentAnnotations
 from reqstool.lsp.project_state import ProjectState
 from reqstool.lsp.workspace_manager import WorkspaceManager
 
@@ -15,14 +15,16 @@ def handle_inlay_hints(
     language_id: str,
     project: ProjectState | None,
     workspace_manager: WorkspaceManager | None = None,
+    annotations: DocumentAnnotations | None = None,
 ) -> list[types.InlayHint]:
     if project is None or not project.ready:
         return []
 
-    annotations = find_all_annotations(text, language_id)
+    if annotations is None:
+        annotations = DocumentAnnotations(text, language_id)
     result: list[types.InlayHint] = []
 
-    for match in annotations:
+    for match in annotations.matches:
         if match.line < range_.start.line or match.line > range_.end.line:
             continue
 
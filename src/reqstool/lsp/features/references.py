@@ -7,7 +7,7 @@ from pathlib import Path
 
 from lsprotocol import types
 
-from reqstool.lsp.annotation_parser import annotation_at_position, find_all_annotations
+from reqstool.lsp.annotation_parser import AnnotationCache, DocumentAnnotations, annotations_of
 from reqstool.lsp.project_state import ProjectState
 
 REQSTOOL_YAML_FILES = {
@@ -35,11 +35,13 @@ def handle_references(
     project: ProjectState | None,
     include_declaration: bool,
     workspace_text_documents: dict,
+    annotations: DocumentAnnotations | None = None,
+    annotation_cache: AnnotationCache | None = None,
 ) -> list[types.Location]:
     if project is None or not project.ready:
         return []
 
-    raw_id = _resolve_id_at_position(uri, position, text, language_id)
+    raw_id = _resolve_id_at_position(uri, position, text, language_id, annotations)
     if not raw_id:
         return []
 
@@ -47,7 +49,9 @@ def handle_references(
     locations: list[types.Location] = []
     seen_uris: set[str] = set()
 
-    _search_open_documents(workspace_text_documents, raw_id, pattern, include_declaration, locations, seen_uris)
+    _search_open_documents(
+        workspace_text_documents, raw_id, pattern, include_declaration, locations, seen_uris, annotation_cache
+    )
     _search_project_yaml_files(project, pattern, include_declaration, locations, seen_uris)
 
     return locations
@@ -60,6 +64,7 @@ def _search_open_documents(
     include_declaration: bool,
     locations: list[types.Location],
     seen_uris: set[str],
+    annotation_cache: AnnotationCache | None = None,
 ) -> None:
     bare_search = raw_id.split(":")[-1]
     for doc_uri, doc in workspace_text_documents.items():
@@ -68,8 +73,7 @@ def _search_open_documents(
         if basename in REQSTOOL_YAML_FILES:
             _search_yaml_text(doc_uri, doc.source, pattern, include_declaration, locations)
         else:
-            lang = getattr(doc, "language_id", None) or ""
-            for ann in find_all_annotations(doc.source, lang):
+            for ann in annotations_of(doc_uri, doc, annotation_cache).matches:
                 if ann.raw_id.split(":")[-1] == bare_search:
                     locations.append(
                         types.Location(
@@ -107,7 +111,13 @@ def _search_project_yaml_files(
                 pass
 
 
-def _resolve_id_at_position(uri: str, position: types.Position, text: str, language_id: str) -> str | None:
+def _resolve_id_at_position(
+    uri: str,
+    position: types.Position,
+    text: str,
+    language_id: str,
+    annotations: DocumentAnnotations | None = None,
+) -> str | None:
     basename = os.path.basename(uri)
     if basename in REQSTOOL_YAML_FILES:
         lines = text.splitlines()
@@ -116,7 +126,9 @@ def _resolve_id_at_position(uri: str, position: types.Position, text: str, langu
             if m:
                 return m.group(1)
         return None
-    match = annotation_at_position(text, position.line, position.character, language_id)
+    if annotations is None:
+        annotations = DocumentAnnotations(text, language_id)
+    match = annotations.at_position(position.line, position.character)
     return match.raw_id if match else None
 
 
@@ -4,7 +4,7 @@
 from lsprotocol import types
 
 from reqstool.common.models.lifecycle import LIFECYCLESTATE
-from reqstool.lsp.annotation_parser import find_all_annotations
+from reqstool.lsp.annotation_parser import DocumentAnnotations
 from reqstool.lsp.project_state import ProjectState
 from reqstool.lsp.workspace_manager import WorkspaceManager
 
@@ -37,14 +37,16 @@ def handle_semantic_tokens(
     language_id: str,
     project: ProjectState | None,
     workspace_manager: WorkspaceManager | None = None,
+    annotations: DocumentAnnotations | None = None,
 ) -> types.SemanticTokens:
     if project is None or not project.ready:
         return types.SemanticTokens(data=[])
 
-    annotations = find_all_annotations(text, language_id)
+    if annotations is None:
+        annotations = DocumentAnnotations(text, language_id)
     tokens: list[tuple[int, int, int, int]] = []
 
-    for match in annotations:
+    for match in annotations.matches:
         p = workspace_manager.resolve_project(match.raw_id, project) if workspace_manager else project
         if match.kind == "Requirements":
             item = p.get_requirement(match.raw_id)
@@ -0,0 +1,85 @@
+# Copyright © LFV
+
+"""Read-only, in-memory view of a built project for the LSP request handlers.
+
+Handlers run on every keystroke (completion, semantic tokens, inlay hints, diagnostics) and
+look entities up one id at a time, often for every id in the project. Served from SQLite,
+each lookup was a query plus row hydration, and listing ids hydrated every entity again, so
+a completion over thousands of requirements took seconds. The index is built once per
+(re)build from a handful of set-based repository queries and never changes afterwards; a
+rebuild replaces it as a whole, so a handler holding one always sees a consistent snapshot.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, TypeVar
+
+from reqstool.common.models.urn_id import UrnId
+from reqstool.storage.records import AnnotationRecord, MVRRecord, RequirementRecord, SVCRecord, TestRecord
+from reqstool.storage.requirements_repository import RequirementsRepository
+
+K = TypeVar("K")
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectIndex:
+    initial_urn: str
+    requirements: Mapping[UrnId, RequirementRecord]
+    svcs: Mapping[UrnId, SVCRecord]
+    mvrs: Mapping[UrnId, MVRRecord]
+    # Bare ids (without URN) of every entity, as the id lists of completion and symbols show them
+    requirement_ids: tuple[str, ...]
+    svc_ids: tuple[str, ...]
+    mvr_ids: tuple[str, ...]
+    # Adjacency lists of the link tables, in link order
+    svc_ids_by_req: Mapping[UrnId, tuple[UrnId, ...]]
+    mvr_ids_by_svc: Mapping[UrnId, tuple[UrnId, ...]]
+    impl_annotations_by_req: Mapping[UrnId, tuple[AnnotationRecord, ...]]
+    test_annotations_by_svc: Mapping[UrnId, tuple[AnnotationRecord, ...]]
+    test_results_by_svc: Mapping[UrnId, tuple[TestRecord, ...]]
+    urn_locations: Mapping[str, dict]
+    requirements_by_urn: Mapping[str, tuple[RequirementRecord, ...]]
+    svcs_by_urn: Mapping[str, tuple[SVCRecord, ...]]
+    mvrs_by_urn: Mapping[str, tuple[MVRRecord, ...]]
+
+    @classmethod
+    def build(cls, repo: RequirementsRepository) -> "ProjectIndex":
+        requirements = repo.get_all_requirements()
+        svcs = repo.get_all_svcs()
+        mvrs = repo.get_all_mvrs()
+
+        return cls(
+            initial_urn=repo.get_initial_urn(),
+            requirements=MappingProxyType(requirements),
+            svcs=MappingProxyType(svcs),
+            mvrs=MappingProxyType(mvrs),
+            requirement_ids=tuple(urn_id.id for urn_id in requirements),
+            svc_ids=tuple(urn_id.id for urn_id in svcs),
+            mvr_ids=tuple(urn_id.id for urn_id in mvrs),
+            svc_ids_by_req=_frozen(repo.get_svc_ids_by_req()),
+            mvr_ids_by_svc=_frozen(repo.get_mvr_ids_by_svc()),
+            impl_annotations_by_req=_frozen(repo.get_annotations_impls()),
+            test_annotations_by_svc=_frozen(repo.get_annotations_tests()),
+            test_results_by_svc=_frozen(repo.get_test_results_by_svc()),
+            urn_locations=MappingProxyType(
+                {urn: location for urn in repo.get_urn_parsing_order() if (location := repo.get_urn_location(urn))}
+            ),
+            requirements_by_urn=_by_urn(requirements),
+            svcs_by_urn=_by_urn(svcs),
+            mvrs_by_urn=_by_urn(mvrs),
+        )
+
+    def urn_id(self, raw_id: str) -> UrnId:
+        """Resolve an id as written in a document: bare ids belong to the initial URN."""
+        return UrnId.assure_urn_id(self.initial_urn, raw_id)
+
+
+def _frozen(lists: dict[K, list]) -> Mapping[K, tuple]:
+    return MappingProxyType({key: tuple(values) for key, values in lists.items()})
+
+
+def _by_urn(entities: dict[UrnId, object]) -> Mapping[str, tuple]:
+    grouped: dict[str, list] = {}
+    for urn_id, entity in entities.items():
+        grouped.setdefault(urn_id.urn, []).append(entity)
+    return _frozen(grouped)
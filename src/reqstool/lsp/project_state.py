@@ -4,121 +4,123 @@
 import logging
 import os
 
-from reqstool.common.models.urn_id import UrnId
 from reqstool.common.project_session import ProjectSession
 from reqstool.locations.local_location import LocalLocation
+from reqstool.lsp.project_index import ProjectIndex
 from reqstool.model_generators.parsing_config import ParsingConfig
-from reqstool.models.annotations import AnnotationData
-from reqstool.models.mvrs import MVRData
-from reqstool.models.requirements import RequirementData
-from reqstool.models.svcs import SVCData
-from reqstool.models.test_data import TestData
+from reqstool.storage.records import AnnotationRecord, MVRRecord, RequirementRecord, SVCRecord, TestRecord
 
 logger = logging.getLogger(__name__)
 
 
 class ProjectState(ProjectSession):
+    """A ProjectSession for the LSP, whose lookups are served from a ProjectIndex.
+
+    The index is rebuilt whenever a new snapshot is swapped in and dropped when the session
+    is closed. Handlers read ``self._index`` once per call, so a concurrent rebuild never
+    mixes two snapshots within one answer.
+    """
+
     def __init__(self, reqstool_path: str):
         super().__init__(
             LocalLocation(path=reqstool_path),
             parsing_config=ParsingConfig(include_line_numbers=True),
         )
         self._reqstool_path = reqstool_path
+        self._index: ProjectIndex | None = None
 
     @property
     def reqstool_path(self) -> str:
         return self._reqstool_path
 
+    @property
+    def index(self) -> ProjectIndex | None:
+        return self._index
+
+    def close(self) -> None:
+        with self._lock:
+            super().close()
+            self._index = None
+
+    def _snapshot_swapped_in(self) -> None:
+        self._index = ProjectIndex.build(self._repo)
+
     def get_initial_urn(self) -> str | None:
-        if not self._ready or self._repo is None:
-            return None
-        return self._repo.get_initial_urn()
+        index = self._index
+        return index.initial_urn if index is not None else None
 
-    def get_requirement(self, raw_id: str) -> RequirementData | None:
-        if not self._ready or self._repo is None:
+    def get_requirement(self, raw_id: str) -> RequirementRecord | None:
+        index = self._index
+        if index is None:
             return None
-        initial_urn = self._repo.get_initial_urn()
-        urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-        all_reqs = self._repo.get_all_requirements()
-        return all_reqs.get(urn_id)
+        return index.requirements.get(index.urn_id(raw_id))
 
-    def get_svc(self, raw_id: str) -> SVCData | None:
-        if not self._ready or self._repo is None:
+    def get_svc(self, raw_id: str) -> SVCRecord | None:
+        index = self._index
+        if index is None:
             return None
-        initial_urn = self._repo.get_initial_urn()
-        urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-        all_svcs = self._repo.get_all_svcs()
-        return all_svcs.get(urn_id)
+        return index.svcs.get(index.urn_id(raw_id))
 
-    def get_svcs_for_req(self, raw_id: str) -> list[SVCData]:
-        if not self._ready or self._repo is None:
+    def get_svcs_for_req(self, raw_id: str) -> list[SVCRecord]:
+        index = self._index
+        if index is None:
             return []
-        initial_urn = self._repo.get_initial_urn()
-        req_urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-        svc_urn_ids = self._repo.get_svcs_for_req(req_urn_id)
-        all_svcs = self._repo.get_all_svcs()
-        return [all_svcs[uid] for uid in svc_urn_ids if uid in all_svcs]
-
-    def get_mvrs_for_svc(self, raw_id: str) -> list[MVRData]:
-        if not self._ready or self._repo is None:
+        svc_urn_ids = index.svc_ids_by_req.get(index.urn_id(raw_id), ())
+        return [index.svcs[uid] for uid in svc_urn_ids if uid in index.svcs]
+
+    def get_mvrs_for_svc(self, raw_id: str) -> list[MVRRecord]:
+        index = self._index
+        if index is None:
             return []
-        initial_urn = self._repo.get_initial_urn()
-        svc_urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-        mvr_urn_ids = self._repo.get_mvrs_for_svc(svc_urn_id)
-        all_mvrs = self._repo.get_all_mvrs()
-        return [all_mvrs[uid] for uid in mvr_urn_ids if uid in all_mvrs]
+        mvr_urn_ids = index.mvr_ids_by_svc.get(index.urn_id(raw_id), ())
+        return [index.mvrs[uid] for uid in mvr_urn_ids if uid in index.mvrs]
 
     def get_all_requirement_ids(self) -> list[str]:
-        if not self._ready or self._repo is None:
-            return []
-        return [uid.id for uid in self._repo.get_all_requirements()]
+        index = self._index
+        return list(index.requirement_ids) if index is not None else []
 
-    def get_mvr(self, raw_id: str) -> MVRData | None:
-        if not self._ready or self._repo is None:
+    def get_mvr(self, raw_id: str) -> MVRRecord | None:
+        index = self._index
+        if index is None:
             return None
-        initial_urn = self._repo.get_initial_urn()
-        urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-        return self._repo.get_all_mvrs().get(urn_id)
+        return index.mvrs.get(index.urn_id(raw_id))
 
     def get_all_svc_ids(self) -> list[str]:
-        if not self._ready or self._repo is None:
-            return []
-        return [uid.id for uid in self._repo.get_all_svcs()]
+        index = self._index
+        return list(index.svc_ids) if index is not None else []
 
     def get_all_mvr_ids(self) -> list[str]:
-        if not self._ready or self._repo is None:
-            return []
-        return [uid.id for uid in self._repo.get_all_mvrs()]
+        index = self._index
+        return list(index.mvr_ids) if index is not None else []
 
     def get_yaml_paths(self) -> dict[str, dict[str, str]]:
         """Return all URN → file_type → path mappings."""
         return dict(self._urn_source_paths)
 
-    def get_impl_annotations_for_req(self, raw_id: str) -> list[AnnotationData]:
-        if not self._ready or self._repo is None:
+    def get_impl_annotations_for_req(self, raw_id: str) -> list[AnnotationRecord]:
+        index = self._index
+        if index is None:
             return []
-        initial_urn = self._repo.get_initial_urn()
-        req_urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-        return self._repo.get_annotations_impls_for_req(req_urn_id)
+        return list(index.impl_annotations_by_req.get(index.urn_id(raw_id), ()))
 
-    def get_test_annotations_for_svc(self, raw_id: str) -> list[AnnotationData]:
-        if not self._ready or self._repo is None:
+    def get_test_annotations_for_svc(self, raw_id: str) -> list[AnnotationRecord]:
+        index = self._index
+        if index is None:
             return []
-        initial_urn = self._repo.get_initial_urn()
-        svc_urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-        return self._repo.get_annotations_tests_for_svc(svc_urn_id)
+        return list(index.test_annotations_by_svc.get(index.urn_id(raw_id), ()))
 
-    def get_test_results_for_svc(self, raw_id: str) -> list[TestData]:
-        if not self._ready or self._repo is None:
+    def get_test_results_for_svc(self, raw_id: str) -> list[TestRecord]:
+        index = self._index
+        if index is None:
             return []
-        initial_urn = self._repo.get_initial_urn()
-        svc_urn_id = UrnId.assure_urn_id(initial_urn, raw_id)
-        return self._repo.get_test_results_for_svc(svc_urn_id)
+        return list(index.test_results_by_svc.get(index.urn_id(raw_id), ()))
 
     def get_urn_location(self, urn: str) -> dict | None:
-        if not self._ready or self._repo is None:
+        index = self._index
+        if index is None:
             return None
-        return self._repo.get_urn_location(urn)
+        location = index.urn_locations.get(urn)
+        return dict(location) if location is not None else None
 
     def get_yaml_path(self, urn: str, file_type: str) -> str | None:
         """Return the resolved file path for a given URN and file type (requirements, svcs, mvrs, annotations)."""
@@ -135,26 +137,29 @@ class ProjectState(ProjectSession):
                 return urn
         return None
 
-    def get_requirements_for_yaml(self, file_path: str) -> list[RequirementData]:
-        if not self._ready or self._repo is None:
+    def get_requirements_for_yaml(self, file_path: str) -> list[RequirementRecord]:
+        index = self._index
+        if index is None:
             return []
         urn = self._urn_for_yaml_path(file_path, "requirements")
         if urn is None:
             return []
-        return [r for r in self._repo.get_all_requirements().values() if r.id.urn == urn]
+        return list(index.requirements_by_urn.get(urn, ()))
 
-    def get_svcs_for_yaml(self, file_path: str) -> list[SVCData]:
-        if not self._ready or self._repo is None:
+    def get_svcs_for_yaml(self, file_path: str) -> list[SVCRecord]:
+        index = self._index
+        if index is None:
             return []
         urn = self._urn_for_yaml_path(file_path, "svcs")
         if urn is None:
             return []
-        return [s for s in self._repo.get_all_svcs().values() if s.id.urn == urn]
+        return list(index.svcs_by_urn.get(urn, ()))
 
-    def get_mvrs_for_yaml(self, file_path: str) -> list[MVRData]:
-        if not self._ready or self._repo is None:
+    def get_mvrs_for_yaml(self, file_path: str) -> list[MVRRecord]:
+        index = self._index
+        if index is None:
             return []
         urn = self._urn_for_yaml_path(file_path, "mvrs")
         if urn is None:
             return []
-        return [m for m in self._repo.get_all_mvrs().values() if m.id.urn == urn]
+        return list(index.mvrs_by_urn.get(urn, ()))
@@ -1,19 +1,54 @@
 # Copyright © LFV
 
+"""Find the root reqstool projects of a workspace folder.
+
+Directories are listed and requirements.yml files read on a thread pool, level by level,
+since discovery is I/O bound and large monorepos have many of both. A requirements.yml is
+not loaded as YAML: a line scan picks out ``metadata.urn``, ``metadata.variant`` and the
+``path`` of local imports and implementations, and only files the scan cannot make sense
+of (flow style, anchors, quoting it does not handle) fall back to a full YAML load.
+
+Given a DiscoveryCache, what was found is persisted per workspace folder. On the next
+discovery a directory whose mtime (and .reqstoolignore) is unchanged is not listed again,
+and a requirements.yml whose mtime and size are unchanged is not read again.
+"""
 
 import fnmatch
+import hashlib
+import json
 import logging
 import os
+import re
+import tempfile
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 from ruamel.yaml import YAML
 
+from reqstool.common.utils import Utils
 from reqstool.models.requirements import VARIANTS
 
 logger = logging.getLogger(__name__)
 
 SKIP_DIRS = {".git", "node_modules", "build", "target", "__pycache__", ".hatch", ".tox", ".venv", "venv"}
 MAX_DEPTH = 5
+# Threads listing directories and reading files; discovery waits on the file system, not the CPU
+DISCOVERY_WORKERS = 8
+
+REQUIREMENTS_FILE = "requirements.yml"
+IGNORE_FILE = ".reqstoolignore"
+
+# Bump when the layout of cache files changes in a way the version string would not catch
+_CACHE_FORMAT_VERSION = 1
+# Entries modified this recently (relative to the start of discovery) are not cached: a change
+# within the file system's timestamp granularity would leave the mtime as it was
+_RACY_WINDOW_NS = 2_000_000_000
+
+_TOP_LEVEL_KEY_RE = re.compile(r"^([A-Za-z_][\w-]*)[ \t]*:(?:[ \t]+(.*))?$")
+_NESTED_KEY_RE = re.compile(r"^( +)(- +)?([A-Za-z_][\w-]*)[ \t]*:(?:[ \t]+(.*))?$")
+_PRESCANNED_SECTIONS = {"metadata", "imports", "implementations"}
+_UNSUPPORTED_SCALAR_START = tuple("[]{}&*!|>%@`")
 
 
 @dataclass(frozen=True)
@@ -25,34 +60,161 @@ class DiscoveredProject:
     implemented_urns: frozenset[str] = field(default_factory=frozenset)  # URNs referenced in implementations
 
 
-def discover_root_projects(workspace_folder: str) -> list[DiscoveredProject]:
+@dataclass(frozen=True)
+class _Listing:
+    """What discovery needs of a directory, as of its ``mtime_ns``."""
+
+    mtime_ns: int
+    ignore_stamp: tuple[int, int] | None  # (mtime_ns, size) of its .reqstoolignore, if any
+    has_requirements: bool
+    subdirs: tuple[str, ...]  # names of the child directories to descend into
+
+
+@dataclass(frozen=True)
+class _Parsed:
+    """The quick-parse of a requirements.yml with the (mtime_ns, size) it was read at."""
+
+    stamp: tuple[int, int]
+    project: DiscoveredProject | None  # None: not a usable reqstool project
+
+
+class DiscoveryCache:
+    """Results of root discovery kept on disk between language server runs.
+
+    Layout::
+
+        <cache_dir>/<sha256 of the workspace folder path>.json
+    """
+
+    def __init__(self, cache_dir: str):
+        self._cache_dir = cache_dir
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def load(self, workspace_folder: str) -> tuple[dict[str, _Listing], dict[str, _Parsed]]:
+        """The listings and parses stored for ``workspace_folder``; empty if there are none (or they are unusable)."""
+        try:
+            with open(self.__path(workspace_folder), encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") != _CACHE_FORMAT_VERSION or data.get("reqstool_version") != Utils.get_version():
+                return {}, {}
+            listings = {path: _listing_from_dict(entry) for path, entry in data["directories"].items()}
+            parses = {path: _parsed_from_dict(path, entry) for path, entry in data["requirements_files"].items()}
+        except FileNotFoundError:
+            return {}, {}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug("Ignoring unreadable discovery cache for %s: %s", workspace_folder, e)
+            return {}, {}
+        return listings, parses
+
+    def store(self, workspace_folder: str, listings: dict[str, _Listing], parses: dict[str, _Parsed]) -> None:
+        data = {
+            "format": _CACHE_FORMAT_VERSION,
+            "reqstool_version": Utils.get_version(),
+            "workspace_folder": workspace_folder,
+            "directories": {path: _listing_to_dict(listing) for path, listing in listings.items()},
+            "requirements_files": {path: _parsed_to_dict(parsed) for path, parsed in parses.items()},
+        }
+        tmp_path = None
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=self._cache_dir)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.__path(workspace_folder))
+        except OSError as e:
+            logger.warning("Could not write discovery cache for %s: %s", workspace_folder, e)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def __path(self, workspace_folder: str) -> str:
+        key = hashlib.sha256(os.path.normpath(workspace_folder).encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, f"{key}.json")
+
+
+def discover_root_projects(workspace_folder: str, cache: DiscoveryCache | None = None) -> list[DiscoveredProject]:
     """Find root reqstool projects in a workspace folder.
 
-    1. Glob for **/requirements.yml (max depth, skip build dirs)
+    1. Walk the folder for requirements.yml files (max depth, skip build dirs)
     2. Quick-parse each: extract metadata.urn, metadata.variant, imports, implementations
     3. Build local reference graph
     4. Return projects not referenced by any other local project (externals excluded)
     """
-    req_files = _find_requirements_files(workspace_folder)
-    if not req_files:
-        return []
-
-    projects = []
-    for req_file in req_files:
-        project = _quick_parse(req_file)
-        if project is not None:
-            projects.append(project)
-
+    started_ns = time.time_ns()
+    cached_listings, cached_parses = cache.load(workspace_folder) if cache is not None else ({}, {})
+
+    with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS, thread_name_prefix="reqstool-discovery") as executor:
+        listings = _walk(workspace_folder, executor, cached_listings)
+        req_dirs = sorted(path for path, listing in listings.items() if listing.has_requirements)
+        parses = dict(
+            zip(req_dirs, executor.map(lambda req_dir: _parse(req_dir, cached_parses.get(req_dir)), req_dirs))
+        )
+
+    if cache is not None:
+        settled_before_ns = started_ns - _RACY_WINDOW_NS
+        cache.store(
+            workspace_folder,
+            {path: listing for path, listing in listings.items() if listing.mtime_ns < settled_before_ns},
+            {
+                path: parsed
+                for path, parsed in parses.items()
+                if parsed is not None and parsed.stamp[0] < settled_before_ns
+            },
+        )
+
+    projects = [parsed.project for parsed in parses.values() if parsed is not None and parsed.project is not None]
     if not projects:
         return []
 
     return _find_roots(projects)
 
 
-def _find_requirements_files(workspace_folder: str) -> list[str]:
-    results = []
-    _walk_dir(workspace_folder, 0, results)
-    return results
+def _walk(workspace_folder: str, executor: Executor, cached: dict[str, _Listing]) -> dict[str, _Listing]:
+    """List every directory down to MAX_DEPTH, one level at a time; unreadable directories are left out."""
+    listings: dict[str, _Listing] = {}
+    level = [workspace_folder]
+    for _ in range(MAX_DEPTH + 1):
+        if not level:
+            break
+        next_level = []
+        for dirpath, listing in zip(level, executor.map(lambda path: _list_dir(path, cached.get(path)), level)):
+            if listing is None:
+                continue
+            listings[dirpath] = listing
+            next_level.extend(os.path.join(dirpath, name) for name in listing.subdirs)
+        level = next_level
+    return listings
+
+
+def _list_dir(dirpath: str, cached: _Listing | None) -> _Listing | None:
+    try:
+        mtime_ns = os.stat(dirpath).st_mtime_ns
+    except OSError:
+        return None
+    ignore_stamp = _stamp(os.path.join(dirpath, IGNORE_FILE))
+    if cached is not None and cached.mtime_ns == mtime_ns and cached.ignore_stamp == ignore_stamp:
+        return cached
+
+    patterns = _read_ignore_patterns(dirpath)  # None → no file; [] → no effective patterns
+
+    has_requirements = False
+    subdirs = []
+    try:
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name == REQUIREMENTS_FILE:
+                    has_requirements = True
+                elif entry.is_dir() and not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
+                    if not patterns or not any(fnmatch.fnmatch(entry.name, p) for p in patterns):
+                        subdirs.append(entry.name)
+    except OSError:
+        return None
+
+    return _Listing(
+        mtime_ns=mtime_ns, ignore_stamp=ignore_stamp, has_requirements=has_requirements, subdirs=tuple(sorted(subdirs))
+    )
 
 
 def _read_ignore_patterns(dirpath: str) -> list[str] | None:
@@ -63,7 +225,7 @@ def _read_ignore_patterns(dirpath: str) -> list[str] | None:
         []  (empty)     — file exists but is empty; caller should skip dirpath entirely
         [pattern, ...]  — glob patterns; caller should skip child dirs whose names match
     """
-    ignore_file = os.path.join(dirpath, ".reqstoolignore")
+    ignore_file = os.path.join(dirpath, IGNORE_FILE)
     if not os.path.exists(ignore_file):
         return None
     try:
@@ -74,45 +236,39 @@ def _read_ignore_patterns(dirpath: str) -> list[str] | None:
     return patterns
 
 
-def _walk_dir(dirpath: str, depth: int, results: list[str]) -> None:
-    if depth > MAX_DEPTH:
-        return
-
-    patterns = _read_ignore_patterns(dirpath)  # None → no file; [] → no effective patterns
-
+def _stamp(path: str) -> tuple[int, int] | None:
     try:
-        entries = os.scandir(dirpath)
-    except PermissionError:
-        return
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
-    subdirs = []
-    for entry in entries:
-        if entry.is_file() and entry.name == "requirements.yml":
-            results.append(dirpath)
-        elif entry.is_dir() and not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
-            if not patterns or not any(fnmatch.fnmatch(entry.name, p) for p in patterns):
-                subdirs.append(entry.path)
 
-    for subdir in subdirs:
-        _walk_dir(subdir, depth + 1, results)
+def _parse(req_dir: str, cached: _Parsed | None) -> _Parsed | None:
+    stamp = _stamp(os.path.join(req_dir, REQUIREMENTS_FILE))
+    if stamp is None:
+        return None
+    if cached is not None and cached.stamp == stamp:
+        return cached
+    return _Parsed(stamp=stamp, project=_quick_parse(req_dir))
 
 
 def _quick_parse(req_dir: str) -> DiscoveredProject | None:
-    req_file = os.path.join(req_dir, "requirements.yml")
-    yaml = YAML()
+    req_file = os.path.join(req_dir, REQUIREMENTS_FILE)
     try:
-        with open(req_file) as f:
-            data = yaml.load(f)
-    except Exception as e:
-        logger.warning("Failed to parse %s: %s", req_file, e)
+        with open(req_file, encoding="utf-8") as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning("Failed to read %s: %s", req_file, e)
         return None
 
-    if not isinstance(data, dict):
-        return None
+    fields = _prescan(text)
+    if fields is None:
+        fields = _yaml_fields(text, req_file)
+        if fields is None:
+            return None
+    urn, variant_str, imported_urns, implemented_urns = fields
 
-    metadata = data.get("metadata", {})
-    urn = metadata.get("urn")
-    variant_str = metadata.get("variant")
     if not urn or not variant_str:
         return None
 
@@ -122,9 +278,6 @@ def _quick_parse(req_dir: str) -> DiscoveredProject | None:
         logger.warning("Unknown variant %r in %s", variant_str, req_file)
         return None
 
-    imported_urns = _extract_import_urns(data)
-    implemented_urns = _extract_implementation_urns(data)
-
     return DiscoveredProject(
         path=req_dir,
         urn=urn,
@@ -134,6 +287,145 @@ def _quick_parse(req_dir: str) -> DiscoveredProject | None:
     )
 
 
+def _prescan(text: str) -> tuple[str | None, str | None, set[str], set[str]] | None:
+    """Pick (urn, variant, local import paths, local implementation paths) out of block-style YAML.
+
+    Returns None if the text uses anything the scan does not follow in those sections; the
+    caller then loads it as YAML.
+    """
+    scan = _Prescan()
+    for line in text.splitlines():
+        if not scan.feed(line):
+            return None
+    return scan.metadata.get("urn"), scan.metadata.get("variant"), scan.paths["imports"], scan.paths["implementations"]
+
+
+class _Prescan:
+    """State of a _prescan(); feed() returns False on a line it cannot follow."""
+
+    def __init__(self):
+        self.metadata: dict[str, str] = {}
+        self.paths: dict[str, set[str]] = {"imports": set(), "implementations": set()}
+        self._section: str | None = None
+        self._child_indent: int | None = None
+        self._in_local = False
+        self._seen_content = False
+        # Column of the key whose scalar was read last: a more indented line would continue it
+        self._scalar_column: int | None = None
+
+    def feed(self, line: str) -> bool:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            return True
+        if line.startswith(("---", "...")):
+            return not self._seen_content  # several documents
+        self._seen_content = True
+        if line.startswith("\t"):
+            return False
+        if not line.startswith(" "):
+            return self.__top_level_key(line)
+        if self._section not in _PRESCANNED_SECTIONS:
+            return True
+        return self.__nested_line(line)
+
+    def __top_level_key(self, line: str) -> bool:
+        match = _TOP_LEVEL_KEY_RE.match(line)
+        if match is None:
+            return False
+        self._section, self._child_indent, self._in_local, self._scalar_column = match.group(1), None, False, None
+        # A value on the line itself is flow style, or a scalar where a mapping belongs
+        return self._section not in _PRESCANNED_SECTIONS or not _strip_comment(match.group(2))
+
+    def __nested_line(self, line: str) -> bool:
+        match = _NESTED_KEY_RE.match(line)
+        indent = len(line) - len(line.lstrip(" "))
+        if self._child_indent is None:
+            self._child_indent = indent
+        if indent < self._child_indent or (self._scalar_column is not None and indent > self._scalar_column):
+            return False
+        self._scalar_column = None
+
+        if indent == self._child_indent:
+            if match is None or match.group(2):
+                return False
+            return self.__child_key(indent, match.group(3), match.group(4))
+        if not self._in_local:
+            return True
+        if match is None:
+            # Flow-style entries, quoted keys and a lone "-" followed by its keys are left to the YAML load
+            return False
+        if match.group(3) != "path":
+            return True
+        return self.__read_scalar(indent + len(match.group(2) or ""), match.group(4), self.paths[self._section].add)
+
+    def __child_key(self, indent: int, key: str, value: str | None) -> bool:
+        if self._section == "metadata":
+            if key not in ("urn", "variant"):
+                return True
+            return self.__read_scalar(indent, value, lambda scalar: self.metadata.__setitem__(key, scalar))
+        self._in_local = key == "local"
+        return not (self._in_local and _strip_comment(value))
+
+    def __read_scalar(self, column: int, value: str | None, store) -> bool:
+        scalar = _scalar(value)
+        if scalar is None:
+            return False
+        store(scalar)
+        self._scalar_column = column
+        return True
+
+
+def _strip_comment(value: str | None) -> str:
+    if not value:
+        return ""
+    if value.startswith("#"):
+        return ""
+    return re.split(r"[ \t]+#", value, maxsplit=1)[0].strip()
+
+
+def _scalar(value: str | None) -> str | None:
+    """The string a plain or simply quoted YAML scalar stands for, or None if it is anything else."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value[0] in "\"'":
+        quote = value[0]
+        end = value.find(quote, 1)
+        while quote == "'" and end != -1 and value.startswith("''", end):
+            end = value.find(quote, end + 2)
+        if end == -1 or _strip_comment(value[end + 1 :]):  # noqa: E203
+            return None
+        inner = value[1:end]
+        if quote == '"':
+            return None if "\\" in inner else inner
+        return inner.replace("''", "'")
+    value = _strip_comment(value)
+    if not value or value.startswith(_UNSUPPORTED_SCALAR_START) or ": " in value:
+        return None
+    return value
+
+
+def _yaml_fields(text: str, req_file: str) -> tuple[str | None, str | None, set[str], set[str]] | None:
+    try:
+        data = YAML().load(text)
+    except Exception as e:
+        logger.warning("Failed to parse %s: %s", req_file, e)
+        return None
+
+    if not isinstance(data, dict):
+        return None
+
+    metadata = data.get("metadata", {})
+    if not isinstance(metadata, dict):
+        return None
+    return (
+        metadata.get("urn"),
+        metadata.get("variant"),
+        _extract_import_urns(data),
+        _extract_implementation_urns(data),
+    )
+
+
 def _extract_import_urns(data: dict) -> set[str]:
     """Extract URNs referenced in the imports section.
 
@@ -169,6 +461,60 @@ def _extract_implementation_urns(data: dict) -> set[str]:
     return urns
 
 
+def _listing_to_dict(listing: _Listing) -> dict:
+    return {
+        "mtime_ns": listing.mtime_ns,
+        "ignore_stamp": list(listing.ignore_stamp) if listing.ignore_stamp is not None else None,
+        "has_requirements": listing.has_requirements,
+        "subdirs": list(listing.subdirs),
+    }
+
+
+def _listing_from_dict(entry: dict) -> _Listing:
+    ignore_stamp = entry["ignore_stamp"]
+    return _Listing(
+        mtime_ns=int(entry["mtime_ns"]),
+        ignore_stamp=(int(ignore_stamp[0]), int(ignore_stamp[1])) if ignore_stamp is not None else None,
+        has_requirements=bool(entry["has_requirements"]),
+        subdirs=tuple(str(name) for name in entry["subdirs"]),
+    )
+
+
+def _parsed_to_dict(parsed: _Parsed) -> dict:
+    project = parsed.project
+    return {
+        "stamp": list(parsed.stamp),
+        "project": (
+            {
+                "urn": project.urn,
+                "variant": project.variant.value,
+                "imported_urns": sorted(project.imported_urns),
+                "implemented_urns": sorted(project.implemented_urns),
+            }
+            if project is not None
+            else None
+        ),
+    }
+
+
+def _parsed_from_dict(req_dir: str, entry: dict) -> _Parsed:
+    project = entry["project"]
+    return _Parsed(
+        stamp=(int(entry["stamp"][0]), int(entry["stamp"][1])),
+        project=(
+            DiscoveredProject(
+                path=req_dir,
+                urn=project["urn"],
+                variant=VARIANTS(project["variant"]),
+                imported_urns=frozenset(project["imported_urns"]),
+                implemented_urns=frozenset(project["implemented_urns"]),
+            )
+            if project is not None
+            else None
+        ),
+    )
+
+
 def _find_roots(projects: list[DiscoveredProject]) -> list[DiscoveredProject]:
     """A project is a root if no other local project references it.
 
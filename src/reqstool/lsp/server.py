@@ -1,12 +1,17 @@
 # Copyright © LFV
 
 
+import asyncio
 import logging
+import os
+import uuid
 from importlib.metadata import PackageNotFoundError, version as _pkg_version
 
 from lsprotocol import types
 from pygls.lsp.server import LanguageServer
 
+from reqstool.lsp.annotation_parser import AnnotationCache, annotations_of
+from reqstool.lsp.diagnostics_scheduler import DiagnosticsScheduler
 from reqstool.lsp.features.code_actions import handle_code_actions
 from reqstool.lsp.features.codelens import handle_code_lens
 from reqstool.lsp.features.completion import handle_completion
@@ -21,6 +26,8 @@ from reqstool.lsp.features.implementation import handle_implementation
 from reqstool.lsp.features.references import handle_references
 from reqstool.lsp.features.semantic_tokens import SEMANTIC_TOKEN_LEGEND, handle_semantic_tokens
 from reqstool.lsp.features.workspace_symbols import handle_workspace_symbols
+from reqstool.lsp.project_state import ProjectState
+from reqstool.lsp.root_discovery import DiscoveryCache
 from reqstool.lsp.workspace_manager import WorkspaceManager
 
 logger = logging.getLogger(__name__)
@@ -35,7 +42,18 @@ except PackageNotFoundError:
 class ReqstoolLanguageServer(LanguageServer):
     def __init__(self):
         super().__init__(name=SERVER_NAME, version=SERVER_VERSION)
-        self.workspace_manager = WorkspaceManager()
+        # The loop handlers run on; set once initialized, used to hand work back from worker threads
+        self.event_loop: asyncio.AbstractEventLoop | None = None
+        self.build_progress: dict[ProjectState, _BuildProgress] = {}
+        self.workspace_manager = WorkspaceManager(
+            on_build_started=lambda project: _call_on_loop(self, _on_build_started, self, project),
+            on_build_finished=lambda project, initial: _call_on_loop(self, _on_build_finished, self, project, initial),
+        )
+        self.annotation_cache = AnnotationCache()
+        self.diagnostics = DiagnosticsScheduler(
+            compute=lambda uri: _compute_diagnostics_for_document(self, uri),
+            publish=lambda uri, diagnostics: _send_diagnostics(self, uri, diagnostics),
+        )
 
 
 server = ReqstoolLanguageServer()
@@ -47,12 +65,14 @@ server = ReqstoolLanguageServer()
 @server.feature(types.INITIALIZED)
 def on_initialized(ls: ReqstoolLanguageServer, params: types.InitializedParams) -> None:
     logger.info("reqstool LSP server initialized")
+    ls.event_loop = asyncio.get_running_loop()
     _discover_and_build(ls)
 
 
 @server.feature(types.SHUTDOWN)
 def on_shutdown(ls: ReqstoolLanguageServer, params: None) -> None:
     logger.info("reqstool LSP server shutting down")
+    ls.diagnostics.close()
     ls.workspace_manager.close_all()
 
 
@@ -61,12 +81,20 @@ def on_shutdown(ls: ReqstoolLanguageServer, params: None) -> None:
 
 @server.feature(types.TEXT_DOCUMENT_DID_OPEN)
 def on_did_open(ls: ReqstoolLanguageServer, params: types.DidOpenTextDocumentParams) -> None:
-    _publish_diagnostics_for_document(ls, params.text_document.uri)
+    # A (re)opened document gets its diagnostics even if they equal the last ones sent
+    ls.diagnostics.cancel(params.text_document.uri)
+    ls.diagnostics.schedule(params.text_document.uri, delay=0)
 
 
 @server.feature(types.TEXT_DOCUMENT_DID_CHANGE)
 def on_did_change(ls: ReqstoolLanguageServer, params: types.DidChangeTextDocumentParams) -> None:
-    _publish_diagnostics_for_document(ls, params.text_document.uri)
+    uri = params.text_document.uri
+    document = ls.workspace.get_text_document(uri)
+    # The workspace has already applied the changes; re-scan only the lines they touched
+    ls.annotation_cache.update(
+        uri, document.source, document.language_id or "", document.version, params.content_changes
+    )
+    ls.diagnostics.schedule(uri)
 
 
 @server.feature(types.TEXT_DOCUMENT_DID_SAVE)
@@ -74,14 +102,16 @@ def on_did_save(ls: ReqstoolLanguageServer, params: types.DidSaveTextDocumentPar
     uri = params.text_document.uri
     if WorkspaceManager.is_static_yaml(uri):
         logger.info("Static YAML file saved, rebuilding affected project: %s", uri)
+        # Diagnostics are republished once the rebuild has finished
         ls.workspace_manager.rebuild_affected(uri)
-        _publish_all_diagnostics(ls)
     else:
-        _publish_diagnostics_for_document(ls, uri)
+        ls.diagnostics.schedule(uri)
 
 
 @server.feature(types.TEXT_DOCUMENT_DID_CLOSE)
 def on_did_close(ls: ReqstoolLanguageServer, params: types.DidCloseTextDocumentParams) -> None:
+    ls.annotation_cache.discard(params.text_document.uri)
+    ls.diagnostics.cancel(params.text_document.uri)
     # Clear diagnostics for closed document
     ls.text_document_publish_diagnostics(types.PublishDiagnosticsParams(uri=params.text_document.uri, diagnostics=[]))
 
@@ -97,7 +127,7 @@ def on_workspace_folders_changed(ls: ReqstoolLanguageServer, params: types.DidCh
 
     for added in params.event.added:
         logger.info("Workspace folder added: %s", added.uri)
-        ls.workspace_manager.add_folder(added.uri)
+    ls.workspace_manager.add_folders([added.uri for added in params.event.added])
 
     _publish_all_diagnostics(ls)
 
@@ -115,7 +145,6 @@ def on_watched_files_changed(ls: ReqstoolLanguageServer, params: types.DidChange
 
     if rebuild_needed:
         ls.workspace_manager.rebuild_all()
-        _publish_all_diagnostics(ls)
 
 
 # -- Commands --
@@ -125,8 +154,9 @@ def on_watched_files_changed(ls: ReqstoolLanguageServer, params: types.DidChange
 def cmd_refresh(ls: ReqstoolLanguageServer, *args) -> None:
     logger.info("Manual refresh requested")
     ls.workspace_manager.rebuild_all()
-    _publish_all_diagnostics(ls)
-    ls.window_show_message(types.ShowMessageParams(type=types.MessageType.Info, message="reqstool: projects refreshed"))
+    ls.window_show_message(
+        types.ShowMessageParams(type=types.MessageType.Info, message="reqstool: refreshing projects")
+    )
 
 
 # -- Feature handlers --
@@ -143,6 +173,7 @@ def on_hover(ls: ReqstoolLanguageServer, params: types.HoverParams) -> types.Hov
         language_id=document.language_id or "",
         project=project,
         workspace_manager=ls.workspace_manager,
+        annotations=annotations_of(params.text_document.uri, document, ls.annotation_cache),
     )
 
 
@@ -172,6 +203,7 @@ def on_definition(ls: ReqstoolLanguageServer, params: types.DefinitionParams) ->
         text=document.source,
         language_id=document.language_id or "",
         project=project,
+        annotations=annotations_of(params.text_document.uri, document, ls.annotation_cache),
     )
 
 
@@ -252,6 +284,7 @@ def on_code_lens(ls: ReqstoolLanguageServer, params: types.CodeLensParams) -> li
         language_id=document.language_id or "",
         project=project,
         workspace_manager=ls.workspace_manager,
+        annotations=annotations_of(params.text_document.uri, document, ls.annotation_cache),
     )
 
 
@@ -266,6 +299,7 @@ def on_inlay_hint(ls: ReqstoolLanguageServer, params: types.InlayHintParams) ->
         language_id=document.language_id or "",
         project=project,
         workspace_manager=ls.workspace_manager,
+        annotations=annotations_of(params.text_document.uri, document, ls.annotation_cache),
     )
 
 
@@ -280,6 +314,8 @@ def on_implementation(ls: ReqstoolLanguageServer, params: types.ImplementationPa
         language_id=document.language_id or "",
         project=project,
         workspace_text_documents=ls.workspace.text_documents,
+        annotations=annotations_of(params.text_document.uri, document, ls.annotation_cache),
+        annotation_cache=ls.annotation_cache,
     )
 
 
@@ -295,6 +331,8 @@ def on_references(ls: ReqstoolLanguageServer, params: types.ReferenceParams) ->
         project=project,
         include_declaration=params.context.include_declaration,
         workspace_text_documents=ls.workspace.text_documents,
+        annotations=annotations_of(params.text_document.uri, document, ls.annotation_cache),
+        annotation_cache=ls.annotation_cache,
     )
 
 
@@ -313,6 +351,7 @@ def on_semantic_tokens(ls: ReqstoolLanguageServer, params: types.SemanticTokensP
         language_id=document.language_id or "",
         project=project,
         workspace_manager=ls.workspace_manager,
+        annotations=annotations_of(params.text_document.uri, document, ls.annotation_cache),
     )
 
 
@@ -331,6 +370,7 @@ def on_code_action(ls: ReqstoolLanguageServer, params: types.CodeActionParams) -
         language_id=document.language_id or "",
         project=project,
         workspace_manager=ls.workspace_manager,
+        annotations=annotations_of(params.text_document.uri, document, ls.annotation_cache),
     )
 
 
@@ -349,55 +389,128 @@ def _discover_and_build(ls: ReqstoolLanguageServer) -> None:
         logger.info("No workspace folders found")
         return
 
-    for folder_uri, folder in folders.items():
+    for folder in folders.values():
         logger.info("Discovering reqstool projects in workspace folder: %s", folder.name)
-        projects = ls.workspace_manager.add_folder(folder_uri)
-        for project in projects:
-            if project.ready:
-                ls.window_show_message(
-                    types.ShowMessageParams(
-                        type=types.MessageType.Info,
-                        message=f"reqstool: loaded project at {project.reqstool_path}",
-                    )
-                )
-            elif project.error:
-                ls.window_show_message(
-                    types.ShowMessageParams(
-                        type=types.MessageType.Warning,
-                        message=f"reqstool: failed to load {project.reqstool_path}: {project.error}",
-                    )
-                )
-
-
-def _publish_diagnostics_for_document(ls: ReqstoolLanguageServer, uri: str) -> None:
-    """Publish diagnostics for a single document."""
+    ls.workspace_manager.add_folders(list(folders))
+
+
+def _call_on_loop(ls: ReqstoolLanguageServer, callback, *args) -> None:
+    """Run ``callback(*args)`` on the server's event loop (directly if there is none yet)."""
+    loop = ls.event_loop
+    if loop is None:
+        callback(*args)
+        return
+    try:
+        loop.call_soon_threadsafe(callback, *args)
+    except RuntimeError:
+        # The event loop has been closed: the server is gone
+        pass
+
+
+class _BuildProgress:
+    """A window/workDoneProgress for one project build.
+
+    begin is sent once the client has accepted the token, and end only after begin.
+    """
+
+    def __init__(self, ls: ReqstoolLanguageServer, message: str):
+        self._ls = ls
+        self._token = f"reqstool-build-{uuid.uuid4().hex}"
+        self._begin = types.WorkDoneProgressBegin(title="reqstool", message=message)
+        self._created = False
+        self._end: types.WorkDoneProgressEnd | None = None
+        ls.work_done_progress.create(self._token, callback=self.__created)
+
+    def end(self, message: str) -> None:
+        self._end = types.WorkDoneProgressEnd(message=message)
+        if self._created:
+            self.__send_end()
+
+    def __created(self, _result) -> None:
+        self._created = True
+        self._ls.work_done_progress.begin(self._token, self._begin)
+        if self._end is not None:
+            self.__send_end()
+
+    def __send_end(self) -> None:
+        self._ls.work_done_progress.end(self._token, self._end)
+        self._ls.work_done_progress.tokens.pop(self._token, None)
+
+
+def _supports_work_done_progress(ls: ReqstoolLanguageServer) -> bool:
+    window = ls.client_capabilities.window
+    return bool(window and window.work_done_progress)
+
+
+def _on_build_started(ls: ReqstoolLanguageServer, project: ProjectState) -> None:
+    if _supports_work_done_progress(ls):
+        ls.build_progress[project] = _BuildProgress(ls, f"Loading {project.reqstool_path}")
+
+
+def _on_build_finished(ls: ReqstoolLanguageServer, project: ProjectState, initial: bool) -> None:
+    progress = ls.build_progress.pop(project, None)
+    if progress is not None:
+        progress.end("Loaded" if project.error is None else f"Failed: {project.error}")
+
+    if initial and project.ready and project.error is None:
+        ls.window_show_message(
+            types.ShowMessageParams(
+                type=types.MessageType.Info,
+                message=f"reqstool: loaded project at {project.reqstool_path}",
+            )
+        )
+    elif initial and project.error:
+        ls.window_show_message(
+            types.ShowMessageParams(
+                type=types.MessageType.Warning,
+                message=f"reqstool: failed to load {project.reqstool_path}: {project.error}",
+            )
+        )
+
+    _publish_all_diagnostics(ls)
+
+
+def _compute_diagnostics_for_document(ls: ReqstoolLanguageServer, uri: str) -> list[types.Diagnostic] | None:
+    """Compute diagnostics for a single open document (on a DiagnosticsScheduler worker)."""
     try:
         document = ls.workspace.get_text_document(uri)
     except Exception:
-        return
+        return None
     project = ls.workspace_manager.project_for_file(uri)
-    diagnostics = compute_diagnostics(
+    return compute_diagnostics(
         uri=uri,
         text=document.source,
         language_id=document.language_id or "",
         project=project,
         workspace_manager=ls.workspace_manager,
+        annotations=annotations_of(uri, document, ls.annotation_cache),
     )
+
+
+def _send_diagnostics(ls: ReqstoolLanguageServer, uri: str, diagnostics: list[types.Diagnostic]) -> None:
     ls.text_document_publish_diagnostics(types.PublishDiagnosticsParams(uri=uri, diagnostics=diagnostics))
 
 
 def _publish_all_diagnostics(ls: ReqstoolLanguageServer) -> None:
-    """Re-publish diagnostics for all open documents."""
+    """Re-publish diagnostics for all open documents, in the background."""
     for uri in list(ls.workspace.text_documents.keys()):
-        _publish_diagnostics_for_document(ls, uri)
+        ls.diagnostics.schedule(uri, delay=0)
 
 
-def start_server(tcp: bool = False, host: str = "127.0.0.1", port: int = 2087, log_file: str | None = None) -> None:
+def start_server(
+    tcp: bool = False,
+    host: str = "127.0.0.1",
+    port: int = 2087,
+    log_file: str | None = None,
+    cache_dir: str | None = None,
+) -> None:
     """Entry point for `reqstool lsp` command."""
     handlers: list[logging.Handler] = [logging.StreamHandler()]
     if log_file:
         handlers.append(logging.FileHandler(log_file))
     logging.basicConfig(level=logging.INFO, handlers=handlers, force=True)
+    if cache_dir:
+        server.workspace_manager.discovery_cache = DiscoveryCache(os.path.join(cache_dir, "discovery"))
     try:
         if tcp:
             logger.info("Starting reqstool LSP server (TCP %s:%d)", host, port)
@@ -3,11 +3,14 @@
 
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable
 from urllib.parse import unquote, urlparse
 
 from reqstool.common.models.urn_id import UrnId
 from reqstool.lsp.project_state import ProjectState
-from reqstool.lsp.root_discovery import discover_root_projects
+from reqstool.lsp.root_discovery import DiscoveredProject, DiscoveryCache, discover_root_projects
 
 logger = logging.getLogger(__name__)
 
@@ -18,39 +21,88 @@ STATIC_YAML_FILES = {
     "reqstool_config.yml",
 }
 
+# Builds mostly parse (and hold the GIL), but fetching remote sources does not: a few at once
+# keep one slow download from holding up every other project of the workspace
+DEFAULT_BUILD_WORKERS = 4
+
 
 class WorkspaceManager:
-    def __init__(self):
+    """The reqstool projects of the workspace folders, built in the background.
+
+    add_folder() discovers the root projects of a folder (see discover_root_projects()) and,
+    like the rebuild methods, only schedules their builds. Builds of different projects run
+    concurrently on up to ``max_workers`` threads, those of one project one after another;
+    meanwhile a project keeps serving its previous snapshot (see ProjectSession), and a
+    build requested for a project that already has one waiting supersedes (cancels) the
+    waiting one. ``on_build_started(project)`` and ``on_build_finished(project, initial)``
+    are called on the worker thread; ``initial`` is True for the first build of a project.
+    """
+
+    def __init__(
+        self,
+        on_build_started: Callable[[ProjectState], None] | None = None,
+        on_build_finished: Callable[[ProjectState, bool], None] | None = None,
+        discovery_cache: DiscoveryCache | None = None,
+        max_workers: int = DEFAULT_BUILD_WORKERS,
+    ):
         self._folder_projects: dict[str, list[ProjectState]] = {}
+        self._on_build_started = on_build_started
+        self._on_build_finished = on_build_finished
+        self.discovery_cache = discovery_cache
+        self._max_workers = max(1, max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        # The latest build of each project not finished yet, with whether it starts from scratch
+        # and the build it has to wait for (one of the same project that already started)
+        self._builds: dict[ProjectState, tuple[Future, bool, Future | None]] = {}
+        self._closed = False
+        # Reentrant: cancelling a build runs its done callback, which takes the lock, right away
+        self._lock = threading.RLock()
 
     def add_folder(self, folder_uri: str) -> list[ProjectState]:
-        folder_path = uri_to_path(folder_uri)
-        roots = discover_root_projects(folder_path)
+        return self.add_folders([folder_uri])
+
+    def add_folders(self, folder_uris: list[str]) -> list[ProjectState]:
+        """Discover the root projects of several folders at once and schedule their builds."""
+        if len(folder_uris) > 1:
+            with ThreadPoolExecutor(max_workers=len(folder_uris), thread_name_prefix="reqstool-discovery") as executor:
+                roots_by_folder = list(executor.map(self.__discover, folder_uris))
+        else:
+            roots_by_folder = [self.__discover(folder_uri) for folder_uri in folder_uris]
+
+        projects = []
+        for folder_uri, roots in zip(folder_uris, roots_by_folder):
+            projects.extend(self.__add_projects(folder_uri, roots))
+        return projects
+
+    def __discover(self, folder_uri: str) -> list[DiscoveredProject]:
+        return discover_root_projects(uri_to_path(folder_uri), cache=self.discovery_cache)
 
+    def __add_projects(self, folder_uri: str, roots: list[DiscoveredProject]) -> list[ProjectState]:
         projects = []
         for root in roots:
             project = ProjectState(reqstool_path=root.path)
-            project.build()
             projects.append(project)
             logger.info(
-                "Discovered root project: urn=%s variant=%s path=%s ready=%s",
+                "Discovered root project: urn=%s variant=%s path=%s",
                 root.urn,
                 root.variant.value,
                 root.path,
-                project.ready,
             )
 
         self._folder_projects[folder_uri] = projects
+        for project in projects:
+            self.schedule_build(project, full=True)
         return projects
 
     def remove_folder(self, folder_uri: str) -> None:
         projects = self._folder_projects.pop(folder_uri, [])
         for project in projects:
+            self.__cancel_build(project)
             project.close()
 
     def rebuild_folder(self, folder_uri: str) -> None:
         for project in self._folder_projects.get(folder_uri, []):
-            project.rebuild()
+            self.schedule_build(project)
 
     def rebuild_all(self) -> None:
         for folder_uri in self._folder_projects:
@@ -60,9 +112,84 @@ class WorkspaceManager:
         """Rebuild the project affected by a changed file. Returns the project or None."""
         project = self.project_for_file(file_uri)
         if project is not None:
-            project.rebuild()
+            self.schedule_build(project)
         return project
 
+    def schedule_build(self, project: ProjectState, full: bool = False) -> Future:
+        """Build ``project`` in the background: from scratch if ``full``, else incrementally (rebuild())."""
+        with self._lock:
+            after = None
+            previous = self._builds.get(project)
+            if previous is not None:
+                previous_future, previous_full, previous_after = previous
+                if previous_future.cancel():
+                    full = full or previous_full
+                    after = previous_after
+                else:
+                    after = previous_future
+            # Not an executor future: it stays cancellable until it starts, even while it waits
+            # for the project's running build rather than for a worker
+            future: Future = Future()
+            self._builds[project] = (future, full, after)
+            future.add_done_callback(lambda done: self.__forget_build(project, done))
+            if after is None:
+                self.__submit(project, full, future)
+            else:
+                after.add_done_callback(lambda _: self.__submit(project, full, future))
+            return future
+
+    def wait_for_builds(self, timeout: float | None = None) -> None:
+        """Block until every build scheduled so far has finished (or ``timeout`` seconds passed)."""
+        with self._lock:
+            futures = [future for future, _, _ in self._builds.values()]
+        wait(futures, timeout=timeout)
+
+    def __submit(self, project: ProjectState, full: bool, future: Future) -> None:
+        with self._lock:
+            if future.done():
+                return
+            if self._executor is None:
+                if self._closed:
+                    future.cancel()
+                    return
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="reqstool-build")
+            self._executor.submit(self.__run, project, full, future)
+
+    def __run(self, project: ProjectState, full: bool, future: Future) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            self.__build(project, full)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+    def __build(self, project: ProjectState, full: bool) -> None:
+        initial = project.built_at is None and project.error is None
+        if self._on_build_started is not None:
+            self._on_build_started(project)
+        try:
+            if full:
+                project.build()
+            else:
+                project.rebuild()
+        finally:
+            if self._on_build_finished is not None:
+                self._on_build_finished(project, initial)
+
+    def __forget_build(self, project: ProjectState, future: Future) -> None:
+        with self._lock:
+            current = self._builds.get(project)
+            if current is not None and current[0] is future:
+                del self._builds[project]
+
+    def __cancel_build(self, project: ProjectState) -> None:
+        with self._lock:
+            waiting = self._builds.pop(project, None)
+        if waiting is not None:
+            waiting[0].cancel()
+
     def project_for_file(self, file_uri: str) -> ProjectState | None:
         file_path = uri_to_path(file_uri)
         norm_file = os.path.normpath(file_path)
@@ -120,6 +247,15 @@ class WorkspaceManager:
         return result
 
     def close_all(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._closed = True
+            builds = list(self._builds.values())
+            self._builds.clear()
+        for future, _, _ in builds:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
         for projects in self._folder_projects.values():
             for project in projects:
                 project.close()
@@ -7,7 +7,8 @@ from typing import Literal
 from reqstool_python_decorators.decorators.decorators import Requirements
 
 from reqstool.common.project_session import ProjectSession
-from reqstool.common.enrichment.enricher import BUILT_IN_PRESETS, enrich_text
+from reqstool.common.enrichment.enricher import enrich_text
+from reqstool.common.enrichment.presets import BUILT_IN_PRESETS
 from reqstool.common.queries.details import (
     get_mvr_details,
     get_requirement_details,
@@ -143,7 +144,7 @@ def start_server(  # noqa: C901
         Reloading is automatic when input files change, so this is only needed to reload
         unconditionally — after a build, for instance — or to confirm what is being served."""
         session.build()
-        if not session.ready:
+        if session.error is not None:
             raise RuntimeError(f"Failed to reload reqstool project: {session.error}")
         return _snapshot_info()
 
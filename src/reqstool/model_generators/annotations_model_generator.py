@@ -9,14 +9,16 @@ from reqstool.commands.exit_codes import EXIT_CODE_SYNTAX_VALIDATION_ERROR
 from reqstool.common.models.urn_id import UrnId
 from reqstool.common.utils import Utils
 from reqstool.common.validators.syntax_validator import JsonSchemaTypes, SyntaxValidator
+from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.models.annotations import AnnotationData, AnnotationsData
 from reqstool.models.generated.annotations_schema import Model as AnnotationsPydanticModel
 
 
 class AnnotationsModelGenerator:
-    def __init__(self, uri: str, urn: str):
+    def __init__(self, uri: str, urn: str, parsing_config: ParsingConfig = ParsingConfig()):
         self.uri = uri
         self.urn = urn
+        self.parsing_config = parsing_config
         self.model = self.__generate(uri)
 
     def __generate(self, uri: str) -> AnnotationsData:
@@ -26,11 +28,16 @@ class AnnotationsModelGenerator:
 
         data: dict = yaml.load(Utils.interpolate_env_vars(response.text, source=uri))
 
-        if not SyntaxValidator.is_valid_data(json_schema_type=JsonSchemaTypes.ANNOTATIONS, data=data, urn=self.urn):
+        validated = SyntaxValidator.validated_model(
+            AnnotationsPydanticModel,
+            json_schema_type=JsonSchemaTypes.ANNOTATIONS,
+            data=data,
+            urn=self.urn,
+            validation_strategy=self.parsing_config.validation_strategy,
+        )
+        if validated is None:
             sys.exit(EXIT_CODE_SYNTAX_VALIDATION_ERROR)
 
-        validated = AnnotationsPydanticModel.model_validate(data)
-
         tests = self.__parse_annotations(
             validated.requirement_annotations.tests if validated.requirement_annotations.tests else {}
         )
@@ -1,18 +1,23 @@
 # Copyright © LFV
 
+import contextlib
+import contextvars
 import logging
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from reqstool_python_decorators.decorators.decorators import Requirements
 
 from reqstool.common.exceptions import CircularImplementationError, CircularImportError, MissingRequirementsFileError
 from reqstool.common.snapshot_fingerprint import FileStamp, GlobSpec, SnapshotFingerprint
 from reqstool.common.utils import TempDirectoryManager, Utils
+from reqstool.common.validator_error_holder import ValidationError, ValidationErrorHolder
 from reqstool.common.validators.semantic_validator import SemanticValidator
 from reqstool.location_resolver.location_resolver import LocationResolver
+from reqstool.locations.artifact_cache import ArtifactCache
 from reqstool.locations.local_location import LocalLocation
 from reqstool.locations.location import LocationInterface
 from reqstool.model_generators.annotations_model_generator import AnnotationsModelGenerator
@@ -31,6 +36,12 @@ from reqstool.models.test_data import TestsData
 from reqstool.requirements_indata.requirements_indata import RequirementsIndata
 from reqstool.storage.database import RequirementsDatabase
 
+# Fetching is network-bound (git clones, Maven/npm/PyPI downloads), so this is about
+# concurrent round trips rather than CPU cores.
+DEFAULT_MAX_WORKERS = 8
+# A source has at most four files besides requirements.yml: SVCs, MVRs, annotations and test results
+DEFAULT_MAX_FILE_WORKERS = 4
+
 
 class CombinedRawDatasetsGenerator:
     def __init__(
@@ -40,7 +51,24 @@ class CombinedRawDatasetsGenerator:
         database: Optional[RequirementsDatabase] = None,
         tmpdir_manager: Optional[TempDirectoryManager] = None,
         parsing_config: ParsingConfig = ParsingConfig(),
+        reusable_datasets: Optional[Dict[str, RawDataset]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        artifact_cache: Optional[ArtifactCache] = None,
+        max_file_workers: int = DEFAULT_MAX_FILE_WORKERS,
     ):
+        """Parse ``initial_location`` and everything it imports.
+
+        Args:
+            reusable_datasets: previously parsed datasets keyed by ``RawDataset.location_key``.
+                A location found here is not fetched or parsed again; its dataset is used as is.
+            max_workers: how many sibling imports or implementations to fetch and parse at
+                once. 1 resolves the graph strictly one source at a time.
+            artifact_cache: where to keep fetched remote sources pinned to a fixed version
+                between runs; without one every remote source is fetched.
+            max_file_workers: how many of a source's files (SVCs, MVRs, annotations, test
+                results) to parse at once, once its requirements.yml has been parsed. 1 parses
+                them one after another.
+        """
         self.__level: int = 0
         self.__initial_location_handler: LocationResolver = LocationResolver(
             parent=None, current_unresolved=initial_location
@@ -51,7 +79,31 @@ class CombinedRawDatasetsGenerator:
         self._database = database
         self._tmpdir_manager = tmpdir_manager if tmpdir_manager is not None else TempDirectoryManager()
         self._parsing_config = parsing_config
-        self.combined_raw_datasets = self.__generate()
+        self._reusable_datasets: Dict[str, RawDataset] = dict(reusable_datasets or {})
+        self._max_workers = max(1, max_workers)
+        self._artifact_cache = artifact_cache
+        self._max_file_workers = max(1, max_file_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._file_executor: Optional[ThreadPoolExecutor] = None
+        self.combined_raw_datasets = self.__generate_with_executor()
+
+    def __generate_with_executor(self) -> CombinedRawDataset:
+        # Files get a pool of their own: a source being parsed on a fetch worker waits for its
+        # files, and would deadlock a shared pool whose workers all did the same.
+        with contextlib.ExitStack() as stack:
+            if self._max_workers > 1:
+                self._executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="reqstool-fetch")
+                )
+            if self._max_file_workers > 1:
+                self._file_executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=self._max_file_workers, thread_name_prefix="reqstool-parse")
+                )
+            try:
+                return self.__generate()
+            finally:
+                self._executor = None
+                self._file_executor = None
 
     def __generate(self) -> CombinedRawDataset:
         # handle initial source
@@ -59,7 +111,11 @@ class CombinedRawDatasetsGenerator:
 
         raw_datasets: Dict[str, RawDataset] = {}
 
-        initial_imported_model = self.__parse_source(current_location_handler=self.__initial_location_handler)
+        initial_imported_model = self.__parse_source(
+            current_location_handler=self.__initial_location_handler,
+            semantic_validator=self.semantic_validator,
+            level=self.__level,
+        )
 
         initial_urn = initial_imported_model.requirements_data.metadata.urn
 
@@ -98,64 +154,12 @@ class CombinedRawDatasetsGenerator:
 
         self._database.set_metadata("initial_urn", crd.initial_model_urn)
 
-        # Multi-pass insertion to satisfy FK constraints across URNs.
-        # Order: requirements → SVCs → MVRs → annotations → test results → graph
-        # Each pass is committed as a batch for performance.
-        self.__populate_requirements(crd)
-        self.__populate_svcs(crd)
-        self.__populate_mvrs(crd)
-        self.__populate_annotations(crd)
-        self.__populate_test_results(crd)
-        self.__populate_parsing_graph(crd)
-        self._database.commit()
-
-    def __populate_requirements(self, crd: CombinedRawDataset) -> None:
-        for urn in crd.urn_parsing_order:
-            rd = crd.raw_datasets[urn]
-            self._database.insert_urn_metadata(
-                rd.requirements_data.metadata,
-                location_type=rd.location_type,
-                location_uri=rd.location_uri,
-            )
-            for req_data in rd.requirements_data.requirements.values():
-                self._database.insert_requirement(urn, req_data)
-
-    def __populate_svcs(self, crd: CombinedRawDataset) -> None:
-        for urn in crd.urn_parsing_order:
-            rd = crd.raw_datasets[urn]
-            if rd.svcs_data is not None and rd.svcs_data.cases:
-                for svc_data in rd.svcs_data.cases.values():
-                    self._database.insert_svc(urn, svc_data)
-
-    def __populate_mvrs(self, crd: CombinedRawDataset) -> None:
-        for urn in crd.urn_parsing_order:
-            rd = crd.raw_datasets[urn]
-            if rd.mvrs_data is not None and rd.mvrs_data.results:
-                for mvr_data in rd.mvrs_data.results.values():
-                    self._database.insert_mvr(urn, mvr_data)
-
-    def __populate_annotations(self, crd: CombinedRawDataset) -> None:
-        for urn in crd.urn_parsing_order:
-            rd = crd.raw_datasets[urn]
-            if rd.annotations_data is not None:
-                for req_urn_id, annotations in rd.annotations_data.implementations.items():
-                    for annotation in annotations:
-                        self._database.insert_annotation_impl(req_urn_id, annotation)
-                for svc_urn_id, annotations in rd.annotations_data.tests.items():
-                    for annotation in annotations:
-                        self._database.insert_annotation_test(svc_urn_id, annotation)
-
-    def __populate_test_results(self, crd: CombinedRawDataset) -> None:
-        for urn in crd.urn_parsing_order:
-            rd = crd.raw_datasets[urn]
-            if rd.automated_tests is not None:
-                for test_urn_id, test_data in rd.automated_tests.tests.items():
-                    self._database.insert_test_result(test_urn_id.urn, test_data.fully_qualified_name, test_data.status)
-
-    def __populate_parsing_graph(self, crd: CombinedRawDataset) -> None:
-        for parent_urn, children in crd.parsing_graph.items():
-            for child_urn, edge_type in children:
-                self._database.insert_parsing_graph_edge(parent_urn, child_urn, edge_type)
+        # One bulk load across all URNs; rows go in FK order (requirements → SVCs → MVRs →
+        # annotations → test results → graph) so links may point into any URN.
+        self._database.insert_raw_datasets(
+            [(urn, crd.raw_datasets[urn]) for urn in crd.urn_parsing_order],
+            parsing_graph=crd.parsing_graph,
+        )
 
     def __handle_initial_imports(self, raw_datasets: Dict[str, RawDataset], rd: RequirementsData):
         if rd.imports:
@@ -184,8 +188,7 @@ class CombinedRawDatasetsGenerator:
         self.__level += 1
 
         parsed_urns: List[str] = []
-        for system in parent_rd.imports:
-            current_imported_model = self.__parse_source(current_location_handler=system)
+        for current_imported_model in self.__parse_sources(parent_rd.imports):
             current_urn = current_imported_model.requirements_data.metadata.urn
 
             if current_urn in visited:
@@ -223,8 +226,7 @@ class CombinedRawDatasetsGenerator:
         parsed_urns: List[str] = []
 
         self.__level += 1
-        for implementation in implementations:
-            parsed_model = self.__parse_source(current_location_handler=implementation)
+        for parsed_model in self.__parse_sources(implementations):
             current_urn = parsed_model.requirements_data.metadata.urn
 
             if current_urn in visited:
@@ -250,8 +252,57 @@ class CombinedRawDatasetsGenerator:
 
         return parsed_urns
 
+    def __parse_sources(self, location_handlers: List[LocationResolver]) -> Iterator[RawDataset]:
+        """Fetch and parse sibling sources, yielding them in declaration order.
+
+        With a worker pool, all siblings are fetched at once and the caller's graph walk
+        consumes them one by one, so parsing order, the parsing graph and cycle detection
+        come out exactly as in a serial walk. Each worker reports validation errors to its
+        own holder; they are handed on in declaration order as each result is consumed.
+        """
+        level = self.__level
+
+        if self._executor is None or len(location_handlers) < 2:
+            for location_handler in location_handlers:
+                yield self.__parse_source(
+                    current_location_handler=location_handler, semantic_validator=self.semantic_validator, level=level
+                )
+            return
+
+        futures = [
+            # Run in a copy of this thread's context, so env var reads are recorded for the build
+            self._executor.submit(contextvars.copy_context().run, self.__parse_source_isolated, location_handler, level)
+            for location_handler in location_handlers
+        ]
+        try:
+            for future in futures:
+                raw_dataset, errors = future.result()
+                self.semantic_validator.add_errors(errors)
+                yield raw_dataset
+        finally:
+            # Stop fetching siblings nobody will look at once the walk has failed
+            for future in futures:
+                future.cancel()
+
+    def __parse_source_isolated(
+        self, current_location_handler: LocationResolver, level: int
+    ) -> Tuple[RawDataset, List[ValidationError]]:
+        semantic_validator = SemanticValidator(validation_error_holder=ValidationErrorHolder())
+        raw_dataset = self.__parse_source(
+            current_location_handler=current_location_handler, semantic_validator=semantic_validator, level=level
+        )
+        return raw_dataset, semantic_validator.get_errors()
+
     @Requirements("INGEST_0007", "PARSE_0002")
-    def __parse_source(self, current_location_handler: LocationResolver) -> RawDataset:
+    def __parse_source(
+        self, current_location_handler: LocationResolver, semantic_validator: SemanticValidator, level: int
+    ) -> RawDataset:
+        location_key = self.location_key(current_location_handler.current)
+        reused = self._reusable_datasets.get(location_key)
+        if reused is not None:
+            logging.debug(f"Reusing parsed dataset for {reused.requirements_data.metadata.urn} ({location_key})")
+            return reused
+
         annotations_data = None
         svcs_data = None
         mvrs_data = None
@@ -259,7 +310,12 @@ class CombinedRawDatasetsGenerator:
 
         tmp_path = self._tmpdir_manager.get_suffix_path(current_location_handler.current.tmpdir_key()).absolute()
 
-        actual_tmp_path = current_location_handler.make_available_on_localdisk(dst_path=tmp_path)
+        if self._artifact_cache is not None:
+            actual_tmp_path = self._artifact_cache.make_available_on_localdisk(
+                current_location_handler, dst_path=tmp_path
+            )
+        else:
+            actual_tmp_path = current_location_handler.make_available_on_localdisk(dst_path=tmp_path)
 
         requirements_indata = RequirementsIndata(dst_path=actual_tmp_path, location=current_location_handler.current)
 
@@ -270,18 +326,18 @@ class CombinedRawDatasetsGenerator:
             parent=current_location_handler.current,
             filename=requirements_indata.requirements_indata_paths.requirements_yml.path,
             prefix_with_urn=False,
-            semantic_validator=self.semantic_validator,
+            semantic_validator=semantic_validator,
             parsing_config=self._parsing_config,
         )
 
-        if self.__level > 0:
-            logging.info(f"{'*' * self.__level} {requirements_indata.dst_path}")
+        if level > 0:
+            logging.info(f"{'*' * level} {requirements_indata.dst_path}")
         else:
             logging.info(f"{requirements_indata.dst_path}")
 
         # parse file sources other than requirements.yml
         annotations_data, svcs_data, automated_tests, mvrs_data, test_result_files = self.__parse_source_other(
-            actual_tmp_path, requirements_indata, rmg
+            actual_tmp_path, requirements_indata, rmg, semantic_validator
         )
 
         location_type, location_uri = self.__extract_location_provenance(current_location_handler.current)
@@ -307,10 +363,18 @@ class CombinedRawDatasetsGenerator:
             location_uri=location_uri,
             source_paths=source_paths,
             fingerprint=fingerprint,
+            pinned_key=current_location_handler.current.pinned_key(),
+            location_key=location_key,
         )
 
         return raw_dataset
 
+    @staticmethod
+    def location_key(location: LocationInterface) -> str:
+        """Identify a resolved location by its type and coordinates; tokens are left out."""
+        fields = sorted((name, str(value)) for name, value in location if name != "token")
+        return f"{type(location).__name__}:{fields}"
+
     @staticmethod
     def __extract_location_provenance(location: LocationInterface) -> tuple:
         """Extract location_type and location_uri for RawDataset metadata."""
@@ -369,9 +433,17 @@ class CombinedRawDatasetsGenerator:
     ) -> SnapshotFingerprint:
         """Stamp the local input files this source was parsed from.
 
-        Only LocalLocation is fingerprinted: everything else is a version-pinned download
-        materialized under a temp directory that is removed once parsing finishes.
+        LocalLocation is stamped file by file. Local archives (zip/tgz) are stamped as a
+        single file: their extracted contents live under a temp directory that is removed
+        once parsing finishes. Remote downloads are not fingerprinted at all.
         """
+        from reqstool.locations.local_maven_location import LocalMavenLocation
+        from reqstool.locations.local_npm_location import LocalNpmLocation
+        from reqstool.locations.local_pypi_location import LocalPypiLocation
+
+        if isinstance(location, (LocalMavenLocation, LocalNpmLocation, LocalPypiLocation)):
+            return SnapshotFingerprint(stamps=(FileStamp.capture(os.path.abspath(location.path), "archive", urn),))
+
         if not isinstance(location, LocalLocation):
             return SnapshotFingerprint()
 
@@ -406,51 +478,90 @@ class CombinedRawDatasetsGenerator:
 
     @Requirements("INGEST_0002", "INGEST_0003", "INGEST_0004")
     def __parse_source_other(
-        self, actual_tmp_path: str, requirements_indata: RequirementsIndata, rmg: RequirementsModelGenerator
+        self,
+        actual_tmp_path: str,
+        requirements_indata: RequirementsIndata,
+        rmg: RequirementsModelGenerator,
+        semantic_validator: SemanticValidator,
     ):
-        annotations_data: AnnotationsData = None
-        svcs_data: SVCsData = None
-        mvrs_data: MVRsData = None
-        automated_tests: TestsData = None
-        tests = {}
-        test_result_files: Dict[str, List[Path]] = {}
+        """Parse the files of a source other than requirements.yml.
+
+        They only depend on the URN from requirements.yml, not on each other, so with a file
+        pool they are parsed at the same time.
+        """
+        paths = requirements_indata.requirements_indata_paths
         # get current urn
         current_urn = rmg.requirements_data.metadata.urn
 
-        if requirements_indata.requirements_indata_paths.svcs_yml.exists:
-            svcs_data = SVCsModelGenerator(
-                uri=requirements_indata.requirements_indata_paths.svcs_yml.path,
-                semantic_validator=self.semantic_validator,
+        parsers: Dict[str, Callable[[], Any]] = {}
+        if paths.svcs_yml.exists:
+            parsers["svcs"] = lambda: SVCsModelGenerator(
+                uri=paths.svcs_yml.path,
+                semantic_validator=semantic_validator,
                 urn=current_urn,
                 parsing_config=self._parsing_config,
             ).model
 
         # handle automated test results
-
-        for test_result_pattern in requirements_indata.test_results_patterns:
-
-            matching_files = Utils.get_matching_files(path=actual_tmp_path, patterns=[test_result_pattern])
-            test_result_files[test_result_pattern] = matching_files
-
-            automated_tests_results = TestDataModelGenerator(matching_files, urn=current_urn).model
-
-            tests |= automated_tests_results.tests
-
-        automated_tests = TestsData(tests=tests)
+        parsers["tests"] = lambda: self.__parse_automated_tests(
+            actual_tmp_path, requirements_indata.test_results_patterns, current_urn
+        )
 
         # handle manual verification results
-
-        if requirements_indata.requirements_indata_paths.mvrs_yml.exists:
-            mvrs_data = MVRsModelGenerator(
-                uri=requirements_indata.requirements_indata_paths.mvrs_yml.path,
+        if paths.mvrs_yml.exists:
+            parsers["mvrs"] = lambda: MVRsModelGenerator(
+                uri=paths.mvrs_yml.path,
                 urn=current_urn,
                 parsing_config=self._parsing_config,
             ).model
 
         # handle annotations
-        if requirements_indata.requirements_indata_paths.annotations_yml.exists:
-            annotations_data = AnnotationsModelGenerator(
-                uri=requirements_indata.requirements_indata_paths.annotations_yml.path, urn=current_urn
+        if paths.annotations_yml.exists:
+            parsers["annotations"] = lambda: AnnotationsModelGenerator(
+                uri=paths.annotations_yml.path,
+                urn=current_urn,
+                parsing_config=self._parsing_config,
             ).model
 
+        results = dict(zip(parsers.keys(), self.__run_parsers(list(parsers.values()))))
+
+        svcs_data: Optional[SVCsData] = results.get("svcs")
+        automated_tests, test_result_files = results["tests"]
+        mvrs_data: Optional[MVRsData] = results.get("mvrs")
+        annotations_data: Optional[AnnotationsData] = results.get("annotations")
+
         return annotations_data, svcs_data, automated_tests, mvrs_data, test_result_files
+
+    @staticmethod
+    def __parse_automated_tests(
+        actual_tmp_path: str, test_results_patterns: List[str], urn: str
+    ) -> Tuple[TestsData, Dict[str, List[Path]]]:
+        tests = {}
+        test_result_files: Dict[str, List[Path]] = {}
+
+        for test_result_pattern in test_results_patterns:
+
+            matching_files = Utils.get_matching_files(path=actual_tmp_path, patterns=[test_result_pattern])
+            test_result_files[test_result_pattern] = matching_files
+
+            automated_tests_results = TestDataModelGenerator(matching_files, urn=urn).model
+
+            tests |= automated_tests_results.tests
+
+        return TestsData(tests=tests), test_result_files
+
+    def __run_parsers(self, parsers: List[Callable[[], Any]]) -> List[Any]:
+        """Call every parser, on the file pool if there is one; results are in the order given.
+
+        If a parser fails, the first failure in that order is raised, as it would be when
+        parsing serially.
+        """
+        if self._file_executor is None or len(parsers) < 2:
+            return [parser() for parser in parsers]
+
+        futures = [self._file_executor.submit(contextvars.copy_context().run, parser) for parser in parsers]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
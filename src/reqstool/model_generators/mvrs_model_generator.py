@@ -3,12 +3,12 @@
 import sys
 from typing import Dict
 
-from ruamel.yaml import YAML
 
 from reqstool.commands.exit_codes import EXIT_CODE_SYNTAX_VALIDATION_ERROR
 from reqstool.common.models.urn_id import UrnId
 from reqstool.common.utils import Utils
 from reqstool.common.validators.syntax_validator import JsonSchemaTypes, SyntaxValidator
+from reqstool.common.yaml_loader import load_yaml
 from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.models.generated.manual_verification_results_schema import Model as MVRsPydanticModel
 from reqstool.models.mvrs import MVRData, MVRsData
@@ -24,43 +24,27 @@ class MVRsModelGenerator:
     def __generate(self, uri: str) -> MVRsData:
         response = Utils.open_file_https_file(uri)
 
-        yaml = YAML(typ="safe")
-
-        data: dict = yaml.load(Utils.interpolate_env_vars(response.text, source=uri))
-
-        if not SyntaxValidator.is_valid_data(
-            json_schema_type=JsonSchemaTypes.MANUAL_VERIFICATION_RESULTS, data=data, urn=self.urn
-        ):
+        data, id_positions = load_yaml(
+            Utils.interpolate_env_vars(response.text, source=uri),
+            track_positions=self.parsing_config.include_line_numbers,
+        )
+
+        validated = SyntaxValidator.validated_model(
+            MVRsPydanticModel,
+            json_schema_type=JsonSchemaTypes.MANUAL_VERIFICATION_RESULTS,
+            data=data,
+            urn=self.urn,
+            validation_strategy=self.parsing_config.validation_strategy,
+        )
+        if validated is None:
             sys.exit(EXIT_CODE_SYNTAX_VALIDATION_ERROR)
 
-        validated = MVRsPydanticModel.model_validate(data)
-
-        source_lines = self.__capture_source_lines(response.text) if self.parsing_config.include_line_numbers else {}
+        source_lines = id_positions.of_items(data.get("results"))
 
         results = self.__parse_mvrs(validated, source_lines)
 
         return MVRsData(results=results)
 
-    @staticmethod
-    def __capture_source_lines(text: str) -> Dict[str, tuple[int, int, int]]:
-        rt_yaml = YAML(typ="rt")
-        rt_data = rt_yaml.load(text)
-        result: Dict[str, tuple[int, int, int]] = {}
-        if rt_data is None or "results" not in rt_data:
-            return result
-        results = rt_data["results"]
-        if results is None:
-            return result
-        for idx, item in enumerate(results):
-            if not hasattr(results, "lc"):
-                break
-            if not isinstance(item, dict) or "id" not in item:
-                continue
-            id_text = str(item["id"])
-            id_line, id_col = item.lc.value("id")
-            result[id_text] = (id_line, id_col, id_col + len(id_text))
-        return result
-
     def __parse_mvrs(
         self,
         validated: MVRsPydanticModel,
@@ -2,8 +2,26 @@
 
 
 from dataclasses import dataclass
+from enum import StrEnum, unique
+
+
+@unique
+class ValidationStrategy(StrEnum):
+    """How a document is checked before it is turned into its generated Pydantic model."""
+
+    JSON_SCHEMA = "json-schema"
+    """Validate against the JSON Schema, then build the model."""
+
+    PYDANTIC = "pydantic"
+    """Only build the model; the JSON Schema is consulted to report the errors when that fails.
+
+    One validation pass instead of two, but the generated models do not express every schema
+    constraint (conditionally required fields, formats) and coerce some values the schema
+    rejects (the string "true" for a boolean), so such documents are accepted.
+    """
 
 
 @dataclass(frozen=True)
 class ParsingConfig:
     include_line_numbers: bool = False
+    validation_strategy: ValidationStrategy = ValidationStrategy.JSON_SCHEMA
@@ -6,7 +6,6 @@ from enum import Enum, unique
 from typing import Dict, List
 
 from reqstool_python_decorators.decorators.decorators import Requirements
-from ruamel.yaml import YAML
 
 from reqstool.commands.exit_codes import EXIT_CODE_SYNTAX_VALIDATION_ERROR
 from reqstool.common.filter_parser import parse_filters
@@ -15,6 +14,7 @@ from reqstool.common.models.urn_id import UrnId
 from reqstool.common.utils import Utils
 from reqstool.common.validators.semantic_validator import SemanticValidator
 from reqstool.common.validators.syntax_validator import JsonSchemaTypes, SyntaxValidator
+from reqstool.common.yaml_loader import load_yaml
 from reqstool.filters.requirements_filters import RequirementFilter
 from reqstool.locations.git_location import GitLocation
 from reqstool.locations.local_location import LocalLocation
@@ -94,17 +94,23 @@ class RequirementsModelGenerator:
     ) -> RequirementsData:
         response = Utils.open_file_https_file(uri)
 
-        yaml = YAML(typ="safe")
-
-        data = yaml.load(Utils.interpolate_env_vars(response.text, source=uri))
+        data, id_positions = load_yaml(
+            Utils.interpolate_env_vars(response.text, source=uri),
+            track_positions=self.parsing_config.include_line_numbers,
+        )
 
         urn = self.get_urn_if_available(response.text)
 
-        if not SyntaxValidator.is_valid_data(json_schema_type=JsonSchemaTypes.REQUIREMENTS, data=data, urn=urn):
+        validated = SyntaxValidator.validated_model(
+            RequirementsPydanticModel,
+            json_schema_type=JsonSchemaTypes.REQUIREMENTS,
+            data=data,
+            urn=urn,
+            validation_strategy=self.parsing_config.validation_strategy,
+        )
+        if validated is None:
             sys.exit(EXIT_CODE_SYNTAX_VALIDATION_ERROR)
 
-        validated = RequirementsPydanticModel.model_validate(data)
-
         r_metadata: MetaData = self.__parse_metadata(validated)
 
         r_implementations: List[ImplementationDataInterface] = []
@@ -112,7 +118,7 @@ class RequirementsModelGenerator:
         r_requirements: Dict[str, RequirementData] = {}
         r_filters: Dict[str, RequirementFilter] = {}
 
-        source_lines = self.__capture_source_lines(response.text) if self.parsing_config.include_line_numbers else {}
+        source_lines = id_positions.of_items(data.get("requirements"))
 
         self.prefix_with_urn = False
         r_imports = self.__parse_imports(validated)
@@ -279,26 +285,6 @@ class RequirementsModelGenerator:
             validate_fn=self.semantic_validator._validate_req_imports_filter_has_excludes_xor_includes,
         )
 
-    @staticmethod
-    def __capture_source_lines(text: str) -> Dict[str, tuple[int, int, int]]:
-        rt_yaml = YAML(typ="rt")
-        rt_data = rt_yaml.load(text)
-        result: Dict[str, tuple[int, int, int]] = {}
-        if rt_data is None or "requirements" not in rt_data:
-            return result
-        reqs = rt_data["requirements"]
-        if reqs is None:
-            return result
-        for idx, item in enumerate(reqs):
-            if not hasattr(reqs, "lc"):
-                break
-            if not isinstance(item, dict) or "id" not in item:
-                continue
-            id_text = str(item["id"])
-            id_line, id_col = item.lc.value("id")
-            result[id_text] = (id_line, id_col, id_col + len(id_text))
-        return result
-
     @Requirements("INGEST_0001", "LIFECYCLE_0001", "LIFECYCLE_0002")
     def __parse_requirements(self, model, data, source_lines: Dict[str, tuple[int, int, int]]):  # NOSONAR
         r_reqs = {}
@@ -3,7 +3,6 @@
 import sys
 from typing import Dict
 
-from ruamel.yaml import YAML
 from reqstool_python_decorators.decorators.decorators import Requirements
 
 from reqstool.commands.exit_codes import EXIT_CODE_SYNTAX_VALIDATION_ERROR
@@ -13,6 +12,7 @@ from reqstool.common.models.urn_id import UrnId
 from reqstool.common.utils import Utils
 from reqstool.common.validators.semantic_validator import SemanticValidator
 from reqstool.common.validators.syntax_validator import JsonSchemaTypes, SyntaxValidator
+from reqstool.common.yaml_loader import load_yaml
 from reqstool.filters.svcs_filters import SVCFilter
 from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.models.generated.software_verification_cases_schema import Model as SVCsPydanticModel
@@ -36,47 +36,31 @@ class SVCsModelGenerator:
     def __generate(self, uri: str) -> SVCsData:
         response = Utils.open_file_https_file(uri)
 
-        yaml = YAML(typ="safe")
-
-        data: dict = yaml.load(Utils.interpolate_env_vars(response.text, source=uri))
+        data, id_positions = load_yaml(
+            Utils.interpolate_env_vars(response.text, source=uri),
+            track_positions=self.parsing_config.include_line_numbers,
+        )
 
-        if not SyntaxValidator.is_valid_data(
-            json_schema_type=JsonSchemaTypes.SOFTWARE_VERIFICATION_CASES, data=data, urn=self.urn
-        ):
+        validated = SyntaxValidator.validated_model(
+            SVCsPydanticModel,
+            json_schema_type=JsonSchemaTypes.SOFTWARE_VERIFICATION_CASES,
+            data=data,
+            urn=self.urn,
+            validation_strategy=self.parsing_config.validation_strategy,
+        )
+        if validated is None:
             sys.exit(EXIT_CODE_SYNTAX_VALIDATION_ERROR)
 
         # Semantic validation still operates on raw dict
         self.semantic_validator._validate_no_duplicate_svc_ids(data=data)
 
-        validated = SVCsPydanticModel.model_validate(data)
-
-        source_lines = self.__capture_source_lines(response.text) if self.parsing_config.include_line_numbers else {}
+        source_lines = id_positions.of_items(data.get("cases"))
 
         cases = self.__parse_svcs(validated, source_lines)
         filters = self.__parse_svc_filters(data)
 
         return SVCsData(cases=cases, filters=filters)
 
-    @staticmethod
-    def __capture_source_lines(text: str) -> Dict[str, tuple[int, int, int]]:
-        rt_yaml = YAML(typ="rt")
-        rt_data = rt_yaml.load(text)
-        result: Dict[str, tuple[int, int, int]] = {}
-        if rt_data is None or "cases" not in rt_data:
-            return result
-        cases = rt_data["cases"]
-        if cases is None:
-            return result
-        for idx, item in enumerate(cases):
-            if not hasattr(cases, "lc"):
-                break
-            if not isinstance(item, dict) or "id" not in item:
-                continue
-            id_text = str(item["id"])
-            id_line, id_col = item.lc.value("id")
-            result[id_text] = (id_line, id_col, id_col + len(id_text))
-        return result
-
     @Requirements("LIFECYCLE_0003")
     def __parse_svcs(
         self,
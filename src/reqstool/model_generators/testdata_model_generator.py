@@ -1,10 +1,12 @@
 # Copyright © LFV
 
 import logging
+import multiprocessing
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from defusedxml import ElementTree as ET
 
@@ -13,20 +15,104 @@ from reqstool_python_decorators.decorators.decorators import Requirements
 from reqstool.common.models.urn_id import UrnId
 from reqstool.models.test_data import TEST_RUN_STATUS, TestData, TestsData
 
+UNIT_METHOD_IDENTIFIER_REGEX = re.compile(r"^([a-zA-Z_$][a-zA-Z0-9_$]*).*$")
+KARATE_METHOD_IDENTIFIER_REGEX = re.compile(r"\[\d+(?:\.\d+)?:\d+\]\s*(.+)")
+# Gradle parameterized: default "[N] args" or custom "{index} text" (N text) — method name absent
+DISPLAY_NAME_INDEX_REGEX = re.compile(r"^\[?\d")
+
+# fully qualified test name → status, and the warnings to log, for one JUnit XML file
+JunitFileResult = Tuple[Dict[str, TEST_RUN_STATUS], List[str]]
+
 
 def _status_priority(status: TEST_RUN_STATUS) -> int:
     return {TEST_RUN_STATUS.PASSED: 0, TEST_RUN_STATUS.SKIPPED: 1, TEST_RUN_STATUS.FAILED: 2}.get(status, 0)
 
 
+def _merge_status(statuses: Dict[str, TEST_RUN_STATUS], fqn: str, status: TEST_RUN_STATUS) -> None:
+    # The same test may be reported several times (parameterized, reruns): the worst status wins
+    existing = statuses.get(fqn)
+    if existing is None or _status_priority(status) > _status_priority(existing):
+        statuses[fqn] = status
+
+
+def _method_name(name: str, test_result_file: str, warnings: List[str]) -> Optional[str]:
+    match_unit = UNIT_METHOD_IDENTIFIER_REGEX.match(name)
+    if match_unit:
+        return match_unit.group(1)
+
+    match_karate = KARATE_METHOD_IDENTIFIER_REGEX.match(name)
+    if match_karate:
+        return match_karate.group(1)
+
+    if DISPLAY_NAME_INDEX_REGEX.match(name):
+        warnings.append(
+            f"Skipping parameterized test case with display-name-only format "
+            f"(method name not recoverable): {name!r} "
+            f"in {test_result_file}"
+        )
+    else:
+        warnings.append(f"Skipping test case with unrecognized name format: {name!r} in {test_result_file}")
+    return None
+
+
+def _testcase_status(testcase) -> TEST_RUN_STATUS:
+    child_tags = {child.tag for child in testcase}
+
+    if "failure" in child_tags:
+        return TEST_RUN_STATUS.FAILED
+    elif "skipped" in child_tags:
+        return TEST_RUN_STATUS.SKIPPED
+    else:
+        return TEST_RUN_STATUS.PASSED
+
+
+def _parse_junit_file(test_result_file: str) -> JunitFileResult:
+    """Stream the <testcase> elements of one JUnit XML file.
+
+    Elements are discarded as soon as they have been read, so memory use is bounded by the
+    largest single test case rather than by the size of the report. Module level, and only
+    returning plain data, so that it can run in a worker process.
+    """
+    statuses: Dict[str, TEST_RUN_STATUS] = {}
+    warnings: List[str] = []
+    open_elements = []
+    testcase_depth = 0
+
+    for event, element in ET.iterparse(test_result_file, events=("start", "end")):
+        if event == "start":
+            open_elements.append(element)
+            if element.tag == "testcase":
+                testcase_depth += 1
+            continue
+
+        open_elements.pop()
+        if element.tag == "testcase":
+            testcase_depth -= 1
+            methodname = _method_name(element.attrib["name"], test_result_file, warnings)
+            if methodname is not None:
+                _merge_status(statuses, f"{element.attrib['classname']}.{methodname}", _testcase_status(element))
+
+        # Inside a test case only the tags of the children are needed, to tell its status
+        element.clear()
+        if testcase_depth == 0 and open_elements:
+            open_elements[-1].remove(element)
+
+    return statuses, warnings
+
+
 class TestDataModelGenerator:
-    UNIT_METHOD_IDENTIFIER_REGEX = r"^([a-zA-Z_$][a-zA-Z0-9_$]*).*$"
-    KARATE_METHOD_IDENTIFIER_REGEX = r"\[\d+(?:\.\d+)?:\d+\]\s*(.+)"
-    # Gradle parameterized: default "[N] args" or custom "{index} text" (N text) — method name absent
-    DISPLAY_NAME_INDEX_REGEX = r"^\[?\d"
+    UNIT_METHOD_IDENTIFIER_REGEX = UNIT_METHOD_IDENTIFIER_REGEX
+    KARATE_METHOD_IDENTIFIER_REGEX = KARATE_METHOD_IDENTIFIER_REGEX
+    DISPLAY_NAME_INDEX_REGEX = DISPLAY_NAME_INDEX_REGEX
+
+    DEFAULT_MAX_WORKERS = 4
+    # Below this much XML in total, starting worker processes costs more than it saves
+    PARALLEL_MIN_BYTES = 16 * 1024 * 1024
 
-    def __init__(self, test_result_files: List[Path], urn: str):
+    def __init__(self, test_result_files: List[Path], urn: str, max_workers: int = DEFAULT_MAX_WORKERS):
         self.test_result_files = test_result_files
         self.urn = urn
+        self.max_workers = max_workers
         self.model: TestsData = self.__generate(test_result_files, urn)
 
     def __generate(self, test_result_files: List[Path], urn: str) -> TestsData:
@@ -36,55 +122,34 @@ class TestDataModelGenerator:
 
     @Requirements("INGEST_0005", "INGEST_0006")
     def __parse_test_data(self, test_result_files: List[Path], urn: str) -> Dict[UrnId, TestData]:
-        r_testdata: Dict[UrnId, TestData] = {}
-
+        existing_files: List[str] = []
         for test_result_file in test_result_files:
-
             if not os.path.isfile(test_result_file):
                 logging.warning(f"test_result_file did not exist: {test_result_file}")
                 continue
-
-            tree = ET.parse(test_result_file)
-            root = tree.getroot()
-
-            for testcase in root.findall(".//testcase"):
-                # Check if there is a match
-                match_unit = re.match(self.UNIT_METHOD_IDENTIFIER_REGEX, testcase.attrib["name"])
-                match_karate = re.match(self.KARATE_METHOD_IDENTIFIER_REGEX, testcase.attrib["name"])
-
-                if match_unit:
-                    methodname = match_unit.group(1)
-                elif match_karate:
-                    methodname = match_karate.group(1)
-                elif re.match(self.DISPLAY_NAME_INDEX_REGEX, testcase.attrib["name"]):
-                    logging.warning(
-                        f"Skipping parameterized test case with display-name-only format "
-                        f"(method name not recoverable): {testcase.attrib['name']!r} "
-                        f"in {test_result_file}"
-                    )
-                    continue
-                else:
-                    logging.warning(
-                        f"Skipping test case with unrecognized name format: "
-                        f"{testcase.attrib['name']!r} in {test_result_file}"
-                    )
-                    continue
-
-                test_run_status: TEST_RUN_STATUS
-
-                if testcase.find("./failure") is not None:
-                    test_run_status = TEST_RUN_STATUS.FAILED
-                elif testcase.find("./skipped") is not None:
-                    test_run_status = TEST_RUN_STATUS.SKIPPED
-                else:
-                    test_run_status = TEST_RUN_STATUS.PASSED
-
-                fqn = f"{testcase.attrib['classname']}.{methodname}"
-
-                test_data = TestData(fully_qualified_name=fqn, status=test_run_status)
-                urn_id = UrnId(urn=urn, id=fqn)
-                existing = r_testdata.get(urn_id)
-                if existing is None or _status_priority(test_run_status) > _status_priority(existing.status):
-                    r_testdata[urn_id] = test_data
-
-        return r_testdata
+            existing_files.append(str(test_result_file))
+
+        statuses: Dict[str, TEST_RUN_STATUS] = {}
+        for file_statuses, warnings in self.__parse_files(existing_files):
+            for warning in warnings:
+                logging.warning(warning)
+            for fqn, status in file_statuses.items():
+                _merge_status(statuses, fqn, status)
+
+        return {
+            UrnId(urn=urn, id=fqn): TestData(fully_qualified_name=fqn, status=status)
+            for fqn, status in statuses.items()
+        }
+
+    def __parse_files(self, test_result_files: List[str]) -> List[JunitFileResult]:
+        """Parse every file, in worker processes when there are several large ones; results are in file order.
+
+        Processes rather than threads: XML parsing here is pure Python and holds the GIL.
+        """
+        workers = min(self.max_workers, len(test_result_files), os.process_cpu_count() or 1)
+        if workers <= 1 or sum(os.path.getsize(f) for f in test_result_files) < self.PARALLEL_MIN_BYTES:
+            return [_parse_junit_file(test_result_file) for test_result_file in test_result_files]
+
+        # spawn: forking a process that runs threads (the LSP server, concurrent fetching) is unsafe
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            return list(executor.map(_parse_junit_file, test_result_files))
@@ -36,6 +36,14 @@ class RawDataset(BaseModel):
     # by long-lived servers. Empty for non-local locations (version-pinned, materialized to tmp).
     fingerprint: SnapshotFingerprint = Field(default_factory=SnapshotFingerprint)
 
+    # Identity of immutable remote content (exact version / commit SHA), None when the
+    # location is local or can move between runs. See LocationInterface.pinned_key().
+    pinned_key: Optional[str] = None
+
+    # Identity of the resolved location this dataset was parsed from, so a refresh can hand
+    # datasets with unchanged inputs back to the generator instead of re-parsing them.
+    location_key: Optional[str] = None
+
 
 class CombinedRawDataset(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -2,13 +2,15 @@
 
 
 from dataclasses import dataclass, field
+from typing import Iterable
 
 from reqstool_python_decorators.decorators.decorators import Requirements
 
 from reqstool.common.models.urn_id import UrnId
-from reqstool.models.requirements import IMPLEMENTATION, NON_CODE_IMPLEMENTATIONS, RequirementData
+from reqstool.models.requirements import IMPLEMENTATION, NON_CODE_IMPLEMENTATIONS
 from reqstool.models.svcs import EXPECTS_AUTOMATED_TESTS, EXPECTS_MVRS, VERIFICATIONPHASE
-from reqstool.models.test_data import TEST_RUN_STATUS, TestData
+from reqstool.models.test_data import TEST_RUN_STATUS
+from reqstool.storage.records import RequirementRecord, SVCRecord, TestRecord
 from reqstool.storage.requirements_repository import RequirementsRepository
 
 __all__ = [
@@ -19,6 +21,7 @@ __all__ = [
     "RequirementStatus",
     "TotalStats",
     "compute_requirement_status",
+    "compute_requirement_statuses",
     "requirement_to_dict",
 ]
 
@@ -99,7 +102,7 @@ class TotalStats:
 
 
 def compute_requirement_status(
-    req: RequirementData, repo: RequirementsRepository, *, include_post_build: bool = False
+    req: RequirementRecord, repo: RequirementsRepository, *, include_post_build: bool = False
 ) -> RequirementStatus:
     """Compute the single "is this requirement complete?" verdict for one requirement.
 
@@ -108,18 +111,84 @@ def compute_requirement_status(
     completion verdict is computed; every status surface (CLI, MCP, future LSP) must call
     this rather than re-deriving it.
     """
-    svcs_urn_ids = repo.get_svcs_for_req(req.id)
-    svcs = [s for s in (repo.get_svc(sid) for sid in svcs_urn_ids) if s is not None]
+    return _compute_status(req, _ScopedVerdictSource(repo), include_post_build=include_post_build)
+
+
+def compute_requirement_statuses(
+    repo: RequirementsRepository,
+    requirements: Iterable[RequirementRecord] | None = None,
+    *,
+    include_post_build: bool = False,
+) -> dict[UrnId, RequirementStatus]:
+    """Compute the verdict for many requirements (all of them by default) at once.
+
+    Same verdict as compute_requirement_status, but the inputs — SVC links, SVCs,
+    implementation counts, effective MVRs and resolved test results — are loaded with a
+    fixed handful of set-based queries up front instead of several queries per requirement.
+    """
+    if requirements is None:
+        requirements = repo.get_all_requirements().values()
+    source = _BulkVerdictSource(repo)
+    return {req.id: _compute_status(req, source, include_post_build=include_post_build) for req in requirements}
+
+
+class _ScopedVerdictSource:
+    """Verdict inputs fetched on demand, one requirement/SVC at a time."""
+
+    def __init__(self, repo: RequirementsRepository):
+        self._repo = repo
+
+    def svcs_for_req(self, req_urn_id: UrnId) -> list[SVCRecord]:
+        svcs = (self._repo.get_svc(sid) for sid in self._repo.get_svcs_for_req(req_urn_id))
+        return [s for s in svcs if s is not None]
+
+    def nr_of_implementations(self, req_urn_id: UrnId) -> int:
+        return len(self._repo.get_annotations_impls_for_req(req_urn_id))
+
+    def effective_mvr_passed(self, svc_urn_id: UrnId) -> bool | None:
+        effective = self._repo.get_effective_mvr_for_svc(svc_urn_id)
+        return None if effective is None else effective.passed
+
+    def test_results_for_svc(self, svc_urn_id: UrnId) -> list[TestRecord]:
+        annotations = self._repo.get_annotations_tests_for_svc(svc_urn_id)
+        return self._repo.get_test_results_for_annotations(svc_urn_id.urn, annotations) if annotations else []
+
+
+class _BulkVerdictSource:
+    """Verdict inputs for the whole database, loaded once with set-based queries."""
+
+    def __init__(self, repo: RequirementsRepository):
+        self._svc_ids_by_req = repo.get_svc_ids_by_req()
+        self._svcs = repo.get_all_svcs()
+        self._impl_counts = repo.get_annotations_impl_counts()
+        self._effective_mvrs = repo.get_effective_mvr_verdicts()
+        self._test_results = repo.get_test_results_by_svc()
+
+    def svcs_for_req(self, req_urn_id: UrnId) -> list[SVCRecord]:
+        return [self._svcs[sid] for sid in self._svc_ids_by_req.get(req_urn_id, []) if sid in self._svcs]
+
+    def nr_of_implementations(self, req_urn_id: UrnId) -> int:
+        return self._impl_counts.get(req_urn_id, 0)
+
+    def effective_mvr_passed(self, svc_urn_id: UrnId) -> bool | None:
+        return self._effective_mvrs.get(svc_urn_id)
+
+    def test_results_for_svc(self, svc_urn_id: UrnId) -> list[TestRecord]:
+        return self._test_results.get(svc_urn_id, [])
+
+
+def _compute_status(req: RequirementRecord, source, *, include_post_build: bool) -> RequirementStatus:
+    svcs = source.svcs_for_req(req.id)
     verdict_svcs = svcs if include_post_build else [s for s in svcs if s.phase == VERIFICATIONPHASE.BUILD]
     verdict_svc_urn_ids = [s.id for s in verdict_svcs]
 
     should_have_mvrs = any(svc.verification in EXPECTS_MVRS for svc in verdict_svcs)
     should_have_automated_tests = any(svc.verification in EXPECTS_AUTOMATED_TESTS for svc in verdict_svcs)
 
-    nr_of_implementations = len(repo.get_annotations_impls_for_req(req.id))
+    nr_of_implementations = source.nr_of_implementations(req.id)
 
-    mvr_stats = _compute_requirement_mvr_stats(repo, verdict_svc_urn_ids, verdict_svcs, should_have_mvrs)
-    automated_test_stats = _compute_requirement_automated_stats(repo, verdict_svcs, should_have_automated_tests)
+    mvr_stats = _compute_requirement_mvr_stats(source, verdict_svc_urn_ids, verdict_svcs, should_have_mvrs)
+    automated_test_stats = _compute_requirement_automated_stats(source, verdict_svcs, should_have_automated_tests)
 
     implementation_ok = _check_implementation(
         urn_id=req.id, nr_of_implementations=nr_of_implementations, implementation=req.implementation
@@ -141,7 +210,7 @@ def compute_requirement_status(
     )
 
 
-def _compute_requirement_mvr_stats(repo: RequirementsRepository, svcs_urn_ids, svcs, should_have_mvrs) -> TestStats:
+def _compute_requirement_mvr_stats(source, svcs_urn_ids, svcs, should_have_mvrs) -> TestStats:
     if not should_have_mvrs:
         return TestStats(not_applicable=True)
 
@@ -154,10 +223,10 @@ def _compute_requirement_mvr_stats(repo: RequirementsRepository, svcs_urn_ids, s
         svc = svc_map.get(svc_uid)
         if svc is None or svc.verification not in EXPECTS_MVRS:
             continue
-        effective = repo.get_effective_mvr_for_svc(svc_uid)
-        if effective is None:
+        effective_passed = source.effective_mvr_passed(svc_uid)
+        if effective_passed is None:
             missing += 1
-        elif effective.passed:
+        elif effective_passed:
             total += 1
             passed += 1
         else:
@@ -167,24 +236,22 @@ def _compute_requirement_mvr_stats(repo: RequirementsRepository, svcs_urn_ids, s
     return TestStats(total=total, passed=passed, failed=failed, missing=missing)
 
 
-def _compute_requirement_automated_stats(
-    repo: RequirementsRepository, verdict_svcs, should_have_automated_tests
-) -> TestStats:
+def _compute_requirement_automated_stats(source, verdict_svcs, should_have_automated_tests) -> TestStats:
     if not should_have_automated_tests:
         return TestStats(not_applicable=True)
 
-    tests: list[TestData] = []
+    tests: list[TestRecord] = []
     for svc in verdict_svcs:
-        annotations = repo.get_annotations_tests_for_svc(svc.id)
-        if annotations:
-            tests.extend(repo.get_test_results_for_annotations(svc.id.urn, annotations))
+        svc_tests = source.test_results_for_svc(svc.id)
+        if svc_tests:
+            tests.extend(svc_tests)
         elif svc.verification in EXPECTS_AUTOMATED_TESTS:
-            tests.append(TestData(fully_qualified_name="", status=TEST_RUN_STATUS.MISSING))
+            tests.append(TestRecord(fully_qualified_name="", status=TEST_RUN_STATUS.MISSING))
 
     return _compute_test_stats(tests=tests, svcs=verdict_svcs)
 
 
-def _compute_test_stats(tests: list[TestData], svcs) -> TestStats:
+def _compute_test_stats(tests: list[TestRecord], svcs) -> TestStats:
     if not tests:
         no_of_missing = sum(1 for svc in svcs if svc.verification in EXPECTS_AUTOMATED_TESTS)
         return TestStats(missing=no_of_missing)
@@ -275,8 +342,11 @@ class StatisticsService:
 
         self._calculate_global_totals(all_svcs, annotations_tests, automated_test_results)
 
+        statuses = compute_requirement_statuses(
+            self._repo, requirements.values(), include_post_build=self._include_post_build
+        )
         for urn_id, req_data in requirements.items():
-            self._calculate_requirement_stats(urn_id, req_data)
+            self._calculate_requirement_stats(urn_id, req_data, statuses[urn_id])
 
     def _calculate_global_totals(self, all_svcs, annotations_tests, automated_test_results):
         self._totals.total_svcs = len(all_svcs)
@@ -314,8 +384,7 @@ class StatisticsService:
                                 case TEST_RUN_STATUS.MISSING:
                                     self._totals.total_tests -= 1
 
-    def _calculate_requirement_stats(self, urn_id, req_data):
-        status = compute_requirement_status(req_data, self._repo, include_post_build=self._include_post_build)
+    def _calculate_requirement_stats(self, urn_id, req_data, status: RequirementStatus):
         self._requirement_stats[urn_id] = status
         self._update_requirement_totals(
             req_data, status.implementations, status.completed, status.automated_tests, status.manual_tests
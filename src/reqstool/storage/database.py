@@ -2,26 +2,152 @@
 
 
 import logging
+import os
 import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from reqstool.common.models.urn_id import UrnId
 from reqstool.models.annotations import AnnotationData
 from reqstool.models.mvrs import MVRData
+from reqstool.models.raw_datasets import RawDataset
 from reqstool.models.requirements import MetaData, RequirementData
 from reqstool.models.svcs import SVCData
 from reqstool.models.test_data import TEST_RUN_STATUS
 from reqstool.storage.authorizer import authorizer
 from reqstool.storage.el_to_sql_compiler import regexp_function
-from reqstool.storage.schema import SCHEMA_DDL
+from reqstool.storage.schema import SCHEMA_DDL, SCHEMA_INDEXES_DDL, SCHEMA_TABLES_DDL
 
 logger = logging.getLogger(__name__)
 
+_INSERT_REQUIREMENT = (
+    "INSERT INTO requirements (urn, id, title, significance, lifecycle_state, lifecycle_reason,"
+    " implementation, description, rationale, revision, source_line, source_col_start, source_col_end)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_REQUIREMENT_CATEGORY = "INSERT INTO requirement_categories (req_urn, req_id, category) VALUES (?, ?, ?)"
+_INSERT_REQUIREMENT_REFERENCE = (
+    "INSERT OR IGNORE INTO requirement_references (req_urn, req_id, ref_req_urn, ref_req_id) VALUES (?, ?, ?, ?)"
+)
+_INSERT_SVC = (
+    "INSERT INTO svcs (urn, id, title, verification_type, phase, lifecycle_state, lifecycle_reason,"
+    " description, instructions, revision, source_line, source_col_start, source_col_end)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_SVC_REQUIREMENT_LINK = (
+    "INSERT INTO svc_requirement_links (svc_urn, svc_id, req_urn, req_id) VALUES (?, ?, ?, ?)"
+)
+_INSERT_MVR = (
+    "INSERT INTO mvrs (urn, id, passed, comment, date, source_line, source_col_start, source_col_end)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_MVR_SVC_LINK = "INSERT INTO mvr_svc_links (mvr_urn, mvr_id, svc_urn, svc_id) VALUES (?, ?, ?, ?)"
+_INSERT_ANNOTATION_IMPL = (
+    "INSERT OR IGNORE INTO annotations_impls (req_urn, req_id, element_kind, fqn) VALUES (?, ?, ?, ?)"
+)
+_INSERT_ANNOTATION_TEST = (
+    "INSERT OR IGNORE INTO annotations_tests (svc_urn, svc_id, element_kind, fqn) VALUES (?, ?, ?, ?)"
+)
+_INSERT_TEST_RESULT = "INSERT OR REPLACE INTO test_results (urn, fqn, status) VALUES (?, ?, ?)"
+_INSERT_PARSING_GRAPH_EDGE = "INSERT OR IGNORE INTO parsing_graph (parent_urn, child_urn, edge_type) VALUES (?, ?, ?)"
+_INSERT_URN_METADATA = (
+    "INSERT INTO urn_metadata (urn, variant, title, url, parse_position, location_type, location_uri)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _requirement_row(urn: str, req: RequirementData) -> tuple:
+    return (
+        urn,
+        req.id.id,
+        req.title,
+        req.significance.value,
+        req.lifecycle.state.value,
+        req.lifecycle.reason,
+        req.implementation.value,
+        req.description,
+        req.rationale,
+        str(req.revision),
+        req.source_line,
+        req.source_col_start,
+        req.source_col_end,
+    )
+
+
+def _requirement_category_rows(urn: str, req: RequirementData) -> List[tuple]:
+    return [(urn, req.id.id, cat.value) for cat in req.categories]
+
+
+def _requirement_reference_rows(urn: str, req: RequirementData) -> List[tuple]:
+    if not req.references:
+        return []
+    return [
+        (urn, req.id.id, ref_urn_id.urn, ref_urn_id.id) for ref in req.references for ref_urn_id in ref.requirement_ids
+    ]
+
+
+def _svc_row(urn: str, svc: SVCData) -> tuple:
+    return (
+        urn,
+        svc.id.id,
+        svc.title,
+        svc.verification.value,
+        svc.phase.value,
+        svc.lifecycle.state.value,
+        svc.lifecycle.reason,
+        svc.description,
+        svc.instructions,
+        str(svc.revision),
+        svc.source_line,
+        svc.source_col_start,
+        svc.source_col_end,
+    )
+
+
+def _mvr_row(urn: str, mvr: MVRData) -> tuple:
+    return (
+        urn,
+        mvr.id.id,
+        int(mvr.passed),
+        mvr.comment,
+        mvr.date.isoformat() if mvr.date is not None else None,
+        mvr.source_line,
+        mvr.source_col_start,
+        mvr.source_col_end,
+    )
+
+
+def _annotation_row(urn_id: UrnId, annotation: AnnotationData) -> tuple:
+    return (urn_id.urn, urn_id.id, annotation.element_kind, annotation.fully_qualified_name)
+
+
+def _urn_metadata_row(
+    metadata: MetaData, parse_position: int, location_type: str | None, location_uri: str | None
+) -> tuple:
+    return (
+        metadata.urn,
+        metadata.variant.value if metadata.variant else None,
+        metadata.title,
+        metadata.url,
+        parse_position,
+        location_type,
+        location_uri,
+    )
+
 
 class RequirementsDatabase:
-    def __init__(self):
-        self._conn = sqlite3.connect(":memory:")
+    def __init__(self, defer_indexes: bool = False, check_same_thread: bool = True):
+        """Create an empty in-memory database.
+
+        Args:
+            defer_indexes: create only the tables; the secondary indexes are built by
+                insert_raw_datasets() (or create_indexes()) once the data is loaded
+            check_same_thread: as for sqlite3.connect(); False for a database built on one
+                thread and read (and closed) on others
+        """
+        self._conn = sqlite3.connect(":memory:", check_same_thread=check_same_thread)
         self._conn.row_factory = sqlite3.Row
-        self._conn.executescript(SCHEMA_DDL)
+        self._conn.executescript(SCHEMA_TABLES_DDL if defer_indexes else SCHEMA_DDL)
         self._conn.set_authorizer(authorizer)
         self._conn.create_function("regexp", 2, regexp_function)
         self._next_parse_position = 0
@@ -53,6 +179,52 @@ class RequirementsDatabase:
             target.close()
             self._conn.set_authorizer(authorizer)
 
+    @classmethod
+    def restore_from(cls, src_path: str) -> "RequirementsDatabase":
+        """Create an in-memory database holding a copy of a file written by backup_to().
+
+        The source file is opened read-only. As in backup_to(), the authorizer is cleared
+        while the backup API runs and restored afterwards.
+        """
+        db = cls()
+        try:
+            source = sqlite3.connect(f"{Path(os.path.abspath(src_path)).as_uri()}?mode=ro", uri=True)
+            db._conn.set_authorizer(None)
+            try:
+                source.backup(db._conn)
+            finally:
+                source.close()
+                db._conn.set_authorizer(authorizer)
+        except sqlite3.Error:
+            db.close()
+            raise
+        row = db._conn.execute("SELECT COUNT(*) AS n FROM urn_metadata").fetchone()
+        db._next_parse_position = row["n"]
+        return db
+
+    def copy(self) -> "RequirementsDatabase":
+        """Create an independent in-memory copy of this database.
+
+        Used to hand out a database that callers may modify or close without affecting a
+        long-lived one. As in backup_to(), the authorizer is cleared on both connections
+        while the backup API runs and restored afterwards.
+        """
+        self._conn.commit()
+        db = type(self)()
+        try:
+            self._conn.set_authorizer(None)
+            db._conn.set_authorizer(None)
+            try:
+                self._conn.backup(db._conn)
+            finally:
+                self._conn.set_authorizer(authorizer)
+                db._conn.set_authorizer(authorizer)
+        except sqlite3.Error:
+            db.close()
+            raise
+        db._next_parse_position = self._next_parse_position
+        return db
+
     def close(self):
         self._conn.close()
 
@@ -62,127 +234,45 @@ class RequirementsDatabase:
     # -- Insert API --
 
     def insert_requirement(self, urn: str, req: RequirementData) -> None:
-        self._conn.execute(
-            "INSERT INTO requirements (urn, id, title, significance, lifecycle_state, lifecycle_reason,"
-            " implementation, description, rationale, revision, source_line, source_col_start, source_col_end)"
-            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                urn,
-                req.id.id,
-                req.title,
-                req.significance.value,
-                req.lifecycle.state.value,
-                req.lifecycle.reason,
-                req.implementation.value,
-                req.description,
-                req.rationale,
-                str(req.revision),
-                req.source_line,
-                req.source_col_start,
-                req.source_col_end,
-            ),
-        )
-
-        for cat in req.categories:
-            self._conn.execute(
-                "INSERT INTO requirement_categories (req_urn, req_id, category) VALUES (?, ?, ?)",
-                (urn, req.id.id, cat.value),
-            )
-
-        if req.references:
-            for ref in req.references:
-                for ref_urn_id in ref.requirement_ids:
-                    self._conn.execute(
-                        "INSERT OR IGNORE INTO requirement_references"
-                        " (req_urn, req_id, ref_req_urn, ref_req_id) VALUES (?, ?, ?, ?)",
-                        (urn, req.id.id, ref_urn_id.urn, ref_urn_id.id),
-                    )
+        self._conn.execute(_INSERT_REQUIREMENT, _requirement_row(urn, req))
+        self._conn.executemany(_INSERT_REQUIREMENT_CATEGORY, _requirement_category_rows(urn, req))
+        self._conn.executemany(_INSERT_REQUIREMENT_REFERENCE, _requirement_reference_rows(urn, req))
 
     def insert_svc(self, urn: str, svc: SVCData) -> None:
-        self._conn.execute(
-            "INSERT INTO svcs (urn, id, title, verification_type, phase, lifecycle_state, lifecycle_reason,"
-            " description, instructions, revision, source_line, source_col_start, source_col_end)"
-            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                urn,
-                svc.id.id,
-                svc.title,
-                svc.verification.value,
-                svc.phase.value,
-                svc.lifecycle.state.value,
-                svc.lifecycle.reason,
-                svc.description,
-                svc.instructions,
-                str(svc.revision),
-                svc.source_line,
-                svc.source_col_start,
-                svc.source_col_end,
-            ),
-        )
+        self._conn.execute(_INSERT_SVC, _svc_row(urn, svc))
 
         for req_urn_id in svc.requirement_ids:
             try:
-                self._conn.execute(
-                    "INSERT INTO svc_requirement_links (svc_urn, svc_id, req_urn, req_id) VALUES (?, ?, ?, ?)",
-                    (urn, svc.id.id, req_urn_id.urn, req_urn_id.id),
-                )
+                self._conn.execute(_INSERT_SVC_REQUIREMENT_LINK, (urn, svc.id.id, req_urn_id.urn, req_urn_id.id))
             except sqlite3.IntegrityError:
                 logger.warning("SVC %s:%s references non-existent requirement %s", urn, svc.id.id, req_urn_id)
 
     def insert_mvr(self, urn: str, mvr: MVRData) -> None:
-        self._conn.execute(
-            "INSERT INTO mvrs (urn, id, passed, comment, date, source_line, source_col_start, source_col_end)"
-            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                urn,
-                mvr.id.id,
-                int(mvr.passed),
-                mvr.comment,
-                mvr.date.isoformat() if mvr.date is not None else None,
-                mvr.source_line,
-                mvr.source_col_start,
-                mvr.source_col_end,
-            ),
-        )
+        self._conn.execute(_INSERT_MVR, _mvr_row(urn, mvr))
 
         for svc_urn_id in mvr.svc_ids:
             try:
-                self._conn.execute(
-                    "INSERT INTO mvr_svc_links (mvr_urn, mvr_id, svc_urn, svc_id) VALUES (?, ?, ?, ?)",
-                    (urn, mvr.id.id, svc_urn_id.urn, svc_urn_id.id),
-                )
+                self._conn.execute(_INSERT_MVR_SVC_LINK, (urn, mvr.id.id, svc_urn_id.urn, svc_urn_id.id))
             except sqlite3.IntegrityError:
                 logger.warning("MVR %s:%s references non-existent SVC %s", urn, mvr.id.id, svc_urn_id)
 
     def insert_annotation_impl(self, req_urn_id: UrnId, annotation: AnnotationData) -> None:
         try:
-            self._conn.execute(
-                "INSERT OR IGNORE INTO annotations_impls (req_urn, req_id, element_kind, fqn) VALUES (?, ?, ?, ?)",
-                (req_urn_id.urn, req_urn_id.id, annotation.element_kind, annotation.fully_qualified_name),
-            )
+            self._conn.execute(_INSERT_ANNOTATION_IMPL, _annotation_row(req_urn_id, annotation))
         except sqlite3.IntegrityError:
             logger.warning("Annotation impl references non-existent requirement %s", req_urn_id)
 
     def insert_annotation_test(self, svc_urn_id: UrnId, annotation: AnnotationData) -> None:
         try:
-            self._conn.execute(
-                "INSERT OR IGNORE INTO annotations_tests (svc_urn, svc_id, element_kind, fqn) VALUES (?, ?, ?, ?)",
-                (svc_urn_id.urn, svc_urn_id.id, annotation.element_kind, annotation.fully_qualified_name),
-            )
+            self._conn.execute(_INSERT_ANNOTATION_TEST, _annotation_row(svc_urn_id, annotation))
         except sqlite3.IntegrityError:
             logger.warning("Annotation test references non-existent SVC %s", svc_urn_id)
 
     def insert_test_result(self, urn: str, fqn: str, status: TEST_RUN_STATUS) -> None:
-        self._conn.execute(
-            "INSERT OR REPLACE INTO test_results (urn, fqn, status) VALUES (?, ?, ?)",
-            (urn, fqn, status.value),
-        )
+        self._conn.execute(_INSERT_TEST_RESULT, (urn, fqn, status.value))
 
     def insert_parsing_graph_edge(self, parent_urn: str, child_urn: str, edge_type: str) -> None:
-        self._conn.execute(
-            "INSERT OR IGNORE INTO parsing_graph (parent_urn, child_urn, edge_type) VALUES (?, ?, ?)",
-            (parent_urn, child_urn, edge_type),
-        )
+        self._conn.execute(_INSERT_PARSING_GRAPH_EDGE, (parent_urn, child_urn, edge_type))
 
     def insert_urn_metadata(
         self,
@@ -191,20 +281,178 @@ class RequirementsDatabase:
         location_uri: str | None = None,
     ) -> None:
         self._conn.execute(
-            "INSERT INTO urn_metadata (urn, variant, title, url, parse_position, location_type, location_uri)"
-            " VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                metadata.urn,
-                metadata.variant.value if metadata.variant else None,
-                metadata.title,
-                metadata.url,
-                self._next_parse_position,
-                location_type,
-                location_uri,
-            ),
+            _INSERT_URN_METADATA, _urn_metadata_row(metadata, self._next_parse_position, location_type, location_uri)
         )
         self._next_parse_position += 1
 
+    # -- Bulk insert API --
+
+    def insert_raw_datasets(
+        self,
+        raw_datasets: Sequence[Tuple[str, RawDataset]],
+        parsing_graph: Optional[Dict[str, List[Tuple[str, str]]]] = None,
+        with_urn_metadata: bool = True,
+    ) -> None:
+        """Insert whole parsed datasets, one ``executemany`` per table in a single transaction.
+
+        Rows are inserted in FK order (requirements → SVCs → MVRs → annotations → test results
+        → graph) across all datasets, so links may point into any dataset in the batch or
+        already in the database. Links to entities that do not exist are skipped with the
+        same warnings as the single-row API.
+
+        The load runs with the rollback journal and syncing off, so the database must be
+        discarded if it fails. Secondary indexes are (re)created once the rows are in.
+
+        Args:
+            raw_datasets: (urn, dataset) pairs in parsing order
+            parsing_graph: parent urn → [(child urn, edge type)]
+            with_urn_metadata: also insert each dataset's urn_metadata row, numbered in order
+        """
+        self._conn.commit()
+        journal_mode = self._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = self._conn.execute("PRAGMA synchronous").fetchone()[0]
+        self._conn.execute("PRAGMA journal_mode = OFF")
+        self._conn.execute("PRAGMA synchronous = OFF")
+        try:
+            self._conn.execute("BEGIN")
+            self._conn.execute("PRAGMA defer_foreign_keys = ON")
+            if with_urn_metadata:
+                self.__bulk_insert_urn_metadata(raw_datasets)
+            self.__bulk_insert_requirements(raw_datasets)
+            self.__bulk_insert_svcs(raw_datasets)
+            self.__bulk_insert_mvrs(raw_datasets)
+            self.__bulk_insert_annotations(raw_datasets)
+            self.__bulk_insert_test_results(raw_datasets)
+            if parsing_graph:
+                self._conn.executemany(
+                    _INSERT_PARSING_GRAPH_EDGE,
+                    [(parent, child, edge) for parent, children in parsing_graph.items() for child, edge in children],
+                )
+            self._conn.commit()
+        except BaseException:
+            self._conn.rollback()
+            raise
+        finally:
+            self._conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+            self._conn.execute(f"PRAGMA synchronous = {synchronous}")
+
+        self.create_indexes()
+
+    def create_indexes(self) -> None:
+        """Create the secondary indexes if they do not exist yet (see ``defer_indexes``).
+
+        Like backup_to(), this clears the authorizer for the duration: creating an index
+        writes sqlite_master, which the authorizer blocks.
+        """
+        self._conn.set_authorizer(None)
+        try:
+            self._conn.executescript(SCHEMA_INDEXES_DDL)
+        finally:
+            self._conn.set_authorizer(authorizer)
+
+    def __bulk_insert_urn_metadata(self, raw_datasets: Sequence[Tuple[str, RawDataset]]) -> None:
+        rows = []
+        for _, rd in raw_datasets:
+            rows.append(
+                _urn_metadata_row(
+                    rd.requirements_data.metadata, self._next_parse_position, rd.location_type, rd.location_uri
+                )
+            )
+            self._next_parse_position += 1
+        self._conn.executemany(_INSERT_URN_METADATA, rows)
+
+    def __bulk_insert_requirements(self, raw_datasets: Sequence[Tuple[str, RawDataset]]) -> None:
+        requirements = [
+            (urn, req)
+            for urn, rd in raw_datasets
+            if rd.requirements_data is not None
+            for req in rd.requirements_data.requirements.values()
+        ]
+        self._conn.executemany(_INSERT_REQUIREMENT, [_requirement_row(urn, req) for urn, req in requirements])
+        self._conn.executemany(
+            _INSERT_REQUIREMENT_CATEGORY,
+            [row for urn, req in requirements for row in _requirement_category_rows(urn, req)],
+        )
+        self._conn.executemany(
+            _INSERT_REQUIREMENT_REFERENCE,
+            [row for urn, req in requirements for row in _requirement_reference_rows(urn, req)],
+        )
+
+    def __bulk_insert_svcs(self, raw_datasets: Sequence[Tuple[str, RawDataset]]) -> None:
+        svcs = [
+            (urn, svc)
+            for urn, rd in raw_datasets
+            if rd.svcs_data is not None and rd.svcs_data.cases
+            for svc in rd.svcs_data.cases.values()
+        ]
+        self._conn.executemany(_INSERT_SVC, [_svc_row(urn, svc) for urn, svc in svcs])
+
+        known_reqs = self.__existing_keys("requirements")
+        links = []
+        for urn, svc in svcs:
+            for req_urn_id in dict.fromkeys(svc.requirement_ids):
+                if (req_urn_id.urn, req_urn_id.id) in known_reqs:
+                    links.append((urn, svc.id.id, req_urn_id.urn, req_urn_id.id))
+                else:
+                    logger.warning("SVC %s:%s references non-existent requirement %s", urn, svc.id.id, req_urn_id)
+        self._conn.executemany(_INSERT_SVC_REQUIREMENT_LINK, links)
+
+    def __bulk_insert_mvrs(self, raw_datasets: Sequence[Tuple[str, RawDataset]]) -> None:
+        mvrs = [
+            (urn, mvr)
+            for urn, rd in raw_datasets
+            if rd.mvrs_data is not None and rd.mvrs_data.results
+            for mvr in rd.mvrs_data.results.values()
+        ]
+        self._conn.executemany(_INSERT_MVR, [_mvr_row(urn, mvr) for urn, mvr in mvrs])
+
+        known_svcs = self.__existing_keys("svcs")
+        links = []
+        for urn, mvr in mvrs:
+            for svc_urn_id in dict.fromkeys(mvr.svc_ids):
+                if (svc_urn_id.urn, svc_urn_id.id) in known_svcs:
+                    links.append((urn, mvr.id.id, svc_urn_id.urn, svc_urn_id.id))
+                else:
+                    logger.warning("MVR %s:%s references non-existent SVC %s", urn, mvr.id.id, svc_urn_id)
+        self._conn.executemany(_INSERT_MVR_SVC_LINK, links)
+
+    def __bulk_insert_annotations(self, raw_datasets: Sequence[Tuple[str, RawDataset]]) -> None:
+        annotated = [rd.annotations_data for _, rd in raw_datasets if rd.annotations_data is not None]
+
+        known_reqs = self.__existing_keys("requirements")
+        impl_rows = []
+        for annotations_data in annotated:
+            for req_urn_id, annotations in annotations_data.implementations.items():
+                if (req_urn_id.urn, req_urn_id.id) not in known_reqs:
+                    logger.warning("Annotation impl references non-existent requirement %s", req_urn_id)
+                    continue
+                impl_rows.extend(_annotation_row(req_urn_id, annotation) for annotation in annotations)
+        self._conn.executemany(_INSERT_ANNOTATION_IMPL, impl_rows)
+
+        known_svcs = self.__existing_keys("svcs")
+        test_rows = []
+        for annotations_data in annotated:
+            for svc_urn_id, annotations in annotations_data.tests.items():
+                if (svc_urn_id.urn, svc_urn_id.id) not in known_svcs:
+                    logger.warning("Annotation test references non-existent SVC %s", svc_urn_id)
+                    continue
+                test_rows.extend(_annotation_row(svc_urn_id, annotation) for annotation in annotations)
+        self._conn.executemany(_INSERT_ANNOTATION_TEST, test_rows)
+
+    def __bulk_insert_test_results(self, raw_datasets: Sequence[Tuple[str, RawDataset]]) -> None:
+        self._conn.executemany(
+            _INSERT_TEST_RESULT,
+            [
+                (test_urn_id.urn, test_data.fully_qualified_name, test_data.status.value)
+                for _, rd in raw_datasets
+                if rd.automated_tests is not None
+                for test_urn_id, test_data in rd.automated_tests.tests.items()
+            ],
+        )
+
+    def __existing_keys(self, table: str) -> Set[Tuple[str, str]]:
+        return {(row["urn"], row["id"]) for row in self._conn.execute(f"SELECT urn, id FROM {table}")}
+
     # -- Metadata --
 
     def set_metadata(self, key: str, value: str) -> None:
@@ -0,0 +1,46 @@
+# Copyright © LFV
+
+"""Decoding of stored column values back into the enums and versions of the models.
+
+Calling an Enum with a value (``SIGNIFICANCETYPES("shall")``) goes through the enum
+machinery's value lookup and error handling, and ``Version()`` runs a PEP 440 regular
+expression; both dominated profiles of hydrating large result sets. Every value written to
+the database came from a model, so each column only ever holds a handful of distinct
+values: enums are decoded through precomputed value -> member tables, and revisions
+through a bounded cache of parsed versions. ``Version`` is immutable, so a cached instance
+can be shared by every record with the same revision.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import TypeVar
+
+from packaging.version import Version
+
+from reqstool.common.models.lifecycle import LIFECYCLESTATE
+from reqstool.models.requirements import CATEGORIES, IMPLEMENTATION, SIGNIFICANCETYPES
+from reqstool.models.svcs import VERIFICATIONPHASE, VERIFICATIONTYPES
+from reqstool.models.test_data import TEST_RUN_STATUS
+
+E = TypeVar("E", bound=Enum)
+
+# Distinct revision strings kept parsed; far more than a requirement graph normally uses
+REVISION_CACHE_SIZE = 1024
+
+
+def _by_value(enum_type: type[E]) -> dict[str, E]:
+    return {member.value: member for member in enum_type}
+
+
+LIFECYCLE_STATE_BY_VALUE: dict[str, LIFECYCLESTATE] = _by_value(LIFECYCLESTATE)
+SIGNIFICANCE_BY_VALUE: dict[str, SIGNIFICANCETYPES] = _by_value(SIGNIFICANCETYPES)
+IMPLEMENTATION_BY_VALUE: dict[str, IMPLEMENTATION] = _by_value(IMPLEMENTATION)
+CATEGORY_BY_VALUE: dict[str, CATEGORIES] = _by_value(CATEGORIES)
+VERIFICATION_BY_VALUE: dict[str, VERIFICATIONTYPES] = _by_value(VERIFICATIONTYPES)
+PHASE_BY_VALUE: dict[str, VERIFICATIONPHASE] = _by_value(VERIFICATIONPHASE)
+TEST_STATUS_BY_VALUE: dict[str, TEST_RUN_STATUS] = _by_value(TEST_RUN_STATUS)
+
+
+@lru_cache(maxsize=REVISION_CACHE_SIZE)
+def decode_revision(revision: str) -> Version:
+    return Version(revision)
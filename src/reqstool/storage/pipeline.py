@@ -2,11 +2,12 @@
 
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Callable, Generator, Optional
 
-from reqstool.common.utils import TempDirectoryManager
+from reqstool.common.utils import TempDirectoryManager, Utils
 from reqstool.common.validators.lifecycle_validator import LifecycleValidator
 from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.locations.artifact_cache import ArtifactCache
 from reqstool.locations.location import LocationInterface
 from reqstool.model_generators.combined_raw_datasets_generator import CombinedRawDatasetsGenerator
 from reqstool.model_generators.parsing_config import ParsingConfig
@@ -14,6 +15,11 @@ from reqstool.models.raw_datasets import CombinedRawDataset
 from reqstool.storage.database import RequirementsDatabase
 from reqstool.storage.database_filter_processor import DatabaseFilterProcessor
 from reqstool.storage.requirements_repository import RequirementsRepository
+from reqstool.storage.snapshot_cache import SnapshotCache
+
+# Given (location, filter_data, parsing_config, semantic_validator), a ready database to use
+# instead of parsing, or None to parse as usual. The daemon provides SessionPool.database.
+DatabaseProvider = Callable[[LocationInterface, bool, ParsingConfig, SemanticValidator], Optional[RequirementsDatabase]]
 
 
 @contextmanager
@@ -23,24 +29,57 @@ def build_database(
     filter_data: bool = True,
     tmpdir_manager: TempDirectoryManager = None,
     parsing_config: ParsingConfig = ParsingConfig(),
-) -> Generator[tuple[RequirementsDatabase, CombinedRawDataset], None, None]:
+    snapshot_cache: Optional[SnapshotCache] = None,
+    artifact_cache: Optional[ArtifactCache] = None,
+    database_provider: Optional[DatabaseProvider] = None,
+) -> Generator[tuple[RequirementsDatabase, Optional[CombinedRawDataset]], None, None]:
+    """Parse ``location`` and everything it imports into a populated database.
+
+    With a ``database_provider`` (when run by the daemon), the database it provides is used
+    instead of parsing, and with a ``snapshot_cache``, an up-to-date cached
+    database; the yielded CombinedRawDataset is then None. With an ``artifact_cache``,
+    remote sources pinned to a fixed version are only downloaded once.
+    """
+    if database_provider is not None:
+        provided_db = database_provider(location, filter_data, parsing_config, semantic_validator)
+        if provided_db is not None:
+            yield from _prebuilt_database(provided_db)
+            return
+
+    cache_key = None
+    if snapshot_cache is not None:
+        cache_key = snapshot_cache.key_for(location, filter_data, parsing_config)
+        cached_db = snapshot_cache.load(cache_key, semantic_validator)
+        if cached_db is not None:
+            yield from _prebuilt_database(cached_db)
+            return
+
     _owns_tmpdir = tmpdir_manager is None
     if _owns_tmpdir:
         tmpdir_manager = TempDirectoryManager()
-    db = RequirementsDatabase()
+    db = RequirementsDatabase(defer_indexes=True)
     try:
-        crdg = CombinedRawDatasetsGenerator(
-            initial_location=location,
-            semantic_validator=semantic_validator,
-            database=db,
-            tmpdir_manager=tmpdir_manager,
-            parsing_config=parsing_config,
-        )
+        no_of_errors_before = len(semantic_validator.get_errors())
+
+        with Utils.recording_env_var_reads() as env_var_names:
+            crdg = CombinedRawDatasetsGenerator(
+                initial_location=location,
+                semantic_validator=semantic_validator,
+                database=db,
+                tmpdir_manager=tmpdir_manager,
+                parsing_config=parsing_config,
+                artifact_cache=artifact_cache,
+            )
         crd = crdg.combined_raw_datasets
 
         if filter_data:
             DatabaseFilterProcessor(db, crd.raw_datasets).apply_filters()
 
+        if snapshot_cache is not None:
+            snapshot_cache.store(
+                cache_key, db, crd, semantic_validator.get_errors()[no_of_errors_before:], env_var_names
+            )
+
         LifecycleValidator(RequirementsRepository(db))
 
         yield db, crd
@@ -48,3 +87,14 @@ def build_database(
         db.close()
         if _owns_tmpdir:
             tmpdir_manager.cleanup()
+
+
+def _prebuilt_database(
+    db: RequirementsDatabase,
+) -> Generator[tuple[RequirementsDatabase, Optional[CombinedRawDataset]], None, None]:
+    try:
+        LifecycleValidator(RequirementsRepository(db))
+
+        yield db, None
+    finally:
+        db.close()
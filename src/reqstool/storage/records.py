@@ -0,0 +1,121 @@
+# Copyright © LFV
+
+"""Read models returned by RequirementsRepository.
+
+The pydantic models in ``reqstool.models`` validate what is parsed from the input files.
+Rows read back from the database have already been through that, yet building a model per
+row ran its validators again, and listing tens of thousands of entities spent most of its
+time (and memory) there. The records here are plain slotted dataclasses with the same
+attribute names as the corresponding models, so read-only code (status, report, export,
+the LSP and MCP servers) can use either. Lifecycles without a reason are shared, and the
+revision is only decoded into a ``Version`` (see decoding.py) when it is first asked for.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from packaging.version import Version
+
+from reqstool.common.models.lifecycle import LIFECYCLESTATE
+from reqstool.common.models.urn_id import UrnId
+from reqstool.models.requirements import CATEGORIES, IMPLEMENTATION, SIGNIFICANCETYPES
+from reqstool.models.svcs import VERIFICATIONPHASE, VERIFICATIONTYPES
+from reqstool.models.test_data import TEST_RUN_STATUS
+from reqstool.storage.decoding import LIFECYCLE_STATE_BY_VALUE, decode_revision
+
+
+@dataclass(frozen=True, slots=True)
+class LifecycleRecord:
+    state: LIFECYCLESTATE = LIFECYCLESTATE.EFFECTIVE
+    reason: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceRecord:
+    requirement_ids: frozenset[UrnId] = frozenset()
+
+
+class _LazyRevision:
+    """Mixin for records that keep their revision as stored and parse it on first access."""
+
+    __slots__ = ()
+
+    @property
+    def revision(self) -> Version:
+        revision = self._revision
+        if revision is None:
+            revision = decode_revision(self.revision_text)
+            object.__setattr__(self, "_revision", revision)
+        return revision
+
+
+@dataclass(frozen=True, slots=True)
+class RequirementRecord(_LazyRevision):
+    id: UrnId
+    title: str
+    significance: SIGNIFICANCETYPES
+    description: str
+    rationale: Optional[str]
+    revision_text: str
+    lifecycle: LifecycleRecord
+    implementation: IMPLEMENTATION
+    categories: list[CATEGORIES]
+    references: list[ReferenceRecord]
+    source_line: Optional[int] = None
+    source_col_start: Optional[int] = None
+    source_col_end: Optional[int] = None
+    _revision: Optional[Version] = field(default=None, init=False, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class SVCRecord(_LazyRevision):
+    id: UrnId
+    title: str
+    description: Optional[str]
+    verification: VERIFICATIONTYPES
+    phase: VERIFICATIONPHASE
+    instructions: Optional[str]
+    revision_text: str
+    lifecycle: LifecycleRecord
+    requirement_ids: list[UrnId]
+    source_line: Optional[int] = None
+    source_col_start: Optional[int] = None
+    source_col_end: Optional[int] = None
+    _revision: Optional[Version] = field(default=None, init=False, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class MVRRecord:
+    id: UrnId
+    comment: Optional[str]
+    passed: bool
+    date: Optional[datetime]
+    svc_ids: list[UrnId]
+    source_line: Optional[int] = None
+    source_col_start: Optional[int] = None
+    source_col_end: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class TestRecord:
+    fully_qualified_name: str
+    status: TEST_RUN_STATUS
+
+
+@dataclass(frozen=True, slots=True)
+class AnnotationRecord:
+    element_kind: str
+    fully_qualified_name: str
+
+
+# Almost every lifecycle is just a state; those are shared instead of built per row
+_LIFECYCLE_WITHOUT_REASON: dict[str, LifecycleRecord] = {
+    member.value: LifecycleRecord(state=member) for member in LIFECYCLESTATE
+}
+
+
+def lifecycle_record(state: str, reason: Optional[str]) -> LifecycleRecord:
+    if reason is None:
+        return _LIFECYCLE_WITHOUT_REASON[state]
+    return LifecycleRecord(state=LIFECYCLE_STATE_BY_VALUE[state], reason=reason)
@@ -2,23 +2,36 @@
 
 
 from datetime import datetime
+from typing import Iterable, Iterator
 
-from packaging.version import Version
-
-from reqstool.common.models.lifecycle import LIFECYCLESTATE, LifecycleData
 from reqstool.common.models.urn_id import UrnId
-from reqstool.models.annotations import AnnotationData
-from reqstool.models.mvrs import MVRData
-from reqstool.models.requirements import (
-    CATEGORIES,
-    IMPLEMENTATION,
-    SIGNIFICANCETYPES,
-    ReferenceData,
-    RequirementData,
-)
-from reqstool.models.svcs import VERIFICATIONPHASE, VERIFICATIONTYPES, SVCData
-from reqstool.models.test_data import TEST_RUN_STATUS, TestData
+from reqstool.models.test_data import TEST_RUN_STATUS
 from reqstool.storage.database import RequirementsDatabase
+from reqstool.storage.decoding import (
+    CATEGORY_BY_VALUE,
+    IMPLEMENTATION_BY_VALUE,
+    PHASE_BY_VALUE,
+    SIGNIFICANCE_BY_VALUE,
+    TEST_STATUS_BY_VALUE,
+    VERIFICATION_BY_VALUE,
+)
+from reqstool.storage.records import (
+    AnnotationRecord,
+    MVRRecord,
+    ReferenceRecord,
+    RequirementRecord,
+    SVCRecord,
+    TestRecord,
+    lifecycle_record,
+)
+
+# Two bound parameters per (urn, id) key; keeps batch lookups far from SQLITE_MAX_VARIABLE_NUMBER.
+_MAX_KEYS_PER_QUERY = 400
+
+
+def _class_fqn_bounds(fqn: str) -> tuple[str, str, str]:
+    """(exact, lower, upper) bounds selecting a class fqn and every fqn nested under it."""
+    return fqn, fqn + ".", fqn + "/"
 
 
 class RequirementsRepository:
@@ -75,65 +88,132 @@ class RequirementsRepository:
 
     def get_all_requirements(
         self, urn: str | None = None, lifecycle_state: str | None = None
-    ) -> dict[UrnId, RequirementData]:
-        clauses: list[str] = []
-        args: list = []
-        if urn:
-            clauses.append("urn = ?")
-            args.append(urn)
-        if lifecycle_state:
-            clauses.append("lifecycle_state = ?")
-            args.append(lifecycle_state)
-        sql = "SELECT * FROM requirements" + (" WHERE " + " AND ".join(clauses) if clauses else "")
-        rows = self._db.connection.execute(sql, args).fetchall()
+    ) -> dict[UrnId, RequirementRecord]:
+        return self._load_requirements(*self._entity_filter(urn=urn, lifecycle_state=lifecycle_state))
+
+    def get_all_svcs(self, urn: str | None = None, lifecycle_state: str | None = None) -> dict[UrnId, SVCRecord]:
+        return self._load_svcs(*self._entity_filter(urn=urn, lifecycle_state=lifecycle_state))
+
+    def get_all_mvrs(self, urn: str | None = None, passed: bool | None = None) -> dict[UrnId, MVRRecord]:
+        return self._load_mvrs(*self._entity_filter(urn=urn, passed=passed))
+
+    # -- Keyed entity lookups --
+
+    def get_requirement(self, req_urn_id: UrnId) -> RequirementRecord | None:
+        row = self._db.connection.execute(
+            "SELECT * FROM requirements WHERE urn = ? AND id = ?",
+            (req_urn_id.urn, req_urn_id.id),
+        ).fetchone()
+        return self._row_to_requirement(row) if row else None
+
+    def get_mvr(self, mvr_urn_id: UrnId) -> MVRRecord | None:
+        row = self._db.connection.execute(
+            "SELECT * FROM mvrs WHERE urn = ? AND id = ?",
+            (mvr_urn_id.urn, mvr_urn_id.id),
+        ).fetchone()
+        return self._row_to_mvr(row) if row else None
+
+    def get_requirements(self, req_urn_ids: Iterable[UrnId]) -> dict[UrnId, RequirementRecord]:
+        """Return the requirements with the given ids; ids not in the database are left out."""
+        result: dict[UrnId, RequirementRecord] = {}
+        for chunk in self._key_chunks(req_urn_ids):
+            result |= self._load_requirements(*self._entity_filter(keys=chunk))
+        return result
+
+    def get_svcs(self, svc_urn_ids: Iterable[UrnId]) -> dict[UrnId, SVCRecord]:
+        """Return the SVCs with the given ids; ids not in the database are left out."""
+        result: dict[UrnId, SVCRecord] = {}
+        for chunk in self._key_chunks(svc_urn_ids):
+            result |= self._load_svcs(*self._entity_filter(keys=chunk))
+        return result
+
+    def get_mvrs(self, mvr_urn_ids: Iterable[UrnId]) -> dict[UrnId, MVRRecord]:
+        """Return the MVRs with the given ids; ids not in the database are left out."""
+        result: dict[UrnId, MVRRecord] = {}
+        for chunk in self._key_chunks(mvr_urn_ids):
+            result |= self._load_mvrs(*self._entity_filter(keys=chunk))
+        return result
+
+    # -- Bulk hydration --
+
+    def _load_requirements(self, where: str, args: list) -> dict[UrnId, RequirementRecord]:
+        rows = self._db.connection.execute("SELECT r.* FROM requirements r" + where, args).fetchall()
+        if not rows:
+            return {}
+
+        # Load each child table once for the whole result set (joined back to the same filter)
+        # instead of issuing two extra SELECTs per requirement. ORDER BY keeps the primary-key
+        # order the per-row lookups returned, which grouping and reports rely on.
+        categories = self._group_child_rows(
+            "SELECT c.req_urn AS urn, c.req_id AS id, c.category FROM requirement_categories c"
+            " JOIN requirements r ON r.urn = c.req_urn AND r.id = c.req_id"
+            + where
+            + " ORDER BY c.req_urn, c.req_id, c.category",
+            args,
+        )
+        references = self._group_child_rows(
+            "SELECT c.req_urn AS urn, c.req_id AS id, c.ref_req_urn, c.ref_req_id FROM requirement_references c"
+            " JOIN requirements r ON r.urn = c.req_urn AND r.id = c.req_id"
+            + where
+            + " ORDER BY c.req_urn, c.req_id, c.ref_req_urn, c.ref_req_id",
+            args,
+        )
+
         result = {}
         for row in rows:
-            urn_id = UrnId(urn=row["urn"], id=row["id"])
-            result[urn_id] = self._row_to_requirement_data(row)
+            key = (row["urn"], row["id"])
+            req = self._row_to_requirement(
+                row, category_rows=categories.get(key, []), reference_rows=references.get(key, [])
+            )
+            result[req.id] = req
         return result
 
-    def get_all_svcs(self, urn: str | None = None, lifecycle_state: str | None = None) -> dict[UrnId, SVCData]:
-        clauses: list[str] = []
-        args: list = []
-        if urn:
-            clauses.append("urn = ?")
-            args.append(urn)
-        if lifecycle_state:
-            clauses.append("lifecycle_state = ?")
-            args.append(lifecycle_state)
-        sql = "SELECT * FROM svcs" + (" WHERE " + " AND ".join(clauses) if clauses else "")
-        rows = self._db.connection.execute(sql, args).fetchall()
+    def _load_svcs(self, where: str, args: list) -> dict[UrnId, SVCRecord]:
+        rows = self._db.connection.execute("SELECT r.* FROM svcs r" + where, args).fetchall()
+        if not rows:
+            return {}
+
+        req_links = self._group_child_rows(
+            "SELECT c.svc_urn AS urn, c.svc_id AS id, c.req_urn, c.req_id FROM svc_requirement_links c"
+            " JOIN svcs r ON r.urn = c.svc_urn AND r.id = c.svc_id"
+            + where
+            + " ORDER BY c.svc_urn, c.svc_id, c.req_urn, c.req_id",
+            args,
+        )
+
         result = {}
         for row in rows:
-            urn_id = UrnId(urn=row["urn"], id=row["id"])
-            result[urn_id] = self._row_to_svc_data(row)
+            svc = self._row_to_svc(row, req_link_rows=req_links.get((row["urn"], row["id"]), []))
+            result[svc.id] = svc
         return result
 
-    def get_all_mvrs(self, urn: str | None = None, passed: bool | None = None) -> dict[UrnId, MVRData]:
-        clauses: list[str] = []
-        args: list = []
-        if urn:
-            clauses.append("urn = ?")
-            args.append(urn)
-        if passed is not None:
-            clauses.append("passed = ?")
-            args.append(1 if passed else 0)
-        sql = "SELECT * FROM mvrs" + (" WHERE " + " AND ".join(clauses) if clauses else "")
-        rows = self._db.connection.execute(sql, args).fetchall()
+    def _load_mvrs(self, where: str, args: list) -> dict[UrnId, MVRRecord]:
+        rows = self._db.connection.execute("SELECT r.* FROM mvrs r" + where, args).fetchall()
+        if not rows:
+            return {}
+
+        svc_links = self._group_child_rows(
+            "SELECT c.mvr_urn AS urn, c.mvr_id AS id, c.svc_urn, c.svc_id FROM mvr_svc_links c"
+            " JOIN mvrs r ON r.urn = c.mvr_urn AND r.id = c.mvr_id"
+            + where
+            + " ORDER BY c.mvr_urn, c.mvr_id, c.svc_urn, c.svc_id",
+            args,
+        )
+
         result = {}
         for row in rows:
-            urn_id = UrnId(urn=row["urn"], id=row["id"])
-            result[urn_id] = self._row_to_mvr_data(row)
+            mvr = self._row_to_mvr(row, svc_link_rows=svc_links.get((row["urn"], row["id"]), []))
+            result[mvr.id] = mvr
         return result
 
     # -- Index/lookup queries --
 
-    def get_svc(self, svc_urn_id: UrnId) -> SVCData | None:
+    def get_svc(self, svc_urn_id: UrnId) -> SVCRecord | None:
         row = self._db.connection.execute(
             "SELECT * FROM svcs WHERE urn = ? AND id = ?",
             (svc_urn_id.urn, svc_urn_id.id),
         ).fetchone()
-        return self._row_to_svc_data(row) if row else None
+        return self._row_to_svc(row) if row else None
 
     def get_svcs_for_req(self, req_urn_id: UrnId) -> list[UrnId]:
         rows = self._db.connection.execute(
@@ -149,7 +229,7 @@ class RequirementsRepository:
         ).fetchall()
         return [UrnId(urn=row["mvr_urn"], id=row["mvr_id"]) for row in rows]
 
-    def get_effective_mvr_for_svc(self, svc_urn_id: UrnId) -> MVRData | None:
+    def get_effective_mvr_for_svc(self, svc_urn_id: UrnId) -> MVRRecord | None:
         """Return the MVR that represents the current verdict for a SVC.
 
         When a SVC has multiple MVRs the one with the latest date (UTC-normalized
@@ -176,9 +256,9 @@ class RequirementsRepository:
             """,
             (svc_urn_id.urn, svc_urn_id.id),
         ).fetchone()
-        return self._row_to_mvr_data(row) if row else None
+        return self._row_to_mvr(row) if row else None
 
-    def get_superseded_mvrs_for_svc(self, svc_urn_id: UrnId) -> list[MVRData]:
+    def get_superseded_mvrs_for_svc(self, svc_urn_id: UrnId) -> list[MVRRecord]:
         """Return all MVRs for a SVC that are NOT the effective (latest) one.
 
         These are retained as audit history but excluded from the verdict.
@@ -200,7 +280,7 @@ class RequirementsRepository:
             """,
             (svc_urn_id.urn, svc_urn_id.id),
         ).fetchall()
-        return [self._row_to_mvr_data(row) for row in rows]
+        return [self._row_to_mvr(row) for row in rows]
 
     def get_effective_mvr_verdict_counts(self) -> tuple[int, int, int]:
         """Return (total, passed, failed) counts of effective-MVR verdicts across all SVCs.
@@ -228,46 +308,46 @@ class RequirementsRepository:
             return (0, 0, 0)
         return (row["total"] or 0, row["passed"] or 0, row["failed"] or 0)
 
-    def get_annotations_impls(self, urn: str | None = None) -> dict[UrnId, list[AnnotationData]]:
+    def get_annotations_impls(self, urn: str | None = None) -> dict[UrnId, list[AnnotationRecord]]:
         sql = "SELECT req_urn, req_id, element_kind, fqn FROM annotations_impls" + (" WHERE req_urn = ?" if urn else "")
         rows = self._db.connection.execute(sql, (urn,) if urn else ()).fetchall()
-        result: dict[UrnId, list[AnnotationData]] = {}
+        result: dict[UrnId, list[AnnotationRecord]] = {}
         for row in rows:
             key = UrnId(urn=row["req_urn"], id=row["req_id"])
-            annotation = AnnotationData(element_kind=row["element_kind"], fully_qualified_name=row["fqn"])
+            annotation = AnnotationRecord(element_kind=row["element_kind"], fully_qualified_name=row["fqn"])
             result.setdefault(key, []).append(annotation)
         return result
 
-    def get_annotations_tests(self, urn: str | None = None) -> dict[UrnId, list[AnnotationData]]:
+    def get_annotations_tests(self, urn: str | None = None) -> dict[UrnId, list[AnnotationRecord]]:
         sql = "SELECT svc_urn, svc_id, element_kind, fqn FROM annotations_tests" + (" WHERE svc_urn = ?" if urn else "")
         rows = self._db.connection.execute(sql, (urn,) if urn else ()).fetchall()
-        result: dict[UrnId, list[AnnotationData]] = {}
+        result: dict[UrnId, list[AnnotationRecord]] = {}
         for row in rows:
             key = UrnId(urn=row["svc_urn"], id=row["svc_id"])
-            annotation = AnnotationData(element_kind=row["element_kind"], fully_qualified_name=row["fqn"])
+            annotation = AnnotationRecord(element_kind=row["element_kind"], fully_qualified_name=row["fqn"])
             result.setdefault(key, []).append(annotation)
         return result
 
-    def get_annotations_impls_for_req(self, req_urn_id: UrnId) -> list[AnnotationData]:
+    def get_annotations_impls_for_req(self, req_urn_id: UrnId) -> list[AnnotationRecord]:
         rows = self._db.connection.execute(
             "SELECT element_kind, fqn FROM annotations_impls WHERE req_urn = ? AND req_id = ?",
             (req_urn_id.urn, req_urn_id.id),
         ).fetchall()
-        return [AnnotationData(element_kind=row["element_kind"], fully_qualified_name=row["fqn"]) for row in rows]
+        return [AnnotationRecord(element_kind=row["element_kind"], fully_qualified_name=row["fqn"]) for row in rows]
 
-    def get_annotations_tests_for_svc(self, svc_urn_id: UrnId) -> list[AnnotationData]:
+    def get_annotations_tests_for_svc(self, svc_urn_id: UrnId) -> list[AnnotationRecord]:
         rows = self._db.connection.execute(
             "SELECT element_kind, fqn FROM annotations_tests WHERE svc_urn = ? AND svc_id = ?",
             (svc_urn_id.urn, svc_urn_id.id),
         ).fetchall()
-        return [AnnotationData(element_kind=row["element_kind"], fully_qualified_name=row["fqn"]) for row in rows]
+        return [AnnotationRecord(element_kind=row["element_kind"], fully_qualified_name=row["fqn"]) for row in rows]
 
-    def get_test_results_for_svc(self, svc_urn_id: UrnId) -> list[TestData]:
+    def get_test_results_for_svc(self, svc_urn_id: UrnId) -> list[TestRecord]:
         """Return test results for each annotation attached to the given SVC."""
         annotations = self.get_annotations_tests_for_svc(svc_urn_id)
         return self.get_test_results_for_annotations(svc_urn_id.urn, annotations)
 
-    def get_test_results_for_annotations(self, urn: str, annotations: list[AnnotationData]) -> list[TestData]:
+    def get_test_results_for_annotations(self, urn: str, annotations: list[AnnotationRecord]) -> list[TestRecord]:
         """Resolve test results for an already-fetched list of test annotations.
 
         Lets callers that already hold the annotation list (e.g. to check for emptiness)
@@ -283,16 +363,69 @@ class RequirementsRepository:
                     (ann.fully_qualified_name,),
                 ).fetchone()
                 if row is not None:
-                    results.append(TestData(fully_qualified_name=row["fqn"], status=TEST_RUN_STATUS(row["status"])))
+                    results.append(
+                        TestRecord(fully_qualified_name=row["fqn"], status=TEST_STATUS_BY_VALUE[row["status"]])
+                    )
                 else:
                     results.append(
-                        TestData(fully_qualified_name=ann.fully_qualified_name, status=TEST_RUN_STATUS.MISSING)
+                        TestRecord(fully_qualified_name=ann.fully_qualified_name, status=TEST_RUN_STATUS.MISSING)
                     )
         return results
 
+    # -- Set-based verdict inputs --
+
+    def get_svc_ids_by_req(self) -> dict[UrnId, list[UrnId]]:
+        """Every requirement's linked SVC ids, in one query. Requirements without SVCs are absent."""
+        rows = self._db.connection.execute(
+            "SELECT req_urn, req_id, svc_urn, svc_id FROM svc_requirement_links ORDER BY rowid"
+        ).fetchall()
+        result: dict[UrnId, list[UrnId]] = {}
+        for row in rows:
+            key = UrnId(urn=row["req_urn"], id=row["req_id"])
+            result.setdefault(key, []).append(UrnId(urn=row["svc_urn"], id=row["svc_id"]))
+        return result
+
+    def get_mvr_ids_by_svc(self) -> dict[UrnId, list[UrnId]]:
+        """Every SVC's linked MVR ids, in one query. SVCs without MVRs are absent."""
+        rows = self._db.connection.execute(
+            "SELECT svc_urn, svc_id, mvr_urn, mvr_id FROM mvr_svc_links ORDER BY rowid"
+        ).fetchall()
+        result: dict[UrnId, list[UrnId]] = {}
+        for row in rows:
+            key = UrnId(urn=row["svc_urn"], id=row["svc_id"])
+            result.setdefault(key, []).append(UrnId(urn=row["mvr_urn"], id=row["mvr_id"]))
+        return result
+
+    def get_annotations_impl_counts(self) -> dict[UrnId, int]:
+        """Number of implementation annotations per requirement. Requirements without any are absent."""
+        rows = self._db.connection.execute(
+            "SELECT req_urn, req_id, COUNT(*) AS n FROM annotations_impls GROUP BY req_urn, req_id"
+        ).fetchall()
+        return {UrnId(urn=row["req_urn"], id=row["req_id"]): row["n"] for row in rows}
+
+    def get_effective_mvr_verdicts(self) -> dict[UrnId, bool]:
+        """SVC id → passed flag of its effective MVR, for every SVC that has one.
+
+        Uses the same ranking as get_effective_mvr_for_svc, evaluated for all SVCs at once.
+        """
+        rows = self._db.connection.execute(
+            """
+            SELECT svc_urn, svc_id, passed
+            FROM (
+                SELECT l.svc_urn, l.svc_id, m.passed, ROW_NUMBER() OVER (
+                    PARTITION BY l.svc_urn, l.svc_id
+                    ORDER BY datetime(m.date) DESC NULLS LAST
+                ) AS rn
+                FROM mvrs m
+                JOIN mvr_svc_links l ON m.urn = l.mvr_urn AND m.id = l.mvr_id
+            ) WHERE rn = 1
+            """
+        ).fetchall()
+        return {UrnId(urn=row["svc_urn"], id=row["svc_id"]): bool(row["passed"]) for row in rows}
+
     # -- Test result resolution --
 
-    def get_automated_test_results(self) -> dict[UrnId, list[TestData]]:
+    def get_automated_test_results(self) -> dict[UrnId, list[TestRecord]]:
         """Replaces CombinedIndexedDatasetGenerator.__process_automated_test_result.
 
         For each test annotation:
@@ -300,150 +433,198 @@ class RequirementsRepository:
             Aggregate: all passed → PASSED, any not passed → FAILED, none found → MISSING
           - METHOD annotations: find exact test_result match, else MISSING
         """
-        annotations = self._db.connection.execute(
-            "SELECT svc_urn, svc_id, element_kind, fqn FROM annotations_tests"
-        ).fetchall()
+        result: dict[UrnId, list[TestRecord]] = {}
+        for row in self._resolved_test_annotation_rows():
+            test_urn_id = UrnId(urn=row["svc_urn"], id=row["fqn"])
+            result.setdefault(test_urn_id, []).append(
+                TestRecord(fully_qualified_name=row["fqn"], status=TEST_STATUS_BY_VALUE[row["status"]])
+            )
+        return result
 
-        result: dict[UrnId, list[TestData]] = {}
+    def get_test_results_by_svc(self) -> dict[UrnId, list[TestRecord]]:
+        """Set-based counterpart of get_test_results_for_svc for every SVC with test annotations.
 
-        for ann in annotations:
-            test_urn_id = UrnId(urn=ann["svc_urn"], id=ann["fqn"])
-
-            if ann["element_kind"] == "CLASS":
-                test_data = self._process_class_annotated_test_results(ann["svc_urn"], ann["fqn"])
-            else:
-                # METHOD or other — look for exact match in any URN
-                test_result_row = self._db.connection.execute(
-                    "SELECT fqn, status FROM test_results WHERE fqn = ?",
-                    (ann["fqn"],),
-                ).fetchone()
+        SVCs without test annotations are absent from the result.
+        """
+        result: dict[UrnId, list[TestRecord]] = {}
+        for row in self._resolved_test_annotation_rows():
+            svc_urn_id = UrnId(urn=row["svc_urn"], id=row["svc_id"])
+            result.setdefault(svc_urn_id, []).append(
+                TestRecord(fully_qualified_name=row["fqn"], status=TEST_STATUS_BY_VALUE[row["status"]])
+            )
+        return result
 
-                if test_result_row is not None:
-                    test_data = TestData(
-                        fully_qualified_name=test_result_row["fqn"],
-                        status=TEST_RUN_STATUS(test_result_row["status"]),
-                    )
-                else:
-                    test_data = TestData(
-                        fully_qualified_name=ann["fqn"],
-                        status=TEST_RUN_STATUS.MISSING,
-                    )
+    def _resolved_test_annotation_rows(self) -> list:
+        """Resolve every test annotation to a status in a single query.
 
-            result.setdefault(test_urn_id, []).append(test_data)
+        Mirrors get_test_results_for_annotations: CLASS annotations aggregate the exact and
+        ``fqn.*`` matches (all passed → passed, any other → failed, none → missing); every
+        other element kind takes the first exact match, else missing. Both lookups are
+        index searches on idx_test_results_fqn (see _process_class_annotated_test_results).
+        """
+        return self._db.connection.execute(
+            """
+            SELECT a.svc_urn, a.svc_id, a.fqn,
+                CASE WHEN a.element_kind = 'CLASS' THEN (
+                    SELECT CASE
+                        WHEN COUNT(*) = 0 THEN 'missing'
+                        WHEN SUM(t.status <> 'passed') = 0 THEN 'passed'
+                        ELSE 'failed'
+                    END
+                    FROM test_results t
+                    WHERE t.fqn = a.fqn OR (t.fqn >= a.fqn || '.' AND t.fqn < a.fqn || '/')
+                ) ELSE COALESCE(
+                    (SELECT t.status FROM test_results t WHERE t.fqn = a.fqn LIMIT 1), 'missing'
+                ) END AS status
+            FROM annotations_tests a
+            ORDER BY a.rowid
+            """
+        ).fetchall()
 
-        return result
+    def _process_class_annotated_test_results(self, urn: str, fqn: str) -> TestRecord:
+        """Replaces CombinedIndexedDatasetGenerator.__process_class_annotated_test_results.
 
-    def _process_class_annotated_test_results(self, urn: str, fqn: str) -> TestData:
-        """Replaces CombinedIndexedDatasetGenerator.__process_class_annotated_test_results."""
+        Matches the class itself (matching the original `if fqn in urn_id.id` logic) and every
+        test under it. "Under it" is the half-open range [fqn + '.', fqn + '/'): '/' is the
+        character after '.', so the range holds exactly the strings prefixed by fqn + '.' and
+        can be answered from idx_test_results_fqn, unlike LIKE.
+        """
         rows = self._db.connection.execute(
-            "SELECT status FROM test_results WHERE fqn LIKE ? || '.%'",
-            (fqn,),
+            "SELECT status FROM test_results WHERE fqn = ? OR (fqn >= ? AND fqn < ?)",
+            _class_fqn_bounds(fqn),
         ).fetchall()
 
-        # Also check for exact match (fqn == test_result.fqn, matching the original `if fqn in urn_id.id` logic)
-        exact_rows = self._db.connection.execute(
-            "SELECT status FROM test_results WHERE fqn = ?",
-            (fqn,),
-        ).fetchall()
-
-        all_statuses = [TEST_RUN_STATUS(row["status"]) for row in rows] + [
-            TEST_RUN_STATUS(row["status"]) for row in exact_rows
-        ]
+        all_statuses = [TEST_STATUS_BY_VALUE[row["status"]] for row in rows]
 
         if not all_statuses:
-            return TestData(fully_qualified_name=fqn, status=TEST_RUN_STATUS.MISSING)
+            return TestRecord(fully_qualified_name=fqn, status=TEST_RUN_STATUS.MISSING)
         elif all(s == TEST_RUN_STATUS.PASSED for s in all_statuses):
-            return TestData(fully_qualified_name=fqn, status=TEST_RUN_STATUS.PASSED)
+            return TestRecord(fully_qualified_name=fqn, status=TEST_RUN_STATUS.PASSED)
         else:
-            return TestData(fully_qualified_name=fqn, status=TEST_RUN_STATUS.FAILED)
+            return TestRecord(fully_qualified_name=fqn, status=TEST_RUN_STATUS.FAILED)
 
     # -- Private helpers --
 
-    def _row_to_requirement_data(self, row) -> RequirementData:
+    @staticmethod
+    def _entity_filter(
+        urn: str | None = None,
+        lifecycle_state: str | None = None,
+        passed: bool | None = None,
+        keys: list[UrnId] | None = None,
+    ) -> tuple[str, list]:
+        """Build the WHERE clause shared by an entity query and its child-table loads.
+
+        Columns are qualified with the alias ``r`` so the same clause can filter both
+        ``SELECT r.* FROM <entity> r`` and child tables joined back to ``<entity> r``.
+        """
+        clauses: list[str] = []
+        args: list = []
+        if keys is not None:
+            clauses.append("(r.urn, r.id) IN (VALUES " + ", ".join("(?, ?)" for _ in keys) + ")")
+            for key in keys:
+                args.extend((key.urn, key.id))
+        if urn:
+            clauses.append("r.urn = ?")
+            args.append(urn)
+        if lifecycle_state:
+            clauses.append("r.lifecycle_state = ?")
+            args.append(lifecycle_state)
+        if passed is not None:
+            clauses.append("r.passed = ?")
+            args.append(1 if passed else 0)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), args
+
+    @staticmethod
+    def _key_chunks(urn_ids: Iterable[UrnId]) -> Iterator[list[UrnId]]:
+        """Split ids into de-duplicated chunks that stay well below SQLite's bound-parameter limit."""
+        unique = list(dict.fromkeys(urn_ids))
+        for start in range(0, len(unique), _MAX_KEYS_PER_QUERY):
+            yield unique[start : start + _MAX_KEYS_PER_QUERY]  # noqa: E203
+
+    def _group_child_rows(self, sql: str, args: list) -> dict[tuple[str, str], list]:
+        """Run one child-table query and group its rows by the parent's (urn, id)."""
+        grouped: dict[tuple[str, str], list] = {}
+        for row in self._db.connection.execute(sql, args).fetchall():
+            grouped.setdefault((row["urn"], row["id"]), []).append(row)
+        return grouped
+
+    def _row_to_requirement(self, row, category_rows=None, reference_rows=None) -> RequirementRecord:
         urn = row["urn"]
         req_id = row["id"]
 
-        categories = [
-            CATEGORIES(r["category"])
-            for r in self._db.connection.execute(
+        if category_rows is None:
+            category_rows = self._db.connection.execute(
                 "SELECT category FROM requirement_categories WHERE req_urn = ? AND req_id = ?",
                 (urn, req_id),
             ).fetchall()
-        ]
+        categories = [CATEGORY_BY_VALUE[r["category"]] for r in category_rows]
 
-        ref_rows = self._db.connection.execute(
-            "SELECT ref_req_urn, ref_req_id FROM requirement_references WHERE req_urn = ? AND req_id = ?",
-            (urn, req_id),
-        ).fetchall()
+        if reference_rows is None:
+            reference_rows = self._db.connection.execute(
+                "SELECT ref_req_urn, ref_req_id FROM requirement_references WHERE req_urn = ? AND req_id = ?",
+                (urn, req_id),
+            ).fetchall()
 
         references = []
-        if ref_rows:
-            ref_ids = {UrnId(urn=r["ref_req_urn"], id=r["ref_req_id"]) for r in ref_rows}
-            references.append(ReferenceData(requirement_ids=ref_ids))
+        if reference_rows:
+            ref_ids = frozenset(UrnId(urn=r["ref_req_urn"], id=r["ref_req_id"]) for r in reference_rows)
+            references.append(ReferenceRecord(requirement_ids=ref_ids))
 
-        lifecycle = LifecycleData(
-            state=LIFECYCLESTATE(row["lifecycle_state"]),
-            reason=row["lifecycle_reason"],
-        )
-
-        return RequirementData(
+        return RequirementRecord(
             id=UrnId(urn=urn, id=req_id),
             title=row["title"],
-            significance=SIGNIFICANCETYPES(row["significance"]),
+            significance=SIGNIFICANCE_BY_VALUE[row["significance"]],
             description=row["description"],
             rationale=row["rationale"],
-            revision=Version(row["revision"]),
-            lifecycle=lifecycle,
-            implementation=IMPLEMENTATION(row["implementation"]),
+            revision_text=row["revision"],
+            lifecycle=lifecycle_record(row["lifecycle_state"], row["lifecycle_reason"]),
+            implementation=IMPLEMENTATION_BY_VALUE[row["implementation"]],
             categories=categories,
-            references=references if references else [],
+            references=references,
             source_line=row["source_line"],
             source_col_start=row["source_col_start"],
             source_col_end=row["source_col_end"],
         )
 
-    def _row_to_svc_data(self, row) -> SVCData:
+    def _row_to_svc(self, row, req_link_rows=None) -> SVCRecord:
         urn = row["urn"]
         svc_id = row["id"]
 
-        req_link_rows = self._db.connection.execute(
-            "SELECT req_urn, req_id FROM svc_requirement_links WHERE svc_urn = ? AND svc_id = ?",
-            (urn, svc_id),
-        ).fetchall()
+        if req_link_rows is None:
+            req_link_rows = self._db.connection.execute(
+                "SELECT req_urn, req_id FROM svc_requirement_links WHERE svc_urn = ? AND svc_id = ?",
+                (urn, svc_id),
+            ).fetchall()
         requirement_ids = [UrnId(urn=r["req_urn"], id=r["req_id"]) for r in req_link_rows]
 
-        lifecycle = LifecycleData(
-            state=LIFECYCLESTATE(row["lifecycle_state"]),
-            reason=row["lifecycle_reason"],
-        )
-
-        return SVCData(
+        return SVCRecord(
             id=UrnId(urn=urn, id=svc_id),
             title=row["title"],
             description=row["description"],
-            verification=VERIFICATIONTYPES(row["verification_type"]),
-            phase=VERIFICATIONPHASE(row["phase"]),
+            verification=VERIFICATION_BY_VALUE[row["verification_type"]],
+            phase=PHASE_BY_VALUE[row["phase"]],
             instructions=row["instructions"],
-            revision=Version(row["revision"]),
-            lifecycle=lifecycle,
+            revision_text=row["revision"],
+            lifecycle=lifecycle_record(row["lifecycle_state"], row["lifecycle_reason"]),
             requirement_ids=requirement_ids,
             source_line=row["source_line"],
             source_col_start=row["source_col_start"],
             source_col_end=row["source_col_end"],
         )
 
-    def _row_to_mvr_data(self, row) -> MVRData:
+    def _row_to_mvr(self, row, svc_link_rows=None) -> MVRRecord:
         urn = row["urn"]
         mvr_id = row["id"]
 
-        svc_link_rows = self._db.connection.execute(
-            "SELECT svc_urn, svc_id FROM mvr_svc_links WHERE mvr_urn = ? AND mvr_id = ?",
-            (urn, mvr_id),
-        ).fetchall()
+        if svc_link_rows is None:
+            svc_link_rows = self._db.connection.execute(
+                "SELECT svc_urn, svc_id FROM mvr_svc_links WHERE mvr_urn = ? AND mvr_id = ?",
+                (urn, mvr_id),
+            ).fetchall()
         svc_ids = [UrnId(urn=r["svc_urn"], id=r["svc_id"]) for r in svc_link_rows]
 
         raw_date = row["date"]
-        return MVRData(
+        return MVRRecord(
             id=UrnId(urn=urn, id=mvr_id),
             comment=row["comment"],
             passed=bool(row["passed"]),
@@ -1,6 +1,6 @@
 # Copyright © LFV
 
-SCHEMA_DDL = """
+SCHEMA_TABLES_DDL = """
 PRAGMA foreign_keys = ON;
 
 CREATE TABLE IF NOT EXISTS requirements (
@@ -143,7 +143,11 @@ CREATE TABLE IF NOT EXISTS metadata (
     key TEXT NOT NULL PRIMARY KEY,
     value TEXT
 );
+"""
 
+# Secondary indexes, kept apart from the tables so a bulk load can build them once after the
+# rows are in rather than maintaining them row by row (see RequirementsDatabase.insert_raw_datasets).
+SCHEMA_INDEXES_DDL = """
 -- FK indexes
 CREATE INDEX IF NOT EXISTS idx_req_categories_fk ON requirement_categories (req_urn, req_id);
 CREATE INDEX IF NOT EXISTS idx_req_references_fk ON requirement_references (req_urn, req_id);
@@ -154,6 +158,10 @@ CREATE INDEX IF NOT EXISTS idx_mvr_svc_links_svc ON mvr_svc_links (svc_urn, svc_
 CREATE INDEX IF NOT EXISTS idx_mvrs_date ON mvrs(date);
 CREATE INDEX IF NOT EXISTS idx_annotations_impls_fk ON annotations_impls (req_urn, req_id);
 CREATE INDEX IF NOT EXISTS idx_annotations_tests_fk ON annotations_tests (svc_urn, svc_id);
+-- Test result lookups by fqn: exact (METHOD) and class-prefix range scans (CLASS), covering status
+CREATE INDEX IF NOT EXISTS idx_test_results_fqn ON test_results (fqn, status);
 CREATE INDEX IF NOT EXISTS idx_parsing_graph_parent ON parsing_graph (parent_urn);
 CREATE INDEX IF NOT EXISTS idx_parsing_graph_child ON parsing_graph (child_urn);
 """
+
+SCHEMA_DDL = SCHEMA_TABLES_DDL + SCHEMA_INDEXES_DDL
@@ -0,0 +1,212 @@
+# Copyright © LFV
+
+"""On-disk cache of populated, filtered requirement databases.
+
+Repeated CLI runs over the same inputs — a CI pipeline calling ``status``, ``report`` and
+``export`` in turn — would otherwise re-download, re-parse, re-validate and re-populate
+everything on every invocation.
+
+An entry is keyed by what the caller asked for: the initial location, the working
+directory, the filter flag, the parsing config and the reqstool version. It stores the
+database together with the SnapshotFingerprint of its local inputs and a digest of the
+environment variables interpolated into them, and is only served while every stamped file
+is unchanged on disk and every one of those variables still has the same value.
+
+Remote sources leave nothing to stamp, so a snapshot is only stored when every remote
+source is pinned to immutable content (see ``LocationInterface.pinned_key()``). A git
+branch, a Maven SNAPSHOT or an npm dist-tag anywhere in the graph makes it uncacheable.
+
+Layout::
+
+    <cache_dir>/<key>/manifest.json
+    <cache_dir>/<key>/snapshot-<sha256 of the database file>.sqlite
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from dataclasses import asdict
+from typing import Iterable, List, Optional
+
+from reqstool.common.snapshot_fingerprint import SnapshotFingerprint
+from reqstool.common.utils import Utils
+from reqstool.common.validator_error_holder import ValidationError
+from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.locations.location import LocationInterface
+from reqstool.model_generators.parsing_config import ParsingConfig
+from reqstool.models.raw_datasets import CombinedRawDataset
+from reqstool.storage.database import RequirementsDatabase
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema or the manifest layout changes in a way the version string would not catch
+_FORMAT_VERSION = 1
+_MANIFEST = "manifest.json"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def env_digest(names: Iterable[str]) -> str:
+    """Digest of the current values of the environment variables ``names`` (unset ones included)."""
+    values = {name: os.environ.get(name) for name in sorted(names)}
+    return hashlib.sha256(json.dumps(values, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class SnapshotCache:
+    def __init__(self, cache_dir: str):
+        self._cache_dir = cache_dir
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @staticmethod
+    def key_for(location: LocationInterface, filter_data: bool, parsing_config: ParsingConfig) -> str:
+        # Relative local paths resolve against the working directory, so it is part of the key.
+        # Tokens are excluded: they grant access, they do not select content.
+        payload = {
+            "format": _FORMAT_VERSION,
+            "reqstool_version": Utils.get_version(),
+            "location_type": type(location).__name__,
+            "location": location.model_dump(mode="json", exclude={"token"}),
+            "cwd": os.getcwd(),
+            "filter_data": filter_data,
+            "parsing_config": asdict(parsing_config),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def load(self, key: str, semantic_validator: SemanticValidator) -> Optional[RequirementsDatabase]:
+        """Return a fresh in-memory copy of the cached database for ``key``, or None on a miss.
+
+        On a hit, the validation errors recorded when the snapshot was built are replayed
+        into ``semantic_validator`` so that callers see the same errors as on a cold run.
+        """
+        entry_dir = os.path.join(self._cache_dir, key)
+
+        manifest = self._read_manifest(entry_dir)
+        if manifest is None or not self._is_fresh(key, manifest):
+            return None
+
+        try:
+            db = RequirementsDatabase.restore_from(os.path.join(entry_dir, manifest["snapshot"]))
+        except (KeyError, sqlite3.Error) as e:
+            logger.debug("Could not open cached snapshot in %s: %s", entry_dir, e)
+            return None
+
+        semantic_validator.replay_errors([ValidationError(msg=msg) for msg in manifest.get("validation_errors", [])])
+
+        logger.debug("Using cached snapshot %s", key)
+        return db
+
+    def store(
+        self,
+        key: str,
+        db: RequirementsDatabase,
+        crd: CombinedRawDataset,
+        validation_errors: List[ValidationError],
+        env_var_names: Iterable[str] = (),
+    ) -> bool:
+        """Write ``db`` to the cache under ``key`` if every source it was built from is trackable.
+
+        Returns True if an entry was written. Failing to write is logged and otherwise
+        ignored — the cache must never fail the command it speeds up.
+        """
+        unpinned = [urn for urn, rd in crd.raw_datasets.items() if rd.pinned_key is None and not rd.fingerprint.stamps]
+        if unpinned:
+            logger.debug("Not caching snapshot: sources not pinned to a fixed version: %s", ", ".join(unpinned))
+            return False
+
+        entry_dir = os.path.join(self._cache_dir, key)
+        tmp_path = None
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+            os.close(fd)
+            db.backup_to(tmp_path)
+
+            snapshot_name = f"snapshot-{self._file_sha256(tmp_path)}.sqlite"
+            os.replace(tmp_path, os.path.join(entry_dir, snapshot_name))
+            tmp_path = None
+
+            manifest = {
+                "format": _FORMAT_VERSION,
+                "reqstool_version": Utils.get_version(),
+                "snapshot": snapshot_name,
+                "initial_urn": crd.initial_model_urn,
+                "pinned": sorted(rd.pinned_key for rd in crd.raw_datasets.values() if rd.pinned_key is not None),
+                "fingerprint": crd.fingerprint.to_dict(),
+                # Values are only stored as a digest: interpolated variables routinely hold tokens
+                "env_vars": sorted(env_var_names),
+                "env_digest": env_digest(env_var_names),
+                "validation_errors": [error.msg for error in validation_errors],
+            }
+            self._write_atomically(os.path.join(entry_dir, _MANIFEST), json.dumps(manifest, indent=2))
+
+            for old in glob.glob(os.path.join(entry_dir, "snapshot-*.sqlite")):
+                if os.path.basename(old) != snapshot_name:
+                    os.remove(old)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Could not write snapshot cache entry in %s: %s", entry_dir, e)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        logger.debug("Stored snapshot %s", key)
+        return True
+
+    @staticmethod
+    def _read_manifest(entry_dir: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(entry_dir, _MANIFEST), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable snapshot cache manifest in %s: %s", entry_dir, e)
+            return None
+
+        if manifest.get("format") != _FORMAT_VERSION or manifest.get("reqstool_version") != Utils.get_version():
+            return None
+
+        return manifest
+
+    def _is_fresh(self, key: str, manifest: dict) -> bool:
+        try:
+            stale = SnapshotFingerprint.from_dict(manifest["fingerprint"]).stale_reasons(limit=1)
+        except (KeyError, TypeError) as e:
+            logger.debug("Ignoring malformed snapshot cache manifest for %s: %s", key, e)
+            return False
+
+        if stale:
+            logger.debug("Snapshot cache entry %s is stale: %s", key, stale[0])
+            return False
+
+        if manifest.get("env_digest") != env_digest(manifest.get("env_vars", [])):
+            logger.debug("Snapshot cache entry %s is stale: interpolated environment variables changed", key)
+            return False
+
+        return True
+
+    @staticmethod
+    def _file_sha256(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _write_atomically(path: str, content: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
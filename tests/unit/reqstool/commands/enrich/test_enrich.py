@@ -11,7 +11,7 @@ from reqstool_python_decorators.decorators.decorators import SVCs
 
 from reqstool.command import Command
 from reqstool.commands.enrich.enrich import EnrichCommand
-from reqstool.common.enrichment.enricher import BUILT_IN_PRESETS
+from reqstool.common.enrichment.presets import BUILT_IN_PRESETS
 from reqstool.locations.local_location import LocalLocation
 
 _ENRICH_RESOURCES = Path(__file__).parents[4] / "resources" / "enrich"
@@ -79,7 +79,7 @@ def test_command_enrich_reads_stdin_writes_output(monkeypatch):
     monkeypatch.setattr("sys.stdin", io.StringIO("document referencing REQ_X"))
     with (
         patch.object(Command, "_get_initial_source", return_value=MagicMock()),
-        patch("reqstool.command.EnrichCommand") as mock_enrich,
+        patch("reqstool.commands.enrich.enrich.EnrichCommand") as mock_enrich,
     ):
         mock_enrich.return_value.result = "ENRICHED-OUTPUT"
         Command().command_enrich(args)
@@ -1,7 +1,6 @@
 # Copyright © LFV
 
 from reqstool.common.enrichment.enricher import (
-    BUILT_IN_PRESETS,
     _block_field,
     _format_value,
     _in_backtick_span,
@@ -9,6 +8,7 @@ from reqstool.common.enrichment.enricher import (
     _make_pattern,
     enrich_text,
 )
+from reqstool.common.enrichment.presets import BUILT_IN_PRESETS
 
 
 # ---------------------------------------------------------------------------
@@ -1,5 +1,10 @@
 # Copyright © LFV
 
+import logging
+import shutil
+
+from reqstool.common import project_session
+from reqstool.common.models.urn_id import UrnId
 from reqstool.common.project_session import ProjectSession
 from reqstool.locations.local_location import LocalLocation
 
@@ -84,3 +89,84 @@ def test_urn_source_paths_cleared_on_close(local_testdata_resources_rootdir_w_pa
     assert len(session.urn_source_paths) > 0
     session.close()
     assert session.urn_source_paths == {}
+
+
+def test_rebuild_serves_previous_snapshot_until_swapped_in(local_testdata_resources_rootdir_w_path, monkeypatch):
+    path = local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001")
+    session = ProjectSession(LocalLocation(path=path))
+    try:
+        session.build()
+        previous_repo = session.repo
+        seen_during_build = []
+
+        def lifecycle_validator(repo):
+            seen_during_build.append((session.ready, session.repo is previous_repo, previous_repo.get_initial_urn()))
+
+        monkeypatch.setattr(project_session, "LifecycleValidator", lifecycle_validator)
+        session.build()
+
+        assert seen_during_build == [(True, True, "ms-001")]
+        assert session.ready
+        assert session.repo is not previous_repo
+    finally:
+        session.close()
+
+
+def test_failed_rebuild_keeps_serving_the_previous_snapshot(local_testdata_resources_rootdir_w_path, tmp_path):
+    baseline = tmp_path / "baseline"
+    shutil.copytree(local_testdata_resources_rootdir_w_path("test_standard/baseline"), baseline)
+    requirements = baseline / "ms-001" / "requirements.yml"
+    original = requirements.read_text()
+    session = ProjectSession(LocalLocation(path=str(baseline / "ms-001")))
+    try:
+        session.build()
+        previous_repo = session.repo
+
+        requirements.write_text(": this is not: [ valid yaml")
+        session.rebuild()
+
+        assert session.error is not None
+        assert session.ready
+        assert session.repo is previous_repo
+        assert previous_repo.get_initial_urn() == "ms-001"
+
+        requirements.write_text(original.replace("Title REQ_010", "Fixed title REQ_010"))
+        session.rebuild()
+
+        assert session.error is None
+        assert session.repo is not previous_repo
+        assert session.repo.get_requirement(UrnId(urn="ms-001", id="REQ_010")).title == "Fixed title REQ_010"
+    finally:
+        session.close()
+
+
+def test_superseded_build_is_discarded(local_testdata_resources_rootdir_w_path, monkeypatch, caplog):
+    path = local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001")
+    session = ProjectSession(LocalLocation(path=path))
+    repos = []
+
+    def lifecycle_validator(repo):
+        repos.append(repo)
+        if len(repos) == 1:
+            # A second build starts (and finishes) while the first one is still running
+            session.build()
+
+    monkeypatch.setattr(project_session, "LifecycleValidator", lifecycle_validator)
+    caplog.set_level(logging.INFO, logger=project_session.__name__)
+    try:
+        session.build()
+        assert len(repos) == 2
+        assert session.ready
+        assert session.repo.get_initial_urn() == "ms-001"
+        assert "Discarding superseded build" in caplog.text
+    finally:
+        session.close()
+
+
+def test_close_during_build_discards_it(local_testdata_resources_rootdir_w_path, monkeypatch):
+    path = local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001")
+    session = ProjectSession(LocalLocation(path=path))
+    monkeypatch.setattr(project_session, "LifecycleValidator", lambda repo: session.close())
+    session.build()
+    assert not session.ready
+    assert session.repo is None
@@ -2,6 +2,7 @@
 
 import os
 import shutil
+from unittest.mock import patch
 
 import pytest
 from reqstool_python_decorators.decorators.decorators import SVCs
@@ -9,6 +10,7 @@ from reqstool_python_decorators.decorators.decorators import SVCs
 from reqstool.common.exceptions import SnapshotReloadError
 from reqstool.common.project_session import ProjectSession
 from reqstool.locations.local_location import LocalLocation
+from reqstool.model_generators.requirements_model_generator import RequirementsModelGenerator
 from reqstool.services.statistics_service import StatisticsService
 
 ANNOTATIONS_WITH_EXTRA_IMPL = """\
@@ -111,8 +113,10 @@ def test_a_broken_reload_reports_an_error_rather_than_the_superseded_snapshot(se
     with pytest.raises(SnapshotReloadError, match="sources changed but reloading them failed"):
         session.ensure_fresh()
 
-    assert not session.ready
-    assert session.repo is None
+    # The superseded snapshot is kept (the LSP serves it while the file is being edited), but
+    # ensure_fresh() refuses to hand it out
+    assert session.error is not None
+    assert session.repo is not None
 
 
 @SVCs("SVC_MCP_0007")
@@ -160,3 +164,72 @@ def test_absent_test_results_are_warned_about_rather_than_counted_as_zero(sessio
     assert _automated_tests(session)["passed"] == 0
     warnings = session.fingerprint.warnings(primary_urn=session.initial_urn)
     assert warnings == [f"[ms-101] test_results pattern 'test_results/**/*.xml' matched no files under {project_copy}"]
+
+
+@pytest.fixture
+def system_copy(tmp_path, local_testdata_resources_rootdir_w_path):
+    """A writable copy of ms-001 and the sys-001 tree it imports."""
+    dst = tmp_path / "baseline"
+    shutil.copytree(local_testdata_resources_rootdir_w_path("test_standard/baseline"), dst)
+    return dst
+
+
+def _refresh_counting_parses(session: ProjectSession) -> int:
+    with patch(
+        "reqstool.model_generators.combined_raw_datasets_generator.RequirementsModelGenerator",
+        wraps=RequirementsModelGenerator,
+    ) as mock_rmg:
+        session.ensure_fresh()
+    return mock_rmg.call_count
+
+
+@SVCs("SVC_MCP_0006")
+def test_only_the_changed_source_is_parsed_again(system_copy):
+    session = ProjectSession(LocalLocation(path=str(system_copy / "ms-001")))
+    session.build()
+    try:
+        urns = set(session.repo.get_urn_parsing_order())
+        requirements = system_copy / "sys-001" / "requirements.yml"
+        requirements.write_text(requirements.read_text().replace("Title REQ_sys001_505", "Retitled"))
+
+        assert _refresh_counting_parses(session) == 1
+        assert set(session.repo.get_urn_parsing_order()) == urns
+        assert "Retitled" in {req.title for req in session.repo.get_all_requirements().values()}
+    finally:
+        session.close()
+
+
+@SVCs("SVC_MCP_0006")
+def test_build_parses_every_source(system_copy):
+    session = ProjectSession(LocalLocation(path=str(system_copy / "ms-001")))
+    session.build()
+    try:
+        parsed = len(session.repo.get_urn_parsing_order())
+        with patch(
+            "reqstool.model_generators.combined_raw_datasets_generator.RequirementsModelGenerator",
+            wraps=RequirementsModelGenerator,
+        ) as mock_rmg:
+            session.build()
+        assert mock_rmg.call_count == parsed
+    finally:
+        session.close()
+
+
+@SVCs("SVC_MCP_0007")
+def test_refresh_after_a_failed_reload_parses_everything(system_copy):
+    session = ProjectSession(LocalLocation(path=str(system_copy / "ms-001")))
+    session.build()
+    try:
+        parsed = len(session.repo.get_urn_parsing_order())
+        requirements = system_copy / "ms-001" / "requirements.yml"
+        original = requirements.read_text()
+        requirements.write_text(": this is not: [ valid yaml")
+        with pytest.raises(SnapshotReloadError):
+            session.ensure_fresh()
+
+        requirements.write_text(original)
+
+        assert _refresh_counting_parses(session) == parsed
+        assert session.ready
+    finally:
+        session.close()
@@ -170,3 +170,29 @@ def test_empty_fingerprint_is_never_stale():
     """Remote sources are version-pinned downloads: nothing local to watch."""
     assert not SnapshotFingerprint().is_stale()
     assert SnapshotFingerprint().tracked_file_count == 0
+
+
+def test_fingerprint_round_trips_through_dict(tmp_path):
+    reports = tmp_path / "reports"
+    reports.mkdir()
+    _write(reports / "TEST-a.xml")
+    fingerprint = SnapshotFingerprint.merge(
+        [_fingerprint_of([_write(tmp_path / "requirements.yml")]), _test_results_fingerprint(reports)]
+    )
+
+    assert SnapshotFingerprint.from_dict(fingerprint.to_dict()) == fingerprint
+
+
+def test_stale_urns_names_only_sources_with_changed_inputs(tmp_path):
+    changed = _write(tmp_path / "changed.yml", "before")
+    unchanged = _write(tmp_path / "unchanged.yml")
+    fingerprint = SnapshotFingerprint(
+        stamps=(
+            FileStamp.capture(changed, "requirements", "ms-101"),
+            FileStamp.capture(unchanged, "requirements", "sys-001"),
+        )
+    )
+
+    _write(changed, "after, and longer")
+
+    assert fingerprint.stale_urns() == {"ms-101"}
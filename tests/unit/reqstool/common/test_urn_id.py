@@ -1,6 +1,11 @@
 # Copyright © LFV
 
+import copy
+import pickle
+from typing import Dict, List
+
 import pytest
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from reqstool.common.models.urn_id import UrnId
 
@@ -77,3 +82,64 @@ def test_urn_id_ordering_by_urn():
 def test_urn_id_equality():
     assert UrnId(urn="ms-001", id="REQ_001") == UrnId(urn="ms-001", id="REQ_001")
     assert UrnId(urn="ms-001", id="REQ_001") != UrnId(urn="ms-001", id="REQ_002")
+
+
+# ---------------------------------------------------------------------------
+# Immutability, hashing and pydantic compatibility
+# ---------------------------------------------------------------------------
+
+
+def test_urn_id_is_immutable():
+    uid = UrnId(urn="ms-001", id="REQ_001")
+    with pytest.raises(AttributeError):
+        uid.id = "REQ_002"
+
+
+def test_urn_id_requires_strings():
+    with pytest.raises(TypeError):
+        UrnId(urn="ms-001", id=None)
+
+
+def test_urn_id_hash_and_set_semantics():
+    a = UrnId(urn="ms-001", id="REQ_001")
+    b = UrnId(urn="".join(["ms-", "001"]), id="REQ_001")
+    assert hash(a) == hash(b)
+    assert {a, b} == {a}
+    assert a.urn is b.urn  # interned
+    assert a != "ms-001:REQ_001"
+
+
+def test_urn_id_sorting():
+    ids = [UrnId(urn="ms-002", id="REQ_001"), UrnId(urn="ms-001", id="REQ_002"), UrnId(urn="ms-001", id="REQ_001")]
+    assert [str(uid) for uid in sorted(ids)] == ["ms-001:REQ_001", "ms-001:REQ_002", "ms-002:REQ_001"]
+
+
+def test_urn_id_pickles():
+    uid = UrnId(urn="ms-001", id="REQ_001")
+    assert pickle.loads(pickle.dumps(uid)) == uid
+    assert copy.deepcopy(uid) == uid
+
+
+class _Holder(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: UrnId
+    related: Dict[UrnId, List[UrnId]] = {}
+
+
+def test_urn_id_as_pydantic_field():
+    uid = UrnId(urn="ms-001", id="REQ_001")
+
+    assert _Holder(id=uid).id is uid
+    assert _Holder(id={"urn": "ms-001", "id": "REQ_001"}).id == uid
+    assert _Holder(id="ms-001:REQ_001").id == uid
+    with pytest.raises(ValidationError):
+        _Holder(id="no-separator")
+
+
+def test_urn_id_serializes_as_string():
+    uid = UrnId(urn="ms-001", id="REQ_001")
+    holder = _Holder(id=uid, related={uid: [UrnId(urn="ms-001", id="SVC_001")]})
+
+    assert holder.model_dump() == {"id": "ms-001:REQ_001", "related": {"ms-001:REQ_001": ["ms-001:SVC_001"]}}
+    assert holder.model_dump_json() == '{"id":"ms-001:REQ_001","related":{"ms-001:REQ_001":["ms-001:SVC_001"]}}'
@@ -1,6 +1,10 @@
 # Copyright © LFV
 
 
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from reqstool.common.exceptions import EnvVarInterpolationError
@@ -70,3 +74,33 @@ def test_interpolate_env_vars_leaves_bare_dollar_and_schema_directive_untouched(
 def test_interpolate_env_vars_noop_on_text_without_placeholders():
     text = "version: 1.0.0\nname: reqstool\n"
     assert Utils.interpolate_env_vars(text) == text
+
+
+def test_recording_env_var_reads_collects_interpolated_names(monkeypatch):
+    monkeypatch.setenv("REQSTOOL_TEST_A", "a")
+    with Utils.recording_env_var_reads() as reads:
+        Utils.interpolate_env_vars("x: ${REQSTOOL_TEST_A}\ny: ${REQSTOOL_TEST_B:-b}\nz: $REQSTOOL_TEST_C")
+    Utils.interpolate_env_vars("w: ${REQSTOOL_TEST_A}")
+
+    assert reads == {"REQSTOOL_TEST_A", "REQSTOOL_TEST_B"}
+
+
+def test_recording_env_var_reads_is_per_context(monkeypatch):
+    monkeypatch.setenv("REQSTOOL_TEST_A", "a")
+    monkeypatch.setenv("REQSTOOL_TEST_B", "b")
+    with Utils.recording_env_var_reads() as reads:
+        # Another thread's recording is its own; work handed over in a copied context is ours
+        other = threading.Thread(target=_record_in_thread, args=("x: ${REQSTOOL_TEST_A}",))
+        other.start()
+        other.join()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(
+                contextvars.copy_context().run, Utils.interpolate_env_vars, "y: ${REQSTOOL_TEST_B}"
+            ).result()
+
+    assert reads == {"REQSTOOL_TEST_B"}
+
+
+def _record_in_thread(text):
+    with Utils.recording_env_var_reads():
+        Utils.interpolate_env_vars(text)
@@ -0,0 +1,69 @@
+# Copyright © LFV
+
+import pytest
+from ruamel.yaml import YAML
+
+from reqstool.common.yaml_loader import load_yaml
+
+TEXT = """\
+requirements:
+  - id: REQ_001
+    title: first
+  - title: no id
+  -   id: "REQ_002"
+      title: second
+"""
+
+
+def _round_trip_positions(text: str, section: str) -> dict:
+    """Positions as a round-trip parse reports them, for comparison."""
+    items = YAML(typ="rt").load(text)[section]
+    return {
+        str(item["id"]): (item.lc.value("id")[0], item.lc.value("id")[1], item.lc.value("id")[1] + len(str(item["id"])))
+        for item in items
+        if "id" in item
+    }
+
+
+def test_positions_match_a_round_trip_parse():
+    data, id_positions = load_yaml(TEXT, track_positions=True)
+
+    assert id_positions.of_items(data["requirements"]) == _round_trip_positions(TEXT, "requirements")
+    assert id_positions.of_items(data["requirements"])["REQ_001"] == (1, 8, 15)
+
+
+def test_data_is_the_same_as_a_safe_load():
+    data, _ = load_yaml(TEXT, track_positions=True)
+
+    assert data == YAML(typ="safe").load(TEXT)
+
+
+def test_positions_are_not_tracked_unless_asked_for():
+    data, id_positions = load_yaml(TEXT)
+
+    assert id_positions.of_items(data["requirements"]) == {}
+
+
+def test_missing_section_has_no_positions():
+    data, id_positions = load_yaml("metadata:\n  urn: ms-001\n", track_positions=True)
+
+    assert id_positions.of_items(data.get("requirements")) == {}
+
+
+@pytest.mark.parametrize(
+    "filename,section",
+    [
+        ("requirements.yml", "requirements"),
+        ("software_verification_cases.yml", "cases"),
+        ("manual_verification_results.yml", "results"),
+    ],
+)
+def test_positions_match_a_round_trip_parse_for_fixture_files(
+    local_testdata_resources_rootdir_w_path, filename, section
+):
+    with open(local_testdata_resources_rootdir_w_path(f"test_standard/baseline/ms-001/{filename}")) as f:
+        text = f.read()
+
+    data, id_positions = load_yaml(text, track_positions=True)
+
+    assert id_positions.of_items(data[section]) == _round_trip_positions(text, section)
@@ -0,0 +1,144 @@
+# Copyright © LFV
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from reqstool.common.validators import syntax_validator
+from reqstool.common.validators.syntax_validator import JsonSchemaTypes, SyntaxValidator, ValidationStrategy
+from reqstool.models.generated.manual_verification_results_schema import Model as MVRsPydanticModel
+from reqstool.models.generated.requirements_schema import Model as RequirementsPydanticModel
+
+VALID_REQUIREMENTS = {
+    "metadata": {"urn": "ms-001", "variant": "microservice", "title": "Some Microservice"},
+    "requirements": [
+        {
+            "id": "REQ_001",
+            "title": "Title REQ_001",
+            "significance": "shall",
+            "description": "Description REQ_001",
+            "categories": ["functional-suitability"],
+            "revision": "0.0.1",
+            "lifecycle": {"state": "effective"},
+        }
+    ],
+}
+
+
+def _invalid_requirements() -> dict:
+    data = {**VALID_REQUIREMENTS, "requirements": [dict(VALID_REQUIREMENTS["requirements"][0])]}
+    # lifecycle sits next to a $ref in the schema, whose "type" must still apply
+    data["requirements"][0]["lifecycle"] = "effective"
+    return data
+
+
+def test_validator_is_prepared_once_per_schema_type():
+    assert SyntaxValidator.validator_for(JsonSchemaTypes.REQUIREMENTS) is SyntaxValidator.validator_for(
+        JsonSchemaTypes.REQUIREMENTS
+    )
+    assert SyntaxValidator.validator_for(JsonSchemaTypes.REQUIREMENTS) is not SyntaxValidator.validator_for(
+        JsonSchemaTypes.SOFTWARE_VERIFICATION_CASES
+    )
+
+
+def test_valid_data():
+    assert SyntaxValidator.is_valid_data(JsonSchemaTypes.REQUIREMENTS, VALID_REQUIREMENTS, "ms-001")
+
+
+def test_invalid_data_logs_errors(caplog):
+    with caplog.at_level(logging.ERROR):
+        assert not SyntaxValidator.is_valid_data(JsonSchemaTypes.REQUIREMENTS, _invalid_requirements(), "ms-001")
+
+    assert "Syntax error(s) for urn 'ms-001' using schema: requirements.schema.json" in caplog.messages
+    assert any(message.startswith(" 1. ") for message in caplog.messages)
+
+
+@pytest.mark.parametrize("validation_strategy", list(ValidationStrategy))
+def test_validated_model(validation_strategy):
+    model = SyntaxValidator.validated_model(
+        RequirementsPydanticModel, JsonSchemaTypes.REQUIREMENTS, VALID_REQUIREMENTS, "ms-001", validation_strategy
+    )
+
+    assert model.requirements[0].id == "REQ_001"
+
+
+def test_invalid_model_logs_the_same_errors_with_either_strategy(caplog):
+    messages = {}
+    for validation_strategy in ValidationStrategy:
+        caplog.clear()
+        with caplog.at_level(logging.ERROR):
+            model = SyntaxValidator.validated_model(
+                RequirementsPydanticModel,
+                JsonSchemaTypes.REQUIREMENTS,
+                _invalid_requirements(),
+                "ms-001",
+                validation_strategy,
+            )
+        assert model is None
+        messages[validation_strategy] = list(caplog.messages)
+
+    assert messages[ValidationStrategy.PYDANTIC] == messages[ValidationStrategy.JSON_SCHEMA]
+    assert messages[ValidationStrategy.PYDANTIC][:2] == [
+        "Syntax error(s) for urn 'ms-001' using schema: requirements.schema.json",
+        " 1. 'effective' is not of type 'object'",
+    ]
+
+
+def test_pydantic_strategy_is_more_lenient_than_the_schema():
+    # Coerced by the model, rejected by the schema
+    data = {"results": [{"id": "MVR_001", "svc_ids": ["SVC_001"], "pass": "true"}]}
+
+    assert (
+        SyntaxValidator.validated_model(
+            MVRsPydanticModel, JsonSchemaTypes.MANUAL_VERIFICATION_RESULTS, data, "ms-001", ValidationStrategy.PYDANTIC
+        )
+        .results[0]
+        .pass_
+        is True
+    )
+    assert (
+        SyntaxValidator.validated_model(
+            MVRsPydanticModel,
+            JsonSchemaTypes.MANUAL_VERIFICATION_RESULTS,
+            data,
+            "ms-001",
+            ValidationStrategy.JSON_SCHEMA,
+        )
+        is None
+    )
+
+
+def test_without_fastjsonschema_jsonschema_validates_alone():
+    SyntaxValidator.compiled_validator_for.cache_clear()
+    try:
+        with patch.object(syntax_validator, "fastjsonschema", None):
+            assert SyntaxValidator.compiled_validator_for(JsonSchemaTypes.REQUIREMENTS) is None
+            assert SyntaxValidator.is_valid_data(JsonSchemaTypes.REQUIREMENTS, VALID_REQUIREMENTS, "ms-001")
+            assert not SyntaxValidator.is_valid_data(JsonSchemaTypes.REQUIREMENTS, _invalid_requirements(), "ms-001")
+    finally:
+        SyntaxValidator.compiled_validator_for.cache_clear()
+
+
+def test_ref_siblings_are_moved_into_all_of():
+    schema = {"properties": {"lifecycle": {"$ref": "#/$defs/lifecycle", "type": "object", "description": "x"}}}
+
+    assert syntax_validator._without_ref_siblings(schema) == {
+        "properties": {"lifecycle": {"type": "object", "description": "x", "allOf": [{"$ref": "#/$defs/lifecycle"}]}}
+    }
+
+
+def test_every_schema_compiles():
+    pytest.importorskip("fastjsonschema")
+
+    for json_schema_type in JsonSchemaTypes:
+        assert SyntaxValidator.compiled_validator_for(json_schema_type) is not None, json_schema_type
+
+
+def test_compiled_validator_agrees_with_jsonschema():
+    fastjsonschema = pytest.importorskip("fastjsonschema")
+    compiled_validator = SyntaxValidator.compiled_validator_for(JsonSchemaTypes.REQUIREMENTS)
+
+    compiled_validator(VALID_REQUIREMENTS)
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        compiled_validator(_invalid_requirements())
@@ -0,0 +1,217 @@
+# Copyright © LFV
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+
+import pytest
+
+import reqstool.daemon.server as daemon_server
+from reqstool.daemon.client import forward, is_forwardable
+from reqstool.daemon.server import DaemonServer, _OutputRelay, _RequestHandler
+from reqstool.daemon.session_pool import SessionPool
+
+
+@pytest.fixture
+def ms101(local_testdata_resources_rootdir_w_path):
+    return local_testdata_resources_rootdir_w_path("test_basic/baseline/ms-101")
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to about 100 characters, which tmp_path can exceed
+    socket_dir = tempfile.mkdtemp(prefix="reqstool-")
+    yield os.path.join(socket_dir, "d.sock")
+    shutil.rmtree(socket_dir)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = DaemonServer(socket_path, SessionPool())
+    yield server
+    server.server_close()
+    server.session_pool.close()
+
+
+@pytest.fixture
+def serving_daemon(socket_path):
+    server = DaemonServer(socket_path, SessionPool())
+
+    def serve():
+        server.serve_forever()
+        # SQLite connections may only be closed by the thread that opened them
+        server.session_pool.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def _run(daemon: DaemonServer, argv: list[str], cwd: str | None = None) -> tuple[str, str, int]:
+    messages = []
+    exit_code = daemon.run_request(argv=argv, cwd=cwd or os.getcwd(), env=dict(os.environ), send=messages.append)
+    stdout = "".join(message.get("stdout", "") for message in messages)
+    stderr = "".join(message.get("stderr", "") for message in messages)
+    return stdout, stderr, exit_code
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["status", "local", "-p", "."], True),
+        (["--log", "DEBUG", "report", "local", "-p", "."], True),
+        (["mcp", "local", "-p", "."], False),
+        (["enrich", "--preset", "openspec:spec", "local", "-p", "status"], False),
+        (["--version"], False),
+    ],
+)
+def test_only_commands_the_daemon_runs_are_forwarded(argv, expected):
+    assert is_forwardable(argv) is expected
+
+
+def test_warm_status_matches_a_cold_run(daemon, ms101):
+    argv = ["status", "--format", "json", "local", "-p", ms101]
+
+    cold = _run(daemon, argv)
+    warm = _run(daemon, argv)
+
+    assert cold[2] == 0
+    assert '"requirements"' in cold[0]
+    assert warm == cold
+    assert len(daemon.session_pool) == 1
+
+
+def test_exit_code_and_stderr_are_returned(daemon, ms101):
+
+    stdout, stderr, exit_code = _run(daemon, ["status", "--check-all-reqs-met", "--bogus", "local", "-p", ms101])
+
+    assert exit_code == 2
+    assert stdout == ""
+    assert "--bogus" in stderr
+
+
+def test_failing_project_is_reported_once(daemon, ms101, tmp_path):
+    project = tmp_path / "ms-101"
+    shutil.copytree(ms101, project)
+    requirements = project / "requirements.yml"
+    requirements.write_text(requirements.read_text().replace("significance: shall", "significance: bogus", 1))
+    argv = ["status", "local", "-p", str(project)]
+
+    stdout, stderr, exit_code = _run(daemon, argv)
+
+    # As a local run reports it: the syntax error once, and the exit code of the failed parse
+    assert exit_code == 128
+    assert stdout == ""
+    assert stderr.count("'bogus' is not one of") == 1
+    assert "build() called sys.exit" not in stderr
+    assert len(daemon.session_pool) == 0
+
+
+def test_output_file_is_complete_when_the_request_returns(daemon, ms101, tmp_path):
+    output = tmp_path / "export.json"
+
+    _, _, exit_code = _run(daemon, ["export", "local", "-p", ms101, "-o", str(output)])
+
+    assert exit_code == 0
+    assert output.read_text().startswith("{")
+
+
+def test_relative_paths_resolve_against_the_client_directory(daemon, ms101):
+
+    stdout, _, exit_code = _run(daemon, ["export", "local", "-p", "."], cwd=ms101)
+
+    assert exit_code == 0
+    assert '"ms-101"' in stdout
+
+
+def test_servers_are_not_run_by_the_daemon(daemon):
+
+    _, stderr, exit_code = _run(daemon, ["mcp"])
+
+    assert exit_code == 2
+    assert "cannot be run by the daemon" in stderr
+
+
+def test_output_is_sent_line_by_line_in_the_order_written():
+    messages = []
+    relay = _OutputRelay(messages.append)
+
+    relay.stdout.write("first ")
+    assert messages == []
+    relay.stdout.write("line\n")
+    relay.stderr.write("WARNING:a warning\n")
+    relay.stdout.write("second line\n")
+    relay.stdout.write("no newline")
+    relay.flush()
+
+    assert messages == [
+        {"stdout": "first line\n"},
+        {"stderr": "WARNING:a warning\n"},
+        {"stdout": "second line\n"},
+        {"stdout": "no newline"},
+    ]
+
+
+def test_output_is_streamed_while_the_command_runs(daemon, ms101, monkeypatch):
+    running = [False]
+    sent_while_running = []
+    original_run = daemon_server.run
+
+    def tracked_run(command, args):
+        running[0] = True
+        try:
+            return original_run(command, args)
+        finally:
+            running[0] = False
+
+    monkeypatch.setattr(daemon_server, "run", tracked_run)
+    exit_code = daemon.run_request(
+        argv=["status", "local", "-p", ms101],
+        cwd=os.getcwd(),
+        env=dict(os.environ),
+        send=lambda message: sent_while_running.append(running[0]),
+    )
+
+    assert exit_code == 0
+    assert sent_while_running and sent_while_running[0]
+
+
+def test_client_relays_output_and_exit_code(serving_daemon, socket_path, ms101, capsys):
+    exit_code = forward(["export", "local", "-p", ms101], socket_path)
+
+    assert exit_code == 0
+    assert '"ms-101"' in capsys.readouterr().out
+
+
+def test_silent_client_is_dropped(socket_path, ms101, capsys, monkeypatch):
+    monkeypatch.setattr(_RequestHandler, "timeout", 0.2)
+    server = DaemonServer(socket_path, SessionPool())
+
+    def serve():
+        server.serve_forever()
+        server.session_pool.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    silent = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        silent.connect(socket_path)
+
+        # Served once the silent connection has timed out
+        assert forward(["export", "local", "-p", ms101], socket_path) == 0
+        assert '"ms-101"' in capsys.readouterr().out
+        assert silent.recv(1) == b""
+    finally:
+        silent.close()
+        server.shutdown()
+        thread.join()
+        server.server_close()
+
+
+def test_client_without_a_daemon_returns_none(tmp_path):
+    assert forward(["status", "local", "-p", "."], str(tmp_path / "missing.sock")) is None
@@ -0,0 +1,147 @@
+# Copyright © LFV
+
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from reqstool.common.exceptions import MissingRequirementsFileError
+from reqstool.common.validator_error_holder import ValidationError, ValidationErrorHolder
+from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.daemon.session_pool import SessionPool
+from reqstool.locations.local_location import LocalLocation
+from reqstool.model_generators.combined_raw_datasets_generator import CombinedRawDatasetsGenerator
+from reqstool.model_generators.parsing_config import ParsingConfig
+from reqstool.storage.pipeline import build_database
+from reqstool.storage.requirements_repository import RequirementsRepository
+
+
+@pytest.fixture
+def project(tmp_path, local_testdata_resources_rootdir_w_path):
+    dst = tmp_path / "ms-101"
+    shutil.copytree(local_testdata_resources_rootdir_w_path("test_basic/baseline/ms-101"), dst)
+    return dst
+
+
+@pytest.fixture
+def pool():
+    session_pool = SessionPool()
+    yield session_pool
+    session_pool.close()
+
+
+def _validator(holder: ValidationErrorHolder | None = None) -> SemanticValidator:
+    return SemanticValidator(validation_error_holder=holder or ValidationErrorHolder())
+
+
+def _titles(pool: SessionPool, location, filter_data: bool = True) -> dict[str, str]:
+    db = pool.database(location, filter_data, ParsingConfig(), _validator())
+    assert db is not None
+    try:
+        return {str(urn_id): req.title for urn_id, req in RequirementsRepository(db).get_all_requirements().items()}
+    finally:
+        db.close()
+
+
+def _count_parses(pool: SessionPool, location, filter_data: bool = True) -> int:
+    with patch(
+        "reqstool.common.project_session.CombinedRawDatasetsGenerator", wraps=CombinedRawDatasetsGenerator
+    ) as mock_crdg:
+        _titles(pool, location, filter_data)
+    return mock_crdg.call_count
+
+
+def test_unchanged_project_is_served_without_parsing(project, pool):
+    location = LocalLocation(path=str(project))
+
+    assert _count_parses(pool, location) == 1
+    assert _count_parses(pool, location) == 0
+    assert len(pool) == 1
+
+
+def test_each_request_gets_a_private_copy(project, pool):
+    location = LocalLocation(path=str(project))
+
+    db = pool.database(location, True, ParsingConfig(), _validator())
+    db.connection.execute("DELETE FROM test_results")
+    db.close()
+
+    assert _titles(pool, location)
+
+
+def test_edited_input_file_is_picked_up(project, pool):
+    location = LocalLocation(path=str(project))
+    _titles(pool, location)
+
+    requirements_yml = project / "requirements.yml"
+    requirements_yml.write_text(requirements_yml.read_text().replace("Title REQ_101", "Retitled REQ_101"))
+
+    assert _titles(pool, location)["ms-101:REQ_101"] == "Retitled REQ_101"
+
+
+def test_changed_interpolated_env_var_reloads_the_session(project, pool, monkeypatch):
+    monkeypatch.setenv("REQSTOOL_TEST_TITLE", "First")
+    requirements_yml = project / "requirements.yml"
+    requirements_yml.write_text(requirements_yml.read_text().replace("Title REQ_101", "${REQSTOOL_TEST_TITLE}"))
+    location = LocalLocation(path=str(project))
+    assert _titles(pool, location)["ms-101:REQ_101"] == "First"
+
+    monkeypatch.setenv("REQSTOOL_TEST_TITLE", "Second")
+
+    assert _titles(pool, location)["ms-101:REQ_101"] == "Second"
+
+
+def test_filter_flag_selects_a_separate_session(project, pool):
+    location = LocalLocation(path=str(project))
+    _titles(pool, location, filter_data=True)
+
+    assert _count_parses(pool, location, filter_data=False) == 1
+    assert len(pool) == 2
+
+
+def test_least_recently_used_session_is_closed(tmp_path, local_testdata_resources_rootdir_w_path):
+    pool = SessionPool(max_sessions=1)
+    try:
+        first = LocalLocation(path=local_testdata_resources_rootdir_w_path("test_basic/baseline/ms-101"))
+        second = LocalLocation(path=local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001"))
+        _titles(pool, first)
+        _titles(pool, second)
+
+        assert len(pool) == 1
+        assert _count_parses(pool, first) == 1
+    finally:
+        pool.close()
+
+
+def test_validation_errors_are_replayed(project, pool):
+    location = LocalLocation(path=str(project))
+    _titles(pool, location)
+
+    with patch(
+        "reqstool.common.project_session.ProjectSession.validation_errors",
+        [ValidationError(msg="SVC_999 refers to missing REQ_999")],
+    ):
+        holder = ValidationErrorHolder()
+        pool.database(location, True, ParsingConfig(), _validator(holder)).close()
+
+    assert [e.msg for e in holder.get_errors()] == ["SVC_999 refers to missing REQ_999"]
+
+
+def test_unbuildable_location_raises_what_the_build_failed_with(pool):
+    with pytest.raises(MissingRequirementsFileError):
+        pool.database(LocalLocation(path="/nonexistent/path"), True, ParsingConfig(), _validator())
+    assert len(pool) == 0
+
+
+def test_build_database_uses_the_pool(project, pool):
+    location = LocalLocation(path=str(project))
+    _titles(pool, location)
+
+    with patch("reqstool.storage.pipeline.CombinedRawDatasetsGenerator") as mock_crdg:
+        with build_database(location=location, semantic_validator=_validator(), database_provider=pool.database) as (
+            db,
+            crd,
+        ):
+            assert crd is None
+            assert RequirementsRepository(db).get_initial_urn() == "ms-101"
+    mock_crdg.assert_not_called()
@@ -0,0 +1,222 @@
+# Copyright © LFV
+
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from reqstool.location_resolver.location_resolver import LocationResolver
+from reqstool.locations.artifact_cache import ArtifactCache
+from reqstool.locations.git_location import GitLocation
+from reqstool.locations.maven_location import MavenLocation
+
+COMMIT_SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArtifactCache(str(tmp_path / "artifacts"))
+
+
+def _maven(version: str = "1.0.0") -> LocationResolver:
+    return LocationResolver(
+        parent=None, current_unresolved=MavenLocation(group_id="com.example", artifact_id="sys", version=version)
+    )
+
+
+def _fake_download(self, dst_path):
+    """What a Maven fetch leaves behind: the downloaded zip and the directory extracted from it."""
+    extracted = os.path.join(dst_path, f"sys-{self.version}")
+    os.makedirs(extracted)
+    with open(os.path.join(dst_path, f"sys-{self.version}.zip"), "w") as f:
+        f.write("zip")
+    with open(os.path.join(extracted, "requirements.yml"), "w") as f:
+        f.write(f"version: {self.version}\n" + "x" * 1000)
+    return extracted
+
+
+def _fetch(cache, tmp_path, location_handler, name: str) -> str:
+    dst_path = tmp_path / name
+    dst_path.mkdir()
+    return cache.make_available_on_localdisk(location_handler, dst_path=str(dst_path))
+
+
+def _entry_dir(cache, location_handler) -> str:
+    location = location_handler.current
+    return os.path.join(cache.cache_dir, ArtifactCache.entry_name(location.tmpdir_key(), location.pinned_key()))
+
+
+def test_pinned_artifact_is_downloaded_once(cache, tmp_path):
+    with patch.object(MavenLocation, "_make_available_on_localdisk", autospec=True, side_effect=_fake_download) as dl:
+        first = _fetch(cache, tmp_path, _maven(), "run-1")
+        second = _fetch(cache, tmp_path, _maven(), "run-2")
+
+    assert dl.call_count == 1
+    assert second == os.path.join(str(tmp_path / "run-2"), "sys-1.0.0")
+    with open(os.path.join(first, "requirements.yml")) as a, open(os.path.join(second, "requirements.yml")) as b:
+        assert a.read() == b.read()
+    # Only the extracted tree is kept, not the downloaded archive
+    assert not os.path.exists(tmp_path / "run-2" / "sys-1.0.0.zip")
+
+
+def test_unpinned_artifact_is_always_downloaded(cache, tmp_path):
+    with patch.object(MavenLocation, "_make_available_on_localdisk", autospec=True, side_effect=_fake_download) as dl:
+        _fetch(cache, tmp_path, _maven("1.0.0-SNAPSHOT"), "run-1")
+        _fetch(cache, tmp_path, _maven("1.0.0-SNAPSHOT"), "run-2")
+
+    assert dl.call_count == 2
+    assert not os.path.exists(cache.cache_dir)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    # Room for two entries of ~1 kB each
+    cache = ArtifactCache(str(tmp_path / "artifacts"), max_size_bytes=2500)
+
+    with patch.object(MavenLocation, "_make_available_on_localdisk", autospec=True, side_effect=_fake_download) as dl:
+        _fetch(cache, tmp_path, _maven("1.0.0"), "a")
+        _fetch(cache, tmp_path, _maven("2.0.0"), "b")
+        entry_1 = _entry_dir(cache, _maven("1.0.0"))
+        entry_2 = _entry_dir(cache, _maven("2.0.0"))
+        os.utime(os.path.join(entry_1, "entry.json"), (1000, 1000))
+        os.utime(os.path.join(entry_2, "entry.json"), (2000, 2000))
+
+        _fetch(cache, tmp_path, _maven("1.0.0"), "c")  # a hit makes 1.0.0 the most recently used
+        _fetch(cache, tmp_path, _maven("3.0.0"), "d")
+
+    assert dl.call_count == 3
+    assert os.path.exists(entry_1)
+    assert not os.path.exists(entry_2)
+
+
+def test_unreadable_entry_is_fetched_again(cache, tmp_path):
+    location_handler = _maven()
+    with patch.object(MavenLocation, "_make_available_on_localdisk", autospec=True, side_effect=_fake_download) as dl:
+        _fetch(cache, tmp_path, location_handler, "run-1")
+        with open(os.path.join(_entry_dir(cache, location_handler), "entry.json"), "w") as f:
+            f.write("{not json")
+
+        path = _fetch(cache, tmp_path, location_handler, "run-2")
+
+    assert dl.call_count == 2
+    assert os.path.exists(os.path.join(path, "requirements.yml"))
+
+
+def test_git_history_is_not_cached(cache, tmp_path):
+    def fake_clone(self, dst_path):
+        os.makedirs(os.path.join(dst_path, ".git"))
+        with open(os.path.join(dst_path, "requirements.yml"), "w") as f:
+            f.write("x")
+        return dst_path + "/"
+
+    location_handler = LocationResolver(
+        parent=None, current_unresolved=GitLocation(url="https://example.com/repo.git", ref=COMMIT_SHA)
+    )
+    with patch.object(GitLocation, "_make_available_on_localdisk", autospec=True, side_effect=fake_clone) as clone:
+        _fetch(cache, tmp_path, location_handler, "run-1")
+        path = _fetch(cache, tmp_path, location_handler, "run-2")
+
+    assert clone.call_count == 1
+    assert os.path.normpath(path) == str(tmp_path / "run-2")
+    assert os.path.exists(os.path.join(path, "requirements.yml"))
+    assert not os.path.exists(os.path.join(path, ".git"))
+
+
+def test_entry_published_concurrently_is_kept(cache, tmp_path):
+    location_handler = _maven()
+    with patch.object(MavenLocation, "_make_available_on_localdisk", autospec=True, side_effect=_fake_download):
+        _fetch(cache, tmp_path, location_handler, "run-1")
+        # Another process finished the same download while this one was fetching
+        with patch.object(ArtifactCache, "_copy_from_cache", return_value=None):
+            _fetch(cache, tmp_path, location_handler, "run-2")
+
+    assert [name for name in os.listdir(cache.cache_dir) if name.startswith(".tmp-")] == []
+
+
+def test_git_sources_are_fetched_through_the_mirror(tmp_path):
+    cache = ArtifactCache(str(tmp_path / "artifacts"), git_mirror_dir=str(tmp_path / "git"))
+    location_handler = LocationResolver(
+        parent=None, current_unresolved=GitLocation(url="https://example.com/repo.git", ref="main")
+    )
+
+    with patch.object(GitLocation, "make_available", autospec=True, return_value="checkout") as make_available:
+        assert _fetch(cache, tmp_path, location_handler, "run-1") == "checkout"
+
+    assert make_available.call_args.kwargs["mirror_dir"] == str(tmp_path / "git")
+
+
+def _mirror(tmp_path, name: str, size: int, last_used: float) -> str:
+    mirror_path = tmp_path / "git" / name
+    (mirror_path / "objects").mkdir(parents=True)
+    (mirror_path / "objects" / "pack").write_bytes(b"x" * size)
+    os.utime(mirror_path, (last_used, last_used))
+    return str(mirror_path)
+
+
+def test_git_mirrors_count_against_the_size_limit(tmp_path):
+    cache = ArtifactCache(str(tmp_path / "artifacts"), max_size_bytes=2500, git_mirror_dir=str(tmp_path / "git"))
+    old_mirror = _mirror(tmp_path, "old", 2000, 1000)
+
+    with patch.object(MavenLocation, "_make_available_on_localdisk", autospec=True, side_effect=_fake_download):
+        _fetch(cache, tmp_path, _maven("1.0.0"), "a")
+
+    assert not os.path.exists(old_mirror)
+    assert os.path.exists(_entry_dir(cache, _maven("1.0.0")))
+
+
+def test_git_mirror_in_use_is_not_evicted(tmp_path):
+    from reqstool.common.utils import Utils
+
+    cache = ArtifactCache(str(tmp_path / "artifacts"), max_size_bytes=2500, git_mirror_dir=str(tmp_path / "git"))
+    busy_mirror = _mirror(tmp_path, "busy", 2000, 1000)
+
+    with patch.object(MavenLocation, "_make_available_on_localdisk", autospec=True, side_effect=_fake_download):
+        with Utils.file_lock(f"{busy_mirror}.lock"):
+            _fetch(cache, tmp_path, _maven("1.0.0"), "a")
+
+    assert os.path.exists(busy_mirror)
+
+
+def test_git_mirror_just_used_evicts_older_entries(tmp_path):
+    cache = ArtifactCache(str(tmp_path / "artifacts"), max_size_bytes=2500, git_mirror_dir=str(tmp_path / "git"))
+    location_handler = LocationResolver(
+        parent=None, current_unresolved=GitLocation(url="https://example.com/repo.git", ref="main")
+    )
+
+    def fetch_into_mirror(self, dst_path, mirror_dir):
+        _mirror(tmp_path, self.mirror_key(), 3000, 1000)
+        return dst_path
+
+    with patch.object(MavenLocation, "_make_available_on_localdisk", autospec=True, side_effect=_fake_download):
+        _fetch(cache, tmp_path, _maven("1.0.0"), "a")
+    with patch.object(GitLocation, "make_available", autospec=True, side_effect=fetch_into_mirror):
+        _fetch(cache, tmp_path, location_handler, "b")
+
+    # The mirror alone exceeds the limit, yet it is the one just used
+    assert os.path.exists(os.path.join(tmp_path, "git", location_handler.current.mirror_key()))
+    assert not os.path.exists(_entry_dir(cache, _maven("1.0.0")))
+
+
+def test_cache_hits_only_share_the_lock(cache, tmp_path):
+    from reqstool.common.utils import Utils
+
+    lock_path = os.path.join(cache.cache_dir, ".lock")
+    copytree = shutil.copytree
+    held = []
+
+    def observing_copytree(*args, **kwargs):
+        with Utils.file_lock(lock_path, shared=True, blocking=False):
+            held.append("shared")
+        with pytest.raises(BlockingIOError):
+            with Utils.file_lock(lock_path, blocking=False):
+                pass
+        return copytree(*args, **kwargs)
+
+    with patch.object(MavenLocation, "_make_available_on_localdisk", autospec=True, side_effect=_fake_download):
+        _fetch(cache, tmp_path, _maven(), "run-1")
+        with patch("reqstool.locations.artifact_cache.shutil.copytree", side_effect=observing_copytree):
+            path = _fetch(cache, tmp_path, _maven(), "run-2")
+
+    # Another reader could copy at the same time; publishing or evicting has to wait
+    assert held == ["shared"]
+    assert os.path.exists(os.path.join(path, "requirements.yml"))
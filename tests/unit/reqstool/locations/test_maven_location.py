@@ -42,3 +42,13 @@ def test_maven_location_make_available_with_token(tmp_path):
 def test_maven_location_token_not_in_repr():
     loc = MavenLocation(group_id="com.example", artifact_id="my-lib", version="1.0.0", token="super-secret")
     assert "super-secret" not in repr(loc)
+
+
+def test_maven_location_pinned_key_only_for_release_versions():
+    def key(version):
+        return MavenLocation(group_id="com.example", artifact_id="my-lib", version=version).pinned_key()
+
+    assert key("1.0.0") is not None
+    assert key("1.0.0-SNAPSHOT") is None
+    assert key("LATEST") is None
+    assert key("RELEASE") is None
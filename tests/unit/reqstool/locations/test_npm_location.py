@@ -242,3 +242,13 @@ def test_npm_location_make_available_no_token_sends_no_auth(tmp_path):
         loc._make_available_on_localdisk(str(tmp_path))
 
     assert "Authorization" not in mock_get.call_args[1]["headers"]
+
+
+def test_npm_location_pinned_key_only_for_exact_versions():
+    def key(version):
+        return NpmLocation(package="@scope/pkg", version=version).pinned_key()
+
+    assert key("1.2.3") is not None
+    assert key("1.2.3-rc.1") is not None
+    assert key("latest") is None
+    assert key("^1.2.0") is None
@@ -52,3 +52,8 @@ def test_pypi_location_make_available_empty_string_token_treated_as_no_auth(tmp_
 def test_pypi_location_token_not_in_repr():
     loc = PypiLocation(package="my-package", version="1.0.0", token="super-secret")
     assert "super-secret" not in repr(loc)
+
+
+def test_pypi_location_pinned_key_only_for_valid_versions():
+    assert PypiLocation(package="my-package", version="1.0.0").pinned_key() is not None
+    assert PypiLocation(package="my-package", version="1.0.*").pinned_key() is None
@@ -1,6 +1,17 @@
 # Copyright © LFV
 
-from reqstool.lsp.annotation_parser import annotation_at_position, find_all_annotations, is_inside_annotation
+import random
+
+from lsprotocol import types
+from pygls.workspace import TextDocument
+
+from reqstool.lsp.annotation_parser import (
+    AnnotationCache,
+    DocumentAnnotations,
+    annotation_at_position,
+    find_all_annotations,
+    is_inside_annotation,
+)
 
 
 # -- find_all_annotations: Python/Java (source annotations) --
@@ -246,3 +257,117 @@ def test_unknown_language_inside():
     line = '@Requirements("REQ_")'
     result = is_inside_annotation(line, 17, "rust")
     assert result is None
+
+
+# -- DocumentAnnotations / AnnotationCache --
+
+_JAVA_SOURCE = (
+    "class FooTest {\n"
+    '    @Requirements("REQ_010")\n'
+    "    void foo() {}\n"
+    "\n"
+    "    @SVCs(\n"
+    '        "SVC_010",\n'
+    '        "SVC_011"\n'
+    "    )\n"
+    "    void testFoo() {}\n"
+    "}\n"
+)
+
+
+def _edit(document: TextDocument, start: tuple[int, int], end: tuple[int, int], new_text: str):
+    change = types.TextDocumentContentChangePartial(
+        range=types.Range(
+            start=types.Position(line=start[0], character=start[1]),
+            end=types.Position(line=end[0], character=end[1]),
+        ),
+        text=new_text,
+    )
+    document.apply_change(change)
+    document.version += 1
+    return change
+
+
+def _apply(annotations: DocumentAnnotations, document: TextDocument, change) -> DocumentAnnotations:
+    updated = annotations.apply_changes(document.source, document.version, [change])
+    assert updated.matches == find_all_annotations(document.source, document.language_id)
+    return updated
+
+
+def test_document_annotations_match_full_scan():
+    annotations = DocumentAnnotations(_JAVA_SOURCE, "java")
+    assert annotations.matches == find_all_annotations(_JAVA_SOURCE, "java")
+    assert [m.raw_id for m in annotations.on_line(6)] == ["SVC_011"]
+    assert annotations.at_position(5, 10).raw_id == "SVC_010"
+    assert annotations.at_position(5, 8) is None
+
+
+def test_apply_changes_shifts_lines_below_edit():
+    document = TextDocument("file:///FooTest.java", _JAVA_SOURCE, version=1, language_id="java")
+    annotations = DocumentAnnotations(document.source, "java", version=1)
+
+    annotations = _apply(annotations, document, _edit(document, (0, 15), (0, 15), "\n    // added\n"))
+    assert [m.line for m in annotations.matches] == [3, 7, 8]
+    assert annotations.version == 2
+
+
+def test_apply_changes_rescans_multiline_span():
+    document = TextDocument("file:///FooTest.java", _JAVA_SOURCE, version=1, language_id="java")
+    annotations = DocumentAnnotations(document.source, "java", version=1)
+
+    # Edit inside the parens of an annotation that starts two lines above
+    annotations = _apply(annotations, document, _edit(document, (6, 17), (6, 17), ', "SVC_012"'))
+    assert [m.raw_id for m in annotations.matches] == ["REQ_010", "SVC_010", "SVC_011", "SVC_012"]
+
+    # Opening a paren that is never closed pulls in the quoted strings below it
+    annotations = _apply(annotations, document, _edit(document, (2, 13), (2, 13), ' @Requirements("REQ_020", '))
+    annotations = _apply(annotations, document, _edit(document, (7, 4), (7, 5), ""))
+
+
+def test_apply_changes_reparses_on_full_change():
+    annotations = DocumentAnnotations(_JAVA_SOURCE, "java", version=1)
+    text = '@Requirements("REQ_099")\n'
+    updated = annotations.apply_changes(text, 2, [types.TextDocumentContentChangeWholeDocument(text=text)])
+    assert [m.raw_id for m in updated.matches] == ["REQ_099"]
+
+
+def test_apply_changes_random_edits_match_full_scan():
+    rng = random.Random(4711)
+    fragments = ["\n", '"REQ_0', '", "', "(", ")", "@Requirements(", "@SVCs(", "x", "  ", '"SVC_01"']
+    for language_id in ("python", "typescript"):
+        source = _JAVA_SOURCE if language_id == "python" else "/**\n * @Requirements REQ_010, REQ_011\n */\n"
+        document = TextDocument("file:///foo", source, version=1, language_id=language_id)
+        annotations = DocumentAnnotations(document.source, language_id, version=1)
+        for _ in range(300):
+            lines = document.source.split("\n")
+            start_line = rng.randrange(len(lines))
+            end_line = min(len(lines) - 1, start_line + rng.choice([0, 0, 1, 2]))
+            start = (start_line, rng.randint(0, len(lines[start_line])))
+            end = (end_line, rng.randint(0, len(lines[end_line])))
+            if end < start:
+                start, end = end, start
+            new_text = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 3)))
+            annotations = _apply(annotations, document, _edit(document, start, end, new_text))
+
+
+def test_annotation_cache_keyed_by_version():
+    cache = AnnotationCache()
+    first = cache.get("file:///a.py", '@Requirements("REQ_010")', "python", 1)
+    assert cache.get("file:///a.py", '@Requirements("REQ_010")', "python", 1) is first
+    second = cache.get("file:///a.py", '@Requirements("REQ_011")', "python", 2)
+    assert second is not first
+    assert [m.raw_id for m in second.matches] == ["REQ_011"]
+
+    cache.discard("file:///a.py")
+    assert cache.get("file:///a.py", '@Requirements("REQ_011")', "python", 2) is not second
+
+
+def test_annotation_cache_update_applies_changes():
+    cache = AnnotationCache()
+    document = TextDocument("file:///FooTest.java", _JAVA_SOURCE, version=1, language_id="java")
+    cache.get(document.uri, document.source, "java", document.version)
+
+    change = _edit(document, (1, 23), (1, 26), "099")
+    updated = cache.update(document.uri, document.source, "java", document.version, [change])
+    assert [m.raw_id for m in updated.matches] == ["REQ_099", "SVC_010", "SVC_011"]
+    assert cache.get(document.uri, document.source, "java", document.version) is updated
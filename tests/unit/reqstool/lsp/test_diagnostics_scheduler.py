@@ -0,0 +1,138 @@
+# Copyright © LFV
+
+import threading
+import time
+
+import pytest
+from lsprotocol import types
+
+from reqstool.lsp.diagnostics_scheduler import DiagnosticsScheduler
+
+URI = "file:///a.py"
+
+
+def _diagnostic(message: str) -> types.Diagnostic:
+    return types.Diagnostic(
+        range=types.Range(start=types.Position(line=0, character=0), end=types.Position(line=0, character=1)),
+        message=message,
+    )
+
+
+class _Recorder:
+    def __init__(self):
+        self.computed: list[str] = []
+        self.published: list[tuple[str, list[types.Diagnostic]]] = []
+        self.messages = {URI: "first"}
+        self._published = threading.Event()
+
+    def compute(self, uri: str) -> list[types.Diagnostic] | None:
+        self.computed.append(uri)
+        return [_diagnostic(self.messages[uri])] if uri in self.messages else None
+
+    def publish(self, uri: str, diagnostics: list[types.Diagnostic]) -> None:
+        self.published.append((uri, diagnostics))
+        self._published.set()
+
+    def wait_for_publish(self, timeout: float = 5.0) -> bool:
+        published = self._published.wait(timeout)
+        self._published.clear()
+        return published
+
+
+@pytest.fixture
+def recorder():
+    return _Recorder()
+
+
+@pytest.fixture
+def scheduler(recorder):
+    scheduler = DiagnosticsScheduler(recorder.compute, recorder.publish, debounce=0.05)
+    yield scheduler
+    scheduler.close()
+
+
+def test_schedule_publishes_in_background(scheduler, recorder):
+    scheduler.schedule(URI, delay=0)
+    assert recorder.wait_for_publish()
+    assert recorder.published == [(URI, [_diagnostic("first")])]
+
+
+def test_debounce_coalesces_schedules(scheduler, recorder):
+    for _ in range(5):
+        scheduler.schedule(URI)
+    assert recorder.wait_for_publish()
+    time.sleep(0.1)
+    assert recorder.computed == [URI]
+
+
+def test_unchanged_diagnostics_not_republished(scheduler, recorder):
+    scheduler.schedule(URI, delay=0)
+    assert recorder.wait_for_publish()
+
+    scheduler.schedule(URI, delay=0)
+    time.sleep(0.2)
+    assert len(recorder.computed) == 2
+    assert len(recorder.published) == 1
+
+    recorder.messages[URI] = "second"
+    scheduler.schedule(URI, delay=0)
+    assert recorder.wait_for_publish()
+    assert recorder.published[-1] == (URI, [_diagnostic("second")])
+
+
+def test_cancel_drops_pending_computation(scheduler, recorder):
+    scheduler.schedule(URI, delay=0.1)
+    scheduler.cancel(URI)
+    time.sleep(0.2)
+    assert recorder.computed == []
+    assert recorder.published == []
+
+
+def test_cancel_forgets_published_diagnostics(scheduler, recorder):
+    scheduler.schedule(URI, delay=0)
+    assert recorder.wait_for_publish()
+    scheduler.cancel(URI)
+
+    # Reopened: the same diagnostics are sent again
+    scheduler.schedule(URI, delay=0)
+    assert recorder.wait_for_publish()
+    assert len(recorder.published) == 2
+
+
+def test_superseded_computation_is_discarded(recorder):
+    started, release = threading.Event(), threading.Event()
+    compute = recorder.compute
+
+    def slow_compute(uri):
+        if not started.is_set():
+            started.set()
+            release.wait(5)
+        return compute(uri)
+
+    scheduler = DiagnosticsScheduler(slow_compute, recorder.publish, debounce=0.05)
+    try:
+        scheduler.schedule(URI, delay=0)
+        assert started.wait(5)
+        recorder.messages[URI] = "second"
+        scheduler.schedule(URI, delay=0)
+        release.set()
+
+        assert recorder.wait_for_publish()
+        time.sleep(0.1)
+        assert recorder.published == [(URI, [_diagnostic("second")])]
+    finally:
+        scheduler.close()
+
+
+def test_document_gone_is_not_published(scheduler, recorder):
+    scheduler.schedule("file:///gone.py", delay=0)
+    time.sleep(0.2)
+    assert recorder.computed == ["file:///gone.py"]
+    assert recorder.published == []
+
+
+def test_schedule_after_close_is_ignored(scheduler, recorder):
+    scheduler.close()
+    scheduler.schedule(URI, delay=0)
+    time.sleep(0.1)
+    assert recorder.computed == []
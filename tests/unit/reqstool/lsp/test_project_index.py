@@ -0,0 +1,53 @@
+# Copyright © LFV
+
+import pytest
+
+from reqstool.common.models.urn_id import UrnId
+from reqstool.common.project_session import ProjectSession
+from reqstool.locations.local_location import LocalLocation
+from reqstool.lsp.project_index import ProjectIndex
+
+
+@pytest.fixture
+def session(local_testdata_resources_rootdir_w_path):
+    session = ProjectSession(
+        LocalLocation(path=local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001"))
+    )
+    session.build()
+    assert session.ready
+    yield session
+    session.close()
+
+
+def test_build_matches_repository(session):
+    repo = session.repo
+    index = ProjectIndex.build(repo)
+
+    assert index.initial_urn == "ms-001"
+    assert dict(index.requirements) == repo.get_all_requirements()
+    assert dict(index.svcs) == repo.get_all_svcs()
+    assert dict(index.mvrs) == repo.get_all_mvrs()
+    assert list(index.requirement_ids) == [uid.id for uid in repo.get_all_requirements()]
+
+    req_010 = UrnId(urn="ms-001", id="REQ_010")
+    assert list(index.svc_ids_by_req[req_010]) == repo.get_svcs_for_req(req_010)
+    for svc_urn_id in index.svcs:
+        assert list(index.mvr_ids_by_svc.get(svc_urn_id, ())) == repo.get_mvrs_for_svc(svc_urn_id)
+
+    for urn in repo.get_urn_parsing_order():
+        assert index.urn_locations.get(urn) == repo.get_urn_location(urn)
+        assert list(index.requirements_by_urn.get(urn, ())) == [
+            req for uid, req in repo.get_all_requirements().items() if uid.urn == urn
+        ]
+
+
+def test_urn_id_resolves_bare_ids(session):
+    index = ProjectIndex.build(session.repo)
+    assert index.urn_id("REQ_010") == UrnId(urn="ms-001", id="REQ_010")
+    assert index.urn_id("other:REQ_010") == UrnId(urn="other", id="REQ_010")
+
+
+def test_index_is_read_only(session):
+    index = ProjectIndex.build(session.repo)
+    with pytest.raises(TypeError):
+        index.requirements[UrnId(urn="ms-001", id="REQ_NEW")] = None
@@ -99,6 +99,37 @@ def test_rebuild(local_testdata_resources_rootdir_w_path):
         state.close()
 
 
+def test_rebuild_replaces_index(local_testdata_resources_rootdir_w_path):
+    path = local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001")
+    state = ProjectState(reqstool_path=path)
+    try:
+        state.build()
+        index = state.index
+        assert index is not None
+        state.rebuild()
+        assert state.index is not None
+        assert state.index is not index
+        assert state.get_all_requirement_ids() == list(index.requirement_ids)
+    finally:
+        state.close()
+    assert state.index is None
+
+
+def test_lookups_do_not_query_the_database(local_testdata_resources_rootdir_w_path):
+    path = local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001")
+    state = ProjectState(reqstool_path=path)
+    try:
+        state.build()
+        statements = []
+        state.repo._db.connection.set_trace_callback(statements.append)
+        assert state.get_requirement("REQ_010") is not None
+        assert state.get_svcs_for_req("REQ_010")
+        assert "REQ_010" in state.get_all_requirement_ids()
+        assert statements == []
+    finally:
+        state.close()
+
+
 def test_close_idempotent(local_testdata_resources_rootdir_w_path):
     path = local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001")
     state = ProjectState(reqstool_path=path)
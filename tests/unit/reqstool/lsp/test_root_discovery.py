@@ -2,8 +2,10 @@
 
 import os
 import tempfile
+import time
 
-from reqstool.lsp.root_discovery import discover_root_projects
+from reqstool.lsp import root_discovery
+from reqstool.lsp.root_discovery import DiscoveryCache, _prescan, _yaml_fields, discover_root_projects
 
 
 def _write_requirements_yml(directory: str, urn: str, variant: str = "microservice") -> None:
@@ -125,3 +127,146 @@ def test_no_reqstoolignore_discovers_all_roots():
         urns = {p.urn for p in roots}
         assert "project-a" in urns
         assert "project-b" in urns
+
+
+# ---------------------------------------------------------------------------
+# Quick parse — line scan with a YAML fallback
+# ---------------------------------------------------------------------------
+
+
+def test_prescan_agrees_with_yaml_load():
+    text = (
+        "# yaml-language-server: $schema=requirements.schema.json\n"
+        "---\n"
+        "metadata:\n"
+        '  urn: "ms-001"  # the service\n'
+        "  variant: 'microservice'\n"
+        "  title: Some title\n"
+        "    continued\n"
+        "imports:\n"
+        "  git:\n"
+        "    - url: https://example.com/repo.git\n"
+        "      path: docs/reqstool\n"
+        "  local:\n"
+        "    - path: ../sys-001\n"
+        "implementations:\n"
+        "  local:\n"
+        "    - path: ./lib-a # comment\n"
+        "requirements:\n"
+        "  - id: REQ_001\n"
+    )
+    fields = _prescan(text)
+    assert fields == ("ms-001", "microservice", {"../sys-001"}, {"./lib-a"})
+    assert fields == _yaml_fields(text, "requirements.yml")
+
+
+def test_prescan_gives_up_on_unsupported_yaml():
+    assert _prescan("metadata: {urn: ms-001, variant: microservice}\n") is None
+    assert _prescan("metadata:\n  urn: &urn ms-001\n  variant: microservice\n") is None
+    assert _prescan("metadata:\n  urn: ms-001\n    continued\n  variant: microservice\n") is None
+    assert (
+        _prescan("metadata:\n  urn: ms-001\n  variant: system\nimports:\n  local:\n    -\n      path: ../a\n") is None
+    )
+    header = "metadata:\n  urn: ms-001\n  variant: system\nimports:\n"
+    for local in (
+        "  local:\n    - {path: ../a}\n",
+        "  local:\n    - [../a]\n",
+        "  local:\n    {path: ../a}\n",
+        "  local:\n    [ {path: ../a} ]\n",
+        "  local: [ {path: ../a} ]\n",
+        '  local:\n    - "path": ../a\n',
+        "  local:\n    - 'path': ../a\n",
+    ):
+        assert _prescan(header + local) is None, local
+    # What the YAML load then finds, and the scan would have missed
+    assert _yaml_fields(header + "  local:\n    - {path: ../a}\n", "requirements.yml")[2] == {"../a"}
+
+
+def test_discover_flow_style_requirements_yml():
+    with tempfile.TemporaryDirectory() as tmp:
+        req_dir = os.path.join(tmp, "docs", "reqstool")
+        os.makedirs(req_dir)
+        with open(os.path.join(req_dir, "requirements.yml"), "w") as f:
+            f.write("metadata: {urn: my-project, variant: microservice}\n")
+
+        roots = discover_root_projects(tmp)
+        assert [p.urn for p in roots] == ["my-project"]
+
+
+# ---------------------------------------------------------------------------
+# Discovery cache
+# ---------------------------------------------------------------------------
+
+
+def _age(root: str, seconds: int = 60) -> None:
+    """Backdate every file and directory under root, as if nothing had changed in a while."""
+    past = time.time() - seconds
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+        os.utime(dirpath, (past, past))
+
+
+def _count_reads(monkeypatch) -> dict[str, int]:
+    counts = {"scandir": 0, "parse": 0}
+    scandir, quick_parse = os.scandir, root_discovery._quick_parse
+
+    def counting_scandir(path):
+        counts["scandir"] += 1
+        return scandir(path)
+
+    def counting_quick_parse(req_dir):
+        counts["parse"] += 1
+        return quick_parse(req_dir)
+
+    monkeypatch.setattr(root_discovery.os, "scandir", counting_scandir)
+    monkeypatch.setattr(root_discovery, "_quick_parse", counting_quick_parse)
+    return counts
+
+
+def test_discovery_cache_skips_unchanged_directories_and_files(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as cache_dir:
+        workspace = os.path.join(tmp, "workspace")
+        _write_requirements_yml(os.path.join(workspace, "docs", "reqstool"), "project-a")
+        _write_requirements_yml(os.path.join(workspace, "services", "svc-b"), "project-b")
+        _age(workspace)
+        cache = DiscoveryCache(cache_dir)
+
+        counts = _count_reads(monkeypatch)
+        first = discover_root_projects(workspace, cache=cache)
+        assert counts == {"scandir": 5, "parse": 2}
+
+        counts.update(scandir=0, parse=0)
+        second = discover_root_projects(workspace, cache=cache)
+        assert counts == {"scandir": 0, "parse": 0}
+        assert second == first
+
+
+def test_discovery_cache_picks_up_changes(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as cache_dir:
+        workspace = os.path.join(tmp, "workspace")
+        _write_requirements_yml(os.path.join(workspace, "docs", "reqstool"), "project-a")
+        _age(workspace)
+        cache = DiscoveryCache(cache_dir)
+        assert {p.urn for p in discover_root_projects(workspace, cache=cache)} == {"project-a"}
+
+        _write_requirements_yml(os.path.join(workspace, "docs", "reqstool"), "project-a-renamed")
+        _write_requirements_yml(os.path.join(workspace, "services", "svc-b"), "project-b")
+
+        counts = _count_reads(monkeypatch)
+        roots = discover_root_projects(workspace, cache=cache)
+        assert {p.urn for p in roots} == {"project-a-renamed", "project-b"}
+        # Only the workspace root (a new child) and the new directories are listed again
+        assert counts == {"scandir": 3, "parse": 2}
+
+
+def test_discovery_cache_ignores_unreadable_cache_file():
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as cache_dir:
+        _write_requirements_yml(os.path.join(tmp, "docs", "reqstool"), "my-project")
+        cache = DiscoveryCache(cache_dir)
+        discover_root_projects(tmp, cache=cache)
+        for name in os.listdir(cache_dir):
+            with open(os.path.join(cache_dir, name), "w") as f:
+                f.write("{not json")
+
+        assert [p.urn for p in discover_root_projects(tmp, cache=cache)] == ["my-project"]
@@ -1,6 +1,7 @@
 # Copyright © LFV
 
 import os
+import threading
 
 from reqstool.lsp.root_discovery import DiscoveredProject, discover_root_projects, _find_roots
 from reqstool.lsp.workspace_manager import WorkspaceManager, uri_to_path
@@ -118,6 +119,7 @@ def test_workspace_manager_add_folder(local_testdata_resources_rootdir_w_path):
     manager = WorkspaceManager()
     try:
         projects = manager.add_folder(folder_uri)
+        manager.wait_for_builds()
         assert len(projects) >= 1
         assert any(p.ready for p in projects)
         assert len(manager.all_projects()) >= 1
@@ -144,6 +146,7 @@ def test_workspace_manager_project_for_file(local_testdata_resources_rootdir_w_p
     manager = WorkspaceManager()
     try:
         manager.add_folder(folder_uri)
+        manager.wait_for_builds()
         req_file_uri = "file://" + os.path.join(workspace, "ms-001", "requirements.yml")
         project = manager.project_for_file(req_file_uri)
         assert project is not None
@@ -168,6 +171,7 @@ def test_workspace_manager_rebuild_all(local_testdata_resources_rootdir_w_path):
     try:
         manager.add_folder(folder_uri)
         manager.rebuild_all()
+        manager.wait_for_builds()
         assert any(p.ready for p in manager.all_projects())
     finally:
         manager.close_all()
@@ -176,3 +180,100 @@ def test_workspace_manager_rebuild_all(local_testdata_resources_rootdir_w_path):
 def test_workspace_manager_close_all_empty():
     manager = WorkspaceManager()
     manager.close_all()  # should not raise
+
+
+def test_workspace_manager_builds_in_background(local_testdata_resources_rootdir_w_path):
+    workspace = local_testdata_resources_rootdir_w_path("test_standard/baseline")
+    release = threading.Event()
+    finished = []
+    manager = WorkspaceManager(
+        on_build_started=lambda project: release.wait(5),
+        on_build_finished=lambda project, initial: finished.append((project, initial)),
+    )
+    try:
+        projects = manager.add_folder("file://" + workspace)
+        # add_folder() returned while the first build is still held up
+        assert not any(p.ready for p in projects)
+        release.set()
+        manager.wait_for_builds()
+        assert any(p.ready for p in projects)
+        assert {project for project, _ in finished} == set(projects)
+        assert all(initial for _, initial in finished)
+
+        finished.clear()
+        manager.rebuild_all()
+        manager.wait_for_builds()
+        assert [initial for _, initial in finished] == [False] * len(projects)
+    finally:
+        manager.close_all()
+
+
+def test_workspace_manager_supersedes_waiting_build(local_testdata_resources_rootdir_w_path):
+    workspace = local_testdata_resources_rootdir_w_path("test_standard/baseline")
+    started, release = threading.Event(), threading.Event()
+
+    def on_build_started(project):
+        started.set()
+        release.wait(5)
+
+    manager = WorkspaceManager(on_build_started=on_build_started)
+    try:
+        project = manager.add_folder("file://" + workspace)[0]
+        assert started.wait(5)
+        waiting = manager.schedule_build(project)
+        superseding = manager.schedule_build(project)
+        assert waiting.cancelled()
+        release.set()
+        manager.wait_for_builds()
+        assert superseding.done() and not superseding.cancelled()
+        assert project.ready
+    finally:
+        release.set()
+        manager.close_all()
+
+
+def test_workspace_manager_builds_projects_concurrently(local_testdata_resources_rootdir_w_path):
+    workspace_a = local_testdata_resources_rootdir_w_path("test_standard/baseline")
+    workspace_b = local_testdata_resources_rootdir_w_path("test_basic/baseline")
+    started = []
+    two_started = threading.Event()
+
+    def on_build_started(project):
+        # Each build waits until another one has started too
+        started.append(project)
+        if len(started) >= 2:
+            two_started.set()
+        two_started.wait(5)
+
+    manager = WorkspaceManager(on_build_started=on_build_started)
+    try:
+        projects = manager.add_folders(["file://" + workspace_a, "file://" + workspace_b])
+        assert manager.all_projects() == projects
+        manager.wait_for_builds()
+        assert two_started.is_set()
+        assert all(p.ready for p in projects)
+    finally:
+        manager.close_all()
+
+
+def test_workspace_manager_builds_one_project_at_a_time(local_testdata_resources_rootdir_w_path):
+    workspace = local_testdata_resources_rootdir_w_path("test_standard/baseline")
+    building = set()
+    overlapping = []
+
+    def on_build_started(project):
+        overlapping.append(project in building)
+        building.add(project)
+
+    manager = WorkspaceManager(
+        on_build_started=on_build_started, on_build_finished=lambda project, initial: building.discard(project)
+    )
+    try:
+        project = manager.add_folder("file://" + workspace)[0]
+        manager.schedule_build(project)
+        manager.schedule_build(project, full=True)
+        manager.wait_for_builds()
+        assert overlapping and not any(overlapping)
+        assert project.ready
+    finally:
+        manager.close_all()
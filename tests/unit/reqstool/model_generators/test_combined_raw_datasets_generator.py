@@ -2,6 +2,7 @@
 
 import contextlib
 import re
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -11,6 +12,7 @@ from reqstool.common.exceptions import CircularImplementationError, CircularImpo
 from reqstool.common.utils import TempDirectoryManager
 from reqstool.common.validator_error_holder import ValidationErrorHolder
 from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.common.validators.syntax_validator import SyntaxValidator, ValidationStrategy
 from reqstool.location_resolver.location_resolver import LocationResolver
 from reqstool.locations.git_location import GitLocation
 from reqstool.locations.local_location import LocalLocation
@@ -18,6 +20,9 @@ from reqstool.locations.maven_location import MavenLocation
 from reqstool.locations.pypi_location import PypiLocation
 from reqstool.model_generators import combined_raw_datasets_generator
 from reqstool.model_generators.combined_raw_datasets_generator import CombinedRawDatasetsGenerator
+from reqstool.model_generators.mvrs_model_generator import MVRsModelGenerator
+from reqstool.model_generators.svcs_model_generator import SVCsModelGenerator
+from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.models.raw_datasets import CombinedRawDataset
 
 
@@ -206,3 +211,153 @@ def test_tmpdir_suffix_remote_uses_location_type_prefix(tmp_path, location, expe
                 )
     assert len(captured_suffixes) >= 1, "get_suffix_path was never called"
     _assert_safe_suffix(captured_suffixes[0], expected_prefix, uri_fragment)
+
+
+def test_reusable_datasets_are_not_fetched_again(local_testdata_resources_rootdir_w_path):
+    location = LocalLocation(path=local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001"))
+    first = CombinedRawDatasetsGenerator(
+        initial_location=location,
+        semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+    ).combined_raw_datasets
+    reusable = {rd.location_key: rd for urn, rd in first.raw_datasets.items() if urn != "ms-001"}
+
+    with patch.object(
+        LocationResolver,
+        "make_available_on_localdisk",
+        wraps=LocationResolver.make_available_on_localdisk,
+        autospec=True,
+    ) as mock_fetch:
+        second = CombinedRawDatasetsGenerator(
+            initial_location=location,
+            semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+            reusable_datasets=reusable,
+        ).combined_raw_datasets
+
+    assert mock_fetch.call_count == 1
+    assert second.urn_parsing_order == first.urn_parsing_order
+    assert second.raw_datasets["sys-001"] is first.raw_datasets["sys-001"]
+    assert second.raw_datasets["ms-001"] is not first.raw_datasets["ms-001"]
+
+
+def test_location_key_ignores_tokens():
+    with_token = GitLocation(url="https://example.com/repo.git", ref="main", token="secret")
+    without_token = GitLocation(url="https://example.com/repo.git", ref="main")
+
+    assert CombinedRawDatasetsGenerator.location_key(with_token) == CombinedRawDatasetsGenerator.location_key(
+        without_token
+    )
+    assert "secret" not in CombinedRawDatasetsGenerator.location_key(with_token)
+
+
+def _generate(location, max_workers: int):
+    holder = ValidationErrorHolder()
+    crd = CombinedRawDatasetsGenerator(
+        initial_location=location,
+        semantic_validator=SemanticValidator(validation_error_holder=holder),
+        max_workers=max_workers,
+    ).combined_raw_datasets
+    return crd, [error.msg for error in holder.get_errors()]
+
+
+@pytest.mark.parametrize("initial", ["test_standard/baseline/ms-001", "test_standard/baseline/sys-001"])
+def test_concurrent_resolution_matches_serial(local_testdata_resources_rootdir_w_path, initial):
+    location = LocalLocation(path=local_testdata_resources_rootdir_w_path(initial))
+
+    serial, serial_errors = _generate(location, max_workers=1)
+    concurrent, concurrent_errors = _generate(location, max_workers=4)
+
+    assert concurrent.urn_parsing_order == serial.urn_parsing_order
+    assert dict(concurrent.parsing_graph) == dict(serial.parsing_graph)
+    assert concurrent.raw_datasets.keys() == serial.raw_datasets.keys()
+    assert concurrent_errors == serial_errors
+
+
+def test_sibling_sources_are_fetched_on_worker_threads(local_testdata_resources_rootdir_w_path):
+    fetching_threads = []
+    make_available = LocationResolver.make_available_on_localdisk
+
+    def recording_make_available(self, dst_path):
+        fetching_threads.append(threading.current_thread().name)
+        return make_available(self, dst_path)
+
+    with patch.object(LocationResolver, "make_available_on_localdisk", recording_make_available):
+        _generate(
+            LocalLocation(path=local_testdata_resources_rootdir_w_path("test_standard/baseline/sys-001")),
+            max_workers=4,
+        )
+
+    # sys-001 itself is parsed first on the calling thread; its imports and implementations are siblings
+    assert fetching_threads[0] == threading.current_thread().name
+    assert any(name.startswith("reqstool-fetch") for name in fetching_threads[1:])
+
+
+@SVCs("SVC_IMPORT_0002")
+def test_circular_import_raises_with_concurrent_resolution(local_testdata_resources_rootdir_w_path):
+    with pytest.raises(CircularImportError):
+        _generate(
+            LocalLocation(path=local_testdata_resources_rootdir_w_path("test_circular_import/node-a")),
+            max_workers=4,
+        )
+
+
+def test_pydantic_validation_parses_the_same_data(local_testdata_resources_rootdir_w_path):
+    location = LocalLocation(path=local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001"))
+    default = CombinedRawDatasetsGenerator(
+        initial_location=location,
+        semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+    ).combined_raw_datasets
+
+    with patch.object(SyntaxValidator, "is_valid_data", wraps=SyntaxValidator.is_valid_data) as is_valid_data:
+        pydantic_first = CombinedRawDatasetsGenerator(
+            initial_location=location,
+            semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+            parsing_config=ParsingConfig(validation_strategy=ValidationStrategy.PYDANTIC),
+        ).combined_raw_datasets
+
+    # Valid inputs never reach the JSON Schema (reqstool_config.yml has no generated model)
+    assert {c.kwargs["json_schema_type"].name for c in is_valid_data.call_args_list} <= {"REQSTOOL_CONFIG"}
+    assert pydantic_first.raw_datasets.keys() == default.raw_datasets.keys()
+    for urn, rd in default.raw_datasets.items():
+        other = pydantic_first.raw_datasets[urn]
+        assert other.requirements_data == rd.requirements_data
+        assert other.svcs_data == rd.svcs_data
+        assert other.mvrs_data == rd.mvrs_data
+        assert other.annotations_data == rd.annotations_data
+
+
+def _generate_ms001(local_testdata_resources_rootdir_w_path, max_file_workers: int) -> CombinedRawDataset:
+    return CombinedRawDatasetsGenerator(
+        initial_location=LocalLocation(path=local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001")),
+        semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+        max_workers=1,
+        max_file_workers=max_file_workers,
+    ).combined_raw_datasets
+
+
+def test_files_of_a_source_are_parsed_concurrently(local_testdata_resources_rootdir_w_path):
+    parsing_threads = []
+    svcs_init = SVCsModelGenerator.__init__
+
+    def recording_init(self, *args, **kwargs):
+        parsing_threads.append(threading.current_thread().name)
+        svcs_init(self, *args, **kwargs)
+
+    with patch.object(SVCsModelGenerator, "__init__", recording_init):
+        concurrent = _generate_ms001(local_testdata_resources_rootdir_w_path, max_file_workers=4)
+    serial = _generate_ms001(local_testdata_resources_rootdir_w_path, max_file_workers=1)
+
+    assert parsing_threads and all(name.startswith("reqstool-parse") for name in parsing_threads)
+    assert concurrent.raw_datasets.keys() == serial.raw_datasets.keys()
+    for urn, rd in serial.raw_datasets.items():
+        other = concurrent.raw_datasets[urn]
+        assert other.svcs_data == rd.svcs_data
+        assert other.mvrs_data == rd.mvrs_data
+        assert other.annotations_data == rd.annotations_data
+        assert other.automated_tests == rd.automated_tests
+        assert other.fingerprint == rd.fingerprint
+
+
+def test_failure_parsing_a_file_concurrently_is_raised(local_testdata_resources_rootdir_w_path):
+    with patch.object(MVRsModelGenerator, "__init__", side_effect=SystemExit(3)):
+        with pytest.raises(SystemExit):
+            _generate_ms001(local_testdata_resources_rootdir_w_path, max_file_workers=4)
@@ -4,6 +4,7 @@ import pytest
 
 from reqstool.common.models.urn_id import UrnId
 from reqstool.model_generators.mvrs_model_generator import MVRsModelGenerator
+from reqstool.model_generators.parsing_config import ParsingConfig
 
 MVRS_YML_FILE = "manual_verification_results.yml"
 URN = "ms-001"
@@ -35,3 +36,14 @@ def test_mvrs_model_generator(mvrs_model_generator: MVRsModelGenerator, resource
     ]
     assert model.results[UrnId(urn="ms-001", id="MVR_002")].comment == "Failed due..."
     assert model.results[UrnId(urn="ms-001", id="MVR_002")].passed is False
+
+
+def test_mvrs_model_generator_records_source_positions(local_testdata_resources_rootdir_w_path):
+    model = MVRsModelGenerator(
+        uri=local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001/manual_verification_results.yml"),
+        urn="ms-001",
+        parsing_config=ParsingConfig(include_line_numbers=True),
+    ).model
+
+    mvr = model.results[UrnId(urn="ms-001", id="MVR_201")]
+    assert (mvr.source_line, mvr.source_col_start, mvr.source_col_end) == (3, 8, 15)
@@ -9,6 +9,7 @@ from reqstool.common.models.urn_id import UrnId
 from reqstool.common.validator_error_holder import ValidationErrorHolder
 from reqstool.common.validators.semantic_validator import SemanticValidator
 from reqstool.locations.npm_location import NpmLocation
+from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.model_generators.requirements_model_generator import RequirementsModelGenerator
 from reqstool.models.requirements import CATEGORIES, SIGNIFICANCETYPES, VARIANTS
 
@@ -327,3 +328,25 @@ def test_requirements_model_generator_unset_env_var_raises(resource_funcname_roo
         )
 
     assert "REQSTOOL_TEST_MAVEN_VERSION" in str(exc_info.value)
+
+
+def test_requirements_model_generator_records_source_positions(local_testdata_resources_rootdir_w_path):
+    rmg = RequirementsModelGenerator(
+        parent=None,
+        filename=local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001/requirements.yml"),
+        semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+        parsing_config=ParsingConfig(include_line_numbers=True),
+    )
+
+    requirement = rmg.requirements_data.requirements[UrnId(urn="ms-001", id="REQ_010")]
+    assert (requirement.source_line, requirement.source_col_start, requirement.source_col_end) == (14, 8, 15)
+
+
+def test_requirements_model_generator_skips_source_positions_by_default(local_testdata_resources_rootdir_w_path):
+    rmg = RequirementsModelGenerator(
+        parent=None,
+        filename=local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001/requirements.yml"),
+        semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+    )
+
+    assert rmg.requirements_data.requirements[UrnId(urn="ms-001", id="REQ_010")].source_line is None
@@ -6,6 +6,7 @@ from reqstool.common.models.lifecycle import LIFECYCLESTATE
 from reqstool.common.models.urn_id import UrnId
 from reqstool.common.validator_error_holder import ValidationErrorHolder
 from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.model_generators.parsing_config import ParsingConfig
 from reqstool.model_generators.svcs_model_generator import SVCsModelGenerator
 from reqstool.models.svcs import VERIFICATIONPHASE, VERIFICATIONTYPES
 
@@ -79,3 +80,15 @@ def test_lifecycle_variable_model_generator(svcs_model_generator):
     assert cases[UrnId(urn="ms-001", id="SVC_003")].lifecycle.reason == "Reason for being obsolete"
     assert cases[UrnId(urn="ms-001", id="SVC_004")].lifecycle.state == LIFECYCLESTATE.DRAFT
     assert cases[UrnId(urn="ms-001", id="SVC_004")].lifecycle.reason == "Unnecessary reason"
+
+
+def test_svcs_model_generator_records_source_positions(local_testdata_resources_rootdir_w_path):
+    model = SVCsModelGenerator(
+        uri=local_testdata_resources_rootdir_w_path("test_standard/baseline/ms-001/software_verification_cases.yml"),
+        semantic_validator=SemanticValidator(validation_error_holder=ValidationErrorHolder()),
+        urn="ms-001",
+        parsing_config=ParsingConfig(include_line_numbers=True),
+    ).model
+
+    svc = model.cases[UrnId(urn="ms-001", id="SVC_010")]
+    assert (svc.source_line, svc.source_col_start, svc.source_col_end) == (10, 8, 15)
@@ -2,6 +2,7 @@
 
 import logging
 import re
+from unittest.mock import patch
 
 import pytest
 from reqstool_python_decorators.decorators.decorators import SVCs
@@ -96,3 +97,90 @@ def test_testdata_model_generator(local_testdata_resources_rootdir_w_path):
     )
 
     assert tdmg is not None
+
+
+JUNIT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+  <testsuite name="{classname}">
+    <properties><property name="java.version" value="21"/></properties>
+    <testcase name="passes" classname="{classname}"><system-out>{output}</system-out></testcase>
+    <testcase name="fails" classname="{classname}"><failure message="boom">trace</failure></testcase>
+    <testcase name="isSkipped" classname="{classname}"><skipped/></testcase>
+    <testsuite name="nested">
+      <testcase name="param(int)[1]" classname="{classname}"/>
+      <testcase name="param(int)[2]" classname="{classname}"><failure/></testcase>
+      <testcase name="[1] display name" classname="{classname}"/>
+    </testsuite>
+  </testsuite>
+</testsuites>
+"""
+
+
+def _write_junit_files(tmp_path, count: int) -> list:
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"TEST-com.example.Suite{i}.xml"
+        path.write_text(JUNIT_XML.format(classname=f"com.example.Suite{i}", output="x" * 1000))
+        paths.append(path)
+    return paths
+
+
+def _statuses(tdmg: TestDataModelGenerator) -> dict:
+    return {str(urn_id.id): test_data.status for urn_id, test_data in tdmg.model.tests.items()}
+
+
+def test_streamed_report(tmp_path, caplog):
+    (path,) = _write_junit_files(tmp_path, 1)
+
+    with caplog.at_level(logging.WARNING):
+        tdmg = TestDataModelGenerator(test_result_files=[path], urn="test")
+
+    assert _statuses(tdmg) == {
+        "com.example.Suite0.passes": TEST_RUN_STATUS.PASSED,
+        "com.example.Suite0.fails": TEST_RUN_STATUS.FAILED,
+        "com.example.Suite0.isSkipped": TEST_RUN_STATUS.SKIPPED,
+        "com.example.Suite0.param": TEST_RUN_STATUS.FAILED,
+    }
+    assert any("display-name-only" in message for message in caplog.messages)
+
+
+def test_missing_file_is_skipped(tmp_path, caplog):
+    with caplog.at_level(logging.WARNING):
+        tdmg = TestDataModelGenerator(test_result_files=[tmp_path / "TEST-missing.xml"], urn="test")
+
+    assert tdmg.model.tests == {}
+    assert any("did not exist" in message for message in caplog.messages)
+
+
+def test_many_reports_are_parsed_in_worker_processes(tmp_path, caplog):
+    paths = _write_junit_files(tmp_path, 3)
+    serial = TestDataModelGenerator(test_result_files=paths, urn="test", max_workers=1)
+    caplog.clear()
+
+    with (
+        patch.object(TestDataModelGenerator, "PARALLEL_MIN_BYTES", 0),
+        patch("reqstool.model_generators.testdata_model_generator.os.process_cpu_count", return_value=2),
+        patch("reqstool.model_generators.testdata_model_generator.ProcessPoolExecutor") as executor,
+    ):
+        executor.return_value.__enter__.return_value.map.side_effect = map
+        with caplog.at_level(logging.WARNING):
+            parallel = TestDataModelGenerator(test_result_files=paths, urn="test", max_workers=4)
+
+    assert executor.call_args.kwargs["max_workers"] == 2
+    assert parallel.model.tests == serial.model.tests
+    # Warnings found by the workers are logged by the calling process
+    assert sum("display-name-only" in message for message in caplog.messages) == 3
+
+
+def test_worker_processes_return_the_same_results(tmp_path):
+    paths = _write_junit_files(tmp_path, 2)
+
+    with (
+        patch.object(TestDataModelGenerator, "PARALLEL_MIN_BYTES", 0),
+        patch("reqstool.model_generators.testdata_model_generator.os.process_cpu_count", return_value=2),
+    ):
+        parallel = TestDataModelGenerator(test_result_files=paths, urn="test")
+
+    assert (
+        parallel.model.tests == TestDataModelGenerator(test_result_files=paths, urn="test", max_workers=1).model.tests
+    )
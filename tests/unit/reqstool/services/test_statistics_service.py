@@ -14,7 +14,16 @@ from reqstool.models.requirements import (
 )
 from reqstool.models.svcs import SVCData, VERIFICATIONPHASE, VERIFICATIONTYPES
 from reqstool.models.test_data import TEST_RUN_STATUS
-from reqstool.services.statistics_service import StatisticsService, TestStats, compute_requirement_status
+from reqstool.common.validator_error_holder import ValidationErrorHolder
+from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.locations.local_location import LocalLocation
+from reqstool.services.statistics_service import (
+    StatisticsService,
+    TestStats,
+    compute_requirement_status,
+    compute_requirement_statuses,
+)
+from reqstool.storage.pipeline import build_database
 from reqstool.storage.database import RequirementsDatabase
 from reqstool.storage.requirements_repository import RequirementsRepository
 
@@ -691,3 +700,80 @@ def test_post_build_manual_test_svc_gates_when_include_post_build_true(db):
     req_status = stats.requirement_statistics[REQ_ID]
     assert req_status.manual_tests.passed == 1
     assert req_status.completed is True
+
+
+# -- compute_requirement_statuses (set-based) --
+
+
+def _assert_bulk_matches_scoped(repo, include_post_build):
+    reqs = repo.get_all_requirements()
+    bulk = compute_requirement_statuses(repo, include_post_build=include_post_build)
+    assert set(bulk) == set(reqs)
+    for urn_id, req in reqs.items():
+        assert bulk[urn_id] == compute_requirement_status(req, repo, include_post_build=include_post_build)
+
+
+@pytest.mark.parametrize("include_post_build", [False, True])
+def test_compute_requirement_statuses_matches_scoped_path(db, include_post_build):
+    req_2 = UrnId(urn=URN, id="REQ_002")
+    req_3 = UrnId(urn=URN, id="REQ_003")
+    svc_2 = UrnId(urn=URN, id="SVC_002")
+    svc_3 = UrnId(urn=URN, id="SVC_003")
+    svc_4 = UrnId(urn=URN, id="SVC_004")
+    _insert_req(db)
+    _insert_req(db, req_id=req_2)
+    _insert_req(db, req_id=req_3, implementation=IMPLEMENTATION.NOT_APPLICABLE)
+    _insert_svc(db, verification=VERIFICATIONTYPES.AUTOMATED_TEST)
+    _insert_svc(db, svc_id=svc_2, req_ids=[REQ_ID, req_2], verification=VERIFICATIONTYPES.MANUAL_TEST)
+    _insert_svc(db, svc_id=svc_3, req_ids=[req_2], phase=VERIFICATIONPHASE.POST_BUILD)
+    _insert_svc(db, svc_id=svc_4, req_ids=[req_3], verification=VERIFICATIONTYPES.MANUAL_TEST)
+    db.insert_annotation_impl(REQ_ID, AnnotationData(element_kind="METHOD", fully_qualified_name="com.example.Foo.bar"))
+    db.insert_annotation_test(SVC_ID, AnnotationData(element_kind="CLASS", fully_qualified_name="com.example.FooTest"))
+    db.insert_annotation_test(SVC_ID, AnnotationData(element_kind="METHOD", fully_qualified_name="com.example.X.y"))
+    db.insert_annotation_test(svc_3, AnnotationData(element_kind="CLASS", fully_qualified_name="com.example.None"))
+    db.insert_test_result(URN, "com.example.FooTest.testA", TEST_RUN_STATUS.PASSED)
+    db.insert_test_result(URN, "com.example.FooTest.testB", TEST_RUN_STATUS.FAILED)
+    db.insert_test_result(URN, "com.example.X.y", TEST_RUN_STATUS.SKIPPED)
+    _insert_mvr(db, mvr_id=UrnId(urn=URN, id="MVR_001"), svc_ids=[svc_2], passed=False)
+    _insert_mvr(db, mvr_id=UrnId(urn=URN, id="MVR_002"), svc_ids=[svc_4], passed=True)
+    db.commit()
+
+    _assert_bulk_matches_scoped(RequirementsRepository(db), include_post_build)
+
+
+@pytest.mark.parametrize("include_post_build", [False, True])
+@pytest.mark.parametrize("dataset", ["test_standard/baseline/ms-001", "test_basic/baseline/ms-101"])
+def test_compute_requirement_statuses_matches_scoped_path_on_datasets(
+    local_testdata_resources_rootdir_w_path, dataset, include_post_build
+):
+    semantic_validator = SemanticValidator(validation_error_holder=ValidationErrorHolder())
+    with build_database(
+        location=LocalLocation(path=local_testdata_resources_rootdir_w_path(dataset)),
+        semantic_validator=semantic_validator,
+    ) as (database, _):
+        _assert_bulk_matches_scoped(RequirementsRepository(database), include_post_build)
+
+
+def test_compute_requirement_statuses_query_count_independent_of_requirement_count(db):
+    def count_statements(n):
+        database = RequirementsDatabase()
+        try:
+            for i in range(n):
+                req_id = UrnId(urn=URN, id=f"REQ_{i:03}")
+                svc_id = UrnId(urn=URN, id=f"SVC_{i:03}")
+                _insert_req(database, req_id=req_id)
+                _insert_svc(database, svc_id=svc_id, req_ids=[req_id])
+                database.insert_annotation_test(
+                    svc_id, AnnotationData(element_kind="METHOD", fully_qualified_name=f"t.T.test_{i}")
+                )
+            database.commit()
+            repo = RequirementsRepository(database)
+            reqs = list(repo.get_all_requirements().values())
+            statements: list[str] = []
+            database.connection.set_trace_callback(statements.append)
+            compute_requirement_statuses(repo, reqs)
+            return len(statements)
+        finally:
+            database.close()
+
+    assert count_statements(2) == count_statements(20)
@@ -3,8 +3,9 @@
 import pytest
 
 from reqstool.common.models.urn_id import UrnId
-from reqstool.models.annotations import AnnotationData
-from reqstool.models.mvrs import MVRData
+from reqstool.models.annotations import AnnotationData, AnnotationsData
+from reqstool.models.mvrs import MVRData, MVRsData
+from reqstool.models.raw_datasets import RawDataset
 from reqstool.models.requirements import (
     CATEGORIES,
     IMPLEMENTATION,
@@ -13,9 +14,10 @@ from reqstool.models.requirements import (
     MetaData,
     ReferenceData,
     RequirementData,
+    RequirementsData,
 )
-from reqstool.models.svcs import SVCData, VERIFICATIONTYPES
-from reqstool.models.test_data import TEST_RUN_STATUS
+from reqstool.models.svcs import SVCData, SVCsData, VERIFICATIONTYPES
+from reqstool.models.test_data import TEST_RUN_STATUS, TestData, TestsData
 from reqstool.storage.database import RequirementsDatabase
 
 
@@ -494,3 +496,187 @@ def test_insert_requirement_new_implementation_type_accepted(db, impl_type):
     db.commit()
     row = db.connection.execute("SELECT implementation FROM requirements WHERE urn='ms-001' AND id='REQ_NC'").fetchone()
     assert row[0] == impl_type
+
+
+# -- Bulk insert --
+
+_ALL_TABLES = [
+    "requirements",
+    "requirement_categories",
+    "requirement_references",
+    "svcs",
+    "svc_requirement_links",
+    "mvrs",
+    "mvr_svc_links",
+    "annotations_impls",
+    "annotations_tests",
+    "test_results",
+    "parsing_graph",
+    "urn_metadata",
+]
+
+
+def _raw_dataset(urn, requirements=(), svcs=(), mvrs=(), impls=None, tests=None, results=None):
+    return RawDataset(
+        requirements_data=RequirementsData(
+            metadata=MetaData(urn=urn, variant=VARIANTS.MICROSERVICE, title=f"Title {urn}"),
+            requirements={r.id: r for r in requirements},
+        ),
+        svcs_data=SVCsData(cases={s.id: s for s in svcs}),
+        mvrs_data=MVRsData(results={m.id: m for m in mvrs}),
+        annotations_data=AnnotationsData(implementations=impls or {}, tests=tests or {}),
+        automated_tests=TestsData(tests=results or {}),
+    )
+
+
+def _dump(database):
+    return {
+        table: sorted(tuple(row) for row in database.connection.execute(f"SELECT * FROM {table}"))  # noqa: S608
+        for table in _ALL_TABLES
+    }
+
+
+@pytest.fixture
+def two_urn_datasets(sample_requirement, sample_svc, sample_mvr):
+    sys_req = RequirementData(
+        id=UrnId(urn="sys-001", id="REQ_100"),
+        title="System requirement",
+        significance=SIGNIFICANCETYPES.SHALL,
+        description="Imported",
+        revision="1.0.0",
+    )
+    # ms-001 links to a requirement of sys-001, which comes later in the batch
+    cross_urn_svc = SVCData(
+        id=UrnId(urn="ms-001", id="SVC_002"),
+        title="Cross-URN SVC",
+        verification=VERIFICATIONTYPES.MANUAL_TEST,
+        revision="1.0.0",
+        requirement_ids=[sys_req.id, UrnId(urn="ms-001", id="REQ_404")],
+    )
+    ms = _raw_dataset(
+        "ms-001",
+        requirements=[sample_requirement],
+        svcs=[sample_svc, cross_urn_svc],
+        mvrs=[sample_mvr],
+        impls={sample_requirement.id: [AnnotationData(element_kind="METHOD", fully_qualified_name="a.B.c")]},
+        tests={
+            sample_svc.id: [AnnotationData(element_kind="CLASS", fully_qualified_name="a.BTest")],
+            UrnId(urn="ms-001", id="SVC_404"): [AnnotationData(element_kind="CLASS", fully_qualified_name="x.Y")],
+        },
+        results={
+            UrnId(urn="ms-001", id="a.BTest.t"): TestData(
+                fully_qualified_name="a.BTest.t", status=TEST_RUN_STATUS.PASSED
+            )
+        },
+    )
+    sys = _raw_dataset("sys-001", requirements=[sys_req])
+    return [("ms-001", ms), ("sys-001", sys)], {"ms-001": [("sys-001", "import")]}
+
+
+def _insert_entities_row_by_row(database, datasets):
+    for urn, rd in datasets:
+        database.insert_urn_metadata(rd.requirements_data.metadata)
+    for urn, rd in datasets:
+        for req in rd.requirements_data.requirements.values():
+            database.insert_requirement(urn, req)
+    for urn, rd in datasets:
+        for svc in rd.svcs_data.cases.values():
+            database.insert_svc(urn, svc)
+    for urn, rd in datasets:
+        for mvr in rd.mvrs_data.results.values():
+            database.insert_mvr(urn, mvr)
+
+
+def _insert_annotations_row_by_row(database, datasets):
+    for _, rd in datasets:
+        for req_urn_id, annotations in rd.annotations_data.implementations.items():
+            for annotation in annotations:
+                database.insert_annotation_impl(req_urn_id, annotation)
+        for svc_urn_id, annotations in rd.annotations_data.tests.items():
+            for annotation in annotations:
+                database.insert_annotation_test(svc_urn_id, annotation)
+        for test_urn_id, test_data in rd.automated_tests.tests.items():
+            database.insert_test_result(test_urn_id.urn, test_data.fully_qualified_name, test_data.status)
+
+
+def test_bulk_insert_matches_single_row_inserts(two_urn_datasets):
+    datasets, graph = two_urn_datasets
+
+    with RequirementsDatabase() as expected:
+        _insert_entities_row_by_row(expected, datasets)
+        _insert_annotations_row_by_row(expected, datasets)
+        expected.insert_parsing_graph_edge("ms-001", "sys-001", "import")
+        expected_rows = _dump(expected)
+
+    with RequirementsDatabase(defer_indexes=True) as bulk:
+        bulk.insert_raw_datasets(datasets, parsing_graph=graph)
+        assert _dump(bulk) == expected_rows
+
+    assert ("ms-001", "SVC_002", "sys-001", "REQ_100") in expected_rows["svc_requirement_links"]
+
+
+def test_bulk_insert_skips_and_warns_about_dangling_links(two_urn_datasets, caplog):
+    datasets, graph = two_urn_datasets
+
+    with RequirementsDatabase() as bulk:
+        bulk.insert_raw_datasets(datasets, parsing_graph=graph)
+
+    assert "SVC ms-001:SVC_002 references non-existent requirement ms-001:REQ_404" in caplog.text
+    assert "Annotation test references non-existent SVC ms-001:SVC_404" in caplog.text
+
+
+def test_bulk_insert_creates_deferred_indexes(two_urn_datasets):
+    datasets, graph = two_urn_datasets
+
+    def index_names(database):
+        return {row["name"] for row in database.connection.execute("PRAGMA index_list(test_results)")}
+
+    with RequirementsDatabase(defer_indexes=True) as bulk:
+        assert "idx_test_results_fqn" not in index_names(bulk)
+        bulk.insert_raw_datasets(datasets, parsing_graph=graph)
+        assert "idx_test_results_fqn" in index_names(bulk)
+
+
+def test_bulk_insert_restores_pragmas_and_foreign_keys(two_urn_datasets):
+    datasets, graph = two_urn_datasets
+
+    with RequirementsDatabase() as bulk:
+        before = (
+            bulk.connection.execute("PRAGMA journal_mode").fetchone()[0],
+            bulk.connection.execute("PRAGMA synchronous").fetchone()[0],
+        )
+        bulk.insert_raw_datasets(datasets, parsing_graph=graph)
+        after = (
+            bulk.connection.execute("PRAGMA journal_mode").fetchone()[0],
+            bulk.connection.execute("PRAGMA synchronous").fetchone()[0],
+        )
+        assert after == before
+        assert bulk.connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert bulk.connection.execute("PRAGMA defer_foreign_keys").fetchone()[0] == 0
+
+
+def test_bulk_insert_numbers_urn_metadata_in_order(two_urn_datasets):
+    datasets, graph = two_urn_datasets
+
+    with RequirementsDatabase() as bulk:
+        bulk.insert_raw_datasets(datasets, parsing_graph=graph)
+        bulk.insert_urn_metadata(MetaData(urn="ext-001", variant=VARIANTS.EXTERNAL, title="Later"))
+        rows = bulk.connection.execute("SELECT urn, parse_position FROM urn_metadata ORDER BY parse_position")
+
+        assert [tuple(row) for row in rows] == [("ms-001", 0), ("sys-001", 1), ("ext-001", 2)]
+
+
+# -- Copy --
+
+
+def test_copy_is_independent_of_the_original(db, sample_requirement):
+    db.insert_requirement("ms-001", sample_requirement)
+    db.commit()
+
+    with db.copy() as copy:
+        copy.insert_test_result("ms-001", "com.example.FooTest.test_bar", TEST_RUN_STATUS.PASSED)
+        assert copy.connection.execute("SELECT COUNT(*) FROM requirements").fetchone()[0] == 1
+        assert copy.connection.execute("SELECT COUNT(*) FROM test_results").fetchone()[0] == 1
+
+    assert db.connection.execute("SELECT COUNT(*) FROM test_results").fetchone()[0] == 0
+    assert db.connection.execute("SELECT COUNT(*) FROM requirements").fetchone()[0] == 1
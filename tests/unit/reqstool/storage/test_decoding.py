@@ -0,0 +1,35 @@
+# Copyright © LFV
+
+from packaging.version import Version
+
+from reqstool.models.requirements import SIGNIFICANCETYPES
+from reqstool.models.test_data import TEST_RUN_STATUS
+from reqstool.storage.decoding import (
+    REVISION_CACHE_SIZE,
+    SIGNIFICANCE_BY_VALUE,
+    TEST_STATUS_BY_VALUE,
+    decode_revision,
+)
+
+
+def test_tables_decode_every_member():
+    assert {SIGNIFICANCE_BY_VALUE[member.value] for member in SIGNIFICANCETYPES} == set(SIGNIFICANCETYPES)
+    assert TEST_STATUS_BY_VALUE["missing"] is TEST_RUN_STATUS.MISSING
+
+
+def test_revisions_are_parsed_once_and_shared():
+    decode_revision.cache_clear()
+
+    first = decode_revision("2.0.1")
+    assert first == Version("2.0.1")
+    assert decode_revision("2.0.1") is first
+    assert decode_revision.cache_info().hits == 1
+
+
+def test_revision_cache_is_bounded():
+    decode_revision.cache_clear()
+
+    for patch in range(REVISION_CACHE_SIZE + 10):
+        decode_revision(f"1.0.{patch}")
+
+    assert decode_revision.cache_info().currsize == REVISION_CACHE_SIZE
@@ -0,0 +1,58 @@
+# Copyright © LFV
+
+import dataclasses
+
+import pytest
+from packaging.version import Version
+
+from reqstool.common.models.lifecycle import LIFECYCLESTATE
+from reqstool.common.models.urn_id import UrnId
+from reqstool.models.requirements import IMPLEMENTATION, SIGNIFICANCETYPES
+from reqstool.storage.records import LifecycleRecord, RequirementRecord, lifecycle_record
+
+
+def _record(revision_text: str = "1.2.3") -> RequirementRecord:
+    return RequirementRecord(
+        id=UrnId(urn="ms-001", id="REQ_001"),
+        title="Requirement",
+        significance=SIGNIFICANCETYPES.SHALL,
+        description="Desc",
+        rationale=None,
+        revision_text=revision_text,
+        lifecycle=lifecycle_record("effective", None),
+        implementation=IMPLEMENTATION.IN_CODE,
+        categories=[],
+        references=[],
+    )
+
+
+def test_revision_is_parsed_once_on_first_access():
+    record = _record()
+
+    assert record._revision is None
+    revision = record.revision
+    assert revision == Version("1.2.3")
+    assert (revision.major, revision.minor, revision.micro) == (1, 2, 3)
+    assert record.revision is revision
+
+
+def test_parsed_revision_does_not_affect_equality():
+    parsed = _record()
+    parsed.revision
+
+    assert parsed == _record()
+
+
+def test_records_are_immutable_and_slotted():
+    record = _record()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        record.title = "Other"
+    assert not hasattr(record, "__dict__")
+
+
+def test_lifecycles_without_reason_are_shared():
+    assert lifecycle_record("draft", None) is lifecycle_record("draft", None)
+    assert lifecycle_record("deprecated", "Replaced") == LifecycleRecord(
+        state=LIFECYCLESTATE.DEPRECATED, reason="Replaced"
+    )
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 import pytest
+from packaging.version import Version
 from reqstool.common.models.lifecycle import LIFECYCLESTATE
 from reqstool.common.models.urn_id import UrnId
 from reqstool.models.annotations import AnnotationData
@@ -18,6 +19,7 @@ from reqstool.models.requirements import (
 from reqstool.models.svcs import SVCData, VERIFICATIONPHASE, VERIFICATIONTYPES
 from reqstool.models.test_data import TEST_RUN_STATUS
 from reqstool.storage.database import RequirementsDatabase
+from reqstool.storage.records import MVRRecord, RequirementRecord, SVCRecord
 from reqstool.storage.requirements_repository import RequirementsRepository
 
 
@@ -201,6 +203,44 @@ def test_get_all_mvrs(db):
     assert SVC_ID in mvrs[MVR_ID].svc_ids
 
 
+def _count_statements(db, fn):
+    statements: list[str] = []
+    db.connection.set_trace_callback(statements.append)
+    try:
+        fn()
+    finally:
+        db.connection.set_trace_callback(None)
+    return len(statements)
+
+
+def test_get_all_entities_query_count_independent_of_row_count(db):
+    for i in range(1, 6):
+        _insert_requirement(db, UrnId(urn=URN, id=f"REQ_{i:03}"))
+    for i in range(1, 6):
+        _insert_svc(db, UrnId(urn=URN, id=f"SVC_{i:03}"))
+    for i in range(1, 6):
+        _insert_mvr(db, UrnId(urn=URN, id=f"MVR_{i:03}"))
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    assert _count_statements(db, repo.get_all_requirements) == 3
+    assert _count_statements(db, repo.get_all_svcs) == 2
+    assert _count_statements(db, repo.get_all_mvrs) == 2
+
+
+def test_get_all_requirements_filtered_children_stay_scoped(db):
+    other = UrnId(urn="ms-002", id="REQ_001")
+    _insert_requirement(db, REQ_ID)
+    _insert_requirement(db, other)
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    reqs = repo.get_all_requirements(urn=URN)
+    assert list(reqs) == [REQ_ID]
+    assert reqs[REQ_ID].categories == [CATEGORIES.FUNCTIONAL_SUITABILITY]
+    assert reqs[REQ_ID].references[0].requirement_ids == {UrnId(urn="sys-001", id="REQ_100")}
+
+
 # -- Index/lookup queries --
 
 
@@ -224,6 +264,70 @@ def test_get_svc_not_found(db):
     assert repo.get_svc(SVC_ID) is None
 
 
+def test_get_requirement(db):
+    _insert_requirement(db)
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    req = repo.get_requirement(REQ_ID)
+    assert req is not None
+    assert req.id == REQ_ID
+    assert req.categories == [CATEGORIES.FUNCTIONAL_SUITABILITY]
+
+
+def test_get_requirement_not_found(db):
+    repo = RequirementsRepository(db)
+    assert repo.get_requirement(REQ_ID) is None
+
+
+def test_get_mvr(db):
+    _insert_requirement(db)
+    _insert_svc(db)
+    _insert_mvr(db)
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    mvr = repo.get_mvr(MVR_ID)
+    assert mvr is not None
+    assert mvr.svc_ids == [SVC_ID]
+    assert repo.get_mvr(UrnId(urn=URN, id="MVR_999")) is None
+
+
+def test_get_requirements_batch_skips_unknown_ids(db):
+    _insert_requirement(db, REQ_ID)
+    _insert_requirement(db, REQ_ID_2)
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    reqs = repo.get_requirements([REQ_ID_2, UrnId(urn=URN, id="REQ_999"), REQ_ID_2])
+    assert list(reqs) == [REQ_ID_2]
+    assert reqs[REQ_ID_2].references[0].requirement_ids == {UrnId(urn="sys-001", id="REQ_100")}
+    assert repo.get_requirements([]) == {}
+
+
+def test_get_requirements_batch_larger_than_one_chunk(db):
+    ids = [UrnId(urn=URN, id=f"REQ_{i:04}") for i in range(1000)]
+    for urn_id in ids:
+        _insert_requirement(db, urn_id)
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    assert set(repo.get_requirements(ids)) == set(ids)
+
+
+def test_get_svcs_and_mvrs_batch(db):
+    _insert_requirement(db)
+    _insert_svc(db, SVC_ID)
+    _insert_svc(db, SVC_ID_2)
+    _insert_mvr(db)
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    assert set(repo.get_svcs([SVC_ID, SVC_ID_2])) == {SVC_ID, SVC_ID_2}
+    assert repo.get_svcs([SVC_ID_2])[SVC_ID_2].requirement_ids == [REQ_ID]
+    assert repo.get_mvrs([MVR_ID])[MVR_ID].svc_ids == [SVC_ID]
+
+
 def test_get_svcs_for_req(db):
     _insert_requirement(db)
     _insert_svc(db, SVC_ID, req_ids=[REQ_ID])
@@ -347,6 +451,36 @@ def test_get_test_results_for_annotations_class(db):
     assert results[0].status == TEST_RUN_STATUS.FAILED
 
 
+def test_get_test_results_for_annotations_class_excludes_sibling_prefixes(db):
+    _insert_requirement(db)
+    _insert_svc(db)
+    ann = AnnotationData(element_kind="CLASS", fully_qualified_name="com.example.FooTest")
+    db.insert_annotation_test(SVC_ID, ann)
+    db.insert_test_result(URN, "com.example.FooTest.testA", TEST_RUN_STATUS.PASSED)
+    db.insert_test_result(URN, "com.example.FooTestExtra.testB", TEST_RUN_STATUS.FAILED)
+    db.insert_test_result(URN, "com.example.FooTest-1.testC", TEST_RUN_STATUS.FAILED)
+    db.insert_test_result(URN, "com.example.footest.testD", TEST_RUN_STATUS.FAILED)
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    results = repo.get_test_results_for_annotations(URN, [ann])
+    assert results[0].status == TEST_RUN_STATUS.PASSED
+    # The bulk path must not pick up the failed FooTestExtra, FooTest-1 and footest rows either
+    assert [(t.fully_qualified_name, t.status) for t in repo.get_test_results_by_svc()[SVC_ID]] == [
+        ("com.example.FooTest", TEST_RUN_STATUS.PASSED)
+    ]
+
+
+def test_class_test_result_lookup_uses_fqn_index(db):
+    plan = db.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT status FROM test_results WHERE fqn = ? OR (fqn >= ? AND fqn < ?)",
+        ("a.B", "a.B.", "a.B/"),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_test_results_fqn" in details
+    assert "SCAN test_results" not in details
+
+
 def test_get_test_results_for_svc_delegates_to_annotations(db):
     """get_test_results_for_svc must produce the same results as resolving its own
     annotations through get_test_results_for_annotations (it's a thin wrapper)."""
@@ -437,6 +571,77 @@ def test_get_automated_test_results_class_no_results(db):
     assert results[key][0].status == TEST_RUN_STATUS.MISSING
 
 
+# -- Set-based verdict inputs --
+
+
+def test_get_svc_ids_by_req(db):
+    _insert_requirement(db, REQ_ID)
+    _insert_requirement(db, REQ_ID_2)
+    _insert_svc(db, SVC_ID, req_ids=[REQ_ID, REQ_ID_2])
+    _insert_svc(db, SVC_ID_2, req_ids=[REQ_ID])
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    assert repo.get_svc_ids_by_req() == {REQ_ID: [SVC_ID, SVC_ID_2], REQ_ID_2: [SVC_ID]}
+
+
+def test_get_mvr_ids_by_svc(db):
+    _insert_requirement(db)
+    _insert_svc(db, SVC_ID)
+    _insert_svc(db, SVC_ID_2)
+    _insert_mvr(db, MVR_ID, svc_ids=[SVC_ID, SVC_ID_2])
+    _insert_mvr(db, UrnId(urn=URN, id="MVR_002"), svc_ids=[SVC_ID])
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    assert repo.get_mvr_ids_by_svc() == {SVC_ID: [MVR_ID, UrnId(urn=URN, id="MVR_002")], SVC_ID_2: [MVR_ID]}
+
+
+def test_get_annotations_impl_counts(db):
+    _insert_requirement(db, REQ_ID)
+    _insert_requirement(db, REQ_ID_2)
+    db.insert_annotation_impl(REQ_ID, AnnotationData(element_kind="METHOD", fully_qualified_name="a.B.c"))
+    db.insert_annotation_impl(REQ_ID, AnnotationData(element_kind="CLASS", fully_qualified_name="a.B"))
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    assert repo.get_annotations_impl_counts() == {REQ_ID: 2}
+
+
+def test_get_effective_mvr_verdicts_latest_wins(db):
+    _insert_requirement(db)
+    _insert_svc(db, SVC_ID)
+    _insert_svc(db, SVC_ID_2)
+    _insert_mvr_dated(db, UrnId(urn=URN, id="MVR_A"), [SVC_ID], passed=True, date_iso="2024-01-01T00:00:00+00:00")
+    _insert_mvr_dated(db, UrnId(urn=URN, id="MVR_B"), [SVC_ID], passed=False, date_iso="2024-06-01T00:00:00+00:00")
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    assert repo.get_effective_mvr_verdicts() == {SVC_ID: False}
+
+
+def test_get_test_results_by_svc_matches_per_svc_resolution(db):
+    _insert_requirement(db)
+    _insert_svc(db, SVC_ID)
+    _insert_svc(db, SVC_ID_2)
+    db.insert_annotation_test(SVC_ID, AnnotationData(element_kind="CLASS", fully_qualified_name="com.example.FooTest"))
+    db.insert_annotation_test(SVC_ID, AnnotationData(element_kind="METHOD", fully_qualified_name="com.example.Bar.t"))
+    db.insert_annotation_test(SVC_ID_2, AnnotationData(element_kind="CLASS", fully_qualified_name="com.example.None"))
+    db.insert_test_result(URN, "com.example.FooTest.test_a", TEST_RUN_STATUS.PASSED)
+    db.insert_test_result(URN, "com.example.FooTest.test_b", TEST_RUN_STATUS.PASSED)
+    db.insert_test_result(URN, "com.example.Bar.t", TEST_RUN_STATUS.FAILED)
+    db.commit()
+
+    repo = RequirementsRepository(db)
+    by_svc = repo.get_test_results_by_svc()
+    for svc_id in (SVC_ID, SVC_ID_2):
+        expected = repo.get_test_results_for_svc(svc_id)
+        assert sorted(by_svc[svc_id], key=lambda t: t.fully_qualified_name) == sorted(
+            expected, key=lambda t: t.fully_qualified_name
+        )
+    assert [t.status for t in by_svc[SVC_ID_2]] == [TEST_RUN_STATUS.MISSING]
+
+
 # -- URN location queries --
 
 
@@ -618,3 +823,24 @@ def test_svc_phase_round_trip(db, phase):
     repo = RequirementsRepository(db)
     svcs = repo.get_all_svcs()
     assert svcs[SVC_ID].phase is phase
+
+
+# -- Read models --
+
+
+def test_entities_are_returned_as_records(db):
+    _setup_metadata(db)
+    _insert_requirement(db)
+    _insert_svc(db)
+    _insert_mvr(db)
+    db.commit()
+    repo = RequirementsRepository(db)
+
+    req = repo.get_requirement(REQ_ID)
+    assert isinstance(req, RequirementRecord)
+    assert req.revision_text == "1.0.0"
+    assert req.revision == Version("1.0.0")
+    assert req.lifecycle.state == LIFECYCLESTATE.EFFECTIVE
+    assert req.references[0].requirement_ids == {UrnId(urn="sys-001", id="REQ_100")}
+    assert isinstance(repo.get_svc(SVC_ID), SVCRecord)
+    assert isinstance(repo.get_mvr(MVR_ID), MVRRecord)
@@ -0,0 +1,153 @@
+# Copyright © LFV
+
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from reqstool.common.validator_error_holder import ValidationError, ValidationErrorHolder
+from reqstool.common.validators.semantic_validator import SemanticValidator
+from reqstool.locations.git_location import GitLocation
+from reqstool.locations.local_location import LocalLocation
+from reqstool.model_generators.combined_raw_datasets_generator import CombinedRawDatasetsGenerator
+from reqstool.model_generators.parsing_config import ParsingConfig
+from reqstool.models.raw_datasets import CombinedRawDataset, RawDataset
+from reqstool.storage.database import RequirementsDatabase
+from reqstool.storage.pipeline import build_database
+from reqstool.storage.requirements_repository import RequirementsRepository
+from reqstool.storage.snapshot_cache import SnapshotCache
+
+
+@pytest.fixture
+def project(tmp_path, local_testdata_resources_rootdir_w_path):
+    dst = tmp_path / "ms-101"
+    shutil.copytree(local_testdata_resources_rootdir_w_path("test_basic/baseline/ms-101"), dst)
+    return dst
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SnapshotCache(str(tmp_path / "cache"))
+
+
+def _validator() -> SemanticValidator:
+    return SemanticValidator(validation_error_holder=ValidationErrorHolder())
+
+
+def _requirement_ids(location, cache, filter_data: bool = True) -> list[str]:
+    with build_database(
+        location=location, semantic_validator=_validator(), filter_data=filter_data, snapshot_cache=cache
+    ) as (db, _):
+        return sorted(str(urn_id) for urn_id in RequirementsRepository(db).get_all_requirements())
+
+
+def _count_parses(location, cache, filter_data: bool = True) -> int:
+    with patch(
+        "reqstool.storage.pipeline.CombinedRawDatasetsGenerator", wraps=CombinedRawDatasetsGenerator
+    ) as mock_crdg:
+        _requirement_ids(location, cache, filter_data)
+    return mock_crdg.call_count
+
+
+def test_warm_run_skips_parsing_and_returns_same_data(project, cache):
+    location = LocalLocation(path=str(project))
+
+    cold = _requirement_ids(location, cache)
+    assert _count_parses(location, cache) == 0
+    assert _requirement_ids(location, cache) == cold
+
+
+def test_warm_run_yields_no_combined_raw_dataset(project, cache):
+    location = LocalLocation(path=str(project))
+    _requirement_ids(location, cache)
+
+    with build_database(location=location, semantic_validator=_validator(), snapshot_cache=cache) as (db, crd):
+        assert crd is None
+        assert RequirementsRepository(db).get_initial_urn() == "ms-101"
+
+
+def test_modified_input_file_invalidates_entry(project, cache):
+    location = LocalLocation(path=str(project))
+    _requirement_ids(location, cache)
+
+    requirements_yml = project / "requirements.yml"
+    requirements_yml.write_text(requirements_yml.read_text().replace("Title REQ_101", "Retitled REQ_101"))
+
+    assert _count_parses(location, cache) == 1
+    assert _count_parses(location, cache) == 0
+
+
+def test_filter_flag_is_part_of_the_key(project, cache):
+    location = LocalLocation(path=str(project))
+    _requirement_ids(location, cache, filter_data=True)
+
+    assert _count_parses(location, cache, filter_data=False) == 1
+
+
+def test_version_change_invalidates_entry(project, cache):
+    location = LocalLocation(path=str(project))
+    _requirement_ids(location, cache)
+
+    with patch("reqstool.storage.snapshot_cache.Utils.get_version", return_value="0.0.0-other"):
+        assert _count_parses(location, cache) == 1
+
+
+def test_validation_errors_are_replayed_on_hit(project, cache):
+    location = LocalLocation(path=str(project))
+    key = SnapshotCache.key_for(location, True, ParsingConfig())
+    with build_database(location=location, semantic_validator=_validator()) as (db, crd):
+        cache.store(key, db, crd, [ValidationError(msg="SVC_999 refers to missing REQ_999")])
+
+    holder = ValidationErrorHolder()
+    db = cache.load(key, SemanticValidator(validation_error_holder=holder))
+    try:
+        assert [e.msg for e in holder.get_errors()] == ["SVC_999 refers to missing REQ_999"]
+    finally:
+        db.close()
+
+
+def test_unpinned_remote_source_is_not_stored(cache):
+    git_branch = GitLocation(url="https://example.com/repo.git", ref="main")
+    crd = CombinedRawDataset(initial_model_urn="ms-101", raw_datasets={"ms-101": RawDataset(pinned_key=None)})
+
+    with RequirementsDatabase() as db:
+        assert cache.store("key", db, crd, []) is False
+    assert git_branch.pinned_key() is None
+    assert not os.path.exists(cache.cache_dir)
+
+
+def test_pinned_remote_source_is_stored(cache):
+    git_sha = GitLocation(url="https://example.com/repo.git", ref="0123456789abcdef0123456789abcdef01234567")
+    crd = CombinedRawDataset(
+        initial_model_urn="ms-101", raw_datasets={"ms-101": RawDataset(pinned_key=git_sha.pinned_key())}
+    )
+
+    with RequirementsDatabase() as db:
+        assert cache.store("key", db, crd, []) is True
+    restored = cache.load("key", _validator())
+    assert restored is not None
+    restored.close()
+
+
+def test_corrupt_manifest_is_a_miss(project, cache):
+    location = LocalLocation(path=str(project))
+    _requirement_ids(location, cache)
+    key = SnapshotCache.key_for(location, True, ParsingConfig())
+    with open(os.path.join(cache.cache_dir, key, "manifest.json"), "w") as f:
+        f.write("{not json")
+
+    assert _count_parses(location, cache) == 1
+
+
+def test_changed_interpolated_env_var_invalidates_entry(project, cache, monkeypatch):
+    monkeypatch.setenv("REQSTOOL_TEST_TITLE", "First")
+    requirements_yml = project / "requirements.yml"
+    requirements_yml.write_text(requirements_yml.read_text().replace("Title REQ_101", "${REQSTOOL_TEST_TITLE}"))
+    location = LocalLocation(path=str(project))
+    _requirement_ids(location, cache)
+    assert _count_parses(location, cache) == 0
+
+    monkeypatch.setenv("REQSTOOL_TEST_TITLE", "Second")
+
+    assert _count_parses(location, cache) == 1
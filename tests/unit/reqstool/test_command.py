@@ -4,6 +4,8 @@ from unittest.mock import MagicMock, patch
 
 import argparse
 import io
+import logging
+import subprocess
 import sys
 
 import pytest
@@ -20,6 +22,8 @@ from reqstool.locations.maven_location import MavenLocation
 from reqstool.locations.pypi_location import PypiLocation
 from reqstool.locations.local_npm_location import LocalNpmLocation
 from reqstool.locations.npm_location import NpmLocation
+from reqstool.locations.artifact_cache import DEFAULT_MAX_SIZE_MB
+from reqstool.model_generators.parsing_config import ValidationStrategy
 from reqstool_python_decorators.decorators.decorators import SVCs
 
 
@@ -209,6 +213,63 @@ def test_git_source_parser_missing_ref_errors():
         _make_command_and_parse(["reqstool", "report", "git", "-u", "https://example.com/repo", "-p", "docs/reqstool"])
 
 
+def test_artifact_cache_max_size_from_env(monkeypatch):
+    monkeypatch.setenv("REQSTOOL_ARTIFACT_CACHE_MAX_SIZE", "64")
+    args = _make_command_and_parse(["reqstool", "report", "local", "-p", "/tmp"])
+    assert args.artifact_cache_max_size == 64
+
+
+def test_invalid_artifact_cache_max_size_in_env_is_a_usage_error(monkeypatch, capsys):
+    monkeypatch.setenv("REQSTOOL_ARTIFACT_CACHE_MAX_SIZE", "1G")
+    with pytest.raises(SystemExit) as exc:
+        _make_command_and_parse(["reqstool", "--cache-dir", "/tmp/cache", "report", "local", "-p", "/tmp"])
+    assert exc.value.code == 2
+    assert "REQSTOOL_ARTIFACT_CACHE_MAX_SIZE: invalid int value: '1G'" in capsys.readouterr().err
+
+
+def test_invalid_artifact_cache_max_size_in_env_is_ignored_without_a_cache(monkeypatch):
+    monkeypatch.setenv("REQSTOOL_ARTIFACT_CACHE_MAX_SIZE", "1G")
+    monkeypatch.delenv("REQSTOOL_CACHE_DIR", raising=False)
+    args = _make_command_and_parse(["reqstool", "report", "local", "-p", "/tmp"])
+    assert args.artifact_cache_max_size == DEFAULT_MAX_SIZE_MB
+
+
+def test_invalid_artifact_cache_max_size_option_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as exc:
+        _make_command_and_parse(["reqstool", "--artifact-cache-max-size", "1G", "report", "local", "-p", "/tmp"])
+    assert exc.value.code == 2
+    assert "--artifact-cache-max-size: invalid int value: '1G'" in capsys.readouterr().err
+
+
+def test_validation_from_env(monkeypatch):
+    monkeypatch.setenv("REQSTOOL_VALIDATION", "pydantic")
+    args = _make_command_and_parse(["reqstool", "report", "local", "-p", "/tmp"])
+    assert args.validation is ValidationStrategy.PYDANTIC
+
+
+def test_invalid_validation_in_env_is_a_usage_error(monkeypatch, capsys):
+    monkeypatch.setenv("REQSTOOL_VALIDATION", "foo")
+    with pytest.raises(SystemExit) as exc:
+        _make_command_and_parse(["reqstool", "report", "local", "-p", "/tmp"])
+    assert exc.value.code == 2
+    assert "--validation: invalid choice: 'foo'" in capsys.readouterr().err
+
+
+def test_pydantic_validation_is_warned_about(caplog):
+    args = _make_command_and_parse(["reqstool", "--validation", "pydantic", "report", "local", "-p", "/tmp"])
+    with caplog.at_level(logging.WARNING):
+        parsing_config = Command()._get_parsing_config(args)
+    assert parsing_config.validation_strategy is ValidationStrategy.PYDANTIC
+    assert "not checked against their JSON Schema" in caplog.text
+
+
+def test_json_schema_validation_is_not_warned_about(caplog):
+    args = _make_command_and_parse(["reqstool", "report", "local", "-p", "/tmp"])
+    with caplog.at_level(logging.WARNING):
+        Command()._get_parsing_config(args)
+    assert caplog.text == ""
+
+
 def test_maven_source_parser_requires_group_artifact_version():
     args = _make_command_and_parse(
         [
@@ -454,7 +515,7 @@ def test_command_status_writes_result_to_output_destination():
     args = argparse.Namespace(output=out, check_all_reqs_met=False)
     with (
         patch.object(Command, "_get_initial_source", return_value=MagicMock()),
-        patch("reqstool.command.StatusCommand") as mock_status,
+        patch("reqstool.commands.status.status.StatusCommand") as mock_status,
     ):
         mock_status.return_value.result = ("STATUS-BODY", 0)
         exit_code = Command().command_status(args)
@@ -470,7 +531,7 @@ def test_command_status_returns_nonzero_when_enforcing_and_incomplete():
     args = argparse.Namespace(output=out, check_all_reqs_met=True)
     with (
         patch.object(Command, "_get_initial_source", return_value=MagicMock()),
-        patch("reqstool.command.StatusCommand") as mock_status,
+        patch("reqstool.commands.status.status.StatusCommand") as mock_status,
     ):
         mock_status.return_value.result = ("STATUS-BODY", 2)
         exit_code = Command().command_status(args)
@@ -480,8 +541,42 @@ def test_command_status_returns_nonzero_when_enforcing_and_incomplete():
     args = argparse.Namespace(output=out, check_all_reqs_met=False)
     with (
         patch.object(Command, "_get_initial_source", return_value=MagicMock()),
-        patch("reqstool.command.StatusCommand") as mock_status,
+        patch("reqstool.commands.status.status.StatusCommand") as mock_status,
     ):
         mock_status.return_value.result = ("STATUS-BODY", 2)
         exit_code = Command().command_status(args)
     assert exit_code == 0
+
+
+# ---------------------------------------------------------------------------
+# Startup cost
+# ---------------------------------------------------------------------------
+
+# Imported only once a command or location that needs them has been selected
+_DEFERRED_MODULES = {"pygit2", "maven_artifact", "bs4", "requests", "rich", "jinja2", "lark", "jsonschema"}
+
+# Far above what parsing the command line takes (~0.2 s), far below the seconds it took
+# when every command was imported up front
+_IMPORT_BUDGET_SECONDS = 1.5
+
+
+def _imports_while_parsing(argv: list[str]) -> dict[str, int]:
+    """Top-level package -> cumulative import time (µs) when importing reqstool.command and parsing ``argv``."""
+    code = f"import sys; sys.argv = {argv!r}; from reqstool.command import Command; Command().get_arguments()"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    imports: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        imports[fields[2].strip()] = int(fields[1])
+    return imports
+
+
+def test_cli_startup_defers_heavy_imports():
+    imports = _imports_while_parsing(["reqstool", "status", "local", "-p", "."])
+
+    assert _DEFERRED_MODULES.isdisjoint(imports)
+    assert imports["reqstool.command"] < _IMPORT_BUDGET_SECONDS * 1_000_000